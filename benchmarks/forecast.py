@@ -0,0 +1,88 @@
+"""Forecast benchmark: vectorized seat simulation vs one random draw per candidate in Python.
+
+Usage (from the repository root):
+    python -m benchmarks.forecast [--seats 435] [--senate 100] [--simulations 20000]
+
+Builds a synthetic House (and Senate) of two- and three-way races and times
+simulate_seats, both inline and through the process pool the /forecast command
+uses for heavy runs.
+"""
+import argparse
+import asyncio
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cogs.forecast import FORECAST_SIGMA, get_process_pool, minimum_floor, simulate_seats
+
+
+def make_seats(count: int, group: str = "House", seed: int = 42):
+    rng = random.Random(seed)
+    seats = []
+    for i in range(count):
+        dem = rng.uniform(30, 70)
+        candidates = [("Dem %d" % i, "Democrat", dem), ("Rep %d" % i, "Republican", 100 - dem)]
+        if i % 4 == 0:
+            third = rng.uniform(2, 10)
+            candidates = [(n, p, s * (100 - third) / 100) for n, p, s in candidates]
+            candidates.append(("Ind %d" % i, "Independent", third))
+        seats.append(("%s-%d" % (group.upper(), i), group, [(n, p, s, minimum_floor(p)) for n, p, s in candidates]))
+    return seats
+
+
+def python_baseline(seats, simulations: int):
+    """The naive version: a Python loop per simulation per candidate"""
+    wins = {}
+    for seat_id, _, candidates in seats:
+        counts = [0] * len(candidates)
+        for _ in range(simulations):
+            draws = [max(share + random.gauss(0, FORECAST_SIGMA), floor) for _, _, share, floor in candidates]
+            counts[draws.index(max(draws))] += 1
+        wins[seat_id] = counts
+    return wins
+
+
+async def in_pool(seats, simulations):
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_process_pool(), simulate_seats, seats, simulations)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--seats", type=int, default=435, help="House seats")
+    parser.add_argument("--senate", type=int, default=100, help="Senate seats")
+    parser.add_argument("--simulations", type=int, default=20000)
+    parser.add_argument("--baseline-seats", type=int, default=5, help="Seats to time the pure Python loop on")
+    args = parser.parse_args()
+
+    seats = make_seats(args.seats) + make_seats(args.senate, "Senate", seed=43)
+
+    start = time.perf_counter()
+    result = simulate_seats(seats, args.simulations, seed=1)
+    inline_ms = (time.perf_counter() - start) * 1000
+
+    asyncio.run(in_pool(seats[:1], 1000))  # Warm the worker processes up
+    start = time.perf_counter()
+    asyncio.run(in_pool(seats, args.simulations))
+    pool_ms = (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+    python_baseline(seats[:args.baseline_seats], args.simulations)
+    python_ms = (time.perf_counter() - start) * 1000 * len(seats) / args.baseline_seats
+
+    print(f"{len(seats)} seats x {args.simulations:,} simulations")
+    print(f"  numpy inline:        {inline_ms:8.1f} ms")
+    print(f"  numpy process pool:  {pool_ms:8.1f} ms")
+    print(f"  python loop (est.):  {python_ms:8.1f} ms")
+    for group, chamber in result["chambers"].items():
+        print(f"  {group} ({chamber['seats']} seats, {chamber['majority']} for a majority)")
+        for party, stats in sorted(chamber["parties"].items()):
+            print(f"    {party}: {stats['mean']:.1f} seats ({stats['low']:.0f}-{stats['high']:.0f}), "
+                  f"majority {stats['majority_probability'] * 100:.1f}%")
+
+
+if __name__ == "__main__":
+    main()
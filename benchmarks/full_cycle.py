@@ -0,0 +1,283 @@
+"""Full election cycle simulation: every phase for N guilds x M candidates, time accelerated.
+
+Usage (from the repository root; in-memory mongomock, or a scratch MongoDB via MONGO_URI):
+    python -m benchmarks.full_cycle [--guilds 5] [--candidates 20] [--presidential 4] [--rp-days-per-tick 5] [--cycles 1]
+    MONGO_URI=mongodb://localhost:27017 python -m benchmarks.full_cycle
+
+Loads the real cogs into an offline bot (benchmarks.offline) and plays the
+cycle in every guild:
+
+- Signups: every candidate runs /signup and picks a seat from its select; in
+  presidential cycles the first --presidential candidates run /pres_signup instead.
+- Primary Campaign: presidential candidates canvass every tick while the
+  delegate loop calls the state primaries.
+- Primary Election: the phase change processes the primary winners.
+- General Campaign: everyone campaigns; primary losers are refused and stop.
+- General Election: an admin declares the winners, and the Dec 31 tick rolls
+  the cycle over (archive, back to Signups).
+Each tick one candidate per guild also runs the phase's read command.
+
+Time runs on TimeManager's own clock. A tick stands for one real minute of the
+time loop (the delegate loop runs every 5th tick): last_real_update is moved a
+minute back and minutes_per_rp_day is set so that minute is --rp-days-per-tick
+RP days. Campaign cooldowns are real hours, so action_cooldowns is cleared every
+tick to let candidates act at the accelerated pace.
+
+Reports per-command latency and DB round trips ("rejected" counts ❌ answers),
+loop tick times, throughput and memory: max RSS, plus the tracemalloc peak with
+--trace-memory (which slows everything down).
+
+A phase transition that keeps failing ends the run early and is reported with
+the steps it finished (--verbose shows the error). tests/test_full_cycle.py
+plays one small guild through a whole cycle on every test run.
+"""
+import argparse
+import asyncio
+import os
+import sys
+import time
+import tracemalloc
+from collections import Counter
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from typing import List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.offline import FakeGuild, OfflineBot, command_table, loop_table, stand_in_database
+from cogs.ideology import STATE_DATA
+from cogs.presidential_winners import PRESIDENTIAL_STATE_DATA
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+PARTIES = ["Democratic Party", "Republican Party"]
+STATES = sorted(set(STATE_DATA) & set(PRESIDENTIAL_STATE_DATA))
+DELEGATE_LOOP_EVERY = 5  # Minutes between delegate_check_loop runs; the time loop runs every minute
+STUCK_AFTER = 5  # Ticks a phase transition may keep failing before the run gives up
+CANVASS_MESSAGE = "Out knocking on doors today to talk about good jobs, safer roads and better schools for every family in the state."
+READS = {
+    "Signups": "view_signups",
+    "Primary Campaign": "delegate totals",
+    "Primary Election": "view_primary_winners",
+    "General Campaign": "view_general_campaign",
+    "General Election": "view_general_winners",
+}
+
+
+class Campaign:
+    """One guild's cast: an admin and the candidates"""
+
+    def __init__(self, guild: FakeGuild, candidates: int):
+        self.guild = guild
+        self.admin = guild.add_member("Admin", administrator=True)
+        self.candidates = [guild.add_member(f"Candidate {k + 1}") for k in range(candidates)]
+        self.presidential = []  # Running for President this cycle
+        self.signed_up = None  # RP year of the last signups
+        self.declared = None  # RP year whose general winners were declared
+        self.dropped = set()  # (year, phase, user_id) refused a campaign action
+
+
+async def sign_up(offline: OfflineBot, campaign: Campaign, year: int, presidential: int):
+    guild = campaign.guild
+    regions = offline.cog("AllSignups")._get_regions_from_elections(guild.id)
+    campaign.presidential = campaign.candidates[:presidential] if year % 4 == 3 else []
+    for k, member in enumerate(campaign.candidates):
+        party = PARTIES[k % len(PARTIES)]
+        if member in campaign.presidential:
+            profile = STATE_DATA[STATES[k % len(STATES)]]
+            await offline.invoke("pres_signup", guild, member, name=member.name, party=party,
+                                 ideology=profile["ideology"], economic=profile["economic"], social=profile["social"],
+                                 government=profile["government"], axis=profile["axis"])
+            continue
+
+        interaction = await offline.invoke("signup", guild, member, name=member.name, party=party,
+                                           region=regions[k % len(regions)])
+        message = interaction.messages[0] if interaction.messages else None
+        if message and message.view:
+            await offline.choose(message, member, "signup (seat select)", index=k // len(regions))
+
+
+async def campaign_action(offline: OfflineBot, campaign: Campaign, key: tuple, name: str, member, **options):
+    """Run a campaign command unless the candidate was already refused this phase"""
+    key = key + (member.id,)
+    if key in campaign.dropped:
+        return
+    interaction = await offline.invoke(name, campaign.guild, member, **options)
+    if interaction.rejected:
+        campaign.dropped.add(key)
+
+
+async def play(offline: OfflineBot, campaign: Campaign, rp_date: datetime, phase: str, tick: int, presidential: int):
+    """What a guild's members do during one tick"""
+    guild, year = campaign.guild, rp_date.year
+    key = (year, phase)
+    if phase == "Signups" and campaign.signed_up != year:
+        await sign_up(offline, campaign, year, presidential)
+        campaign.signed_up = year
+    elif phase == "Primary Campaign":
+        for k, member in enumerate(campaign.presidential):
+            await campaign_action(offline, campaign, key, "pres_canvassing", member,
+                                  state=STATES[(tick + k) % len(STATES)], canvassing_message=CANVASS_MESSAGE)
+    elif phase == "General Campaign":
+        for k, member in enumerate(campaign.candidates):
+            state = STATES[(tick + k) % len(STATES)]
+            if member in campaign.presidential:
+                await campaign_action(offline, campaign, key, "pres_canvassing", member,
+                                      state=state, canvassing_message=CANVASS_MESSAGE)
+            else:
+                await campaign_action(offline, campaign, key, "canvassing", member,
+                                      state=state, canvassing_message=CANVASS_MESSAGE, target=member.name)
+    elif phase == "General Election" and campaign.declared != year:
+        await offline.invoke("admin_declare_general_winners", guild, campaign.admin, confirm=True)
+        campaign.declared = year
+
+    read = READS.get(phase)
+    if read:
+        await offline.invoke(read, guild, campaign.candidates[tick % len(campaign.candidates)])
+
+
+def advance_clock(db, guild_ids, config: dict, rp_days: float):
+    """Make the next time loop tick see `rp_days` RP days pass since the last one.
+
+    Never steps past Dec 31 of a General Election, the day the cycle reset runs on.
+    """
+    rp_date = config["current_rp_date"]
+    if config["current_phase"] == "General Election":
+        year_end = datetime(rp_date.year, 12, 31, 12)
+        rp_days = min(rp_days, max(0.0, (year_end - rp_date).total_seconds() / 86400))
+    last_update = datetime.utcnow() - timedelta(minutes=rp_days * config["minutes_per_rp_day"])
+    db["time_configs"].update_many({"guild_id": {"$in": guild_ids}}, {"$set": {"last_real_update": last_update}})
+
+
+def max_rss_mb() -> float:
+    if resource is None:
+        return 0.0
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024  # KiB on Linux
+
+
+def open_guilds(offline: OfflineBot, guilds: int, candidates: int, rp_days_per_tick: float) -> List[Campaign]:
+    time_manager, elections = offline.cog("TimeManager"), offline.cog("Elections")
+    campaigns = []
+    for g in range(guilds):
+        guild = FakeGuild(f"Guild {g + 1}")
+        offline.add_guild(guild)
+        campaigns.append(Campaign(guild, candidates))
+        # Default time and seat configuration, as the first command in a new guild creates them
+        time_manager._get_time_config(guild.id)
+        elections._get_elections_config(guild.id)
+    guild_ids = [campaign.guild.id for campaign in campaigns]
+    offline.raw_db["time_configs"].update_many({"guild_id": {"$in": guild_ids}},
+                                               {"$set": {"minutes_per_rp_day": 1 / rp_days_per_tick}})
+    return campaigns
+
+
+async def simulate(offline: OfflineBot, campaigns: List[Campaign], presidential: int, rp_days_per_tick: float,
+                   cycles: int, max_ticks: int) -> SimpleNamespace:
+    """Tick until `cycles` cycles rolled over, a transition is stuck or max_ticks ran out.
+
+    Returns ticks, cycles, phase_ticks, phase (the last one seen), and stuck/failing:
+    the open phase_transitions entry and how many ticks in a row it failed.
+    """
+    guild_ids = [campaign.guild.id for campaign in campaigns]
+    raw = offline.raw_db
+    result = SimpleNamespace(ticks=0, cycles=0, phase_ticks=Counter(), phase=None, stuck=None, failing=0)
+    while result.ticks < max_ticks:
+        config = raw["time_configs"].find_one({"guild_id": guild_ids[0]})
+        phase = config["current_phase"]
+        if phase == "Signups" and result.phase not in (None, "Signups"):
+            result.cycles += 1
+            if result.cycles == cycles:
+                result.phase = phase
+                break
+        result.phase = phase
+        result.phase_ticks[phase] += 1
+
+        raw["action_cooldowns"].delete_many({"guild_id": {"$in": guild_ids}})
+        for campaign in campaigns:
+            await play(offline, campaign, config["current_rp_date"], phase, result.ticks, presidential)
+
+        advance_clock(raw, guild_ids, config, rp_days_per_tick)
+        await offline.tick("TimeManager", "time_loop")
+        if result.ticks % DELEGATE_LOOP_EVERY == 0:
+            await offline.tick("Delegates", "delegate_check_loop")
+        result.ticks += 1
+
+        open_entry = raw["phase_transitions"].find_one({"guild_id": {"$in": guild_ids}, "completed_at": None})
+        stuck = result.stuck
+        result.failing = result.failing + 1 if open_entry and stuck and open_entry["_id"] == stuck["_id"] else 0
+        result.stuck = open_entry
+        if result.failing >= STUCK_AFTER:
+            break
+        await asyncio.sleep(0)  # Let queued announcements and listeners run, as between real minutes
+    return result
+
+
+async def run(args) -> list:
+    db, label = stand_in_database()
+    rss_start = max_rss_mb()
+    if args.trace_memory:
+        tracemalloc.start()
+
+    async with OfflineBot(db, quiet=not args.verbose) as offline:
+        campaigns = open_guilds(offline, args.guilds, args.candidates, args.rp_days_per_tick)
+        rss_loaded = max_rss_mb()
+
+        start = time.perf_counter()
+        result = await simulate(offline, campaigns, args.presidential, args.rp_days_per_tick,
+                                args.cycles, args.max_ticks)
+        elapsed = time.perf_counter() - start
+        ticks = result.ticks
+
+        traced_peak = tracemalloc.get_traced_memory()[1] / 1024 / 1024 if args.trace_memory else None
+        commands = sum(len(samples) for samples in offline.samples.values())
+        sent = sum(len(channel.sent) for campaign in campaigns for channel in campaign.guild.text_channels)
+        queued = sum(len(queue) for queue in offline.cog("Announcements").queues.values())
+        lookups = sum(campaign.guild.member_requests for campaign in campaigns)
+
+        lines = [
+            f"{args.guilds} guilds x {args.candidates} candidates ({args.presidential} presidential), "
+            f"{args.rp_days_per_tick:g} RP days per tick, {label}",
+            f"{result.cycles} cycle(s) in {ticks} ticks: "
+            + ", ".join(f"{phase} {count}" for phase, count in result.phase_ticks.items()),
+            f"{commands} commands in {elapsed:.1f}s ({commands / elapsed:.0f}/s, {ticks / elapsed:.1f} ticks/s)",
+            "",
+            *command_table(offline),
+            "",
+            *loop_table(),
+            "",
+            f"announcements sent {sent} ({queued} still queued), member lookups {lookups}",
+        ]
+        memory = f"max RSS {max_rss_mb():.0f} MB (before loading the cogs {rss_start:.0f} MB, after {rss_loaded:.0f} MB)"
+        if traced_peak is not None:
+            memory += f", traced peak {traced_peak:.1f} MB"
+        lines.append(memory)
+        stuck = result.stuck
+        if result.failing >= STUCK_AFTER:
+            lines.append(f"Stopped: {stuck['old_phase']} -> {stuck['new_phase']} failed {result.failing + 1} ticks in a row "
+                         f"after steps {', '.join(stuck['steps']) or 'none'} (--verbose shows the error)")
+        elif result.cycles < args.cycles:
+            lines.append(f"Stopped at --max-ticks {args.max_ticks} before the cycle finished (phase {result.phase})")
+    return lines
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--guilds", type=int, default=5)
+    parser.add_argument("--candidates", type=int, default=20, help="Per guild, presidential ones included")
+    parser.add_argument("--presidential", type=int, default=4, help="Candidates per guild running for President")
+    parser.add_argument("--rp-days-per-tick", type=float, default=5)
+    parser.add_argument("--cycles", type=int, default=1)
+    parser.add_argument("--max-ticks", type=int, default=2000)
+    parser.add_argument("--trace-memory", action="store_true")
+    parser.add_argument("--verbose", action="store_true", help="Keep the cogs' own output")
+    args = parser.parse_args()
+
+    for line in asyncio.run(run(args)):
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
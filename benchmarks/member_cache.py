@@ -0,0 +1,112 @@
+"""Member cache memory benchmark: full member list vs the lean cache, for large guilds.
+
+Usage (from the repository root):
+    python -m benchmarks.member_cache [--members 10000 50000 200000] [--candidates 400] [--authors 2000]
+
+Builds a guild the way discord.py's gateway state does, with each mode's
+constructor options from gateway_options(). Full mode holds every member, as
+after startup chunking. Lean mode gets no member list (Discord leaves it out
+without the members intent). Instead --candidates candidates and --authors
+interaction authors pass through MemberCache, which keeps at most
+MEMBER_LRU_SIZE of them. The table shows the memory traced while building
+each, and the share of it the lean mode saves.
+"""
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import discord
+
+from cogs.member_cache import LRU_SIZE, MemberCache, gateway_options
+
+GUILD_ID = 1407527193470439565
+ROLES = 40
+
+
+def role_payload(role_id: int, position: int) -> dict:
+    return {"id": str(role_id), "name": f"role-{position}", "permissions": "0", "position": position,
+            "color": 0, "hoist": False, "managed": False, "mentionable": False}
+
+
+def member_payload(user_id: int) -> dict:
+    return {
+        "user": {"id": str(user_id), "username": f"user{user_id}", "discriminator": "0",
+                 "global_name": f"User {user_id}", "avatar": None},
+        "roles": [str(GUILD_ID + 1 + k) for k in range(user_id % 4)],
+        "joined_at": "2024-01-01T00:00:00+00:00",
+        "nick": None,
+        "deaf": False,
+        "mute": False,
+        "flags": 0,
+    }
+
+
+def guild_payload(members: list, member_count: int) -> dict:
+    return {
+        "id": str(GUILD_ID),
+        "name": "Benchmark Guild",
+        "owner_id": str(GUILD_ID + 10_000),
+        "member_count": member_count,
+        "roles": [role_payload(GUILD_ID, 0)] + [role_payload(GUILD_ID + 1 + k, k + 1) for k in range(ROLES)],
+        "members": members,
+        "channels": [],
+        "threads": [],
+        "voice_states": [],
+        "emojis": [],
+        "stickers": [],
+        "features": [],
+    }
+
+
+def build(lean: bool, member_count: int, candidates: int, authors: int):
+    """Guild state (and member cache) as a process in this mode would hold it"""
+    state = discord.Client(**gateway_options(lean))._connection
+    user_ids = [10_000_000 + k for k in range(member_count)]
+    if not lean:
+        return state, state._add_guild_from_data(guild_payload([member_payload(u) for u in user_ids], member_count)), None
+
+    guild = state._add_guild_from_data(guild_payload([], member_count))
+    member_cache = MemberCache(SimpleNamespace())
+    # Candidates looked up for list views, then people running commands
+    looked_up = user_ids[:candidates] + user_ids[len(user_ids) - authors:]
+    for user_id in looked_up:
+        member_cache.remember(discord.Member(data=member_payload(user_id), guild=guild, state=state))
+    return state, guild, member_cache
+
+
+def measure(lean: bool, member_count: int, candidates: int, authors: int):
+    tracemalloc.start()
+    start = time.perf_counter()
+    held = build(lean, member_count, candidates, authors)
+    elapsed = time.perf_counter() - start
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    cached = len(held[1]._members) + (len(held[2].members) if held[2] else 0)
+    del held
+    return current / 1024 / 1024, elapsed, cached
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--members", type=int, nargs="+", default=[10_000, 50_000, 200_000])
+    parser.add_argument("--candidates", type=int, default=400)
+    parser.add_argument("--authors", type=int, default=2000)
+    args = parser.parse_args()
+
+    print(f"LRU size {LRU_SIZE}, {args.candidates} candidates, {args.authors} interaction authors\n")
+    print(f"{'members':>9} {'full MB':>9} {'cached':>8} {'lean MB':>9} {'cached':>8} {'saved':>7} {'build full/lean':>17}")
+    for member_count in args.members:
+        full_mb, full_s, full_cached = measure(False, member_count, args.candidates, args.authors)
+        lean_mb, lean_s, lean_cached = measure(True, member_count, args.candidates, args.authors)
+        saved = 1 - lean_mb / full_mb if full_mb else 0
+        print(f"{member_count:>9,} {full_mb:>9.1f} {full_cached:>8,} {lean_mb:>9.1f} {lean_cached:>8,} "
+              f"{saved:>6.0%} {full_s * 1000:>8.0f}/{lean_s * 1000:.0f}ms")
+
+
+if __name__ == "__main__":
+    main()
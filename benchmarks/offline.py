@@ -0,0 +1,514 @@
+"""Offline bot for the simulation benchmarks: the real cogs on a stand-in database, fake Discord objects.
+
+Not a benchmark itself; benchmarks.full_cycle and benchmarks.replay build on it.
+
+The bot is a real commands.Bot (with the instrumented command tree) that never
+logs in. Every extension main.py loads is loaded except the ones that only
+matter between processes (cache_sync, sharding), and their background loops
+are stopped so a benchmark can run loop bodies itself, one tick at a time.
+Commands are invoked the way the command tree does it, checks and transformers
+included, with fake interactions, and timed with the same
+metrics.track("command", ...) scope the command tree uses, so DB round trips
+are attributed the same way as in production.
+
+Guilds behave like the lean member cache: get_member() finds nothing and
+members come from query_members()/fetch_member().
+
+On mongomock the stand-in database applies update array_filters and $[]
+itself (ArrayFilterDatabase), which mongomock doesn't implement, so the
+Primary Election -> General Campaign resets run as they do on MongoDB.
+"""
+import asyncio
+import contextlib
+import itertools
+import os
+import re
+import sys
+import time
+from collections import Counter, defaultdict
+from types import SimpleNamespace
+from typing import Dict, List, Optional, Tuple
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import discord
+from discord import app_commands
+from discord.ext import commands, tasks
+
+from cogs.member_cache import gateway_options
+from cogs.instrumentation import InstrumentedCommandTree, InstrumentedDatabase, LatencyWindow, metrics
+from startup import EXTENSIONS, load_extensions
+
+try:
+    import mongomock
+    from mongomock.filtering import filter_applies
+    from pymongo.results import UpdateResult
+except ImportError:
+    mongomock = None
+
+# Cross-process only: change streams/polling for other processes' writes, and the leader lease
+SKIPPED_EXTENSIONS = {"cogs.cache_sync", "cogs.sharding"}
+DEFAULT_AVATAR = "https://cdn.discordapp.com/embed/avatars/0.png"
+
+_ids = itertools.count(1_000_000_000_000)
+POSITIONAL_RE = re.compile(r"^\$\[(\w*)\]$")  # $[] or $[identifier] in an update path
+
+
+def _filter_identifier(condition: dict) -> str:
+    """The identifier an array filter document is about, e.g. "w" for {"w.year": 2000}"""
+    key = next(iter(condition))
+    if key.startswith("$"):
+        return _filter_identifier(condition[key][0])
+    return key.split(".", 1)[0]
+
+
+def _rebase_filter(condition: dict, identifier: str) -> dict:
+    """{"w.year": 2000} as a query on {"_": element}"""
+    rebased = {}
+    for key, value in condition.items():
+        if key in ("$and", "$or", "$nor"):
+            rebased[key] = [_rebase_filter(part, identifier) for part in value]
+        elif key == identifier or key.startswith(identifier + "."):
+            rebased["_" + key[len(identifier):]] = value
+        else:
+            rebased[key] = value
+    return rebased
+
+
+def _expand_path(parts: List[str], value, filters: Dict[str, dict]) -> List[List[str]]:
+    """Concrete paths for one update path: $[] and $[identifier] become the indexes of the matching elements"""
+    if not parts:
+        return [[]]
+    head, rest = parts[0], parts[1:]
+    positional = POSITIONAL_RE.match(head)
+    if positional is None:
+        if isinstance(value, dict):
+            child = value.get(head)
+        elif isinstance(value, list) and head.isdigit() and int(head) < len(value):
+            child = value[int(head)]
+        else:
+            child = None
+        return [[head] + tail for tail in _expand_path(rest, child, filters)]
+    if not isinstance(value, list):
+        return []
+    identifier = positional.group(1)
+    return [
+        [str(i)] + tail
+        for i, element in enumerate(value)
+        if not identifier or filter_applies(filters[identifier], {"_": element})
+        for tail in _expand_path(rest, element, filters)
+    ]
+
+
+class ArrayFilterCollection:
+    """mongomock collection proxy that applies array_filters and $[] in updates itself.
+
+    Every matched document is updated on its own, with each positional path
+    expanded to the indexes of the elements it selects. Upserts with positional
+    paths aren't supported; nothing in the bot does them.
+    """
+
+    def __init__(self, collection):
+        self._collection = collection
+
+    def __getattr__(self, name):
+        return getattr(self._collection, name)
+
+    def update_one(self, filter, update, upsert=False, array_filters=None, **kwargs):
+        return self._update(filter, update, upsert, array_filters, False, kwargs)
+
+    def update_many(self, filter, update, upsert=False, array_filters=None, **kwargs):
+        return self._update(filter, update, upsert, array_filters, True, kwargs)
+
+    def _update(self, filter, update, upsert, array_filters, many, kwargs):
+        if not array_filters and "$[" not in str(update):
+            method = self._collection.update_many if many else self._collection.update_one
+            return method(filter, update, upsert=upsert, **kwargs)
+
+        filters = {identifier: _rebase_filter(condition, identifier)
+                   for condition in array_filters or []
+                   for identifier in [_filter_identifier(condition)]}
+        documents = self._collection.find(filter, limit=0 if many else 1)
+        matched = modified = 0
+        for document in documents:
+            matched += 1
+            concrete = self._concrete_update(document, update, filters)
+            if concrete:
+                result = self._collection.update_one({"_id": document["_id"]}, concrete, **kwargs)
+                modified += result.modified_count
+        return UpdateResult({"n": matched, "nModified": modified, "ok": 1.0}, acknowledged=True)
+
+    @staticmethod
+    def _concrete_update(document: dict, update: dict, filters: Dict[str, dict]) -> dict:
+        concrete = {}
+        for operator, fields in update.items():
+            expanded = {}
+            for path, value in fields.items():
+                for parts in _expand_path(path.split("."), document, filters):
+                    expanded[".".join(parts)] = value
+            if expanded:
+                concrete[operator] = expanded
+        return concrete
+
+
+class ArrayFilterDatabase:
+    """mongomock database proxy that hands out ArrayFilterCollections"""
+
+    def __init__(self, db):
+        self._db = db
+
+    def __getitem__(self, name: str) -> ArrayFilterCollection:
+        return ArrayFilterCollection(self._db[name])
+
+    def get_collection(self, name: str, **kwargs) -> ArrayFilterCollection:
+        return ArrayFilterCollection(self._db.get_collection(name, **kwargs))
+
+    def __getattr__(self, name):
+        return getattr(self._db, name)
+
+
+def stand_in_database(drop: bool = True) -> Tuple[object, str]:
+    """(db, label): database BENCH_DB on MONGO_URI if set (dropped first unless drop=False), else an in-memory mongomock one"""
+    name = os.getenv("BENCH_DB", "election_bot_bench")
+    uri = os.getenv("MONGO_URI")
+    if uri:
+        from pymongo import MongoClient
+        client = MongoClient(uri)
+        if drop:
+            client.drop_database(name)
+        return client[name], f"{name} on {uri}"
+    if mongomock is None:
+        raise SystemExit("Set MONGO_URI to a scratch MongoDB, or pip install mongomock")
+    return ArrayFilterDatabase(mongomock.MongoClient()[name]), "mongomock"
+
+
+class FakeMessage:
+    def __init__(self, channel, content: Optional[str] = None, embeds: Optional[list] = None, view=None):
+        self.id = next(_ids)
+        self.channel = channel
+        self.guild = channel.guild
+        self.content = content
+        self.embeds = embeds or []
+        self.view = view
+        self.jump_url = f"https://discord.com/channels/{channel.guild.id}/{channel.id}/{self.id}"
+
+    async def edit(self, content=None, *, embed=None, embeds=None, view=None, **kwargs):
+        if content is not None:
+            self.content = content
+        if embed is not None or embeds is not None:
+            self.embeds = [embed] if embed is not None else embeds
+        if view is not None:
+            self.view = view
+        return self
+
+    async def delete(self, **kwargs):
+        pass
+
+
+class FakeChannel:
+    def __init__(self, guild, name: str):
+        self.id = next(_ids)
+        self.guild = guild
+        self.name = name
+        self.mention = f"<#{self.id}>"
+        self.sent: List[FakeMessage] = []
+
+    async def send(self, content: Optional[str] = None, *, embed=None, embeds=None, view=None, **kwargs):
+        message = FakeMessage(self, content, [embed] if embed is not None else embeds, view)
+        self.sent.append(message)
+        return message
+
+    async def edit(self, *, name: Optional[str] = None, **kwargs):
+        if name is not None:
+            self.name = name
+
+
+class FakeMember:
+    bot = False
+
+    def __init__(self, guild, name: str, administrator: bool = False, user_id: Optional[int] = None):
+        self.id = user_id or next(_ids)
+        self.guild = guild
+        self.name = self.display_name = self.global_name = name
+        self.mention = f"<@{self.id}>"
+        self.roles = []
+        self.guild_permissions = discord.Permissions(administrator=administrator)
+        self.avatar = None
+        self.display_avatar = SimpleNamespace(url=DEFAULT_AVATAR)
+        self.dms: List[FakeMessage] = []
+
+    async def send(self, content: Optional[str] = None, *, embed=None, embeds=None, view=None, **kwargs):
+        message = FakeMessage(self.guild.text_channels[0], content, [embed] if embed is not None else embeds, view)
+        self.dms.append(message)
+        return message
+
+    async def add_roles(self, *roles, **kwargs):
+        self.roles.extend(role for role in roles if role not in self.roles)
+
+    async def remove_roles(self, *roles, **kwargs):
+        self.roles = [role for role in self.roles if role not in roles]
+
+    def __str__(self):
+        return self.name
+
+
+class FakeGuild:
+    def __init__(self, name: str, guild_id: Optional[int] = None):
+        self.id = guild_id or next(_ids)
+        self.name = name
+        self.icon = None
+        self.roles = []
+        self.members: Dict[int, FakeMember] = {}
+        self.member_requests = 0
+        general = FakeChannel(self, "general")
+        self.channels = [general]
+        self.text_channels = [general]
+        self.system_channel = general
+        self.me = self.add_member("Election Bot")
+
+    @property
+    def member_count(self) -> int:
+        return len(self.members)
+
+    def add_member(self, name: str, administrator: bool = False, user_id: Optional[int] = None) -> FakeMember:
+        member = FakeMember(self, name, administrator, user_id)
+        self.members[member.id] = member
+        return member
+
+    def get_member(self, user_id: int):
+        return None  # Lean mode: no member list
+
+    def get_channel(self, channel_id: int):
+        return next((channel for channel in self.channels if channel.id == channel_id), None)
+
+    def get_role(self, role_id: int):
+        return None
+
+    async def query_members(self, query=None, *, limit=5, user_ids=None, cache=True, **kwargs):
+        self.member_requests += 1
+        return [self.members[user_id] for user_id in user_ids or [] if user_id in self.members][:limit]
+
+    async def fetch_member(self, user_id: int):
+        self.member_requests += 1
+        if user_id not in self.members:
+            raise discord.NotFound(SimpleNamespace(status=404, reason="Not Found"), "Unknown Member")
+        return self.members[user_id]
+
+
+class FakeResponse:
+    def __init__(self, interaction: "FakeInteraction"):
+        self._interaction = interaction
+        self._done = False
+
+    def is_done(self) -> bool:
+        return self._done
+
+    def _respond(self):
+        if self._done:
+            raise discord.InteractionResponded(self._interaction)
+        self._done = True
+
+    async def send_message(self, content: Optional[str] = None, *, embed=None, embeds=None, view=None, **kwargs):
+        self._respond()
+        self._interaction.record(content, embed, embeds, view)
+
+    async def edit_message(self, content: Optional[str] = None, *, embed=None, embeds=None, view=None, **kwargs):
+        self._respond()
+        self._interaction.record(content, embed, embeds, view)
+
+    async def defer(self, **kwargs):
+        self._respond()
+
+    async def send_modal(self, modal):
+        self._respond()
+
+
+class FakeFollowup:
+    def __init__(self, interaction: "FakeInteraction"):
+        self._interaction = interaction
+
+    async def send(self, content: Optional[str] = None, *, embed=None, embeds=None, view=None, **kwargs):
+        return self._interaction.record(content, embed, embeds, view)
+
+
+class FakeInteraction:
+    type = discord.InteractionType.application_command
+
+    def __init__(self, bot, guild: FakeGuild, user: FakeMember, name: str = ""):
+        self.id = next(_ids)
+        self.client = bot
+        self.guild = guild
+        self.guild_id = guild.id
+        self.user = user
+        self.channel = guild.text_channels[0]
+        self.channel_id = self.channel.id
+        self.data = {"name": name}
+        self.created_at = discord.utils.utcnow()
+        self.response = FakeResponse(self)
+        self.followup = FakeFollowup(self)
+        self.messages: List[FakeMessage] = []
+
+    def record(self, content, embed=None, embeds=None, view=None) -> FakeMessage:
+        message = FakeMessage(self.channel, content, [embed] if embed is not None else embeds, view)
+        self.messages.append(message)
+        return message
+
+    async def original_response(self) -> FakeMessage:
+        return self.messages[0] if self.messages else self.record(None)
+
+    async def edit_original_response(self, content=None, *, embed=None, embeds=None, view=None, **kwargs):
+        return await (await self.original_response()).edit(content, embed=embed, embeds=embeds, view=view)
+
+    @property
+    def permissions(self) -> discord.Permissions:
+        return self.user.guild_permissions
+
+    @property
+    def rejected(self) -> bool:
+        """The command answered with an error message (the repo's "❌ ..." replies)"""
+        first = self.messages[0] if self.messages else None
+        if first is None:
+            return False
+        text = first.content or (first.embeds[0].title if first.embeds and first.embeds[0] else "") or ""
+        return text.startswith("❌")
+
+
+class OfflineBot:
+    """The real cogs in a bot that never connects; use as `async with OfflineBot(db) as offline:`.
+
+    samples holds every invocation as (ms, db_ops) per command; rejected counts
+    "❌" answers and failed checks, failed counts exceptions.
+    """
+
+    def __init__(self, db, quiet: bool = True):
+        self.bot = commands.Bot(command_prefix=None, help_command=None, tree_cls=InstrumentedCommandTree,
+                                **gateway_options())
+        self.bot.db = InstrumentedDatabase(db, metrics)
+        self.bot.owner_id = next(_ids)  # Nobody: is_owner() would otherwise ask Discord for the application
+        self.raw_db = db  # Harness bookkeeping that shouldn't count as bot traffic
+        self.quiet = quiet
+        self.samples: Dict[str, List[tuple]] = defaultdict(list)
+        self.rejected = Counter()
+        self.failed = Counter()
+        self.errors: Dict[str, str] = {}
+        self._devnull = None
+
+    async def __aenter__(self):
+        if self.quiet:
+            self._devnull = open(os.devnull, "w")
+            self._redirect = contextlib.redirect_stdout(self._devnull)
+            self._redirect.__enter__()
+        await self.bot.__aenter__()
+        report = await load_extensions(self.bot, core=["cogs.metrics"],
+                                       extensions=[name for name in EXTENSIONS if name not in SKIPPED_EXTENSIONS])
+        if report.failed:
+            raise RuntimeError(f"Extensions failed to load: {', '.join(report.failed)}")
+        for cog in self.bot.cogs.values():
+            for value in vars(cog).values():
+                if isinstance(value, tasks.Loop):
+                    value.cancel()  # Benchmarks run loop bodies themselves
+        await asyncio.sleep(0)
+        # Drop whatever the loops managed to record while loading
+        metrics.windows.clear()
+        metrics.db_totals.clear()
+        return self
+
+    async def __aexit__(self, *exc_info):
+        try:
+            for name in list(self.bot.extensions):
+                await self.bot.unload_extension(name)
+            await self.bot.__aexit__(*exc_info)
+        finally:
+            if self._devnull:
+                self._redirect.__exit__(*exc_info)
+                self._devnull.close()
+
+    def add_guild(self, guild: FakeGuild):
+        # bot.guilds and bot.get_guild read the connection state's guild map
+        self.bot._connection._guilds[guild.id] = guild
+
+    def cog(self, name: str):
+        return self.bot.get_cog(name)
+
+    def command(self, qualified_name: str) -> app_commands.Command:
+        """A slash command by its full name, e.g. "time admin reset_cycle" """
+        first, *rest = qualified_name.split()
+        command = self.bot.tree.get_command(first)
+        for name in rest:
+            command = command.get_command(name) if isinstance(command, app_commands.Group) else None
+        if not isinstance(command, app_commands.Command):
+            raise KeyError(f"No slash command named {qualified_name!r}")
+        return command
+
+    async def invoke(self, qualified_name: str, guild: FakeGuild, user: FakeMember, **options) -> FakeInteraction:
+        command = self.command(qualified_name)
+        interaction = FakeInteraction(self.bot, guild, user, qualified_name)
+        # Options arrive already resolved (members, channels), keyed by parameter name; the tree keys them by display name
+        names = {param.name: param.display_name for param in command._params.values()}
+        namespace = SimpleNamespace(**{names.get(name, name): value for name, value in options.items()})
+        await self._run(qualified_name, interaction, lambda: command._invoke_with_namespace(interaction, namespace))
+        return interaction
+
+    async def choose(self, message: FakeMessage, user: FakeMember, name: str, index: int = 0) -> FakeInteraction:
+        """Pick an option (index wraps around) in the first select of the message's view, recorded under `name`"""
+        select = next(item for item in message.view.children if isinstance(item, discord.ui.Select))
+        select._values = [select.options[index % len(select.options)].value]
+        interaction = FakeInteraction(self.bot, message.guild, user, name)
+        interaction.type = discord.InteractionType.component
+        await self._run(name, interaction, lambda: select.callback(interaction))
+        return interaction
+
+    async def _run(self, name: str, interaction: FakeInteraction, call):
+        """Await call() under the command's metrics scope; any exception, even building the call, counts as failed"""
+        start = time.perf_counter()
+        try:
+            with metrics.track("command", name) as scope:
+                await call()
+        except app_commands.CheckFailure:
+            self.rejected[name] += 1  # e.g. a non-admin replaying an admin command
+        except Exception as e:
+            self.failed[name] += 1
+            self.errors.setdefault(name, f"{type(e).__name__}: {e}")
+        else:
+            if interaction.rejected:
+                self.rejected[name] += 1
+        self.samples[name].append(((time.perf_counter() - start) * 1000, scope.db_ops))
+
+    async def tick(self, cog_name: str, loop_name: str):
+        """One iteration of a background loop's body, recorded by its timed_loop"""
+        cog = self.bot.get_cog(cog_name)
+        await getattr(type(cog), loop_name).coro(cog)
+
+
+percentile = LatencyWindow._percentile  # Nearest rank, same as the metrics summaries
+
+
+def command_table(offline: OfflineBot) -> List[str]:
+    """Per-command latency and DB round trips, slowest p95 first"""
+    lines = [f"{'command':<44}{'count':>7}{'rejected':>9}{'errors':>7}{'p50 ms':>9}{'p95 ms':>9}"
+             f"{'p99 ms':>9}{'max ms':>9}{'db ops':>8}"]
+    rows = []
+    for name, samples in offline.samples.items():
+        ordered = sorted(ms for ms, _ in samples)
+        rows.append((percentile(ordered, 0.95), name, samples, ordered))
+    for p95, name, samples, ordered in sorted(rows, reverse=True):
+        db_ops = sum(ops for _, ops in samples) / len(samples)
+        lines.append(f"{name:<44}{len(samples):>7}{offline.rejected[name]:>9}{offline.failed[name]:>7}"
+                     f"{percentile(ordered, 0.5):>9.2f}{p95:>9.2f}{percentile(ordered, 0.99):>9.2f}"
+                     f"{ordered[-1]:>9.2f}{db_ops:>8.1f}")
+    for name, error in offline.errors.items():
+        lines.append(f"  {name} raised {error}")
+    return lines
+
+
+def loop_table() -> List[str]:
+    """Background loop iterations as recorded by timed_loop"""
+    lines = [f"{'loop':<44}{'ticks':>7}{'p50 ms':>9}{'p95 ms':>9}{'max ms':>9}{'db ops':>8}"]
+    for (kind, name), window in sorted(metrics.windows.items()):
+        if kind != "loop":
+            continue
+        ordered = sorted(window.samples)
+        lines.append(f"{name:<44}{window.count:>7}{percentile(ordered, 0.5):>9.2f}"
+                     f"{percentile(ordered, 0.95):>9.2f}{ordered[-1] if ordered else 0:>9.2f}"
+                     f"{window.mean_db_ops():>8.1f}")
+    return lines
@@ -0,0 +1,118 @@
+"""Bytes transferred by candidate lookups: whole guild documents vs server-side $filter.
+
+Usage (from the repository root, against a scratch MongoDB):
+    MONGO_URI=mongodb://localhost:27017 python -m benchmarks.query_bytes [--years 10] [--per-year 400]
+
+Seeds winners/signups documents with several cycles of candidates, then runs the
+hot lookups (user, name, seat, autocomplete) both ways. A command listener adds
+up the BSON size of every server reply, so the numbers are what actually crossed
+the wire, not what Python kept.
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import bson
+from pymongo import MongoClient, monitoring
+
+from cogs.queries import find_entries, find_entry
+
+GUILD_ID = 1
+CURRENT_YEAR = 2001
+
+
+class ReplyBytes(monitoring.CommandListener):
+    def __init__(self):
+        self.bytes = 0
+        self.round_trips = 0
+
+    def started(self, event):
+        pass
+
+    def succeeded(self, event):
+        self.bytes += len(bson.encode(event.reply))
+        self.round_trips += 1
+
+    def failed(self, event):
+        self.round_trips += 1
+
+
+def seed(db, years: int, per_year: int):
+    db["winners"].delete_many({})
+    db["signups"].delete_many({})
+    entries = []
+    for year in range(CURRENT_YEAR - years + 1, CURRENT_YEAR + 1):
+        for i in range(per_year):
+            entries.append({
+                "year": year, "user_id": i, "candidate": f"Candidate {year}-{i}", "name": f"Candidate {year}-{i}",
+                "office": "Senate", "state": "Columbia", "seat_id": f"SEN-{i % 100}", "party": "Democrat",
+                "points": 0.0, "stamina": 100, "corruption": 0, "primary_winner": i % 2 == 0,
+                "state_points": {f"STATE{k}": 0.0 for k in range(10)},
+            })
+    db["winners"].insert_one({"guild_id": GUILD_ID, "winners": entries})
+    db["signups"].insert_one({"guild_id": GUILD_ID, "candidates": entries})
+
+
+def legacy_lookups(db):
+    winners = db["winners"].find_one({"guild_id": GUILD_ID})["winners"]
+    user = next(w for w in winners if w["user_id"] == 42 and w["year"] == CURRENT_YEAR and w["primary_winner"])
+    winners = db["winners"].find_one({"guild_id": GUILD_ID})["winners"]
+    name = next(w for w in winners if w["candidate"].lower() == f"candidate {CURRENT_YEAR}-42" and w["year"] == CURRENT_YEAR)
+    winners = db["winners"].find_one({"guild_id": GUILD_ID})["winners"]
+    seat = [w for w in winners if w["seat_id"] == "SEN-42" and w["year"] == CURRENT_YEAR]
+    candidates = db["signups"].find_one({"guild_id": GUILD_ID})["candidates"]
+    names = [c["name"] for c in candidates if c["year"] == CURRENT_YEAR and "-4" in c["name"].lower()][:25]
+    return user, name, seat, names
+
+
+def filtered_lookups(db):
+    user = find_entry(db["winners"], GUILD_ID, "winners",
+                      {"user_id": 42, "year": CURRENT_YEAR, "primary_winner": True})
+    name = find_entry(db["winners"], GUILD_ID, "winners",
+                      {"candidate": f"Candidate {CURRENT_YEAR}-42", "year": CURRENT_YEAR}, ignore_case=("candidate",))
+    seat = find_entries(db["winners"], GUILD_ID, "winners", {"seat_id": "SEN-42", "year": CURRENT_YEAR})
+    names = [c["name"] for c in find_entries(db["signups"], GUILD_ID, "candidates", {"year": CURRENT_YEAR},
+                                             contains={"name": "-4"}, limit=25, fields=("name",))]
+    return user, name, seat, names
+
+
+def measure(label: str, func, db, listener: ReplyBytes, rounds: int):
+    listener.bytes = listener.round_trips = 0
+    start = time.perf_counter()
+    for _ in range(rounds):
+        result = func(db)
+    elapsed_ms = (time.perf_counter() - start) * 1000 / rounds
+    print(f"{label:<10}{listener.bytes / rounds / 1024:>12.1f} KiB{listener.round_trips / rounds:>8.1f}{elapsed_ms:>10.1f} ms")
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--years", type=int, default=10)
+    parser.add_argument("--per-year", type=int, default=400)
+    parser.add_argument("--rounds", type=int, default=20)
+    args = parser.parse_args()
+
+    listener = ReplyBytes()
+    client = MongoClient(os.getenv("MONGO_URI", "mongodb://localhost:27017"), event_listeners=[listener])
+    db = client[os.getenv("BENCH_DB", "election_bot_bench")]
+    seed(db, args.years, args.per_year)
+
+    print(f"{args.years} years x {args.per_year} candidates, 4 lookups per round")
+    print(f"{'':<10}{'per round':>16}{'trips':>8}{'latency':>13}")
+    legacy = measure("legacy", legacy_lookups, db, listener, args.rounds)
+    filtered = measure("$filter", filtered_lookups, db, listener, args.rounds)
+
+    # Same answers both ways
+    assert legacy[0]["user_id"] == filtered[0]["user_id"]
+    assert legacy[1]["candidate"] == filtered[1]["candidate"]
+    assert len(legacy[2]) == len(filtered[2])
+    assert legacy[3] == filtered[3]
+    print("OK: both paths return the same candidates")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,223 @@
+"""Load generator: replays a recorded slash command trace against the real cogs.
+
+Usage (from the repository root; in-memory mongomock, or MONGO_URI/BENCH_DB):
+    python -m benchmarks.replay traffic_trace.jsonl [--speed 10] [--skip 3600] [--duration 600] [--no-loops]
+    MONGO_URI=mongodb://localhost:27017 BENCH_DB=election_bot_copy python -m benchmarks.replay trace.jsonl --keep-data
+
+Record a trace in production with TRAFFIC_TRACE=1 or /admincentral system
+traffic_trace start (see cogs/traffic_trace.py). Each command is fired at its
+recorded offset divided by --speed as its own task, the way the gateway hands
+over interactions, against an offline bot (benchmarks.offline) holding one fake
+guild and member per recorded id. Unless --no-loops, the time and delegate
+loops tick at their real intervals divided by --speed.
+
+For realistic answers, restore a copy of the production database and pass
+--keep-data (the replay writes to it). On an empty stand-in most commands stop
+at "not a candidate" checks, which still shows dispatch overhead and contention
+but not the heavy paths.
+
+Reports per command: service time and DB round trips, and a histogram of the
+response time users saw (waiting to start plus service). Also the event loop
+lag, sampled every 50ms: how late a sleeping task wakes up while commands
+block the loop.
+"""
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+from collections import Counter, defaultdict
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from discord import AppCommandOptionType
+
+from benchmarks.offline import FakeGuild, OfflineBot, command_table, loop_table, percentile, stand_in_database
+
+HISTOGRAM_MS = [5, 10, 25, 50, 100, 250, 500, 1000, 2500]
+LAG_INTERVAL = 0.05
+LOOPS = [("TimeManager", "time_loop", 60), ("Delegates", "delegate_check_loop", 300)]  # Real interval in seconds
+
+
+def load_trace(path: str, skip: float, duration: float, limit: int) -> list:
+    with open(path, encoding="utf-8") as f:
+        events = [json.loads(line) for line in f if line.strip()]
+    events = [event for event in events if event.get("guild_id")]  # The bot has no DM commands
+    events.sort(key=lambda event: event["at"])
+    if not events:
+        return []
+    start = events[0]["at"] + skip
+    end = start + duration if duration else float("inf")
+    events = [event for event in events if start <= event["at"] < end]
+    return events[:limit] if limit else events
+
+
+class Population:
+    """Fake guilds and members for the recorded ids, created on first sight"""
+
+    def __init__(self, offline: OfflineBot):
+        self.offline = offline
+        self.guilds = {}
+
+    def guild(self, guild_id: int) -> FakeGuild:
+        guild = self.guilds.get(guild_id)
+        if guild is None:
+            guild = self.guilds[guild_id] = FakeGuild(f"Guild {guild_id}", guild_id)
+            self.offline.add_guild(guild)
+            # Same documents a guild's first command creates; kept as they are when the data is restored
+            self.offline.cog("TimeManager")._get_time_config(guild_id)
+            self.offline.cog("Elections")._get_elections_config(guild_id)
+        return guild
+
+    def member(self, guild: FakeGuild, user_id: int, administrator: bool = False):
+        return guild.members.get(user_id) or guild.add_member(f"User {user_id}", administrator, user_id)
+
+    def arguments(self, command, guild: FakeGuild, options: dict) -> dict:
+        """Recorded option values as the callback's keyword arguments"""
+        params = {getattr(param, "display_name", param.name): param for param in command._params.values()}
+        kwargs = {}
+        for name, value in options.items():
+            param = params.get(name)
+            if param is None:
+                continue  # Option removed since the trace was recorded
+            if param.type in (AppCommandOptionType.user, AppCommandOptionType.mentionable):
+                value = self.member(guild, int(value))
+            elif param.type == AppCommandOptionType.channel:
+                value = guild.get_channel(int(value)) or guild.text_channels[0]
+            elif param.type == AppCommandOptionType.role:
+                value = SimpleNamespace(id=int(value), name=f"Role {value}", mention=f"<@&{value}>")
+            elif param.type == AppCommandOptionType.attachment:
+                continue
+            kwargs[param.name] = value
+        return kwargs
+
+
+class Replay:
+    def __init__(self, offline: OfflineBot, speed: float):
+        self.offline = offline
+        self.speed = speed
+        self.population = Population(offline)
+        self.responses = defaultdict(list)  # command -> response times (ms) as users saw them
+        self.waits = []  # ms between a command's due time and its start
+        self.lag = []
+        self.unknown = Counter()
+
+    async def fire(self, event: dict, due: float):
+        started = time.perf_counter()
+        wait_ms = (started - due) * 1000
+        self.waits.append(wait_ms)
+        name = event["command"]
+        try:
+            command = self.offline.command(name)
+        except KeyError:
+            self.unknown[name] += 1
+            return
+        guild = self.population.guild(event["guild_id"])
+        user = self.population.member(guild, event["user_id"], event.get("admin", False))
+        await self.offline.invoke(name, guild, user, **self.population.arguments(command, guild, event["options"]))
+        self.responses[name].append(wait_ms + (time.perf_counter() - started) * 1000)
+
+    async def watch_lag(self):
+        while True:
+            start = time.perf_counter()
+            await asyncio.sleep(LAG_INTERVAL)
+            self.lag.append((time.perf_counter() - start - LAG_INTERVAL) * 1000)
+
+    async def run_loop(self, cog_name: str, loop_name: str, interval: float):
+        while True:
+            await asyncio.sleep(interval / self.speed)
+            await self.offline.tick(cog_name, loop_name)
+
+    async def play(self, events: list, loops: bool) -> float:
+        for guild_id in {event["guild_id"] for event in events}:
+            self.population.guild(guild_id)
+        background = [asyncio.create_task(self.watch_lag())]
+        if loops:
+            background += [asyncio.create_task(self.run_loop(*loop)) for loop in LOOPS]
+
+        first = events[0]["at"]
+        start = time.perf_counter()
+        fired = []
+        for event in events:
+            due = start + (event["at"] - first) / self.speed
+            delay = due - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            fired.append(asyncio.create_task(self.fire(event, due)))
+        await asyncio.gather(*fired)
+        elapsed = time.perf_counter() - start
+
+        for task in background:
+            task.cancel()
+        await asyncio.gather(*background, return_exceptions=True)
+        return elapsed
+
+
+def histogram_table(responses: dict) -> list:
+    edges = [f"<={edge}" for edge in HISTOGRAM_MS] + [f">{HISTOGRAM_MS[-1]}"]
+    lines = [f"{'response time (ms)':<44}" + "".join(f"{edge:>7}" for edge in edges)]
+    for name, samples in sorted(responses.items(), key=lambda item: -len(item[1])):
+        counts = [0] * len(edges)
+        for ms in samples:
+            counts[next((i for i, edge in enumerate(HISTOGRAM_MS) if ms <= edge), len(HISTOGRAM_MS))] += 1
+        lines.append(f"{name:<44}" + "".join(f"{count:>7}" for count in counts))
+    return lines
+
+
+def spread(label: str, samples: list) -> str:
+    ordered = sorted(samples)
+    return (f"{label}: p50 {percentile(ordered, 0.5):.1f}ms, p95 {percentile(ordered, 0.95):.1f}ms, "
+            f"p99 {percentile(ordered, 0.99):.1f}ms, max {ordered[-1] if ordered else 0:.1f}ms ({len(ordered)} samples)")
+
+
+async def run(args) -> list:
+    events = load_trace(args.trace, args.skip, args.duration, args.limit)
+    if not events:
+        return [f"No commands in {args.trace} for that window"]
+    db, label = stand_in_database(drop=not args.keep_data)
+
+    async with OfflineBot(db, quiet=not args.verbose) as offline:
+        replay = Replay(offline, args.speed)
+        elapsed = await replay.play(events, loops=not args.no_loops)
+        span = events[-1]["at"] - events[0]["at"]
+        users = len({(event["guild_id"], event["user_id"]) for event in events})
+        lines = [
+            f"{len(events)} commands ({span:.0f}s of traffic, {len(replay.population.guilds)} guilds, {users} users) "
+            f"at {args.speed:g}x in {elapsed:.1f}s, {label}",
+            "",
+            *command_table(offline),
+            "",
+            *histogram_table(replay.responses),
+            "",
+            *loop_table(),
+            "",
+            spread("waiting to start", replay.waits),
+            spread("event loop lag", replay.lag),
+        ]
+        if replay.unknown:
+            lines.append("not in this bot's command tree: " + ", ".join(f"{name} ({count})" for name, count in replay.unknown.items()))
+    return lines
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("trace", help="JSON lines written by the traffic recorder")
+    parser.add_argument("--speed", type=float, default=1.0, help="Replay speed, e.g. 1 to 50")
+    parser.add_argument("--skip", type=float, default=0, help="Seconds of the trace to skip")
+    parser.add_argument("--duration", type=float, default=0, help="Seconds of the trace to replay (0: all)")
+    parser.add_argument("--limit", type=int, default=0, help="Most commands to replay (0: all)")
+    parser.add_argument("--keep-data", action="store_true", help="Don't drop BENCH_DB first (restored production copy)")
+    parser.add_argument("--no-loops", action="store_true", help="Don't run the time and delegate loops")
+    parser.add_argument("--verbose", action="store_true", help="Keep the cogs' own output")
+    args = parser.parse_args()
+    if args.speed <= 0:
+        parser.error("--speed must be positive")
+
+    for line in asyncio.run(run(args)):
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""Reply routing benchmark: ReplyRouter vs one bot.wait_for check per pending prompt.
+
+Usage (from the repository root):
+    python -m benchmarks.reply_router [--pending 5000] [--messages 20000]
+
+Simulates a busy server: thousands of speech prompts waiting for replies while
+ordinary chat messages (and the occasional reply) stream in.
+"""
+import argparse
+import asyncio
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cogs.reply_router import ReplyRouter
+
+
+class FakeAuthor:
+    def __init__(self, user_id):
+        self.id = user_id
+        self.bot = False
+
+
+class FakeReference:
+    def __init__(self, message_id):
+        self.message_id = message_id
+
+
+class FakeMessage:
+    def __init__(self, author_id, reference_id=None, attachments=0):
+        self.author = FakeAuthor(author_id)
+        self.reference = FakeReference(reference_id) if reference_id else None
+        self.attachments = [object()] * attachments
+
+
+def make_traffic(pending: int, messages: int, reply_ratio: float):
+    prompts = [(1_000_000 + i, 10_000 + i) for i in range(pending)]  # (prompt message id, user id)
+    traffic = []
+    for _ in range(messages):
+        if random.random() < reply_ratio:
+            prompt_id, user_id = random.choice(prompts)
+            traffic.append(FakeMessage(user_id, prompt_id))
+        else:
+            traffic.append(FakeMessage(random.randint(1, 10_000)))
+    return prompts, traffic
+
+
+def bench_wait_for(prompts, traffic):
+    """What discord.py does today: every listener's check runs against every message"""
+    checks = []
+    for prompt_id, user_id in prompts:
+        def check(message, prompt_id=prompt_id, user_id=user_id):
+            return (message.author.id == user_id and
+                    message.reference and
+                    message.reference.message_id == prompt_id)
+        checks.append(check)
+
+    start = time.perf_counter()
+    resolved = 0
+    for message in traffic:
+        for i, check in enumerate(checks):
+            if check(message):
+                del checks[i]  # wait_for removes its listener once resolved
+                resolved += 1
+                break
+    return time.perf_counter() - start, resolved
+
+
+async def bench_router(prompts, traffic):
+    router = ReplyRouter(bot=None)  # Not added to a bot: the expiry task is driven by hand below
+    futures = [router.register(prompt_id, user_id, timeout=300.0) for prompt_id, user_id in prompts]
+
+    start = time.perf_counter()
+    resolved = 0
+    for message in traffic:
+        if router.dispatch(message):
+            resolved += 1
+    elapsed = time.perf_counter() - start
+
+    expire_start = time.perf_counter()
+    expired = router.expire(now=router.wheel.last_tick + 301)
+    expire_elapsed = time.perf_counter() - expire_start
+    await asyncio.sleep(0)  # Let done-callbacks clear the table
+    for future in futures:
+        if future.done() and not future.cancelled():
+            future.exception()  # Mark timeouts as retrieved
+    return elapsed, resolved, expired, expire_elapsed, len(router.pending)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pending", type=int, default=5000)
+    parser.add_argument("--messages", type=int, default=20000)
+    parser.add_argument("--reply-ratio", type=float, default=0.05)
+    args = parser.parse_args()
+
+    random.seed(42)
+    prompts, traffic = make_traffic(args.pending, args.messages, args.reply_ratio)
+
+    print(f"{args.pending} pending prompts, {args.messages} messages ({args.reply_ratio:.0%} replies)")
+    old_elapsed, old_resolved = bench_wait_for(prompts, traffic)
+    print(f"wait_for checks : {old_elapsed * 1000:9.1f} ms  ({old_elapsed / args.messages * 1e6:8.2f} us/message, {old_resolved} resolved)")
+
+    new_elapsed, new_resolved, expired, expire_elapsed, left = asyncio.run(bench_router(prompts, traffic))
+    print(f"ReplyRouter     : {new_elapsed * 1000:9.1f} ms  ({new_elapsed / args.messages * 1e6:8.2f} us/message, {new_resolved} resolved)")
+    print(f"timer wheel     : expired {expired} prompts in {expire_elapsed * 1000:.1f} ms, {left} left in the table")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+"""Multi-process sharding harness: background-loop throughput vs process count.
+
+Usage (from the repository root, against a scratch MongoDB):
+    MONGO_URI=mongodb://localhost:27017 python -m benchmarks.sharding [--guilds 400] [--shards 8] [--processes 1 2 4]
+
+Seeds momentum/time configs for --guilds guilds spread over --shards shards, then
+for each process count splits the shard range evenly (SHARD_IDS "0-3", "4-7", ...)
+and runs that many worker processes for --seconds. Each worker plays one sharded
+bot: it repeatedly runs the real Momentum decay loop body over its own guilds only
+(local_guilds_filter) and competes for a short leader lease. The table shows guild
+passes per second overall, and the lease checks that exactly one worker led at
+any moment.
+"""
+import argparse
+import asyncio
+import contextlib
+import multiprocessing
+import os
+import sys
+import time
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pymongo import MongoClient
+
+from cogs.momentum import Momentum
+from cogs.sharding import LeaderLease, process_holder_id, shard_for_guild
+
+LEASE_TTL = 2
+LEASE_NAME = "bench"
+PARTIES = ["Republican", "Democrat", "Independent"]
+STATES = [f"STATE{k}" for k in range(50)]
+
+
+def seed(db, guilds: int):
+    for name in ("momentum_config", "time_configs", "leases"):
+        db[name].delete_many({})
+    guild_ids = [(i << 22) | 12345 for i in range(1, guilds + 1)]  # Snowflake-shaped, shard = i % shards
+    db["time_configs"].insert_many([{"guild_id": g, "current_phase": "General Campaign"} for g in guild_ids])
+    db["momentum_config"].insert_many([{
+        "guild_id": g,
+        "settings": {"momentum_decay_rate": 0.999},  # Slow decay: every pass still has work to do
+        "state_momentum": {state: {party: 1e6 for party in PARTIES} for state in STATES},
+        "momentum_events": [],
+    } for g in guild_ids])
+    return guild_ids
+
+
+def split_shards(shard_count: int, processes: int):
+    per_process = -(-shard_count // processes)
+    return [list(range(start, min(start + per_process, shard_count))) for start in range(0, shard_count, per_process)]
+
+
+def worker(uri: str, db_name: str, shard_ids, shard_count: int, seconds: float, start_at: float, results):
+    db = MongoClient(uri)[db_name]
+    guild_ids = [c["guild_id"] for c in db["time_configs"].find({}, {"guild_id": 1})
+                 if shard_for_guild(c["guild_id"], shard_count) in shard_ids]
+    bot = SimpleNamespace(db=db, shard_ids=shard_ids, shard_count=shard_count,
+                          guilds=[SimpleNamespace(id=g) for g in guild_ids], get_cog=lambda name: None)
+    cog = Momentum.__new__(Momentum)  # Skip __init__: it starts the real loop
+    cog.bot = bot
+    lease = LeaderLease(db["leases"], LEASE_NAME, process_holder_id(bot), ttl=LEASE_TTL)
+
+    time.sleep(max(0.0, start_at - time.time()))
+    deadline = time.time() + seconds
+    passes = 0
+    led = []  # (checked_at, is_leader)
+    next_lease_check = 0.0
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        while time.time() < deadline:
+            if time.time() >= next_lease_check:
+                led.append((time.time(), lease.try_acquire()))
+                next_lease_check = time.time() + LEASE_TTL / 3
+            asyncio.run(Momentum.momentum_decay_loop.coro(cog))
+            passes += 1
+    if led and led[-1][1]:
+        lease.release()
+    results.put({"shard_ids": shard_ids, "guilds": len(guild_ids), "passes": passes, "led": led})
+
+
+def run(uri: str, db_name: str, shard_count: int, processes: int, seconds: float):
+    ctx = multiprocessing.get_context("spawn")
+    results = ctx.Queue()
+    start_at = time.time() + 3  # Let every worker connect first
+    workers = [ctx.Process(target=worker, args=(uri, db_name, shard_ids, shard_count, seconds, start_at, results))
+               for shard_ids in split_shards(shard_count, processes)]
+    for process in workers:
+        process.start()
+    reports = [results.get() for _ in workers]
+    for process in workers:
+        process.join()
+    return reports
+
+
+def leader_overlaps(reports) -> int:
+    """Lease checks where two workers both believed they led within one TTL of each other"""
+    claims = sorted((t, i) for i, report in enumerate(reports) for t, leader in report["led"] if leader)
+    return sum(1 for (t1, a), (t2, b) in zip(claims, claims[1:]) if a != b and t2 - t1 < LEASE_TTL - 0.5)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--guilds", type=int, default=400)
+    parser.add_argument("--shards", type=int, default=8)
+    parser.add_argument("--processes", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--seconds", type=float, default=10)
+    args = parser.parse_args()
+
+    uri = os.getenv("MONGO_URI", "mongodb://localhost:27017")
+    db_name = os.getenv("BENCH_DB", "election_bot_bench")
+
+    print(f"{args.guilds} guilds on {args.shards} shards, {args.seconds:g}s per run")
+    print(f"{'processes':>10}{'guild passes/s':>16}{'speedup':>9}{'leaders':>9}{'overlaps':>10}")
+    baseline = None
+    for processes in args.processes:
+        seed(MongoClient(uri)[db_name], args.guilds)
+        reports = run(uri, db_name, args.shards, processes, args.seconds)
+        assert sum(r["guilds"] for r in reports) == args.guilds, "every guild owned by exactly one worker"
+        throughput = sum(r["guilds"] * r["passes"] for r in reports) / args.seconds
+        baseline = baseline or throughput
+        leaders = sum(1 for r in reports if any(leader for _, leader in r["led"]))
+        overlaps = leader_overlaps(reports)
+        print(f"{processes:>10}{throughput:>16.1f}{throughput / baseline:>8.2f}x{leaders:>9}{overlaps:>10}")
+        assert overlaps == 0, "two workers held the leader lease at once"
+
+
+if __name__ == "__main__":
+    main()
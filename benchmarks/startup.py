@@ -0,0 +1,69 @@
+"""Startup benchmark: loads every extension the way main.py does and prints the breakdown.
+
+Usage (from the repository root):
+    python -m benchmarks.startup [--sequential]
+
+No Discord token is needed; the bot never connects to the gateway. The database
+readiness probe is awaited separately so its latency shows up on its own line.
+"""
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import discord
+from discord.ext import commands
+from dotenv import load_dotenv
+
+from startup import CORE_EXTENSIONS, EXTENSIONS, StartupReport, load_extensions
+
+
+async def run(sequential: bool):
+    intents = discord.Intents.default()
+    intents.members = True
+    intents.message_content = True
+    bot = commands.Bot(command_prefix=None, intents=intents, help_command=None)
+
+    async with bot:
+        if sequential:
+            # Baseline: one extension after another, like the old main.py
+            report = StartupReport()
+            start = time.perf_counter()
+            for name in CORE_EXTENSIONS + EXTENSIONS:
+                sub_report = await load_extensions(bot, core=[name], extensions=[])
+                report.timings.update(sub_report.timings)
+                report.failed.update(sub_report.failed)
+            report.total_ms = (time.perf_counter() - start) * 1000
+        else:
+            report = await load_extensions(bot)
+
+        print()
+        print(report.format())
+
+        db_cog = bot.get_cog("Db")
+        if db_cog is not None:
+            probe_start = time.perf_counter()
+            try:
+                await asyncio.wait_for(db_cog.ready.wait(), timeout=10)
+                print(f"{'database readiness probe':<34}{'':>20}{db_cog.ping_ms:>8.1f}ms")
+            except asyncio.TimeoutError:
+                waited = (time.perf_counter() - probe_start) * 1000
+                print(f"{'database readiness probe':<34}{'':>20}  not ready after {waited:.0f}ms")
+
+        for name in list(bot.extensions):
+            await bot.unload_extension(name)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sequential", action="store_true", help="load extensions one at a time for comparison")
+    args = parser.parse_args()
+    load_dotenv()
+    asyncio.run(run(args.sequential))
+
+
+if __name__ == "__main__":
+    main()
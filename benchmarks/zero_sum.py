@@ -0,0 +1,43 @@
+"""Zero-sum kernel benchmark.
+
+Usage (from the repository root):
+    python -m benchmarks.zero_sum [--seats 60] [--rounds 20]
+
+Times the shared kernel against the sequential loop it replaced for 2-20
+candidates per seat across a guild's worth of seats. tests/test_zero_sum.py
+checks that both give the same shares on random seats.
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cogs.zero_sum import redistribute
+from tests.zero_sum_reference import legacy_redistribute, random_seat
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--seats", type=int, default=60)
+    parser.add_argument("--rounds", type=int, default=20)
+    args = parser.parse_args()
+
+    rng = random.Random(2)
+    print(f"{'candidates':>10} {'legacy ms':>10} {'kernel ms':>10} {'speedup':>8}  ({args.seats} seats)")
+    for candidates in (2, 3, 5, 10, 15, 20):
+        seats = [random_seat(rng, candidates) for _ in range(args.seats)]
+        timings = []
+        for func in (legacy_redistribute, redistribute):
+            start = time.perf_counter()
+            for _ in range(args.rounds):
+                for baselines, gains, floors in seats:
+                    func(baselines, gains, floors)
+            timings.append((time.perf_counter() - start) * 1000 / args.rounds)
+        print(f"{candidates:>10} {timings[0]:>10.3f} {timings[1]:>10.3f} {timings[0] / timings[1]:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
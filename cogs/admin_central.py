@@ -3,6 +3,11 @@ import discord
 from discord import app_commands
 from datetime import datetime, timedelta
 import inspect
+import asyncio
+import io
+from .archive import ARCHIVED_ARRAYS, archive_completed_cycles
+from .config_registry import configs
+from .guild_locks import guild_locks
 
 class AdminCentral(commands.Cog):
     """Centralized admin commands with role-based access control"""
@@ -183,6 +188,210 @@ class AdminCentral(commands.Cog):
         return [app_commands.Choice(name=col, value=col)
                 for col in collections if current.lower() in col.lower()][:25]
 
+    @admin_system_group.command(
+        name="metrics",
+        description="Show rolling latency percentiles and DB round trips per command or loop"
+    )
+    @app_commands.describe(
+        kind="What to show: command, autocomplete or loop",
+        limit="Number of rows to show (slowest p95 first)"
+    )
+    @app_commands.default_permissions(administrator=True)
+    @app_commands.checks.has_permissions(administrator=True)
+    async def admin_metrics(
+        self,
+        interaction: discord.Interaction,
+        kind: str = "command",
+        limit: int = 15
+    ):
+        metrics_cog = self.bot.get_cog("Metrics")
+        if not metrics_cog:
+            await interaction.response.send_message("❌ Metrics are not enabled on this bot.", ephemeral=True)
+            return
+
+        rows = metrics_cog.registry.summary(kind)[:max(1, min(limit, 25))]
+        if not rows:
+            await interaction.response.send_message(f"📊 No `{kind}` samples recorded yet.", ephemeral=True)
+            return
+
+        lines = [f"{'name':<28}{'n':>6}{'p50':>8}{'p95':>8}{'p99':>8}{'db':>6}"]
+        for row in rows:
+            lines.append(
+                f"{row['name'][:27]:<28}{row['count']:>6}{row['p50']:>7.0f}m{row['p95']:>7.0f}m"
+                f"{row['p99']:>7.0f}m{row['mean_db_ops']:>6.1f}"
+            )
+
+        embed = discord.Embed(
+            title=f"📊 {kind.title()} Latency",
+            description="```\n" + "\n".join(lines) + "\n```",
+            color=discord.Color.blue(),
+            timestamp=datetime.utcnow()
+        )
+        embed.set_footer(text="Latency in ms over the last 1000 samples • db = mean DB round trips")
+        await interaction.response.send_message(embed=embed, ephemeral=True)
+
+    @admin_metrics.autocomplete("kind")
+    async def metrics_kind_autocomplete(self, interaction: discord.Interaction, current: str):
+        kinds = ["command", "autocomplete", "loop"]
+        return [app_commands.Choice(name=kind, value=kind)
+                for kind in kinds if current.lower() in kind.lower()]
+
+    @admin_system_group.command(
+        name="db_profile",
+        description="Record every DB query per command and report the heaviest commands"
+    )
+    @app_commands.describe(
+        action="start, stop, report or reset",
+        explain="Run explain() on each query shape to find missing indexes (report only)"
+    )
+    @app_commands.default_permissions(administrator=True)
+    @app_commands.checks.has_permissions(administrator=True)
+    async def admin_db_profile(
+        self,
+        interaction: discord.Interaction,
+        action: str,
+        explain: bool = True
+    ):
+        metrics_cog = self.bot.get_cog("Metrics")
+        if not metrics_cog:
+            await interaction.response.send_message("❌ Metrics are not enabled on this bot.", ephemeral=True)
+            return
+        profiler = metrics_cog.registry.profiler
+
+        if action == "start":
+            profiler.start()
+            await interaction.response.send_message("🔬 DB profiling started. Every query is now recorded per command.", ephemeral=True)
+        elif action == "stop":
+            profiler.stop()
+            await interaction.response.send_message(f"⏹️ DB profiling stopped ({len(profiler.profiles)} interactions recorded).", ephemeral=True)
+        elif action == "reset":
+            profiler.reset()
+            await interaction.response.send_message("🗑️ DB profile cleared.", ephemeral=True)
+        elif action == "report":
+            await interaction.response.defer(ephemeral=True)
+            # explain() is a round trip per query shape - keep it off the event loop
+            report = await asyncio.to_thread(profiler.build_report, 25, explain)
+            await interaction.followup.send(
+                f"📄 DB profile ({len(profiler.profiles)} interactions, profiling {'on' if profiler.enabled else 'off'})",
+                file=discord.File(io.BytesIO(report.encode("utf-8")), filename="db_profile.txt"),
+                ephemeral=True
+            )
+        else:
+            await interaction.response.send_message("❌ Action must be start, stop, report or reset.", ephemeral=True)
+
+    @admin_db_profile.autocomplete("action")
+    async def db_profile_action_autocomplete(self, interaction: discord.Interaction, current: str):
+        actions = ["start", "stop", "report", "reset"]
+        return [app_commands.Choice(name=action, value=action)
+                for action in actions if current.lower() in action.lower()]
+
+    @admin_system_group.command(
+        name="traffic_trace",
+        description="Record incoming slash commands to a file for replay in the load generator (bot owner only)"
+    )
+    @app_commands.describe(action="start, stop or status")
+    @app_commands.default_permissions(administrator=True)
+    @app_commands.checks.has_permissions(administrator=True)
+    async def admin_traffic_trace(self, interaction: discord.Interaction, action: str):
+        # The recorder is process-wide and writes every guild's user ids and options to disk
+        if not await self.bot.is_owner(interaction.user):
+            await interaction.response.send_message(
+                "❌ Only the bot owner can record traffic traces, since they cover every guild.", ephemeral=True
+            )
+            return
+        metrics_cog = self.bot.get_cog("Metrics")
+        if not metrics_cog:
+            await interaction.response.send_message("❌ Metrics are not enabled on this bot.", ephemeral=True)
+            return
+        recorder = metrics_cog.registry.recorder
+
+        if action == "start":
+            try:
+                recorder.start()
+            except OSError as e:
+                await interaction.response.send_message(f"❌ Could not open `{recorder.path}`: {e}", ephemeral=True)
+                return
+            await interaction.response.send_message(
+                f"⏺️ Recording slash commands from every guild on this process to `{recorder.path}`.", ephemeral=True
+            )
+        elif action == "stop":
+            recorder.stop()
+            await interaction.response.send_message(
+                f"⏹️ Traffic trace stopped ({recorder.recorded} commands recorded).", ephemeral=True
+            )
+        elif action == "status":
+            state = "on" if recorder.enabled else "off"
+            await interaction.response.send_message(
+                f"📼 Traffic trace is {state}: {recorder.recorded} commands recorded to `{recorder.path}`.", ephemeral=True
+            )
+        else:
+            await interaction.response.send_message("❌ Action must be start, stop or status.", ephemeral=True)
+
+    @admin_traffic_trace.autocomplete("action")
+    async def traffic_trace_action_autocomplete(self, interaction: discord.Interaction, current: str):
+        actions = ["start", "stop", "status"]
+        return [app_commands.Choice(name=action, value=action)
+                for action in actions if current.lower() in action.lower()]
+
+    @admin_system_group.command(
+        name="archive_cycles",
+        description="Move signups and winners of finished election cycles into the yearly archives"
+    )
+    @app_commands.default_permissions(administrator=True)
+    @app_commands.checks.has_permissions(administrator=True)
+    async def admin_archive_cycles(self, interaction: discord.Interaction):
+        time_config = self.bot.db["time_configs"].find_one({"guild_id": interaction.guild.id})
+        if not time_config:
+            await interaction.response.send_message("❌ Election system not configured.", ephemeral=True)
+            return
+
+        # The active cycle starts in its (odd) signup year
+        current_year = time_config["current_rp_date"].year
+        keep_from_year = current_year if current_year % 2 == 1 else current_year - 1
+
+        await interaction.response.defer(ephemeral=True)
+        async with guild_locks.write(interaction.guild.id, *ARCHIVED_ARRAYS):
+            moved = await asyncio.to_thread(archive_completed_cycles, self.bot.db, interaction.guild.id, keep_from_year)
+
+        await self._log_admin_command(interaction, "archive_cycles", {"keep_from_year": keep_from_year, "moved": moved})
+        if not moved:
+            await interaction.followup.send(f"📦 Nothing to archive before {keep_from_year}.", ephemeral=True)
+            return
+        summary = "\n".join(f"• **{collection}**: {count} entries" for collection, count in moved.items())
+        await interaction.followup.send(
+            f"📦 Archived everything before {keep_from_year}:\n{summary}\n"
+            f"History views still show archived years.",
+            ephemeral=True
+        )
+
+    @admin_system_group.command(
+        name="cleanup_winners",
+        description="One-off: remove stray per-candidate documents from winners (bot owner only)"
+    )
+    @app_commands.default_permissions(administrator=True)
+    @app_commands.checks.has_permissions(administrator=True)
+    async def admin_cleanup_winners(self, interaction: discord.Interaction):
+        # The stray documents span every guild and block the collection-wide unique guild_id index
+        if not await self.bot.is_owner(interaction.user):
+            await interaction.response.send_message(
+                "❌ Only the bot owner can run this cleanup, since it covers every guild.", ephemeral=True
+            )
+            return
+
+        await interaction.response.defer(ephemeral=True)
+        # Per-candidate documents presidential campaign actions used to upsert next to the guild
+        # documents; nothing reads them
+        col = self.bot.db["winners"]
+        removed = (await asyncio.to_thread(col.delete_many, {"user_id": {"$exists": True}})).deleted_count
+        indexed = await asyncio.to_thread(configs.ensure_index, col, True)
+
+        await self._log_admin_command(interaction, "cleanup_winners", {"removed": removed, "indexed": indexed})
+        index_text = ("The unique guild_id index is in place." if indexed
+                      else "⚠️ The unique guild_id index still can't be created; see the bot log for the duplicates.")
+        await interaction.followup.send(
+            f"🧹 Removed {removed} stray per-candidate documents from winners. {index_text}", ephemeral=True
+        )
+
     # ELECTION COMMANDS
     @admin_election_group.command(
         name="set_seats",
@@ -483,6 +692,12 @@ class AdminCentral(commands.Cog):
             upsert=True
         )
 
+        # Transitions after the new date can happen again
+        time_cog = self.bot.get_cog("TimeManager")
+        if time_cog:
+            time_cog.journal.forget(interaction.guild.id, new_date)
+            time_cog._voice_clock_changed(interaction.guild.id)
+
         await self._log_admin_command(interaction, "set_current_time", {"year": year, "month": month, "day": day})
 
         await interaction.response.send_message(
@@ -781,15 +996,10 @@ class AdminCentral(commands.Cog):
             return
 
         col = self.bot.db["presidential_winners"]
-        config = col.find_one({"guild_id": interaction.guild.id})
-        if not config:
-            config = {"guild_id": interaction.guild.id, "winners": {}}
-            col.insert_one(config)
-
-        config["winners"][party] = winner_name
+        configs.get(col, interaction.guild.id)
         col.update_one(
             {"guild_id": interaction.guild.id},
-            {"$set": {"winners": config["winners"]}}
+            {"$set": {f"winners.{party}": winner_name}}
         )
 
         await self._log_admin_command(interaction, "update_winner", {"party": party, "winner_name": winner_name})
@@ -856,11 +1066,7 @@ class AdminCentral(commands.Cog):
     @app_commands.checks.has_permissions(administrator=True)
     async def admin_toggle_delegate_system(self, interaction: discord.Interaction):
         delegates_col = self.bot.db["delegates_config"]
-        config = delegates_col.find_one({"guild_id": interaction.guild.id})
-
-        if not config:
-            config = {"guild_id": interaction.guild.id, "enabled": True}
-            delegates_col.insert_one(config)
+        config = configs.get(delegates_col, interaction.guild.id)
 
         current_status = config.get("enabled", True)
         new_status = not current_status
@@ -886,11 +1092,7 @@ class AdminCentral(commands.Cog):
     @app_commands.checks.has_permissions(administrator=True)
     async def admin_pause_delegate_system(self, interaction: discord.Interaction):
         delegates_col = self.bot.db["delegates_config"]
-        config = delegates_col.find_one({"guild_id": interaction.guild.id})
-
-        if not config:
-            config = {"guild_id": interaction.guild.id, "paused": False}
-            delegates_col.insert_one(config)
+        config = configs.get(delegates_col, interaction.guild.id)
 
         current_status = config.get("paused", False)
         new_status = not current_status
@@ -3,233 +3,65 @@ import discord
 from discord import app_commands
 from typing import List, Optional
 from datetime import datetime
-
-class CampaignPointsPaginationView(discord.ui.View):
-    def __init__(self, interaction, sort_by, filter_region, filter_party, year, total_pages, current_page=1):
-        super().__init__(timeout=300)
-        self.interaction = interaction
+from .archive import year_entries
+from .config_registry import configs
+from .member_cache import mention
+from .persistent_views import is_admin, pack, page_options, persistent_view, template, unpack
+
+class CampaignPointsPageSelect(discord.ui.DynamicItem[discord.ui.Select],
+                               template=template("signups:points", "year", "page", "sort", "region", "party")):
+    """Page picker for admin_view_campaign_points.
+
+    The year, page, sort and filters live in the custom_id, so nothing is held in
+    memory per message and the picker keeps working after a restart; each pick
+    rebuilds the page from the current signups.
+    """
+
+    def __init__(self, year: int, page: int, total_pages: Optional[int], sort_by: str,
+                 filter_region: Optional[str], filter_party: Optional[str]):
+        self.year = year
         self.sort_by = sort_by
         self.filter_region = filter_region
         self.filter_party = filter_party
-        self.year = year
-        self.total_pages = total_pages
-        self.current_page = current_page
+        super().__init__(discord.ui.Select(
+            custom_id=pack("signups:points", year, page, sort_by, filter_region, filter_party),
+            placeholder="Select a page...",
+            options=page_options(total_pages, page) if total_pages else []
+        ))
 
-        # Add dropdown for page selection
-        if total_pages > 1:
-            self.add_item(PageSelectDropdown(total_pages, current_page))
+    @classmethod
+    async def from_custom_id(cls, interaction: discord.Interaction, item: discord.ui.Select, match):
+        return cls(int(match["year"]), int(match["page"]), None, unpack(match["sort"]) or "points",
+                   unpack(match["region"]), unpack(match["party"]))
 
-    async def on_timeout(self):
-        # Disable all items when the view times out
-        for item in self.children:
-            item.disabled = True
-        try:
-            await self.interaction.edit_original_response(view=self)
-        except:
-            pass
-
-class PageSelectDropdown(discord.ui.Select):
-    def __init__(self, total_pages, current_page):
-        self.total_pages = total_pages
-
-        options = []
-        for i in range(1, min(total_pages + 1, 26)):  # Discord limit of 25 options
-            label = f"Page {i}"
-            if i == current_page:
-                label += " (Current)"
-            options.append(discord.SelectOption(label=label, value=str(i)))
-
-        super().__init__(placeholder="Select a page...", options=options)
+    async def interaction_check(self, interaction: discord.Interaction) -> bool:
+        return is_admin(interaction)
 
     async def callback(self, interaction: discord.Interaction):
-        try:
-            await interaction.response.defer()
-
-            selected_page = int(self.values[0])
-
-            # Get the main cog to access the command logic
-            signups_cog = interaction.client.get_cog('AllSignups')
-            if not signups_cog:
-                await interaction.followup.send("❌ Error: AllSignups cog not found.", ephemeral=True)
-                return
-
-            # Get time configuration
-            time_col, time_config = signups_cog._get_time_config(interaction.guild.id)
-            if not time_config:
-                await interaction.followup.send("❌ Election system not configured.", ephemeral=True)
-                return
-
-            current_phase = time_config.get("current_phase", "")
-            target_year = self.view.year
-
-            # Get signups configuration
-            signups_col, signups_config = signups_cog._get_signups_config(interaction.guild.id)
-
-            # Filter candidates by year
-            candidates = [c for c in signups_config["candidates"] if c["year"] == target_year]
-
-            if not candidates:
-                await interaction.followup.send(f"❌ No candidates found for {target_year}.", ephemeral=True)
-                return
-
-            # Apply filters and sorting (same logic as in main command)
-            filtered_candidates = candidates
-            if self.view.filter_region:
-                filtered_candidates = [c for c in filtered_candidates if c["region"].lower() == self.view.filter_region.lower()]
-            if self.view.filter_party:
-                filtered_candidates = [c for c in filtered_candidates if self.view.filter_party.lower() in c["party"].lower()]
-
-            if not filtered_candidates:
-                await interaction.followup.send("❌ No candidates found with those filters.", ephemeral=True)
-                return
-
-            # Sort candidates
-            if self.view.sort_by.lower() == "points":
-                filtered_candidates.sort(key=lambda x: x["points"], reverse=True)
-            elif self.view.sort_by.lower() == "corruption":
-                filtered_candidates.sort(key=lambda x: x["corruption"], reverse=True)
-            elif self.view.sort_by.lower() == "stamina":
-                filtered_candidates.sort(key=lambda x: x["stamina"], reverse=True)
-            elif self.view.sort_by.lower() == "seat":
-                filtered_candidates.sort(key=lambda x: x["seat_id"])
-            else:
-                filtered_candidates.sort(key=lambda x: x["name"].lower())
-
-            # Pagination
-            candidates_per_page = 10
-            total_candidates = len(filtered_candidates)
-            total_pages = max(1, (total_candidates + candidates_per_page - 1) // candidates_per_page)
-            page = max(1, min(selected_page, total_pages))
-
-            start_idx = (page - 1) * candidates_per_page
-            end_idx = start_idx + candidates_per_page
-            page_candidates = filtered_candidates[start_idx:end_idx]
-
-            # Create embed (same logic as main command)
-            filter_text = ""
-            if self.view.filter_region:
-                filter_text += f" • Region: {self.view.filter_region}"
-            if self.view.filter_party:
-                filter_text += f" • Party: {self.view.filter_party}"
-
-            embed = discord.Embed(
-                title=f"📊 {target_year} Primary Campaign Points",
-                description=f"Sorted by {self.view.sort_by} • Page {page}/{total_pages} • {total_candidates} total candidates{filter_text}",
-                color=discord.Color.orange(),
-                timestamp=datetime.utcnow()
-            )
-
-            # Build candidate list
-            candidate_entries = []
-            for i, candidate in enumerate(page_candidates, start_idx + 1):
-                user = interaction.guild.get_member(candidate["user_id"])
-                user_mention = user.mention if user else f"User ID: {candidate['user_id']}"
-
-                entry = (
-                    f"**{i}.** {candidate['name']} ({candidate['party']})\n"
-                    f"   └ {candidate['seat_id']} • Points: {candidate['points']:.2f}\n"
-                    f"   └ Stamina: {candidate['stamina']} • Corruption: {candidate['corruption']} • {user_mention}\n\n"
-                )
-                candidate_entries.append(entry)
-
-            # Split candidates into multiple fields if needed
-            current_field = ""
-            field_count = 1
-
-            for entry in candidate_entries:
-                if len(current_field + entry) > 1020:
-                    embed.add_field(
-                        name=f"🏆 Candidates (Part {field_count})" if field_count > 1 else "🏆 Candidates",
-                        value=current_field.strip(),
-                        inline=False
-                    )
-                    current_field = entry
-                    field_count += 1
-                else:
-                    current_field += entry
-
-            if current_field:
-                embed.add_field(
-                    name=f"🏆 Candidates (Part {field_count})" if field_count > 1 else "🏆 Candidates",
-                    value=current_field.strip(),
-                    inline=False
-                )
-
-            # Add statistics and navigation
-            seat_counts = {}
-            for candidate in filtered_candidates:
-                seat_id = candidate["seat_id"]
-                seat_counts[seat_id] = seat_counts.get(seat_id, 0) + 1
-
-            # Show most competitive seats
-            competitive_seats = sorted(seat_counts.items(), key=lambda x: x[1], reverse=True)[:5]
-            competitive_text = ""
-            for seat_id, count in competitive_seats:
-                if count > 1:
-                    competitive_text += f"**{seat_id}:** {count} candidates\n"
-
-            if competitive_text:
-                embed.add_field(
-                    name="🔥 Most Competitive Seats",
-                    value=competitive_text,
-                    inline=True
-                )
-
-            # Add summary statistics
-            total_points = sum(c["points"] for c in filtered_candidates)
-            avg_points = total_points / len(filtered_candidates) if filtered_candidates else 0
-            avg_corruption = sum(c["corruption"] for c in filtered_candidates) / len(filtered_candidates) if filtered_candidates else 0
-            avg_stamina = sum(c["stamina"] for c in filtered_candidates) / len(filtered_candidates) if filtered_candidates else 0
-
-            embed.add_field(
-                name="📈 Summary Statistics",
-                value=f"**Total Candidates:** {len(filtered_candidates)}\n"
-                      f"**Total Points:** {total_points:.2f}\n"
-                      f"**Avg Corruption:** {avg_corruption:.1f}\n"
-                      f"**Avg Stamina:** {avg_stamina:.1f}",
-                inline=True
-            )
+        signups_cog = interaction.client.get_cog("AllSignups")
+        if not signups_cog:
+            await interaction.response.send_message("❌ Error: AllSignups cog not found.", ephemeral=True)
+            return
 
-            navigation_info = f"Page {page}/{total_pages}"
-            if page > 1:
-                prev_start = max(1, start_idx - candidates_per_page + 1)
-                navigation_info += f" • Previous page shows candidates {prev_start}-{start_idx}"
-            if page < total_pages:
-                next_start = end_idx + 1
-                next_end = min(total_candidates, end_idx + candidates_per_page)
-                navigation_info += f" • Next page shows candidates {next_start}-{next_end}"
+        embed, page, total_pages = signups_cog._campaign_points_page(
+            interaction.guild, self.sort_by, self.filter_region, self.filter_party, self.year, int(self.item.values[0])
+        )
+        if isinstance(embed, str):
+            await interaction.response.send_message(embed, ephemeral=True)
+            return
 
-            navigation_info += f"\nShowing candidates {start_idx + 1}-{min(end_idx, total_candidates)}"
+        view = None
+        if total_pages > 1:
+            view = persistent_view(CampaignPointsPageSelect, self.year, page, total_pages,
+                                   self.sort_by, self.filter_region, self.filter_party)
+        await interaction.response.edit_message(embed=embed, view=view)
 
-            embed.add_field(
-                name="📄 Navigation",
-                value=navigation_info,
-                inline=False
-            )
 
-            # Create new view with updated page - this is the key fix
-            new_view = CampaignPointsPaginationView(
-                interaction,
-                self.view.sort_by,
-                self.view.filter_region,
-                self.view.filter_party,
-                self.view.year,
-                total_pages,
-                page  # Pass the selected page as current_page
-            )
+def _default_signups_config():
+    return {"candidates": []}
 
-            # Use edit_original_response instead of followup to maintain the same message
-            try:
-                await interaction.edit_original_response(embed=embed, view=new_view)
-            except discord.NotFound:
-                # If edit fails, fall back to followup
-                await interaction.followup.send(embed=embed, view=new_view, ephemeral=True)
 
-        except Exception as e:
-            print(f"Error in dropdown callback: {e}")
-            import traceback
-            traceback.print_exc()
-            await interaction.followup.send("❌ An error occurred while changing pages.", ephemeral=True)
+configs.register("signups", _default_signups_config)
 
 
 class AllSignups(commands.Cog):
@@ -237,6 +69,12 @@ class AllSignups(commands.Cog):
         self.bot = bot
         print("All Signups cog loaded successfully")
 
+    async def cog_load(self):
+        self.bot.add_dynamic_items(CampaignPointsPageSelect)
+
+    def cog_unload(self):
+        self.bot.remove_dynamic_items(CampaignPointsPageSelect)
+
     def _get_time_config(self, guild_id: int):
         """Get time configuration to check current phase"""
         col = self.bot.db["time_configs"]
@@ -252,14 +90,7 @@ class AllSignups(commands.Cog):
     def _get_signups_config(self, guild_id: int):
         """Get or create signups configuration"""
         col = self.bot.db["signups"]
-        config = col.find_one({"guild_id": guild_id})
-        if not config:
-            config = {
-                "guild_id": guild_id,
-                "candidates": []
-            }
-            col.insert_one(config)
-        return col, config
+        return col, configs.get(col, guild_id)
 
     async def party_autocomplete(
         self,
@@ -711,11 +542,9 @@ class AllSignups(commands.Cog):
         target_year = year if year else current_year
         signups_col, signups_config = self._get_signups_config(interaction.guild.id)
 
-        # Filter candidates for target year
-        current_candidates = [
-            c for c in signups_config["candidates"]
-            if c["year"] == target_year
-        ]
+        # Filter candidates for target year (finished cycles come from the archive)
+        year_candidates = year_entries(self.bot.db, interaction.guild.id, "signups", target_year, signups_config)
+        current_candidates = year_candidates
 
         # Apply region filter if specified
         if region:
@@ -732,8 +561,7 @@ class AllSignups(commands.Cog):
             if region:
                 debug_text = f"📋 No candidates found for **{region}** in the {target_year} election."
                 # Show available regions
-                all_candidates_year = [c for c in signups_config["candidates"] if c["year"] == target_year]
-                available_regions = list(set(c["region"] for c in all_candidates_year))
+                available_regions = list(set(c["region"] for c in year_candidates))
                 if available_regions:
                     debug_text += f"\n\n🌍 **Available regions for {target_year}:** {', '.join(sorted(available_regions))}"
             else:
@@ -1482,41 +1310,20 @@ class AllSignups(commands.Cog):
 
         await interaction.response.send_message(embed=embed, ephemeral=True)
 
-    @app_commands.command(
-        name="admin_view_campaign_points",
-        description="View all candidate points in primary campaign phase (Admin only)"
-    )
-    @app_commands.checks.has_permissions(administrator=True)
-    async def admin_view_campaign_points(
-        self,
-        interaction: discord.Interaction,
-        sort_by: str = "points",
-        filter_region: str = None,
-        filter_party: str = None,
-        year: int = None,
-        page: int = 1
-    ):
-        """View candidate points with sorting and filtering options"""
-        # Defer immediately to prevent timeout
-        await interaction.response.defer(ephemeral=True)
-
-        time_col, time_config = self._get_time_config(interaction.guild.id)
-
-        if not time_config:
-            await interaction.followup.send("❌ Election system not configured.", ephemeral=True)
-            return
-
-        current_year = time_config["current_rp_date"].year
-        target_year = year if year else current_year
+    def _campaign_points_page(self, guild: discord.Guild, sort_by: str, filter_region: Optional[str],
+                              filter_party: Optional[str], target_year: int, page: int):
+        """Embed for one page of the primary campaign points list.
 
-        signups_col, signups_config = self._get_signups_config(interaction.guild.id)
+        Returns (embed, page, total_pages) with the page clamped into range, or
+        (error message, page, 0) when nothing matches.
+        """
+        signups_col, signups_config = self._get_signups_config(guild.id)
 
         # Filter by year
         candidates = [c for c in signups_config["candidates"] if c["year"] == target_year]
 
         if not candidates:
-            await interaction.followup.send(f"❌ No candidates found for {target_year}.", ephemeral=True)
-            return
+            return f"❌ No candidates found for {target_year}.", page, 0
 
         # Apply filters
         filtered_candidates = candidates
@@ -1528,8 +1335,7 @@ class AllSignups(commands.Cog):
             filtered_candidates = [c for c in filtered_candidates if filter_party.lower() in c["party"].lower()]
 
         if not filtered_candidates:
-            await interaction.followup.send("❌ No candidates found with those filters.", ephemeral=True)
-            return
+            return "❌ No candidates found with those filters.", page, 0
 
         # Sort candidates
         if sort_by.lower() == "points":
@@ -1574,8 +1380,7 @@ class AllSignups(commands.Cog):
         # Build candidate list for this page, handling field length limits
         candidate_entries = []
         for i, candidate in enumerate(page_candidates, start_idx + 1):
-            user = interaction.guild.get_member(candidate["user_id"])
-            user_mention = user.mention if user else f"User ID: {candidate['user_id']}"
+            user_mention = mention(candidate["user_id"])
 
             entry = (
                 f"**{i}.** {candidate['name']} ({candidate['party']})\n"
@@ -1662,12 +1467,50 @@ class AllSignups(commands.Cog):
             inline=False
         )
 
-        # Create dropdown for quick navigation if many pages
+        return embed, page, total_pages
+
+    @app_commands.command(
+        name="admin_view_campaign_points",
+        description="View all candidate points in primary campaign phase (Admin only)"
+    )
+    @app_commands.checks.has_permissions(administrator=True)
+    async def admin_view_campaign_points(
+        self,
+        interaction: discord.Interaction,
+        sort_by: str = "points",
+        filter_region: str = None,
+        filter_party: str = None,
+        year: int = None,
+        page: int = 1
+    ):
+        """View candidate points with sorting and filtering options"""
+        # Defer immediately to prevent timeout
+        await interaction.response.defer(ephemeral=True)
+
+        time_col, time_config = self._get_time_config(interaction.guild.id)
+
+        if not time_config:
+            await interaction.followup.send("❌ Election system not configured.", ephemeral=True)
+            return
+
+        current_year = time_config["current_rp_date"].year
+        target_year = year if year else current_year
+
+        page_embed, page, total_pages = self._campaign_points_page(
+            interaction.guild, sort_by, filter_region, filter_party, target_year, page
+        )
+        if isinstance(page_embed, str):
+            await interaction.followup.send(page_embed, ephemeral=True)
+            return
+
+        # Dropdown for quick navigation if many pages; it survives restarts
+        view = None
         if total_pages > 1:
-            view = CampaignPointsPaginationView(interaction, sort_by, filter_region, filter_party, year, total_pages, page)
-            await interaction.followup.send(embed=embed, view=view, ephemeral=True)
+            view = persistent_view(CampaignPointsPageSelect, target_year, page, total_pages, sort_by, filter_region, filter_party)
+        if view:
+            await interaction.followup.send(embed=page_embed, view=view, ephemeral=True)
         else:
-            await interaction.followup.send(embed=embed, ephemeral=True)
+            await interaction.followup.send(embed=page_embed, ephemeral=True)
 
     @admin_view_points.autocomplete("filter_region")
     async def filter_region_autocomplete(self, interaction: discord.Interaction, current: str):
@@ -1805,8 +1648,7 @@ class AllSignups(commands.Cog):
 
             party_text = ""
             for i, candidate in enumerate(party_candidates, 1):
-                user = interaction.guild.get_member(candidate["user_id"])
-                user_mention = user.mention if user else candidate["name"]
+                user_mention = mention(candidate["user_id"]) if candidate.get("user_id") else candidate["name"]
 
                 leader_indicator = " 👑" if i == 1 and len(party_candidates) > 1 else ""
                 party_text += (
@@ -2057,15 +1899,9 @@ class AllSignups(commands.Cog):
 
         # During General Campaign phase, add directly to all_winners as a primary winner
         if current_phase == "General Campaign":
-            # Get all_winners configuration
+            # Get or create all_winners configuration (defaults registered by AllWinners)
             winners_col = self.bot.db["winners"]
-            winners_config = winners_col.find_one({"guild_id": interaction.guild.id})
-            if not winners_config:
-                winners_config = {
-                    "guild_id": interaction.guild.id,
-                    "winners": []
-                }
-                winners_col.insert_one(winners_config)
+            winners_config = configs.get(winners_col, interaction.guild.id)
 
             # Check if user already has a winner entry for this year
             for winner in winners_config.get("winners", []):
@@ -2108,11 +1944,9 @@ class AllSignups(commands.Cog):
                 "created_date": datetime.utcnow()
             }
 
-            winners_config["winners"].append(winner_entry)
-
             winners_col.update_one(
                 {"guild_id": interaction.guild.id},
-                {"$set": {"winners": winners_config["winners"]}}
+                {"$push": {"winners": winner_entry}}
             )
 
             await interaction.response.send_message(
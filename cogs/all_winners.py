@@ -3,241 +3,67 @@ import discord
 from discord import app_commands
 from typing import List, Optional
 from datetime import datetime
-
-class CampaignPointsView(discord.ui.View):
-    def __init__(self, interaction: discord.Interaction, sort_by: str, filter_state: str, filter_party: str, year: int, total_pages: int, current_page: int):
-        super().__init__(timeout=300)
-        self.interaction = interaction
+from .announcements import post_announcement
+from .archive import year_entries
+from .config_registry import configs
+from .member_cache import mention, resolve_member
+from .persistent_views import is_admin, pack, page_options, persistent_view, template, unpack
+from .queries import find_entries
+from .transitions import apply_once, transition_key
+from .zero_sum import linear_redistribute, normalize
+
+class GeneralPointsPageSelect(discord.ui.DynamicItem[discord.ui.Select],
+                              template=template("winners:points", "year", "page", "sort", "state", "party")):
+    """Page picker for admin_view_all_campaign_points; its year, page, sort and filters live in the custom_id"""
+
+    def __init__(self, year: int, page: int, total_pages: Optional[int], sort_by: str,
+                 filter_state: Optional[str], filter_party: Optional[str]):
+        self.year = year
         self.sort_by = sort_by
         self.filter_state = filter_state
         self.filter_party = filter_party
-        self.year = year
-        self.total_pages = total_pages
-        self.current_page = current_page
-
-        # Add page selector dropdown
-        self.add_item(PageSelector(total_pages, current_page))
-
-class PageSelector(discord.ui.Select):
-    def __init__(self, total_pages: int, current_page: int):
-        # Create options for page selection
-        options = []
-
-        # Show all pages if 25 or fewer, otherwise show smart selection
-        if total_pages <= 25:
-            for page in range(1, total_pages + 1):
-                label = f"Page {page}"
-                if page == current_page:
-                    label += " (Current)"
-                options.append(discord.SelectOption(
-                    label=label,
-                    value=str(page),
-                    default=(page == current_page)
-                ))
-        else:
-            # For many pages, show first few, current area, and last few
-            pages_to_show = set()
-
-            # First 3 pages
-            pages_to_show.update(range(1, min(4, total_pages + 1)))
-
-            # Current page and neighbors
-            start = max(1, current_page - 2)
-            end = min(total_pages + 1, current_page + 3)
-            pages_to_show.update(range(start, end))
-
-            # Last 3 pages
-            pages_to_show.update(range(max(1, total_pages - 2), total_pages + 1))
-
-            sorted_pages = sorted(pages_to_show)
-
-            for page in sorted_pages:
-                label = f"Page {page}"
-                if page == current_page:
-                    label += " (Current)"
-                options.append(discord.SelectOption(
-                    label=label,
-                    value=str(page),
-                    default=(page == current_page)
-                ))
-
-        super().__init__(
-            placeholder=f"Jump to page... (Current: {current_page}/{total_pages})",
-            options=options
-        )
+        super().__init__(discord.ui.Select(
+            custom_id=pack("winners:points", year, page, sort_by, filter_state, filter_party),
+            placeholder=f"Jump to page... (Current: {page}/{total_pages})",
+            options=page_options(total_pages, page) if total_pages else []
+        ))
+
+    @classmethod
+    async def from_custom_id(cls, interaction: discord.Interaction, item: discord.ui.Select, match):
+        return cls(int(match["year"]), int(match["page"]), None, unpack(match["sort"]) or "points",
+                   unpack(match["state"]), unpack(match["party"]))
+
+    async def interaction_check(self, interaction: discord.Interaction) -> bool:
+        return is_admin(interaction)
 
     async def callback(self, interaction: discord.Interaction):
-        selected_page = int(self.values[0])
         await interaction.response.defer()
 
-        # Get the cog and regenerate the page content
         cog = interaction.client.get_cog('AllWinners')
         if not cog:
             await interaction.followup.send("❌ Error: Cog not found", ephemeral=True)
             return
 
-        # Get time and winners config
-        time_col, time_config = cog._get_time_config(interaction.guild.id)
-        if not time_config:
-            await interaction.followup.send("❌ Election system not configured.", ephemeral=True)
-            return
-
-        current_year = time_config["current_rp_date"].year
-        current_phase = time_config.get("current_phase", "")
-        target_year = self.view.year if self.view.year else current_year
-
-        winners_col, winners_config = cog._get_winners_config(interaction.guild.id)
-
-        # Get primary winners (candidates in general election)
-        candidates = [
-            w for w in winners_config.get("winners", [])
-            if w["year"] == target_year and w.get("primary_winner", False)
-        ]
-
-        # Apply filters
-        if self.view.filter_state:
-            candidates = [c for c in candidates if self.view.filter_state.upper() in c.get("seat_id", "")]
-        if self.view.filter_party:
-            candidates = [c for c in candidates if self.view.filter_party.lower() in c.get("party", "").lower()]
-
-        # Sort candidates
-        if self.view.sort_by == "points":
-            candidates.sort(key=lambda x: x.get("points", 0), reverse=True)
-        elif self.view.sort_by == "total_points":
-            candidates.sort(key=lambda x: x.get("total_points", 0), reverse=True)
-        elif self.view.sort_by == "corruption":
-            candidates.sort(key=lambda x: x.get("corruption", 0), reverse=True)
-        elif self.view.sort_by == "seat":
-            candidates.sort(key=lambda x: x.get("seat_id", ""))
-        elif self.view.sort_by == "name":
-            candidates.sort(key=lambda x: x.get("candidate", ""))
-
-        # Pagination
-        candidates_per_page = 10
-        total_pages = max(1, (len(candidates) + candidates_per_page - 1) // candidates_per_page)
-        start_idx = (selected_page - 1) * candidates_per_page
-        end_idx = start_idx + candidates_per_page
-        page_candidates = candidates[start_idx:end_idx]
-
-        # Calculate percentages if in General Campaign
-        if current_phase == "General Campaign":
-            for candidate in page_candidates:
-                percentages = cog._calculate_zero_sum_percentages(interaction.guild.id, candidate.get("seat_id", ""))
-                candidate['calculated_percentage'] = percentages.get(candidate.get("candidate", ""), 50.0)
-
-        # Create embed
-        embed = discord.Embed(
-            title=f"📊 {target_year} General Campaign Points",
-            description=f"Sorted by {self.view.sort_by} • Page {selected_page}/{total_pages} • {len(candidates)} total candidates",
-            color=discord.Color.purple(),
-            timestamp=datetime.utcnow()
-        )
-
-        # Build candidate list
-        candidate_entries = []
-        for i, candidate in enumerate(page_candidates, start_idx + 1):
-            user = interaction.guild.get_member(candidate.get("user_id"))
-            user_mention = user.mention if user else candidate.get("candidate", "Unknown")
-
-            points_display = f"{candidate.get('points', 0):.2f}"
-            if current_phase == "General Campaign":
-                total_points = candidate.get('total_points', 0)
-                if total_points > 0:
-                    points_display = f"{total_points:.2f}"
-
-                percentage = candidate.get('calculated_percentage', 50.0)
-                points_display += f" ({percentage:.1f}%)"
-
-            entry = (
-                f"**{i}.** {candidate.get('candidate', 'Unknown')} ({candidate.get('party', 'Unknown')})\n"
-                f"   └ {candidate.get('seat_id', 'Unknown')} • Points: {points_display}\n"
-                f"   └ Stamina: {candidate.get('stamina', 100)} • "
-                f"Corruption: {candidate.get('corruption', 0)} • {user_mention}"
-            )
-            candidate_entries.append(entry)
-
-        # Split into fields to handle Discord's field limits
-        field_content = ""
-        field_count = 1
-        for entry in candidate_entries:
-            if len(field_content + entry + "\n\n") > 1024:
-                embed.add_field(
-                    name=f"🏆 Candidates{f' (Part {field_count})' if field_count > 1 else ''}",
-                    value=field_content,
-                    inline=False
-                )
-                field_content = entry + "\n\n"
-                field_count += 1
-            else:
-                field_content += entry + "\n\n"
-
-        if field_content:
-            embed.add_field(
-                name=f"🏆 Candidates{f' (Part {field_count})' if field_count > 1 else ''}",
-                value=field_content,
-                inline=False
-            )
-
-        # Add statistics
-        if candidates:
-            total_points = sum(c.get("points", 0) for c in candidates)
-            total_votes = sum(c.get("votes", 0) for c in candidates)
-            avg_corruption = sum(c.get("corruption", 0) for c in candidates) / len(candidates)
-
-            embed.add_field(
-                name="📈 Summary Statistics",
-                value=f"**Total Candidates:** {len(candidates)}\n"
-                      f"**Total Points:** {total_points:.2f}\n"
-                      f"**Total Votes:** {total_votes:,}\n"
-                      f"**Avg Corruption:** {avg_corruption:.1f}",
-                inline=True
-            )
-
-        # Show filter info if applied
-        filter_info = ""
-        if self.view.filter_state:
-            filter_info += f"State: {self.view.filter_state} • "
-        if self.view.filter_party:
-            filter_info += f"Party: {self.view.filter_party} • "
-        if filter_info:
-            embed.add_field(
-                name="🔍 Active Filters",
-                value=filter_info.rstrip(" • "),
-                inline=True
-            )
-
-        # Navigation info
-        navigation_info = f"**Page {selected_page} of {total_pages}**\n"
-        if selected_page > 1:
-            navigation_info += f"Use `page:{selected_page-1}` for previous page\n"
-        if selected_page < total_pages:
-            navigation_info += f"Use `page:{selected_page+1}` for next page\n"
-        navigation_info += f"Showing candidates {start_idx + 1}-{min(end_idx, len(candidates))}"
-
-        embed.add_field(
-            name="📄 Navigation",
-            value=navigation_info,
-            inline=False
+        # Rebuilt from the current winners, so the page reflects points earned since the command ran
+        embed, page, total_pages = cog._general_points_page(
+            interaction.guild, self.sort_by, self.filter_state, self.filter_party, self.year, int(self.item.values[0])
         )
+        if isinstance(embed, str):
+            await interaction.followup.send(embed, ephemeral=True)
+            return
 
-        # Create new view with updated page
-        new_view = CampaignPointsView(
-            interaction,
-            self.view.sort_by,
-            self.view.filter_state,
-            self.view.filter_party,
-            self.view.year,
-            total_pages,
-            selected_page
-        )
+        view = None
+        if total_pages > 1:
+            view = persistent_view(GeneralPointsPageSelect, self.year, page, total_pages,
+                                   self.sort_by, self.filter_state, self.filter_party)
+        await interaction.edit_original_response(embed=embed, view=view)
 
-        await interaction.edit_original_response(embed=embed, view=new_view)
+class GeneralCampaignRegionSelect(discord.ui.DynamicItem[discord.ui.Select],
+                                  template=template("winners:regions", "year")):
+    """Region picker for view_general_campaign; regenerates the region from the winners on every pick"""
 
-class GeneralCampaignRegionDropdown(discord.ui.Select):
-    def __init__(self, regions, candidates_by_region, year, seat_percentages_cache):
-        self.candidates_by_region = candidates_by_region
+    def __init__(self, year: int, regions: Optional[dict] = None):
         self.year = year
-        self.seat_percentages_cache = seat_percentages_cache
 
         options = [
             discord.SelectOption(
@@ -249,7 +75,7 @@ class GeneralCampaignRegionDropdown(discord.ui.Select):
         ]
 
         # Add region options with candidate counts
-        for region in sorted(regions.keys()):
+        for region in sorted((regions or {}).keys()):
             candidate_count = len(regions[region])
             options.append(
                 discord.SelectOption(
@@ -259,169 +85,55 @@ class GeneralCampaignRegionDropdown(discord.ui.Select):
                 )
             )
 
-        super().__init__(placeholder="Select a region to view candidates...", options=options[:25])
+        super().__init__(discord.ui.Select(
+            custom_id=pack("winners:regions", year),
+            placeholder="Select a region to view candidates...",
+            options=options[:25]
+        ))
+
+    @classmethod
+    async def from_custom_id(cls, interaction: discord.Interaction, item: discord.ui.Select, match):
+        return cls(int(match["year"]))
 
     async def callback(self, interaction: discord.Interaction):
         try:
-            selected_region = self.values[0]
-
-            if selected_region == "all":
-                # Show overview of all regions
-                embed = discord.Embed(
-                    title=f"🎯 {self.year} General Campaign - All Regions",
-                    description="Primary winners advancing to general election",
-                    color=discord.Color.purple(),
-                    timestamp=datetime.utcnow()
-                )
-
-                # Add summary for each region
-                for region, candidates in sorted(self.candidates_by_region.items()):
-                    candidate_list = ""
-                    for candidate in sorted(candidates, key=lambda x: x.get("points", 0), reverse=True)[:5]:
-                        candidate_name = candidate.get('candidate', 'Unknown')
-                        candidate_party = candidate.get('party', 'Unknown')
-                        candidate_seat = candidate.get('seat_id', 'Unknown')
-                        candidate_list += f"• **{candidate_name}** ({candidate_party}) - {candidate_seat}\n"
-
-                    if len(candidates) > 5:
-                        candidate_list += f"• ... and {len(candidates) - 5} more"
-
-                    embed.add_field(
-                        name=f"📍 {region} ({len(candidates)} candidates)",
-                        value=candidate_list or "No candidates",
-                        inline=True
-                    )
-            else:
-                # Show detailed view for selected region
-                candidates = self.candidates_by_region.get(selected_region, [])
-
-                embed = discord.Embed(
-                    title=f"🎯 {self.year} General Campaign - {selected_region}",
-                    description=f"Primary winners from {selected_region} advancing to general election",
-                    color=discord.Color.purple(),
-                    timestamp=datetime.utcnow()
-                )
-
-                if not candidates:
-                    embed.add_field(
-                        name="📋 No Candidates",
-                        value=f"No candidates found for {selected_region}",
-                        inline=False
-                    )
-                else:
-                    # Group candidates by seat for proper percentage calculation
-                    seats_in_region = {}
-                    for candidate in candidates:
-                        seat_id = candidate.get("seat_id", "Unknown")
-                        if seat_id not in seats_in_region:
-                            seats_in_region[seat_id] = []
-                        seats_in_region[seat_id].append(candidate)
-
-                    candidate_list = ""
-                    for seat_id, seat_candidates in sorted(seats_in_region.items()):
-                        seat_percentages = self.seat_percentages_cache.get(seat_id, {})
-
-                        for candidate in sorted(seat_candidates, key=lambda x: x.get("points", 0), reverse=True):
-                            # Safely get candidate data
-                            candidate_name = candidate.get("candidate", "Unknown")
-                            candidate_party = candidate.get("party", "Unknown")
-                            candidate_office = candidate.get("office", "Unknown")
-                            candidate_points = candidate.get("points", 0)
-                            candidate_stamina = candidate.get("stamina", 100)
-                            candidate_corruption = candidate.get("corruption", 0)
-                            
-                            # Get user mention
-                            user_id = candidate.get("user_id")
-                            user_mention = f"<@{user_id}>" if user_id else "No user"
-
-                            # Get percentage for this candidate
-                            candidate_percentage = seat_percentages.get(candidate_name, 50.0)
-
-                            candidate_list += (
-                                f"**{candidate_name}** ({candidate_party})\n"
-                                f"└ {seat_id} - {candidate_office}\n"
-                                f"└ Stamina: {candidate_stamina} | Corruption: {candidate_corruption}\n"
-                                f"└ {user_mention}\n\n"
-                            )
-
-                    # Handle long content by splitting into multiple fields
-                    if len(candidate_list) > 1024:
-                        parts = candidate_list.split('\n\n')
-                        current_part = ""
-                        part_num = 1
-
-                        for part in parts:
-                            if part.strip():  # Skip empty parts
-                                if len(current_part + part + '\n\n') > 1024:
-                                    if current_part.strip():
-                                        embed.add_field(
-                                            name=f"📊 Candidates (Part {part_num})",
-                                            value=current_part.strip(),
-                                            inline=False
-                                        )
-                                    current_part = part + '\n\n'
-                                    part_num += 1
-                                else:
-                                    current_part += part + '\n\n'
-
-                        if current_part.strip():
-                            embed.add_field(
-                                name=f"📊 Candidates (Part {part_num})" if part_num > 1 else "📊 Candidates",
-                                value=current_part.strip(),
-                                inline=False
-                            )
-                    else:
-                        embed.add_field(
-                            name="📊 Candidates",
-                            value=candidate_list.strip() if candidate_list.strip() else "No candidates found",
-                            inline=False
-                        )
-
-                    # Add region statistics
-                    if candidates:
-                        total_points = sum(c.get('points', 0) for c in candidates)
-                        avg_stamina = sum(c.get('stamina', 100) for c in candidates) / len(candidates)
-                        avg_corruption = sum(c.get('corruption', 0) for c in candidates) / len(candidates)
-
-                        embed.add_field(
-                            name="📈 Region Statistics",
-                            value=f"**Total Candidates:** {len(candidates)}\n"
-                                  f"**Average Stamina:** {avg_stamina:.1f}\n"
-                                  f"**Average Corruption:** {avg_corruption:.1f}",
-                            inline=False
-                        )
-
-            embed.set_footer(text=f"Use the dropdown to view other regions • Year: {self.year}")
-            await interaction.response.edit_message(embed=embed, view=self.view)
+            cog = interaction.client.get_cog('AllWinners')
+            regions = cog._general_campaign_regions(interaction.guild.id, self.year)
+            embed = cog._general_campaign_region_embed(self.year, regions, self.item.values[0])
+            await interaction.response.edit_message(
+                embed=embed, view=persistent_view(GeneralCampaignRegionSelect, self.year, regions)
+            )
 
         except Exception as e:
-            print(f"Error in GeneralCampaignRegionDropdown callback: {e}")
+            print(f"Error in GeneralCampaignRegionSelect callback: {e}")
             await interaction.response.send_message(
                 f"❌ An error occurred while switching regions: {str(e)}", 
                 ephemeral=True
             )
 
-class GeneralCampaignRegionView(discord.ui.View):
-    def __init__(self, regions, candidates_by_region, year, seat_percentages_cache):
-        super().__init__(timeout=300)
-        self.add_item(GeneralCampaignRegionDropdown(regions, candidates_by_region, year, seat_percentages_cache))
+
+def _default_winners_config():
+    return {"winners": []}
+
+
+configs.register("winners", _default_winners_config)
+
 
 class AllWinners(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
         print("All Winners cog loaded successfully")
 
+    async def cog_load(self):
+        self.bot.add_dynamic_items(GeneralPointsPageSelect, GeneralCampaignRegionSelect)
+
+    def cog_unload(self):
+        self.bot.remove_dynamic_items(GeneralPointsPageSelect, GeneralCampaignRegionSelect)
+
     def _get_winners_config(self, guild_id: int):
         """Get or create winners configuration"""
         col = self.bot.db["winners"]
-        config = col.find_one({"guild_id": guild_id})
-        if not config:
-            config = {
-                "guild_id": guild_id,
-                "winners": []
-            }
-            col.insert_one(config)
-        return col, config
+        return col, configs.get(col, guild_id)
 
     def _get_signups_config(self, guild_id: int):
         """Get signups configuration"""
@@ -455,7 +167,9 @@ class AllWinners(commands.Cog):
                 signup_year = current_year - 1
                 election_year = current_year
 
-            await self._process_primary_winners(guild_id, signup_year, election_year)
+            # Keyed so a transition resumed after a crash can't append the winners twice
+            once_key = transition_key(old_phase, new_phase, current_year, "primary_winners")
+            await self._process_primary_winners(guild_id, signup_year, election_year, once_key=once_key)
 
         elif old_phase == "Primary Election" and new_phase == "General Campaign":
             # Ensure primary winners are ready for general campaign
@@ -507,16 +221,12 @@ class AllWinners(commands.Cog):
 
     def _calculate_zero_sum_percentages(self, guild_id: int, seat_id: str):
         """Calculate final percentages for candidates in a seat with zero-sum redistribution"""
-        winners_col, winners_config = self._get_winners_config(guild_id)
-
         time_col, time_config = self._get_time_config(guild_id)
         current_year = time_config["current_rp_date"].year
 
         # Find all primary winners for this seat for the current year
-        seat_candidates = [
-            w for w in winners_config.get("winners", [])
-            if w["seat_id"] == seat_id and w["year"] == current_year and w.get("primary_winner", False)
-        ]
+        seat_candidates = find_entries(self.bot.db["winners"], guild_id, "winners",
+                                       {"seat_id": seat_id, "year": current_year, "primary_winner": True}) or []
 
         if not seat_candidates:
             return {}
@@ -569,57 +279,12 @@ class AllWinners(commands.Cog):
             for party in parties.keys():
                 baseline_percentages[party] = 100.0 / num_parties
 
-        # Step 1: Calculate each candidate's raw change (a_i)
-        raw_changes = {}
-        B = 100.0  # Total baseline percentage
-
-        for candidate in seat_candidates:
-            party = candidate["party"]
-            candidate_name = candidate["candidate"]
-
-            # a_i = (p_i / 1200) - (0.1 * c_i)
-            points_change = candidate.get("points", 0.0) / 1200.0
-            corruption_penalty = candidate.get("corruption", 0) * 0.1
-            raw_change = points_change - corruption_penalty
-
-            raw_changes[candidate_name] = raw_change
-
-        # Step 2: Calculate net change across all candidates (s)
-        net_change_s = sum(raw_changes.values())
-
-        # Step 3: Apply zero-sum redistribution formula
-        final_percentages = {}
-
-        for candidate in seat_candidates:
-            party = candidate["party"]
-            candidate_name = candidate["candidate"]
-
-            # Final_i = b_i + a_i - (b_i / B) * s
-            baseline_bi = baseline_percentages[party]
-            raw_change_ai = raw_changes[candidate_name]
-            redistribution = (baseline_bi / B) * net_change_s
-
-            final_percentage = baseline_bi + raw_change_ai - redistribution
-
-            # Ensure minimum percentage (optional guardrail)
-            final_percentage = max(0.1, final_percentage)
-            final_percentages[candidate_name] = final_percentage
-
-        # COMPLETE 100% NORMALIZATION - Force total to exactly 100%
-        total_percentage = sum(final_percentages.values())
-        if total_percentage > 0:
-            for candidate_name in final_percentages:
-                final_percentages[candidate_name] = (final_percentages[candidate_name] / total_percentage) * 100.0
-
-        # Final verification and correction for floating point errors
-        final_total = sum(final_percentages.values())
-        if abs(final_total - 100.0) > 0.001:
-            # Apply micro-adjustment to the largest percentage
-            largest_candidate = max(final_percentages.keys(), key=lambda x: final_percentages[x])
-            adjustment = 100.0 - final_total
-            final_percentages[largest_candidate] += adjustment
-
-        return final_percentages
+        # a_i = (p_i / 1200) - (0.1 * c_i), then Final_i = b_i + a_i - (b_i / B) * s
+        names = [c["candidate"] for c in seat_candidates]
+        baselines = [baseline_percentages[c["party"]] for c in seat_candidates]
+        raw_changes = [c.get("points", 0.0) / 1200.0 - c.get("corruption", 0) * 0.1 for c in seat_candidates]
+        # 0.1% minimum, then proportional rescaling to 100% (no party floors in this model)
+        return dict(zip(names, normalize(linear_redistribute(baselines, raw_changes))))
 
     def _calculate_baseline_percentage(self, guild_id: int, seat_id: str, candidate_party: str):
         """Calculate baseline starting percentage for general election based on party distribution"""
@@ -685,8 +350,9 @@ class AllWinners(commands.Cog):
             # For 5+ parties, split evenly
             return 100.0 / num_parties
 
-    async def _process_primary_winners(self, guild_id: int, signup_year: int, election_year: int = None):
-        """Process primary winners from signups"""
+    async def _process_primary_winners(self, guild_id: int, signup_year: int, election_year: int = None,
+                                       once_key: Optional[str] = None):
+        """Process primary winners from signups. With once_key, at most once per key (see apply_once)."""
         if election_year is None:
             # Default logic: if signup_year is odd (1999), election_year is next even year (2000)
             # if signup_year is even (2000), election_year is the same year (2000)
@@ -695,11 +361,23 @@ class AllWinners(commands.Cog):
             else:  # Even year
                 election_year = signup_year
 
+        # Nothing is awaited while picking and appending the winners; once_key (apply_once) is what
+        # keeps a re-run of the same transition from appending them twice
+        primary_winners = self._build_primary_winners(guild_id, signup_year, election_year, once_key)
+
+        # Send announcement
+        guild = self.bot.get_guild(guild_id)
+        if guild and primary_winners is not None:
+            await self._announce_primary_results(guild, primary_winners, election_year)
+
+    def _build_primary_winners(self, guild_id: int, signup_year: int, election_year: int,
+                               once_key: Optional[str] = None):
+        """Pick each seat/party primary winner and append them to the winners array"""
         signups_col, signups_config = self._get_signups_config(guild_id)
         winners_col, winners_config = self._get_winners_config(guild_id)
 
         if not signups_config:
-            return
+            return None
 
         # Get all candidates for the signup year (previous year for even election years)
         candidates = [c for c in signups_config.get("candidates", []) if c["year"] == signup_year]
@@ -763,37 +441,17 @@ class AllWinners(commands.Cog):
 
             primary_winners.append(winner_entry)
 
-        # Add winners to database
+        # Add winners to database. $push appends without rewriting the array, so
+        # points/stamina $inc'd on existing winners in the meantime are kept
         if primary_winners:
-            if "winners" not in winners_config:
-                winners_config["winners"] = []
-            winners_config["winners"].extend(primary_winners)
-            winners_col.update_one(
-                {"guild_id": guild_id},
-                {"$set": {"winners": winners_config["winners"]}}
-            )
+            query, update = apply_once(guild_id, {"$push": {"winners": {"$each": primary_winners}}}, once_key)
+            if not winners_col.update_one(query, update).modified_count:
+                return None  # Already applied under this key: nothing new to announce
 
-        # Send announcement
-        guild = self.bot.get_guild(guild_id)
-        if guild:
-            await self._announce_primary_results(guild, primary_winners, election_year)
+        return primary_winners
 
     async def _announce_primary_results(self, guild: discord.Guild, winners: List[dict], year: int):
         """Announce primary election results"""
-        # Get announcement channel
-        setup_col = self.bot.db["guild_configs"]
-        setup_config = setup_col.find_one({"guild_id": guild.id})
-        announcement_channel_id = setup_config.get("announcement_channel") if setup_config else None
-
-        channel = None
-        if announcement_channel_id:
-            channel = guild.get_channel(announcement_channel_id)
-        if not channel:
-            channel = discord.utils.get(guild.channels, name="general") or guild.system_channel
-
-        if not channel:
-            return
-
         # Group winners by state for better display
         states = {}
         for winner in winners:
@@ -828,10 +486,7 @@ class AllWinners(commands.Cog):
             inline=False
         )
 
-        try:
-            await channel.send(embed=embed)
-        except Exception as e:
-            print(f"Error sending primary results announcement: {e}")
+        post_announcement(self.bot, guild, embed=embed)
 
     async def _ensure_general_campaign_candidates(self, guild_id: int, current_year: int):
         """Ensure primary winners are properly transitioned to general campaign"""
@@ -849,22 +504,22 @@ class AllWinners(commands.Cog):
             print(f"No primary winners found for general campaign transition in guild {guild_id} for year {current_year}")
             return
 
-        # Reset points and stamina for general campaign
-        updated_count = 0
-        for i, winner in enumerate(winners_config["winners"]):
-            if (winner.get("year") == current_year and
-                winner.get("primary_winner", False) and
-                winner.get("phase") != "General Campaign"):
-
-                winners_config["winners"][i]["points"] = 0.0  # Reset points for general campaign
-                winners_config["winners"][i]["stamina"] = 100  # Reset stamina
-                winners_config["winners"][i]["phase"] = "General Campaign"
-                updated_count += 1
-
+        # Reset points and stamina for general campaign. Updating only the matching array
+        # elements means concurrent $inc on other winners can't be overwritten.
+        updated_count = sum(1 for w in primary_winners if w.get("phase") != "General Campaign")
         if updated_count > 0:
             winners_col.update_one(
                 {"guild_id": guild_id},
-                {"$set": {"winners": winners_config["winners"]}}
+                {"$set": {
+                    "winners.$[w].points": 0.0,
+                    "winners.$[w].stamina": 100,
+                    "winners.$[w].phase": "General Campaign"
+                }},
+                array_filters=[{
+                    "w.year": current_year,
+                    "w.primary_winner": True,
+                    "w.phase": {"$ne": "General Campaign"}
+                }]
             )
             print(f"Updated {updated_count} primary winners for general campaign in guild {guild_id}")
 
@@ -889,7 +544,7 @@ class AllWinners(commands.Cog):
 
         # Reset points and stamina for presidential candidates in general campaign
         candidates_updated = []
-        for i, candidate in enumerate(pres_signups_config.get("candidates", [])):
+        for candidate in pres_signups_config.get("candidates", []):
             if (candidate.get("year") == current_year and
                 candidate.get("office") in ["President", "Vice President"] and
                 candidate.get("phase") != "General Campaign"):
@@ -909,17 +564,26 @@ class AllWinners(commands.Cog):
 
                 if party_key and pres_winners_config["winners"].get(party_key) == candidate_name:
                     # This candidate is a primary winner, reset for general campaign
-                    pres_signups_config["candidates"][i]["points"] = 0.0
-                    pres_signups_config["candidates"][i]["stamina"] = 300  # Presidential candidates get higher stamina
-                    pres_signups_config["candidates"][i]["phase"] = "General Campaign"
-                    candidates_updated.append(candidate_name)
+                    candidates_updated.append((candidate_name, candidate_party))
 
         if candidates_updated:
+            # Only the primary winners' elements, so concurrent $inc on other candidates is kept
             pres_signups_col.update_one(
                 {"guild_id": guild_id},
-                {"$set": {"candidates": pres_signups_config["candidates"]}}
+                {"$set": {
+                    "candidates.$[c].points": 0.0,
+                    "candidates.$[c].stamina": 300,  # Presidential candidates get higher stamina
+                    "candidates.$[c].phase": "General Campaign"
+                }},
+                array_filters=[{
+                    "c.year": current_year,
+                    "c.office": {"$in": ["President", "Vice President"]},
+                    "c.phase": {"$ne": "General Campaign"},
+                    "$or": [{"c.name": name, "c.party": party} for name, party in candidates_updated]
+                }]
             )
-            print(f"Updated {len(candidates_updated)} presidential primary winners for general campaign: {candidates_updated}")
+            print(f"Updated {len(candidates_updated)} presidential primary winners for general campaign: "
+                  f"{[name for name, _ in candidates_updated]}")
 
     @app_commands.command(
         name="view_primary_winners",
@@ -940,10 +604,10 @@ class AllWinners(commands.Cog):
 
         winners_col, winners_config = self._get_winners_config(interaction.guild.id)
 
-        # Filter primary winners for target year
+        # Filter primary winners for target year (finished cycles come from the archive)
         primary_winners = [
-            w for w in winners_config.get("winners", [])
-            if w["year"] == target_year and w.get("primary_winner", False)
+            w for w in year_entries(self.bot.db, interaction.guild.id, "winners", target_year, winners_config)
+            if w.get("primary_winner", False)
         ]
 
         if not primary_winners:
@@ -1164,10 +828,15 @@ class AllWinners(commands.Cog):
         elections_col, elections_config = self._get_elections_config(interaction.guild.id)
 
         if elections_config and "seats" in elections_config:
+            # One batched lookup instead of relying on a full member cache
+            member_cache = self.bot.get_cog("MemberCache")
+            members = {}
+            if member_cache:
+                members = await member_cache.fetch_many(interaction.guild, [w.get("user_id") for w in general_winners])
             for winner in general_winners:
                 for i, seat in enumerate(elections_config["seats"]):
                     if seat["seat_id"] == winner["seat_id"]:
-                        user = interaction.guild.get_member(winner["user_id"])
+                        user = members.get(winner["user_id"]) or interaction.guild.get_member(winner["user_id"])
                         user_name = user.display_name if user else winner["candidate"]
 
                         # Calculate new term dates
@@ -1212,8 +881,8 @@ class AllWinners(commands.Cog):
 
         # Filter general winners for target year
         general_winners = [
-            w for w in winners_config.get("winners", [])
-            if w["year"] == target_year and w.get("general_winner", False)
+            w for w in year_entries(self.bot.db, interaction.guild.id, "winners", target_year, winners_config)
+            if w.get("general_winner", False)
         ]
 
         # If no declared winners, check for general campaign candidates (primary winners)
@@ -1222,8 +891,8 @@ class AllWinners(commands.Cog):
             primary_year = target_year - 1 if target_year % 2 == 0 else target_year
 
             campaign_candidates = [
-                w for w in winners_config.get("winners", [])
-                if w["year"] == primary_year and w.get("primary_winner", False)
+                w for w in year_entries(self.bot.db, interaction.guild.id, "winners", primary_year, winners_config)
+                if w.get("primary_winner", False)
             ]
 
             if campaign_candidates:
@@ -1371,34 +1040,17 @@ class AllWinners(commands.Cog):
 
         await interaction.response.send_message(response, ephemeral=True)
 
-    @app_commands.command(
-        name="admin_view_all_campaign_points",
-        description="View all candidate points in general campaign phase (Admin only)"
-    )
-    @app_commands.checks.has_permissions(administrator=True)
-    async def admin_view_all_campaign_points(
-        self,
-        interaction: discord.Interaction,
-        sort_by: str = "points",
-        filter_state: str = None,
-        filter_party: str = None,
-        year: int = None,
-        page: int = 1
-    ):
-        # Defer immediately to prevent timeout
-        await interaction.response.defer(ephemeral=True)
-
-        time_col, time_config = self._get_time_config(interaction.guild.id)
+    def _general_points_page(self, guild: discord.Guild, sort_by: str, filter_state: Optional[str],
+                             filter_party: Optional[str], target_year: int, page: int):
+        """Embed for one page of the general campaign points list.
 
-        if not time_config:
-            await interaction.followup.send("❌ Election system not configured.", ephemeral=True)
-            return
+        Returns (embed, page, total_pages) with the page clamped into range, or
+        (error message, page, 0) when nothing matches.
+        """
+        time_col, time_config = self._get_time_config(guild.id)
+        current_phase = time_config.get("current_phase", "") if time_config else ""
 
-        current_year = time_config["current_rp_date"].year
-        current_phase = time_config.get("current_phase", "")
-        target_year = year if year else current_year
-
-        winners_col, winners_config = self._get_winners_config(interaction.guild.id)
+        winners_col, winners_config = self._get_winners_config(guild.id)
 
         # Get primary winners (candidates in general election)
         candidates = [
@@ -1407,11 +1059,7 @@ class AllWinners(commands.Cog):
         ]
 
         if not candidates:
-            await interaction.followup.send(
-                f"❌ No general election candidates found for {target_year}.",
-                ephemeral=True
-            )
-            return
+            return f"❌ No general election candidates found for {target_year}.", page, 0
 
         # Apply filters
         if filter_state:
@@ -1421,11 +1069,7 @@ class AllWinners(commands.Cog):
             candidates = [c for c in candidates if c.get("party", "").lower() == filter_party.lower()]
 
         if not candidates:
-            await interaction.followup.send(
-                "❌ No candidates found with those filters.",
-                ephemeral=True
-            )
-            return
+            return "❌ No candidates found with those filters.", page, 0
 
         # Sort candidates
         if sort_by.lower() == "points":
@@ -1457,7 +1101,7 @@ class AllWinners(commands.Cog):
         for seat_id in unique_seats:
             if seat_id and seat_id != "N/A":
                 try:
-                    seat_percentages_cache[seat_id] = self._calculate_zero_sum_percentages(interaction.guild.id, seat_id)
+                    seat_percentages_cache[seat_id] = self._calculate_zero_sum_percentages(guild.id, seat_id)
                 except Exception as e:
                     print(f"Error calculating percentages for seat {seat_id}: {e}")
                     seat_percentages_cache[seat_id] = {}
@@ -1483,8 +1127,7 @@ class AllWinners(commands.Cog):
         candidate_entries = []
         for i, candidate in enumerate(page_candidates, start_idx + 1):
             # Get user info
-            user = interaction.guild.get_member(candidate.get("user_id"))
-            user_mention = user.mention if user else candidate.get("candidate", "Unknown")
+            user_mention = mention(candidate["user_id"]) if candidate.get("user_id") else candidate.get("candidate", "Unknown")
 
             points_display = f"{candidate.get('points', 0):.2f}"
             if current_phase == "General Campaign":
@@ -1576,12 +1219,184 @@ class AllWinners(commands.Cog):
             inline=False
         )
 
-        # Create dropdown for quick navigation if many pages
+        return embed, page, total_pages
+
+    def _general_campaign_regions(self, guild_id: int, year: int) -> dict:
+        """Primary winners of the year's general campaign grouped by state"""
+        winners_col, winners_config = self._get_winners_config(guild_id)
+        regions = {}
+        for candidate in year_entries(self.bot.db, guild_id, "winners", year, winners_config):
+            if candidate.get("primary_winner", False):
+                regions.setdefault(candidate["state"], []).append(candidate)
+        return regions
+
+    def _general_campaign_region_embed(self, year: int, candidates_by_region: dict, selected_region: str) -> discord.Embed:
+        """One region of view_general_campaign ("all" for the overview of every region)"""
+        if selected_region == "all":
+            # Show overview of all regions
+            embed = discord.Embed(
+                title=f"🎯 {year} General Campaign - All Regions",
+                description="Primary winners advancing to general election",
+                color=discord.Color.purple(),
+                timestamp=datetime.utcnow()
+            )
+
+            # Add summary for each region
+            for region, candidates in sorted(candidates_by_region.items()):
+                candidate_list = ""
+                for candidate in sorted(candidates, key=lambda x: x.get("points", 0), reverse=True)[:5]:
+                    candidate_name = candidate.get('candidate', 'Unknown')
+                    candidate_party = candidate.get('party', 'Unknown')
+                    candidate_seat = candidate.get('seat_id', 'Unknown')
+                    candidate_list += f"• **{candidate_name}** ({candidate_party}) - {candidate_seat}\n"
+
+                if len(candidates) > 5:
+                    candidate_list += f"• ... and {len(candidates) - 5} more"
+
+                embed.add_field(
+                    name=f"📍 {region} ({len(candidates)} candidates)",
+                    value=candidate_list or "No candidates",
+                    inline=True
+                )
+        else:
+            # Show detailed view for selected region
+            candidates = candidates_by_region.get(selected_region, [])
+
+            embed = discord.Embed(
+                title=f"🎯 {year} General Campaign - {selected_region}",
+                description=f"Primary winners from {selected_region} advancing to general election",
+                color=discord.Color.purple(),
+                timestamp=datetime.utcnow()
+            )
+
+            if not candidates:
+                embed.add_field(
+                    name="📋 No Candidates",
+                    value=f"No candidates found for {selected_region}",
+                    inline=False
+                )
+            else:
+                # Group candidates by seat for proper percentage calculation
+                seats_in_region = {}
+                for candidate in candidates:
+                    seat_id = candidate.get("seat_id", "Unknown")
+                    if seat_id not in seats_in_region:
+                        seats_in_region[seat_id] = []
+                    seats_in_region[seat_id].append(candidate)
+
+                candidate_list = ""
+                for seat_id, seat_candidates in sorted(seats_in_region.items()):
+                    for candidate in sorted(seat_candidates, key=lambda x: x.get("points", 0), reverse=True):
+                        # Safely get candidate data
+                        candidate_name = candidate.get("candidate", "Unknown")
+                        candidate_party = candidate.get("party", "Unknown")
+                        candidate_office = candidate.get("office", "Unknown")
+                        candidate_points = candidate.get("points", 0)
+                        candidate_stamina = candidate.get("stamina", 100)
+                        candidate_corruption = candidate.get("corruption", 0)
+
+                        # Get user mention
+                        user_id = candidate.get("user_id")
+                        user_mention = f"<@{user_id}>" if user_id else "No user"
+
+                        candidate_list += (
+                            f"**{candidate_name}** ({candidate_party})\n"
+                            f"└ {seat_id} - {candidate_office}\n"
+                            f"└ Stamina: {candidate_stamina} | Corruption: {candidate_corruption}\n"
+                            f"└ {user_mention}\n\n"
+                        )
+
+                # Handle long content by splitting into multiple fields
+                if len(candidate_list) > 1024:
+                    parts = candidate_list.split('\n\n')
+                    current_part = ""
+                    part_num = 1
+
+                    for part in parts:
+                        if part.strip():  # Skip empty parts
+                            if len(current_part + part + '\n\n') > 1024:
+                                if current_part.strip():
+                                    embed.add_field(
+                                        name=f"📊 Candidates (Part {part_num})",
+                                        value=current_part.strip(),
+                                        inline=False
+                                    )
+                                current_part = part + '\n\n'
+                                part_num += 1
+                            else:
+                                current_part += part + '\n\n'
+
+                    if current_part.strip():
+                        embed.add_field(
+                            name=f"📊 Candidates (Part {part_num})" if part_num > 1 else "📊 Candidates",
+                            value=current_part.strip(),
+                            inline=False
+                        )
+                else:
+                    embed.add_field(
+                        name="📊 Candidates",
+                        value=candidate_list.strip() if candidate_list.strip() else "No candidates found",
+                        inline=False
+                    )
+
+                # Add region statistics
+                if candidates:
+                    total_points = sum(c.get('points', 0) for c in candidates)
+                    avg_stamina = sum(c.get('stamina', 100) for c in candidates) / len(candidates)
+                    avg_corruption = sum(c.get('corruption', 0) for c in candidates) / len(candidates)
+
+                    embed.add_field(
+                        name="📈 Region Statistics",
+                        value=f"**Total Candidates:** {len(candidates)}\n"
+                              f"**Average Stamina:** {avg_stamina:.1f}\n"
+                              f"**Average Corruption:** {avg_corruption:.1f}",
+                        inline=False
+                    )
+
+        embed.set_footer(text=f"Use the dropdown to view other regions • Year: {year}")
+        return embed
+
+    @app_commands.command(
+        name="admin_view_all_campaign_points",
+        description="View all candidate points in general campaign phase (Admin only)"
+    )
+    @app_commands.checks.has_permissions(administrator=True)
+    async def admin_view_all_campaign_points(
+        self,
+        interaction: discord.Interaction,
+        sort_by: str = "points",
+        filter_state: str = None,
+        filter_party: str = None,
+        year: int = None,
+        page: int = 1
+    ):
+        # Defer immediately to prevent timeout
+        await interaction.response.defer(ephemeral=True)
+
+        time_col, time_config = self._get_time_config(interaction.guild.id)
+
+        if not time_config:
+            await interaction.followup.send("❌ Election system not configured.", ephemeral=True)
+            return
+
+        current_year = time_config["current_rp_date"].year
+        target_year = year if year else current_year
+
+        page_embed, page, total_pages = self._general_points_page(
+            interaction.guild, sort_by, filter_state, filter_party, target_year, page
+        )
+        if isinstance(page_embed, str):
+            await interaction.followup.send(page_embed, ephemeral=True)
+            return
+
+        # Dropdown for quick navigation if many pages; it survives restarts
+        view = None
         if total_pages > 1:
-            view = CampaignPointsView(interaction, sort_by, filter_state, filter_party, year, total_pages, page)
-            await interaction.followup.send(embed=embed, view=view, ephemeral=True)
+            view = persistent_view(GeneralPointsPageSelect, target_year, page, total_pages, sort_by, filter_state, filter_party)
+        if view:
+            await interaction.followup.send(embed=page_embed, view=view, ephemeral=True)
         else:
-            await interaction.followup.send(embed=embed, ephemeral=True)
+            await interaction.followup.send(embed=page_embed, ephemeral=True)
 
     @app_commands.command(
         name="admin_view_candidate_details",
@@ -1627,7 +1442,7 @@ class AllWinners(commands.Cog):
             )
             return
 
-        user = interaction.guild.get_member(candidate["user_id"])
+        user = await resolve_member(self.bot, interaction.guild, candidate["user_id"])
         user_info = f"{user.mention} ({user.display_name})" if user else "User not found"
 
         embed = discord.Embed(
@@ -2052,14 +1867,9 @@ class AllWinners(commands.Cog):
         current_phase = time_config.get("current_phase", "")
         target_year = year if year else current_year
 
-        winners_col, winners_config = self._get_winners_config(interaction.guild.id)
-
-        # Get primary winners (candidates in general campaign) for target year
-        # Look for primary winners with the target year (they were transitioned to have the election year)
-        general_candidates = [
-            w for w in winners_config.get("winners", [])
-            if w["year"] == target_year and w.get("primary_winner", False)
-        ]
+        # Primary winners (candidates in general campaign) for target year, grouped by state
+        regions = self._general_campaign_regions(interaction.guild.id, target_year)
+        general_candidates = [candidate for candidates in regions.values() for candidate in candidates]
 
         if not general_candidates:
             await interaction.response.send_message(
@@ -2071,20 +1881,6 @@ class AllWinners(commands.Cog):
         # Defer response to prevent timeout
         await interaction.response.defer()
 
-        # Pre-calculate all seat percentages to avoid repeated calculations
-        all_seats = list(set(c["seat_id"] for c in general_candidates))
-        seat_percentages_cache = {}
-        for seat_id in all_seats:
-            seat_percentages_cache[seat_id] = self._calculate_zero_sum_percentages(interaction.guild.id, seat_id)
-
-        # Group by state/region
-        regions = {}
-        for candidate in general_candidates:
-            region = candidate["state"]
-            if region not in regions:
-                regions[region] = []
-            regions[region].append(candidate)
-
         # Create main overview embed
         embed = discord.Embed(
             title=f"🎯 {target_year} General Campaign Candidates",
@@ -2127,7 +1923,7 @@ class AllWinners(commands.Cog):
         )
 
         # Create the dropdown view
-        view = GeneralCampaignRegionView(regions, regions, target_year, seat_percentages_cache)
+        view = persistent_view(GeneralCampaignRegionSelect, target_year, regions)
 
         if target_year % 2 == 0 and not year:  # Even year, showing current year's winners
             embed.set_footer(text=f"Showing {target_year} primary winners advancing to general election")
@@ -2312,7 +2108,7 @@ class AllWinners(commands.Cog):
         winners_col, winners_config = self._get_winners_config(interaction.guild.id)
 
         # Filter winners
-        winners = [w for w in winners_config.get("winners", []) if w["year"] == target_year]
+        winners = year_entries(self.bot.db, interaction.guild.id, "winners", target_year, winners_config)
 
         if winner_type.lower() == "primary":
             winners = [w for w in winners if w.get("primary_winner", False)]
@@ -0,0 +1,220 @@
+from discord.ext import commands
+from collections import deque
+from typing import Deque, Dict, List, Optional
+import asyncio
+import time
+
+import discord
+
+SENDS_PER_WINDOW = 5  # Discord's per-channel message limit...
+SEND_WINDOW = 5.0  # ...per this many seconds
+MERGE_DELAY = 1.0  # How long a mergeable announcement waits for siblings from the same tick
+MAX_FIELDS = 25
+MAX_EMBED_CHARS = 5500  # Under Discord's 6000 per embed, leaving room for title and footer
+
+
+class Announcement:
+    __slots__ = ("content", "embed", "merge_key", "merge_title", "queued_at")
+
+    def __init__(self, content: Optional[str], embed: Optional[discord.Embed],
+                 merge_key: Optional[str], merge_title: Optional[str]):
+        self.content = content
+        self.embed = embed
+        self.merge_key = merge_key
+        self.merge_title = merge_title
+        self.queued_at = time.monotonic()
+
+
+def merge_embeds(items: List[Announcement]) -> List[discord.Embed]:
+    """Fold several announcements into as few embeds as possible, one field per announcement"""
+    if len(items) == 1:
+        return [items[0].embed]
+
+    first = items[0].embed
+    title = items[0].merge_title or f"📢 {len(items)} Announcements"
+    merged: List[discord.Embed] = []
+    current = None
+    for item in items:
+        lines = [item.embed.description or ""]
+        lines += [f"{field.value}" for field in item.embed.fields]
+        name = (item.embed.title or "​")[:256]
+        value = "\n".join(line for line in lines if line)[:1024] or "​"
+        if current is None or len(current.fields) >= MAX_FIELDS or len(current) + len(name) + len(value) > MAX_EMBED_CHARS:
+            current = discord.Embed(title=title, color=first.color, timestamp=first.timestamp)
+            merged.append(current)
+        current.add_field(name=name, value=value, inline=False)
+    return merged
+
+
+class OutboundChannel:
+    """Channel stand-in whose send() queues the message instead of waiting on Discord.
+
+    Lets code that was handed a channel (the Elections phase handlers) keep calling
+    `await channel.send(embed=...)`; everything else is read from the real channel.
+    """
+
+    def __init__(self, announcements: "Announcements", channel):
+        self._announcements = announcements
+        self._channel = channel
+
+    async def send(self, content: Optional[str] = None, *, embed: Optional[discord.Embed] = None, **kwargs):
+        self._announcements.enqueue(self._channel, content=content, embed=embed)
+
+    def __getattr__(self, name):
+        return getattr(self._channel, name)
+
+
+class Announcements(commands.Cog):
+    """Where and how automatic announcements reach a guild.
+
+    The announcement channel (configured channel, else #general, else the system
+    channel) is resolved once per guild and cached until guild_configs or the
+    guild's channels change. Messages go into a per-channel queue drained by a
+    background task that stays within Discord's per-channel rate limit, so loops
+    and phase handlers never wait on Discord HTTP. Announcements posted with the
+    same merge_key within MERGE_DELAY of each other go out as one embed.
+    """
+
+    def __init__(self, bot):
+        self.bot = bot
+        self.channels: Dict[int, Optional[int]] = {}  # guild_id -> channel_id (None: nowhere to post)
+        self.queues: Dict[int, Deque[Announcement]] = {}  # channel_id -> pending announcements
+        self.workers: Dict[int, asyncio.Task] = {}
+        self.sent: Dict[int, Deque[float]] = {}  # channel_id -> recent send times
+        self.listening = hasattr(bot.db, "add_write_listener")
+        if self.listening:
+            bot.db.add_write_listener(self._on_write)
+        print("Announcements cog loaded successfully")
+
+    def cog_unload(self):
+        if self.listening:
+            self.bot.db.remove_write_listener(self._on_write)
+        for task in self.workers.values():
+            task.cancel()
+
+    def _on_write(self, collection: str, operation: str, guild_id: Optional[int]):
+        if collection == "guild_configs":
+            self.invalidate(guild_id)
+
+    @commands.Cog.listener()
+    async def on_remote_change(self, collection: str, operation: str, guild_id: Optional[int]):
+        self._on_write(collection, operation, guild_id)
+
+    @commands.Cog.listener()
+    async def on_guild_channel_create(self, channel):
+        self.invalidate(channel.guild.id)
+
+    @commands.Cog.listener()
+    async def on_guild_channel_delete(self, channel):
+        self.invalidate(channel.guild.id)
+
+    @commands.Cog.listener()
+    async def on_guild_channel_update(self, before, after):
+        if before.name != after.name:
+            self.invalidate(after.guild.id)
+
+    def invalidate(self, guild_id: Optional[int] = None):
+        if guild_id is None:
+            self.channels.clear()
+        else:
+            self.channels.pop(guild_id, None)
+
+    def resolve(self, guild: discord.Guild):
+        """The guild's announcement channel, or None if it has nowhere to post"""
+        if guild.id in self.channels:
+            channel_id = self.channels[guild.id]
+            return guild.get_channel(channel_id) if channel_id else None
+
+        setup_config = self.bot.db["guild_configs"].find_one(
+            {"guild_id": guild.id}, {"announcement_channel_id": 1, "announcement_channel": 1}
+        ) or {}
+        channel = None
+        # /setup stores announcement_channel_id; older documents used announcement_channel
+        for key in ("announcement_channel_id", "announcement_channel"):
+            if not channel and setup_config.get(key):
+                channel = guild.get_channel(setup_config[key])
+        if not channel:
+            channel = discord.utils.get(guild.text_channels, name="general") or guild.system_channel
+
+        self.channels[guild.id] = channel.id if channel else None
+        return channel
+
+    def outbound(self, guild: discord.Guild) -> Optional[OutboundChannel]:
+        channel = self.resolve(guild)
+        return OutboundChannel(self, channel) if channel else None
+
+    def post(self, guild: discord.Guild, embed: Optional[discord.Embed] = None, content: Optional[str] = None,
+             merge_key: Optional[str] = None, merge_title: Optional[str] = None) -> bool:
+        """Queue an announcement for the guild's channel. Returns False if there's nowhere to post."""
+        channel = self.resolve(guild)
+        if not channel:
+            print(f"No announcement channel found for guild {guild.id}")
+            return False
+        self.enqueue(channel, content=content, embed=embed, merge_key=merge_key, merge_title=merge_title)
+        return True
+
+    def enqueue(self, channel, content: Optional[str] = None, embed: Optional[discord.Embed] = None,
+                merge_key: Optional[str] = None, merge_title: Optional[str] = None):
+        if embed is None:
+            merge_key = None  # Only embeds can be merged
+        self.queues.setdefault(channel.id, deque()).append(Announcement(content, embed, merge_key, merge_title))
+        worker = self.workers.get(channel.id)
+        if worker is None or worker.done():
+            self.workers[channel.id] = asyncio.create_task(self._drain(channel))
+
+    async def _wait_for_budget(self, channel_id: int):
+        sent = self.sent.setdefault(channel_id, deque())
+        while True:
+            now = time.monotonic()
+            while sent and sent[0] <= now - SEND_WINDOW:
+                sent.popleft()
+            if len(sent) < SENDS_PER_WINDOW:
+                sent.append(now)
+                return
+            await asyncio.sleep(sent[0] + SEND_WINDOW - now)
+
+    async def _send(self, channel, content: Optional[str], embed: Optional[discord.Embed]):
+        for attempt in range(3):
+            await self._wait_for_budget(channel.id)
+            try:
+                await channel.send(content=content, embed=embed)
+                return
+            except discord.HTTPException as e:
+                if e.status != 429 or attempt == 2:
+                    print(f"Failed to send announcement to #{channel.name}: {e}")
+                    if isinstance(e, (discord.Forbidden, discord.NotFound)):
+                        self.invalidate(channel.guild.id)
+                    return
+                await asyncio.sleep(getattr(e, "retry_after", None) or SEND_WINDOW)
+
+    async def _drain(self, channel):
+        """Send the channel's queued announcements in order, merging same-key embeds"""
+        queue = self.queues[channel.id]
+        while queue:
+            head = queue[0]
+            if head.merge_key:
+                # Give the rest of this tick's announcements a moment to arrive
+                wait = head.queued_at + MERGE_DELAY - time.monotonic()
+                if wait > 0:
+                    await asyncio.sleep(wait)
+                batch = [item for item in queue if item.merge_key == head.merge_key]
+                for item in batch:
+                    queue.remove(item)
+                for embed in merge_embeds(batch):
+                    await self._send(channel, None, embed)
+            else:
+                queue.popleft()
+                await self._send(channel, head.content, head.embed)
+        self.queues.pop(channel.id, None)
+
+
+def post_announcement(bot, guild: discord.Guild, embed: Optional[discord.Embed] = None, content: Optional[str] = None,
+                      merge_key: Optional[str] = None, merge_title: Optional[str] = None) -> bool:
+    """Queue an announcement through the Announcements cog (False if it's not loaded or there's no channel)"""
+    announcements = bot.get_cog("Announcements")
+    return bool(announcements and announcements.post(guild, embed=embed, content=content,
+                                                     merge_key=merge_key, merge_title=merge_title))
+
+
+async def setup(bot):
+    await bot.add_cog(Announcements(bot))
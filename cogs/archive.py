@@ -0,0 +1,102 @@
+from typing import Dict, List, Optional
+
+# Live collection -> the array holding its per-year entries
+ARCHIVED_ARRAYS = {
+    "signups": "candidates",
+    "winners": "winners",
+    "presidential_signups": "candidates",
+}
+ARCHIVE_INDEXES = [
+    [("guild_id", 1), ("seat_id", 1)],
+    [("guild_id", 1), ("user_id", 1)],
+]
+
+_indexed = set()  # Archive collections whose indexes this process already ensured
+
+
+def archive_collection_name(collection: str, year: int) -> str:
+    """winners_archive_2000 etc.; one collection per source collection per year"""
+    return f"{collection}_archive_{year}"
+
+
+def archive_id(guild_id: int, entry: dict) -> str:
+    """Stable _id of an entry's archive copy, guild_id:user_id:seat_id:year.
+
+    Built from who ran for which seat in which year rather than the entry's contents,
+    so an entry edited after it was archived maps to the same document.
+    """
+    who = entry.get("user_id") or entry.get("name") or entry.get("candidate")
+    seat = entry.get("seat_id") or f"{entry.get('state')}/{entry.get('office')}"
+    return f"{guild_id}:{who}:{seat}:{entry.get('year')}"
+
+
+def _ensure_indexes(db, name: str):
+    if name in _indexed:
+        return
+    for keys in ARCHIVE_INDEXES:
+        db[name].create_index(keys)
+    _indexed.add(name)
+
+
+def archive_completed_cycles(db, guild_id: int, keep_from_year: int) -> Dict[str, int]:
+    """Move every entry older than keep_from_year out of the live arrays into the yearly archives.
+
+    Each archived entry becomes its own document (tagged with guild_id) in
+    <collection>_archive_<year>, upserted under archive_id so a run interrupted half
+    way is simply repeated, and later runs for the same year (an entry re-added or
+    backdated, the clock set back) add to what is already archived. Only the entries
+    that were copied are $pulled from the live array; one edited in the meantime
+    stays live and the next run replaces its archive copy. Returns the number of
+    entries moved per collection.
+    """
+    moved = {}
+    for collection, field in ARCHIVED_ARRAYS.items():
+        config = db[collection].find_one({"guild_id": guild_id}, {field: 1})
+        if not config:
+            continue
+
+        by_year: Dict[int, List[dict]] = {}
+        for entry in config.get(field, []):
+            year = entry.get("year")
+            if isinstance(year, int) and year < keep_from_year:
+                by_year.setdefault(year, []).append(entry)
+        if not by_year:
+            continue
+
+        copied = []
+        for year, entries in sorted(by_year.items()):
+            name = archive_collection_name(collection, year)
+            _ensure_indexes(db, name)
+            for entry in entries:
+                entry_id = archive_id(guild_id, entry)
+                db[name].replace_one({"_id": entry_id}, dict(entry, _id=entry_id, guild_id=guild_id), upsert=True)
+                copied.append(entry)
+
+        # Exact matches only: entries added since the read stay live until the next run
+        db[collection].update_one(
+            {"guild_id": guild_id},
+            {"$pull": {field: {"$in": copied}}}
+        )
+        moved[collection] = len(copied)
+    return moved
+
+
+def archived_years(db, collection: str) -> List[int]:
+    """Years that have an archive collection for this source collection, newest first"""
+    prefix = archive_collection_name(collection, "")
+    names = db.list_collection_names(filter={"name": {"$regex": f"^{prefix}[0-9]+$"}})
+    return sorted((int(name[len(prefix):]) for name in names), reverse=True)
+
+
+def year_entries(db, guild_id: int, collection: str, year: int, live: Optional[dict] = None) -> List[dict]:
+    """A year's entries for history views: the live array first, the yearly archive once it's been moved.
+
+    Pass the live document as `live` when the caller already loaded it.
+    """
+    field = ARCHIVED_ARRAYS[collection]
+    if live is None:
+        live = db[collection].find_one({"guild_id": guild_id}, {field: 1})
+    entries = [entry for entry in (live or {}).get(field, []) if entry.get("year") == year]
+    if entries:
+        return entries
+    return list(db[archive_collection_name(collection, year)].find({"guild_id": guild_id}, {"_id": 0}))
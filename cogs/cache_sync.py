@@ -0,0 +1,137 @@
+from discord.ext import commands, tasks
+from typing import Dict, Optional, Tuple
+import asyncio
+import hashlib
+import os
+import threading
+
+import bson
+from pymongo.errors import OperationFailure, PyMongoError
+
+from .instrumentation import timed_loop
+
+# Collections whose documents back in-memory caches somewhere in the bot
+WATCHED_COLLECTIONS = [
+    "time_configs", "signups", "winners", "presidential_signups", "presidential_winners",
+    "momentum_config", "parties_config", "elections_config",
+]
+MAX_AWAIT_MS = 1000  # How long one getMore waits for events before the watcher checks for shutdown
+POLL_INTERVAL = float(os.getenv("CACHE_SYNC_POLL_SECONDS", "5"))  # Fallback staleness bound
+CHANGE_STREAMS_UNSUPPORTED = 40573  # Standalone mongod: change streams need a replica set
+
+
+class CacheSync(commands.Cog):
+    """Tells caches about changes made by other bot processes or directly in the database.
+
+    Watches the cached collections with a change stream and dispatches a
+    `remote_change(collection, operation, guild_id)` event for each change, so any cog
+    can drop or patch its per-guild entries with an `on_remote_change` listener.
+    guild_id is None when the change can't be tied to one guild (deletes, drops).
+    Writes made by this process come back through the stream as well.
+
+    Against a standalone mongod (local testing) it falls back to fingerprinting the
+    watched documents every POLL_INTERVAL seconds.
+    """
+
+    def __init__(self, bot):
+        self.bot = bot
+        self.mode = None  # "change_stream" or "polling" once running
+        self.resume_token = None
+        self.events = 0
+        self._stop = threading.Event()
+        self._task = None
+        self._fingerprints: Dict[Tuple[str, Optional[int]], bytes] = {}
+        self._polled = False  # The first poll only records fingerprints
+        print("CacheSync cog loaded successfully")
+
+    async def cog_load(self):
+        self._task = asyncio.create_task(self.run())
+
+    def cog_unload(self):
+        self._stop.set()
+        if self._task and not self._task.done():
+            self._task.cancel()
+        self.poll_loop.cancel()
+
+    def _publish(self, collection: str, operation: str, guild_id: Optional[int]):
+        self.events += 1
+        self.bot.dispatch("remote_change", collection, operation, guild_id)
+
+    async def run(self):
+        db_ready = getattr(self.bot, "db_ready", None)
+        if db_ready is not None:
+            await db_ready.wait()
+
+        loop = asyncio.get_running_loop()
+        delay = 1
+        while not self._stop.is_set():
+            try:
+                await asyncio.to_thread(self._watch, loop)
+                delay = 1
+            except OperationFailure as e:
+                if e.code == CHANGE_STREAMS_UNSUPPORTED or "replica set" in str(e).lower():
+                    print(f"Change streams unavailable ({e}); polling every {POLL_INTERVAL:g}s instead")
+                    self.mode = "polling"
+                    self.poll_loop.change_interval(seconds=POLL_INTERVAL)
+                    self.poll_loop.start()
+                    return
+                print(f"Change stream error, retrying in {delay}s: {e}")
+            except PyMongoError as e:
+                print(f"Change stream error, retrying in {delay}s: {e}")
+            if not self._stop.is_set():
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, 60)
+
+    def _watch(self, loop):
+        """Blocking change stream reader, run in a worker thread"""
+        pipeline = [
+            {"$match": {"ns.coll": {"$in": WATCHED_COLLECTIONS}}},
+            # Only guild_id of the looked-up document is needed to route the change
+            {"$project": {"operationType": 1, "ns": 1, "fullDocument.guild_id": 1}},
+        ]
+        # start_after (rather than resume_after) also resumes past an invalidate event
+        with self.bot.db.watch(pipeline, full_document="updateLookup", start_after=self.resume_token,
+                               max_await_time_ms=MAX_AWAIT_MS) as stream:
+            self.mode = "change_stream"
+            while not self._stop.is_set() and stream.alive:
+                change = stream.try_next()
+                self.resume_token = stream.resume_token
+                if change is None:
+                    continue
+                collection = change.get("ns", {}).get("coll")
+                guild_id = (change.get("fullDocument") or {}).get("guild_id")
+                loop.call_soon_threadsafe(self._publish, collection, change["operationType"], guild_id)
+
+    def _poll_once(self):
+        """(collection, guild_id) pairs whose document changed since the last poll"""
+        changed = []
+        seen = set()
+        for collection in WATCHED_COLLECTIONS:
+            for document in self.bot.db[collection].find({}):
+                key = (collection, document.get("guild_id"))
+                seen.add(key)
+                digest = hashlib.blake2b(bson.encode(document), digest_size=16).digest()
+                previous = self._fingerprints.get(key)
+                self._fingerprints[key] = digest
+                if self._polled and previous != digest:
+                    changed.append(key)
+        for key in set(self._fingerprints) - seen:
+            del self._fingerprints[key]
+            changed.append(key)
+        self._polled = True
+        return changed
+
+    @tasks.loop(seconds=POLL_INTERVAL)
+    @timed_loop("cache_sync.poll_loop")
+    async def poll_loop(self):
+        try:
+            changed = await asyncio.to_thread(self._poll_once)
+        except PyMongoError as e:
+            print(f"Cache sync poll failed: {e}")
+            return
+        for collection, guild_id in changed:
+            self._publish(collection, "poll", guild_id)
+
+
+async def setup(bot):
+    await bot.add_cog(CacheSync(bot))
@@ -0,0 +1,118 @@
+from discord.ext import commands
+import discord
+import heapq
+import time
+from datetime import datetime
+from typing import Dict, List
+
+CACHE_TTL_SECONDS = 60  # Re-read a guild's effects at most this often, to pick up edits made elsewhere
+MIN_MULTIPLIER = 0.1  # Debuffs can never take an action below 10% effectiveness
+
+
+class GuildEffects:
+    """Active buffs/debuffs for one guild, indexed by target user with an expiry heap"""
+
+    def __init__(self, guild_id: int, active_effects: dict):
+        self.guild_id = guild_id
+        self.loaded_at = time.monotonic()
+        # target user id -> [(effect_id, effect)] in document order, so stacking
+        # order (buffs add, debuffs multiply) matches the stored effect order
+        self.by_user: Dict[int, List[tuple]] = {}
+        self.expiry_heap: List[tuple] = []  # (expires_at, effect_id, target_user_id)
+        self.expires: Dict[str, datetime] = {}  # Current expiry per effect, to skip stale heap entries
+        for effect_id, effect in active_effects.items():
+            self._index(effect_id, effect)
+
+    def _index(self, effect_id: str, effect: dict):
+        target = effect.get("target_user_id")
+        self.by_user.setdefault(target, []).append((effect_id, effect))
+        expires_at = effect.get("expires_at")
+        if not isinstance(expires_at, datetime):
+            expires_at = datetime.min  # No valid expiry: purge on the next lookup
+        self.expires[effect_id] = expires_at
+        heapq.heappush(self.expiry_heap, (expires_at, effect_id, target))
+
+    def remove(self, effect_id: str, target_user_id: int):
+        self.expires.pop(effect_id, None)
+        effects = self.by_user.get(target_user_id)
+        if not effects:
+            return
+        effects[:] = [(eid, effect) for eid, effect in effects if eid != effect_id]
+        if not effects:
+            del self.by_user[target_user_id]
+
+    def pop_expired(self, now: datetime) -> List[str]:
+        """Drop every effect that has expired by now and return their ids"""
+        expired = []
+        while self.expiry_heap and self.expiry_heap[0][0] <= now:
+            expires_at, effect_id, target = heapq.heappop(self.expiry_heap)
+            if self.expires.get(effect_id) != expires_at:
+                continue  # Effect was removed or replaced since this entry was pushed
+            self.remove(effect_id, target)
+            expired.append(effect_id)
+        return expired
+
+    def multiplier(self, user_id: int, action_type: str, now: datetime) -> float:
+        multiplier = 1.0
+        for _, effect in self.by_user.get(user_id, ()):
+            expires_at = effect.get("expires_at")
+            if not expires_at or expires_at <= now:
+                continue
+            action_types = effect.get("action_types")
+            if action_types and action_type not in action_types:
+                continue
+
+            effect_multiplier = effect.get("multiplier", 1.0)
+            if effect.get("effect_type") == "buff":
+                multiplier += (effect_multiplier - 1.0)
+            elif effect.get("effect_type") == "debuff":
+                multiplier *= effect_multiplier
+        return multiplier
+
+
+class CampaignEffects(commands.Cog):
+    """Shared buff/debuff engine for general, presidential and demographic campaign actions"""
+
+    def __init__(self, bot):
+        self.bot = bot
+        self.guilds: Dict[int, GuildEffects] = {}
+        print("CampaignEffects cog loaded successfully")
+
+    def _get_guild_effects(self, guild_id: int) -> GuildEffects:
+        effects = self.guilds.get(guild_id)
+        if effects is None or time.monotonic() - effects.loaded_at > CACHE_TTL_SECONDS:
+            col = self.bot.db["campaign_buffs_debuffs"]
+            config = col.find_one({"guild_id": guild_id}, {"active_effects": 1})
+            effects = GuildEffects(guild_id, (config or {}).get("active_effects", {}))
+            self.guilds[guild_id] = effects
+        return effects
+
+    def invalidate(self, guild_id: int = None):
+        """Forget cached effects for a guild (or all guilds) so the next lookup re-reads them"""
+        if guild_id is None:
+            self.guilds.clear()
+        else:
+            self.guilds.pop(guild_id, None)
+
+    def _purge_expired(self, guild_id: int, effects: GuildEffects, now: datetime):
+        expired = effects.pop_expired(now)
+        if expired:
+            # One write for every effect that lapsed since the last action
+            self.bot.db["campaign_buffs_debuffs"].update_one(
+                {"guild_id": guild_id},
+                {"$unset": {f"active_effects.{effect_id}": "" for effect_id in expired}}
+            )
+
+    def get_multiplier(self, guild_id: int, user_id: int, action_type: str) -> float:
+        now = datetime.utcnow()
+        effects = self._get_guild_effects(guild_id)
+        self._purge_expired(guild_id, effects, now)
+        return max(MIN_MULTIPLIER, effects.multiplier(user_id, action_type, now))
+
+    def apply_multiplier(self, base_points: float, user_id: int, guild_id: int, action_type: str) -> float:
+        """Scale points by the user's active buffs and debuffs for this action type"""
+        return base_points * self.get_multiplier(guild_id, user_id, action_type)
+
+
+async def setup(bot):
+    await bot.add_cog(CampaignEffects(bot))
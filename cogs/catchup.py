@@ -0,0 +1,72 @@
+from datetime import datetime, timedelta
+from typing import Callable, List, NamedTuple, Tuple
+
+CYCLE_END_PHASE = "General Election"
+CYCLE_START_PHASE = "Signups"
+
+
+class Transition(NamedTuple):
+    rp_date: datetime  # RP instant the new phase starts
+    old_phase: str
+    new_phase: str
+    year: int
+    new_cycle: bool  # The Dec 31 roll into the next cycle's signups
+
+
+class Segment(NamedTuple):
+    phase: str
+    start: datetime
+    end: datetime  # Exclusive, except for the last segment, which ends at the target date
+
+
+def _next_month(date: datetime) -> datetime:
+    if date.month == 12:
+        return datetime(date.year + 1, 1, 1)
+    return datetime(date.year, date.month + 1, 1)
+
+
+def rp_timeline(start: datetime, start_phase: str, end: datetime,
+                phase_at: Callable[[datetime], str]) -> Tuple[List[Transition], List[Segment], datetime]:
+    """Every phase change between two RP dates, in order.
+
+    Phases only change on the first of a month, so the walk steps month by month
+    (a few hundred steps for years of downtime) instead of minute by minute. A
+    General Election reaching Dec 31 rolls into Signups on Feb 1 of the next year,
+    as TimeManager.time_loop does, and the rest of the elapsed RP time continues
+    from there. Returns the transitions, the phase segments between them
+    (len(transitions) + 1) and the RP date reached.
+    """
+    transitions: List[Transition] = []
+    segments: List[Segment] = []
+    date, phase, segment_start = start, start_phase, start
+
+    while True:
+        boundary = _next_month(date)
+
+        if phase == CYCLE_END_PHASE:
+            roll_at = max(date, datetime(date.year, 12, 31))
+            if roll_at < boundary and roll_at <= end:
+                next_year = roll_at.year + 1
+                new_date = datetime(next_year, 2, 1)
+                segments.append(Segment(phase, segment_start, roll_at))
+                transitions.append(Transition(new_date, phase, CYCLE_START_PHASE, next_year, True))
+                end = new_date + (end - roll_at)  # Carry the remaining RP time into the new cycle
+                date, phase, segment_start = new_date, CYCLE_START_PHASE, new_date
+                continue
+
+        if boundary > end:
+            break
+        new_phase = phase_at(boundary)
+        if new_phase != phase:
+            segments.append(Segment(phase, segment_start, boundary))
+            transitions.append(Transition(boundary, phase, new_phase, boundary.year, False))
+            phase, segment_start = new_phase, boundary
+        date = boundary
+
+    segments.append(Segment(phase, segment_start, end))
+    return transitions, segments, end
+
+
+def last_instant(segment: Segment, is_last: bool) -> datetime:
+    """The latest RP date inside a segment"""
+    return segment.end if is_last else segment.end - timedelta(microseconds=1)
@@ -0,0 +1,110 @@
+import copy
+from datetime import datetime
+from typing import Callable, Dict, List, Set, Tuple
+
+from pymongo import ReturnDocument
+from pymongo.errors import DuplicateKeyError, OperationFailure
+
+
+class _Now:
+    """Placeholder in a default template for the time the document is created"""
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __repr__(self):
+        return "NOW"
+
+
+NOW = _Now()
+
+
+def _now_paths(value, path=()):
+    if value is NOW:
+        yield path
+    elif isinstance(value, dict):
+        for key, item in value.items():
+            yield from _now_paths(item, path + (key,))
+    elif isinstance(value, list):
+        for index, item in enumerate(value):
+            yield from _now_paths(item, path + (index,))
+
+
+class ConfigRegistry:
+    """Get-or-create for the per-guild config documents, one round trip and duplicate free.
+
+    Each collection registers a factory for its default document (without guild_id).
+    The factory runs once; later creations deep-copy the prebuilt template and stamp
+    NOW placeholders with the current time. Creation is a single
+    find_one_and_update($setOnInsert, upsert=True) backed by a unique guild_id index,
+    so two commands racing on a new guild can't insert two documents. Once a guild's
+    document is known to exist, reads go back to a plain find_one.
+    """
+
+    def __init__(self):
+        self._factories: Dict[str, Callable[[], dict]] = {}
+        self._templates: Dict[str, Tuple[dict, List[tuple]]] = {}
+        self._indexed: Set[str] = set()
+        self._known: Set[Tuple[str, int]] = set()
+
+    def register(self, collection: str, factory: Callable[[], dict]):
+        self._factories[collection] = factory
+        self._templates.pop(collection, None)
+
+    def defaults(self, collection: str) -> dict:
+        """A fresh copy of the collection's default document"""
+        cached = self._templates.get(collection)
+        if cached is None:
+            template = self._factories[collection]()
+            cached = self._templates[collection] = (template, list(_now_paths(template)))
+        template, stamps = cached
+
+        document = copy.deepcopy(template)
+        if stamps:
+            now = datetime.utcnow()
+            for path in stamps:
+                target = document
+                for key in path[:-1]:
+                    target = target[key]
+                target[path[-1]] = now
+        return document
+
+    def ensure_index(self, col, retry: bool = False) -> bool:
+        """Create the unique guild_id index once per process; retry=True tries again after a cleanup"""
+        if col.name in self._indexed and not retry:
+            return True
+        self._indexed.add(col.name)
+        try:
+            col.create_index("guild_id", unique=True)
+        except OperationFailure as e:
+            # Usually duplicate guild documents left by the old find-then-insert race
+            print(f"Could not create unique guild_id index on {col.name}: {e}")
+            return False
+        return True
+
+    def get(self, col, guild_id: int) -> dict:
+        """The guild's document in `col`, created from the registered defaults if missing"""
+        key = (col.name, guild_id)
+        if key in self._known:
+            config = col.find_one({"guild_id": guild_id})
+            if config is not None:
+                return config
+            self._known.discard(key)  # Deleted since (e.g. an admin reset)
+
+        self.ensure_index(col)
+        try:
+            config = col.find_one_and_update(
+                {"guild_id": guild_id},
+                {"$setOnInsert": self.defaults(col.name)},
+                upsert=True,
+                return_document=ReturnDocument.AFTER
+            )
+        except DuplicateKeyError:
+            # Another process inserted it between our match and insert
+            config = col.find_one({"guild_id": guild_id})
+        self._known.add(key)
+        return config
+
+
+# Shared by every cog with a per-guild config document
+configs = ConfigRegistry()
@@ -0,0 +1,283 @@
+from discord.ext import commands
+import discord
+from discord import app_commands
+from typing import Dict, List, Optional
+import time
+
+from .archive import archive_collection_name, archived_years
+
+CACHE_TTL = 300  # Seconds a snapshot lives when bot.db can't report writes
+WATCHED_COLLECTIONS = {"winners", "elections_config", "momentum_config"}
+CHAMBERS = ["Senate", "House", "Governor"]
+
+
+def seat_chamber(seat: dict) -> Optional[str]:
+    """Senate, House or Governor; None for seats outside the chamber projections"""
+    office = seat.get("office", "")
+    if office == "Senate":
+        return "Senate"
+    if office == "Governor":
+        return "Governor"
+    if "District" in office:
+        return "House"
+    return None
+
+
+def add_seat_fields(embed: discord.Embed, name: str, seat_lines: List[str], overflow: str, max_fields: int = 4):
+    """Split seat lines across fields to stay inside Discord's limits, noting how many didn't fit"""
+    field_text, field_count, shown = "", 0, 0
+    for line in seat_lines:
+        if len(field_text) + len(line) + 1 > 1024:
+            embed.add_field(name=name if field_count == 0 else "\u200b", value=field_text, inline=False)
+            field_text, field_count = "", field_count + 1
+            if field_count >= max_fields:
+                break
+        field_text += line + "\n"
+        shown += 1
+    if field_text and field_count < max_fields:
+        embed.add_field(name=name if field_count == 0 else "\u200b", value=field_text, inline=False)
+    if shown < len(seat_lines):
+        embed.add_field(name="\u200b", value=f"...and {len(seat_lines) - shown} {overflow}", inline=False)
+
+
+class ChamberSnapshot:
+    """Every seat's standing for one guild, computed from a single load of its documents"""
+
+    def __init__(self, guild_id: int, cycle: tuple):
+        self.guild_id = guild_id
+        self.cycle = cycle  # (year, phase) the snapshot was computed for
+        self.built_at = time.time()
+        self.build_ms = 0.0
+        self.seats: List[dict] = []
+        # {chamber: {party: {"leading": n, "holdover": n, "total": n}}}
+        self.projections: Dict[str, Dict[str, Dict[str, int]]] = {}
+
+    def project(self):
+        self.projections = {chamber: {} for chamber in CHAMBERS}
+        for seat in self.seats:
+            if seat["contested"]:
+                party, bucket = seat["leader"]["party"], "leading"
+            else:
+                party, bucket = seat["holder_party"] or "Vacant", "holdover"
+            counts = self.projections[seat["chamber"]].setdefault(party, {"leading": 0, "holdover": 0, "total": 0})
+            counts[bucket] += 1
+            counts["total"] += 1
+
+
+class Dashboard(commands.Cog):
+    """Whole-chamber standings and seat projections"""
+
+    def __init__(self, bot):
+        self.bot = bot
+        self.snapshots: Dict[int, ChamberSnapshot] = {}
+        # Invalidate on writes when bot.db is instrumented, otherwise fall back to a TTL
+        self.listening = hasattr(bot.db, "add_write_listener")
+        if self.listening:
+            bot.db.add_write_listener(self._on_write)
+        print("Dashboard cog loaded successfully")
+
+    def cog_unload(self):
+        if self.listening:
+            self.bot.db.remove_write_listener(self._on_write)
+
+    def _on_write(self, collection: str, operation: str, guild_id: Optional[int]):
+        if collection not in WATCHED_COLLECTIONS:
+            return
+        self.invalidate(guild_id)
+
+    @commands.Cog.listener()
+    async def on_remote_change(self, collection: str, operation: str, guild_id: Optional[int]):
+        """Writes from other processes, relayed by CacheSync"""
+        if collection in WATCHED_COLLECTIONS or collection == "time_configs":
+            self.invalidate(guild_id)
+
+    def invalidate(self, guild_id: Optional[int] = None):
+        if guild_id is None:
+            self.snapshots.clear()
+        else:
+            self.snapshots.pop(guild_id, None)
+
+    def get_snapshot(self, guild_id: int) -> Optional[ChamberSnapshot]:
+        """Cached snapshot for the guild, rebuilt after a points/seat change or a new phase"""
+        time_config = self.bot.db["time_configs"].find_one({"guild_id": guild_id})
+        if not time_config:
+            return None
+        cycle = (time_config["current_rp_date"].year, time_config.get("current_phase", ""))
+
+        snapshot = self.snapshots.get(guild_id)
+        if snapshot and snapshot.cycle == cycle and (self.listening or time.time() - snapshot.built_at < CACHE_TTL):
+            return snapshot
+
+        snapshot = self.build_snapshot(guild_id, cycle)
+        if snapshot is not None:
+            self.snapshots[guild_id] = snapshot
+        return snapshot
+
+    def build_snapshot(self, guild_id: int, cycle: tuple) -> Optional[ChamberSnapshot]:
+        polling_cog = self.bot.get_cog("Polling")
+        if polling_cog is None:
+            return None
+        started = time.perf_counter()
+
+        elections_config = self.bot.db["elections_config"].find_one({"guild_id": guild_id})
+        winners_config = self.bot.db["winners"].find_one({"guild_id": guild_id})
+        momentum_config = self.bot.db["momentum_config"].find_one({"guild_id": guild_id})
+        if not elections_config:
+            return None
+
+        current_year, current_phase = cycle
+        # Same cycle selection as the polling model
+        primary_year = current_year - 1 if current_year % 2 == 0 else current_year
+
+        # One pass over the winners array instead of one scan per seat
+        primary_by_seat: Dict[str, List[dict]] = {}
+        current_by_seat: Dict[str, List[dict]] = {}
+        holder_party: Dict[str, tuple] = {}  # seat_id -> (year, party) of the latest general winner
+        for winner in (winners_config or {}).get("winners", []):
+            seat_id = winner.get("seat_id")
+            if winner.get("year") == primary_year and winner.get("primary_winner", False):
+                primary_by_seat.setdefault(seat_id, []).append(winner)
+            if winner.get("year") == current_year:
+                current_by_seat.setdefault(seat_id, []).append(winner)
+            if winner.get("general_winner", False) and winner.get("year", 0) >= holder_party.get(seat_id, (0,))[0]:
+                holder_party[seat_id] = (winner.get("year", 0), winner.get("party"))
+
+        # Holders elected in finished cycles are only in the yearly archives now
+        missing = {
+            seat["seat_id"] for seat in elections_config.get("seats", [])
+            if seat_chamber(seat) and seat.get("current_holder") and seat["seat_id"] not in holder_party
+        }
+        for year in archived_years(self.bot.db, "winners") if missing else []:
+            archived = self.bot.db[archive_collection_name("winners", year)].find(
+                {"guild_id": guild_id, "general_winner": True, "seat_id": {"$in": list(missing)}},
+                {"seat_id": 1, "party": 1}
+            )
+            for winner in archived:
+                holder_party[winner["seat_id"]] = (year, winner.get("party"))
+                missing.discard(winner["seat_id"])
+            if not missing:
+                break
+
+        snapshot = ChamberSnapshot(guild_id, cycle)
+        for seat in elections_config.get("seats", []):
+            chamber = seat_chamber(seat)
+            if chamber is None:
+                continue
+            seat_id = seat["seat_id"]
+            candidates = primary_by_seat.get(seat_id) or current_by_seat.get(seat_id) or []
+            shares = polling_cog._calculate_seat_percentages(guild_id, candidates, current_phase, momentum_config)
+
+            standing = {
+                "seat_id": seat_id,
+                "office": seat.get("office", ""),
+                "state": seat.get("state", ""),
+                "chamber": chamber,
+                "holder": seat.get("current_holder"),
+                "holder_party": holder_party.get(seat_id, (0, None))[1],
+                "contested": bool(shares),
+                "standings": [],
+                "leader": None,
+                "margin": 0.0,
+            }
+            if shares:
+                party_of = {c["candidate"]: c.get("party", "Independent") for c in candidates}
+                standing["standings"] = sorted(
+                    ({"candidate": name, "party": party_of.get(name, "Independent"), "percentage": pct}
+                     for name, pct in shares.items()),
+                    key=lambda row: row["percentage"], reverse=True
+                )
+                standing["leader"] = standing["standings"][0]
+                if len(standing["standings"]) > 1:
+                    standing["margin"] = standing["standings"][0]["percentage"] - standing["standings"][1]["percentage"]
+                else:
+                    standing["margin"] = standing["leader"]["percentage"]
+            snapshot.seats.append(standing)
+
+        snapshot.project()
+        snapshot.build_ms = (time.perf_counter() - started) * 1000
+        return snapshot
+
+    @app_commands.command(
+        name="dashboard",
+        description="Current standing of every seat in a chamber and the projected seat count per party"
+    )
+    @app_commands.describe(
+        chamber="Senate, House or Governor",
+        region="Only list seats in this region (the projection always covers the whole chamber)"
+    )
+    async def dashboard(self, interaction: discord.Interaction, chamber: str, region: Optional[str] = None):
+        chamber = next((c for c in CHAMBERS if c.lower() == chamber.lower()), None)
+        if chamber is None:
+            await interaction.response.send_message(
+                f"❌ Unknown chamber. Choose one of: {', '.join(CHAMBERS)}.", ephemeral=True
+            )
+            return
+        if self.bot.get_cog("Polling") is None:
+            await interaction.response.send_message("❌ Polling system not loaded.", ephemeral=True)
+            return
+
+        await interaction.response.defer()
+        snapshot = self.get_snapshot(interaction.guild.id)
+        if snapshot is None:
+            await interaction.followup.send("❌ Elections are not configured for this server.", ephemeral=True)
+            return
+
+        seats = [s for s in snapshot.seats if s["chamber"] == chamber]
+        if not seats:
+            await interaction.followup.send(f"❌ No {chamber} seats configured.", ephemeral=True)
+            return
+
+        year, phase = snapshot.cycle
+        embed = discord.Embed(
+            title=f"📊 {chamber} Dashboard ({year})",
+            description=f"{len(seats)} seats • {phase or 'Unknown phase'}",
+            color=discord.Color.blue(),
+            timestamp=discord.utils.utcnow()
+        )
+
+        majority = len(seats) // 2 + 1
+        projection_lines = []
+        for party, counts in sorted(snapshot.projections[chamber].items(), key=lambda item: item[1]["total"], reverse=True):
+            marker = " ✅" if counts["total"] >= majority else ""
+            projection_lines.append(
+                f"**{party}**: {counts['total']} seats ({counts['leading']} leading, {counts['holdover']} not up){marker}"
+            )
+        embed.add_field(
+            name=f"Projected Seats ({majority} for majority)",
+            value="\n".join(projection_lines)[:1024] or "No seats",
+            inline=False
+        )
+
+        if region:
+            seats = [s for s in seats if s["state"].lower() == region.lower()]
+        # Closest races first
+        contested = sorted((s for s in seats if s["contested"]), key=lambda s: s["margin"])
+        seat_lines = [
+            f"**{s['seat_id']}**: {s['leader']['candidate']} ({s['leader']['party']}) "
+            f"{s['leader']['percentage']:.1f}%, +{s['margin']:.1f}"
+            for s in contested
+        ]
+
+        add_seat_fields(embed, "Races (closest first)", seat_lines, "more races. Filter by region to see them.")
+        if not seat_lines:
+            embed.add_field(name="Races", value="No contested races for this selection.", inline=False)
+
+        age = int(time.time() - snapshot.built_at)
+        embed.set_footer(text=f"Computed in {snapshot.build_ms:.0f} ms • {age}s ago")
+        await interaction.followup.send(embed=embed)
+
+    @dashboard.autocomplete("chamber")
+    async def chamber_autocomplete(self, interaction: discord.Interaction, current: str):
+        return [app_commands.Choice(name=c, value=c) for c in CHAMBERS if current.lower() in c.lower()]
+
+    @dashboard.autocomplete("region")
+    async def region_autocomplete(self, interaction: discord.Interaction, current: str):
+        config = self.bot.db["elections_config"].find_one({"guild_id": interaction.guild.id})
+        if not config:
+            return []
+        regions = sorted({s.get("state", "") for s in config.get("seats", []) if seat_chamber(s)} - {"", "National"})
+        return [app_commands.Choice(name=r, value=r) for r in regions if current.lower() in r.lower()][:25]
+
+
+async def setup(bot):
+    await bot.add_cog(Dashboard(bot))
@@ -0,0 +1,252 @@
+from collections import deque, OrderedDict
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+import bson
+import time
+
+MAX_PROFILES = 2000  # Interactions kept while profiling
+ARRAY_HEAVY_ITEMS = 50  # An array this long makes a full-document read suspicious
+LARGE_DOCUMENT_BYTES = 16 * 1024
+SCAN_RATIO_WARNING = 10  # docsExamined / nReturned above this is worth an index
+
+
+def filter_shape(value):
+    """Replace literal values with their type so filters group by shape, not by guild"""
+    if isinstance(value, dict):
+        return {key: filter_shape(item) for key, item in sorted(value.items())}
+    if isinstance(value, (list, tuple)):
+        shapes = []
+        for item in value:
+            shape = filter_shape(item)
+            if shape not in shapes:
+                shapes.append(shape)
+        return shapes
+    return f"<{type(value).__name__}>"
+
+
+def _document_size(document) -> int:
+    try:
+        return len(bson.encode(document))
+    except Exception:
+        return 0
+
+
+def _largest_array(document, prefix: str = "") -> Tuple[str, int]:
+    """Dotted path and length of the longest array anywhere in the document"""
+    best_path, best_len = "", 0
+    if isinstance(document, dict):
+        for key, value in document.items():
+            path = f"{prefix}{key}"
+            if isinstance(value, list):
+                if len(value) > best_len:
+                    best_path, best_len = path, len(value)
+                value = value[0] if value else None
+            if isinstance(value, dict):
+                sub_path, sub_len = _largest_array(value, f"{path}.")
+                if sub_len > best_len:
+                    best_path, best_len = sub_path, sub_len
+    return best_path, best_len
+
+
+class OperationRecord:
+    def __init__(self, collection, operation: str, query: Optional[dict], projection):
+        self._collection = collection  # Kept so the report can run explain() on the shape
+        self.collection = collection.name
+        self.operation = operation
+        self.query = query
+        self.shape = repr(filter_shape(query)) if query is not None else "-"
+        self.has_projection = projection is not None
+        self.documents = 0
+        self.bytes = 0
+        self.elapsed_ms = 0.0
+        self.largest_array = ("", 0)
+
+    def add_document(self, document):
+        if not isinstance(document, dict):
+            return
+        self.documents += 1
+        self.bytes += _document_size(document)
+        if not self.has_projection:
+            path, length = _largest_array(document)
+            if length > self.largest_array[1]:
+                self.largest_array = (path, length)
+
+    @property
+    def flags(self) -> List[str]:
+        flags = []
+        if not self.has_projection and self.operation in ("find", "find_one", "find_one_and_update"):
+            path, length = self.largest_array
+            if length >= ARRAY_HEAVY_ITEMS:
+                flags.append(f"full read of array-heavy document ({path}: {length} items)")
+            elif self.documents and self.bytes / self.documents >= LARGE_DOCUMENT_BYTES:
+                flags.append(f"full read of large document ({self.bytes // max(1, self.documents) // 1024} KB)")
+        return flags
+
+
+class InteractionProfile:
+    def __init__(self, kind: str, name: str, scope_id: int):
+        self.kind = kind
+        self.name = name
+        self.scope_id = scope_id
+        self.started_at = datetime.utcnow()
+        self.operations: List[OperationRecord] = []
+
+    @property
+    def total_ms(self) -> float:
+        return sum(op.elapsed_ms for op in self.operations)
+
+    @property
+    def total_bytes(self) -> int:
+        return sum(op.bytes for op in self.operations)
+
+
+class ProfiledCursor:
+    """Wraps a Cursor/CommandCursor so documents, bytes and fetch time are recorded as it is consumed"""
+
+    def __init__(self, cursor, record: OperationRecord):
+        self._cursor = cursor
+        self._record = record
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        start = time.perf_counter()
+        try:
+            document = next(self._cursor)
+        finally:
+            self._record.elapsed_ms += (time.perf_counter() - start) * 1000
+        self._record.add_document(document)
+        return document
+
+    def __getattr__(self, name):
+        attr = getattr(self._cursor, name)
+        if name in ("sort", "limit", "skip", "batch_size", "hint", "max_time_ms", "collation"):
+            def chained(*args, **kwargs):
+                attr(*args, **kwargs)
+                return self
+            return chained
+        return attr
+
+
+class QueryProfiler:
+    """Per-interaction record of every MongoDB call, enabled with DB_PROFILE=1 or the admin command"""
+
+    def __init__(self, enabled: bool = False):
+        self.enabled = enabled
+        self.profiles: "OrderedDict[int, InteractionProfile]" = OrderedDict()
+        self.unscoped = deque(maxlen=MAX_PROFILES)  # Calls made outside any command or loop
+        self._explain_cache: Dict[tuple, Optional[str]] = {}
+        self.started_at = datetime.utcnow() if enabled else None
+
+    def start(self):
+        self.enabled = True
+        self.started_at = datetime.utcnow()
+
+    def stop(self):
+        self.enabled = False
+
+    def reset(self):
+        self.profiles.clear()
+        self.unscoped.clear()
+        self._explain_cache.clear()
+
+    def record(self, scope, collection, operation: str, args: tuple, kwargs: dict, result, elapsed_ms: float):
+        query = kwargs.get("filter", args[0] if args else None)
+        if operation == "aggregate":
+            query = {"pipeline": kwargs.get("pipeline", args[0] if args else None)}
+        elif not isinstance(query, dict):
+            query = None
+        projection = kwargs.get("projection", args[1] if len(args) > 1 and operation in ("find", "find_one") else None)
+
+        record = OperationRecord(collection, operation, query, projection)
+        record.elapsed_ms = elapsed_ms
+
+        if scope is not None:
+            profile = self.profiles.get(scope.id)
+            if profile is None:
+                profile = self.profiles[scope.id] = InteractionProfile(scope.kind, scope.name, scope.id)
+                while len(self.profiles) > MAX_PROFILES:
+                    self.profiles.popitem(last=False)
+            profile.operations.append(record)
+        else:
+            self.unscoped.append(record)
+
+        if operation in ("find", "aggregate"):
+            return ProfiledCursor(result, record)
+        if isinstance(result, dict):
+            record.add_document(result)
+        return result
+
+    def _explain(self, record: OperationRecord) -> Optional[str]:
+        """Winning plan stage summary for a find shape, cached per (collection, shape)"""
+        key = (record.collection, record.shape)
+        if key in self._explain_cache:
+            return self._explain_cache[key]
+
+        flag = None
+        collection = record._collection
+        if record.operation in ("find", "find_one") and record.query:
+            try:
+                plan = collection.find(record.query).explain()
+                stats = plan.get("executionStats", {})
+                winning = plan.get("queryPlanner", {}).get("winningPlan", {})
+                stages = []
+                stage = winning
+                while stage:
+                    stages.append(stage.get("stage", "?"))
+                    stage = stage.get("inputStage")
+                if "COLLSCAN" in stages:
+                    flag = f"no index for {record.shape} (COLLSCAN)"
+                elif stats.get("nReturned") and stats.get("totalDocsExamined", 0) / stats["nReturned"] > SCAN_RATIO_WARNING:
+                    flag = f"index for {record.shape} examines {stats['totalDocsExamined']} docs for {stats['nReturned']}"
+            except Exception as e:
+                flag = f"explain failed: {e}"
+        self._explain_cache[key] = flag
+        return flag
+
+    def build_report(self, limit: int = 20, explain: bool = True) -> str:
+        """Commands ranked by total DB time, with their query shapes and flags"""
+        by_name: Dict[tuple, dict] = {}
+        # Snapshot first: the report may run in a worker thread while commands keep recording
+        for profile in list(self.profiles.values()):
+            entry = by_name.setdefault((profile.kind, profile.name), {
+                "invocations": 0, "ops": 0, "ms": 0.0, "bytes": 0, "docs": 0, "shapes": {}, "flags": set()
+            })
+            entry["invocations"] += 1
+            entry["ops"] += len(profile.operations)
+            entry["ms"] += profile.total_ms
+            entry["bytes"] += profile.total_bytes
+            for op in list(profile.operations):
+                entry["docs"] += op.documents
+                shape_key = (op.collection, op.operation, op.shape)
+                shape = entry["shapes"].setdefault(shape_key, {"count": 0, "ms": 0.0, "bytes": 0, "sample": op})
+                shape["count"] += 1
+                shape["ms"] += op.elapsed_ms
+                shape["bytes"] += op.bytes
+                entry["flags"].update(op.flags)
+                if explain:
+                    plan_flag = self._explain(op)
+                    if plan_flag:
+                        entry["flags"].add(f"{op.collection}: {plan_flag}")
+
+        since = self.started_at.strftime("%Y-%m-%d %H:%M UTC") if self.started_at else "-"
+        lines = [f"DB profile since {since} - {len(self.profiles)} interactions, {len(self.unscoped)} unscoped calls", ""]
+        ranked = sorted(by_name.items(), key=lambda item: item[1]["ms"], reverse=True)[:limit]
+        for rank, ((kind, name), entry) in enumerate(ranked, 1):
+            n = entry["invocations"]
+            lines.append(
+                f"{rank}. [{kind}] {name}: {n}x, {entry['ops'] / n:.1f} queries/call, "
+                f"{entry['ms'] / n:.1f} ms/call in DB, {entry['bytes'] / n / 1024:.1f} KB/call, "
+                f"{entry['docs'] / n:.1f} docs/call"
+            )
+            shapes = sorted(entry["shapes"].items(), key=lambda item: item[1]["ms"], reverse=True)
+            for (collection, operation, shape), stats in shapes:
+                lines.append(
+                    f"     {stats['count'] / n:>5.1f}/call {collection}.{operation} {shape} "
+                    f"({stats['ms'] / stats['count']:.1f} ms, {stats['bytes'] / stats['count'] / 1024:.1f} KB each)"
+                )
+            for flag in sorted(entry["flags"]):
+                lines.append(f"     ⚠ {flag}")
+            lines.append("")
+        return "\n".join(lines)
@@ -4,6 +4,24 @@ from discord import app_commands
 from datetime import datetime, timedelta
 import asyncio
 from typing import Dict, List, Optional
+from .announcements import post_announcement
+from .instrumentation import timed_loop
+from .sharding import local_guilds_filter
+from .config_registry import NOW, configs
+
+
+def _default_delegates_config():
+    return {
+        "called_states": [],  # List of states that have been called
+        "delegate_totals": {},  # Candidate delegate totals
+        "enabled": True,
+        "paused": False, # Added paused state
+        "last_check": NOW
+    }
+
+
+configs.register("delegates_config", _default_delegates_config)
+
 
 class Delegates(commands.Cog):
     def __init__(self, bot):
@@ -136,18 +154,7 @@ class Delegates(commands.Cog):
     def _get_delegates_config(self, guild_id: int):
         """Get or create delegates configuration for a guild"""
         col = self.bot.db["delegates_config"]
-        config = col.find_one({"guild_id": guild_id})
-        if not config:
-            config = {
-                "guild_id": guild_id,
-                "called_states": [],  # List of states that have been called
-                "delegate_totals": {},  # Candidate delegate totals
-                "enabled": True,
-                "paused": False, # Added paused state
-                "last_check": datetime.utcnow()
-            }
-            col.insert_one(config)
-        return col, config
+        return col, configs.get(col, guild_id)
 
     def _get_time_config(self, guild_id: int):
         """Get time configuration"""
@@ -171,21 +178,16 @@ class Delegates(commands.Cog):
         """Get presidential candidates for a specific party and year"""
         candidates = []
         
-        print(f"Searching for candidates: party='{party}', year={year}, guild_id={guild_id}")
-        
         # First check presidential_signups collection
         pres_col = self.bot.db["presidential_signups"]
         pres_config = pres_col.find_one({"guild_id": guild_id})
         
         if pres_config:
-            print(f"Found presidential_signups config with {len(pres_config.get('candidates', []))} total candidates")
             for candidate in pres_config.get("candidates", []):
                 candidate_party = candidate.get("party", "").lower()
                 candidate_year = candidate.get("year", 0)
                 candidate_office = candidate.get("office", "")
                 
-                print(f"  Checking candidate: {candidate.get('name')}, party='{candidate_party}', year={candidate_year}, office='{candidate_office}'")
-                
                 # More flexible party matching
                 party_match = False
                 if party.lower() == "democrats" or party.lower() == "democratic":
@@ -198,7 +200,6 @@ class Delegates(commands.Cog):
                 if (party_match and 
                     candidate_year == year and
                     candidate_office == "President"):
-                    print(f"    -> MATCH! Adding {candidate.get('name')}")
                     candidates.append(candidate)
         else:
             print("No presidential_signups config found")
@@ -242,12 +243,13 @@ class Delegates(commands.Cog):
         return allocation
 
     @tasks.loop(minutes=5)
+    @timed_loop("delegates.delegate_check_loop")
     async def delegate_check_loop(self):
         """Check for states to call every 5 minutes"""
         try:
-            # Get all guild configurations
+            # Get the configurations of the guilds on this process's shards
             time_col = self.bot.db["time_configs"]
-            time_configs = time_col.find({})
+            time_configs = time_col.find(local_guilds_filter(self.bot))
 
             for time_config in time_configs:
                 guild_id = time_config["guild_id"]
@@ -409,7 +411,71 @@ class Delegates(commands.Cog):
         # Update voice channel with current RP time if configured
         await self._update_voice_channel_time(guild)
 
-    async def _check_primary_winners(self, guild, guild_id: int, party: str, year: int, delegates_config: dict):
+    async def call_due_primaries(self, guild, guild_id: int, rp_date: datetime, announce: bool = True) -> List[dict]:
+        """Call every uncalled state of both parties scheduled on or before rp_date, in date order.
+
+        Used by the TimeManager catch-up after downtime. Follows the same rules as
+        delegate_check_loop, but allocates everything in memory and writes the
+        delegates config once. With announce False the per-state announcements are
+        left to the caller's summary. Returns the called states.
+        """
+        year = rp_date.year
+        delegates_col, delegates_config = self._get_delegates_config(guild_id)
+        if year % 2 != 1 or delegates_config.get("paused", False):
+            return []
+
+        called_states = delegates_config.setdefault("called_states", [])
+        delegate_totals = delegates_config.setdefault("delegate_totals", {})
+        primary_winners = delegates_config.get("primary_winners", {})
+        current_date = datetime(rp_date.year, rp_date.month, rp_date.day)
+
+        due = []
+        for party, schedule in (("Democrats", self.dnc_schedule), ("Republican", self.gop_schedule)):
+            if f"{party}_{year}" in primary_winners:
+                continue
+            for state_data in schedule:
+                if f"{state_data['state']}_{party}_{year}" in called_states:
+                    continue
+                try:
+                    state_date = datetime(year, state_data["month"], state_data["day"])
+                except ValueError:
+                    continue
+                if state_date <= current_date:
+                    due.append((state_date, party, state_data))
+        if not due:
+            return []
+        due.sort(key=lambda item: (item[0], item[2].get("order", 0)))
+
+        candidates_by_party = {}
+        results = []
+        for state_date, party, state_data in due:
+            if party not in candidates_by_party:
+                candidates_by_party[party] = self._get_presidential_candidates(guild_id, party, year)
+            allocation = {}
+            if candidates_by_party[party]:
+                allocation = self._allocate_delegates(candidates_by_party[party], state_data["delegates"])
+                for candidate_name, delegates in allocation.items():
+                    delegate_totals[candidate_name] = delegate_totals.get(candidate_name, 0) + delegates
+            called_states.append(f"{state_data['state']}_{party}_{year}")
+            results.append({"state": state_data["state"], "party": party, "date": state_date,
+                             "delegates": state_data["delegates"], "allocation": allocation})
+
+        delegates_col.update_one(
+            {"guild_id": guild_id},
+            {"$set": {"called_states": called_states, "delegate_totals": delegate_totals, "enabled": True}}
+        )
+
+        for party in {result["party"] for result in results}:
+            await self._check_primary_winners(guild, guild_id, party, year, delegates_config, announce=announce)
+        if announce:
+            for result in results:
+                if result["allocation"]:
+                    await self._send_state_announcement(guild, result["state"], result["party"],
+                                                        result["delegates"], result["allocation"])
+        return results
+
+    async def _check_primary_winners(self, guild, guild_id: int, party: str, year: int, delegates_config: dict,
+                                     announce: bool = True):
         """Check if any candidate has reached the delegate threshold to win the primary"""
         delegate_totals = delegates_config.get("delegate_totals", {})
 
@@ -461,7 +527,7 @@ class Delegates(commands.Cog):
                 delegates_config["primary_winners"][primary_key] = winner["name"]
 
                 # Update presidential_winners
-                await self._declare_primary_winner(guild, guild_id, winner, party, year)
+                await self._declare_primary_winner(guild, guild_id, winner, party, year, announce=announce)
 
                 # Update database
                 delegates_col = self.bot.db["delegates_config"]
@@ -472,7 +538,8 @@ class Delegates(commands.Cog):
             else:
                 print(f"Primary winner already declared for {party} {year}: {delegates_config['primary_winners'][primary_key]}")
 
-    async def _declare_primary_winner(self, guild, guild_id: int, winner: dict, party: str, year: int):
+    async def _declare_primary_winner(self, guild, guild_id: int, winner: dict, party: str, year: int,
+                                      announce: bool = True):
         """Declare a primary winner and update presidential_winners"""
         # Get presidential winners config
         winners_col = self.bot.db["presidential_winners"]
@@ -518,6 +585,9 @@ class Delegates(commands.Cog):
             upsert=True
         )
 
+        if not announce:
+            return
+
         # Send primary winner announcement
         await self._send_primary_winner_announcement(guild, winner, party, year)
 
@@ -526,71 +596,12 @@ class Delegates(commands.Cog):
 
     async def _update_voice_channel_time(self, guild):
         """Update voice channel with current RP time if configured"""
-        try:
-            time_col, time_config = self._get_time_config(guild.id)
-            if not time_config:
-                return
-
-            # Check if voice channel updates are enabled and channel is configured
-            if (not time_config.get("update_voice_channels", True) or 
-                not time_config.get("voice_channel_id")):
-                return
-
-            # Calculate current RP time
-            current_rp_date = self._calculate_current_rp_time(time_config)
-            date_string = current_rp_date.strftime("%B %d, %Y")
-
-            # Get the voice channel
-            channel = guild.get_channel(time_config["voice_channel_id"])
-            if not channel or not hasattr(channel, 'edit'):
-                return
-
-            # Update channel name with current date
-            new_name = f"📅 {date_string}"
-            if channel.name != new_name:
-                await channel.edit(name=new_name)
-                print(f"Updated voice channel to: {new_name}")
-
-        except Exception as e:
-            print(f"Failed to update voice channel from delegates: {e}")
-            pass  # Ignore errors to not disrupt delegate functionality
+        voice_clock = self.bot.get_cog("VoiceClock")
+        if voice_clock:
+            voice_clock.schedule(guild.id)  # Coalesced and kept within the rename budget
 
     async def _send_primary_winner_announcement(self, guild, winner: dict, party: str, year: int):
         """Send announcement when a primary winner is declared"""
-        # Find announcement channel - check all possible database locations
-        channel = None
-
-        # First check guild_configs (from setup.py)
-        setup_col = self.bot.db["guild_configs"]
-        setup_config = setup_col.find_one({"guild_id": guild.id})
-
-        if setup_config:
-            # Check announcement_channel_id first
-            if setup_config.get("announcement_channel_id"):
-                channel = guild.get_channel(setup_config["announcement_channel_id"])
-                print(f"Found channel via announcement_channel_id: {channel}")
-
-            # Then check announcement_channel
-            if not channel and setup_config.get("announcement_channel"):
-                channel = guild.get_channel(setup_config["announcement_channel"])
-                print(f"Found channel via announcement_channel: {channel}")
-
-        # If no configured channel, try to find a general channel
-        if not channel:
-            channel = discord.utils.get(guild.channels, name="general")
-            if channel:
-                print(f"Using general channel: {channel}")
-
-        if not channel:
-            channel = guild.system_channel
-            if channel:
-                print(f"Using system channel: {channel}")
-
-        if not channel:
-            print(f"No announcement channel found for guild {guild.id}")
-            print(f"Setup config: {setup_config}")
-            return
-
         # Create winner announcement embed
         party_color = discord.Color.blue() if party == "Democrats" else discord.Color.red()
 
@@ -628,50 +639,11 @@ class Delegates(commands.Cog):
             inline=False
         )
 
-        try:
-            await channel.send(embed=embed)
-            print(f"Primary winner announcement sent for {winner['name']} ({party}) to channel {channel.name}")
-        except Exception as e:
-            print(f"Failed to send primary winner announcement: {e}")
-            pass  # Ignore if can't send message
+        post_announcement(self.bot, guild, embed=embed)
 
     async def _send_state_announcement(self, guild, state_name: str, party: str, 
                                      total_delegates: int, allocation: dict):
         """Send announcement when a state is called"""
-        # Find announcement channel - check all possible database locations
-        channel = None
-
-        # First check guild_configs (from setup.py)
-        setup_col = self.bot.db["guild_configs"]
-        setup_config = setup_col.find_one({"guild_id": guild.id})
-
-        if setup_config:
-            # Check announcement_channel_id first
-            if setup_config.get("announcement_channel_id"):
-                channel = guild.get_channel(setup_config["announcement_channel_id"])
-                print(f"Found channel via announcement_channel_id: {channel}")
-
-            # Then check announcement_channel
-            if not channel and setup_config.get("announcement_channel"):
-                channel = guild.get_channel(setup_config["announcement_channel"])
-                print(f"Found channel via announcement_channel: {channel}")
-
-        # If no configured channel, try to find a general channel
-        if not channel:
-            channel = discord.utils.get(guild.channels, name="general")
-            if channel:
-                print(f"Using general channel: {channel}")
-
-        if not channel:
-            channel = guild.system_channel
-            if channel:
-                print(f"Using system channel: {channel}")
-
-        if not channel:
-            print(f"No announcement channel found for guild {guild.id}")
-            print(f"Setup config: {setup_config}")
-            return
-
         # Create announcement embed
         party_color = discord.Color.blue() if party == "Democrats" else discord.Color.red()
 
@@ -694,12 +666,8 @@ class Delegates(commands.Cog):
             inline=False
         )
 
-        try:
-            await channel.send(embed=embed)
-            print(f"State announcement sent for {state_name} ({party}) to channel {channel.name}")
-        except Exception as e:
-            print(f"Failed to send state announcement: {e}")
-            pass  # Ignore if can't send message
+        # States called in the same tick go out together as one embed
+        post_announcement(self.bot, guild, embed=embed, merge_key="state_calls", merge_title="📢 Primaries Called")
 
     # Create command groups to reduce command count
     delegate_group = app_commands.Group(name="delegate", description="Delegate system commands")
@@ -6,6 +6,8 @@ import asyncio
 import random
 from typing import Optional, Dict
 from .presidential_winners import PRESIDENTIAL_STATE_DATA
+from .queries import find_entry
+from .reply_router import wait_for_reply
 
 # Demographic voting bloc strength values (removed thresholds)
 DEMOGRAPHIC_STRENGTH = {
@@ -549,57 +551,25 @@ class Demographics(commands.Cog):
         current_year = time_config["current_rp_date"].year if time_config else 2024
 
         if current_phase == "General Campaign":
-            # First check all_winners collection for general campaign primary winners
-            winners_col = self.bot.db["winners"]
-            winners_config = winners_col.find_one({"guild_id": guild_id})
-
-            if winners_config and isinstance(winners_config, dict):
-                for winner in winners_config.get("winners", []):
-                    if (isinstance(winner, dict) and 
-                        winner.get("user_id") == user_id and 
-                        winner.get("primary_winner", False) and 
-                        winner.get("year") == current_year and
-                        winner.get("office") in ["President", "Vice President"]):
-                        return winners_col, winner
-
-            # Also check presidential winners collection for general campaign
-            pres_winners_col, pres_winners_config = self._get_presidential_winners_config(guild_id)
-
-            if pres_winners_config and isinstance(pres_winners_config, dict):
-                # For general campaign, look for primary winners from the previous year if we're in an even year
-                # Or current year if odd year
-                primary_year = current_year - 1 if current_year % 2 == 0 else current_year
-
-                for winner in pres_winners_config.get("winners", []):
-                    if (isinstance(winner, dict) and 
-                        winner.get("user_id") == user_id and 
-                        winner.get("primary_winner", False) and 
-                        winner.get("year") == primary_year):
-                        return pres_winners_col, winner
-
-            # Check presidential signups collection for general campaign candidates
-            pres_signups_col = self.bot.db["presidential_signups"]
-            pres_signups_config = pres_signups_col.find_one({"guild_id": guild_id})
-
-            if pres_signups_config and isinstance(pres_signups_config, dict):
-                for candidate in pres_signups_config.get("candidates", []):
-                    if (isinstance(candidate, dict) and 
-                        candidate.get("user_id") == user_id and 
-                        candidate.get("year") == current_year and
-                        candidate.get("office") in ["President", "Vice President"]):
-                        return pres_signups_col, candidate
-
-            # Also check signups collection for admin-created general campaign candidates
-            signups_col = self.bot.db["signups"]
-            signups_config = signups_col.find_one({"guild_id": guild_id})
-
-            if signups_config and isinstance(signups_config, dict):
-                for candidate in signups_config.get("candidates", []):
-                    if (isinstance(candidate, dict) and 
-                        candidate.get("user_id") == user_id and 
-                        candidate.get("year") == current_year and
-                        candidate.get("phase") == "General Campaign"):
-                        return signups_col, candidate
+            # For general campaign, look for primary winners from the previous year if we're in an even year
+            # Or current year if odd year
+            primary_year = current_year - 1 if current_year % 2 == 0 else current_year
+
+            # Checked in order: all_winners primary winners, presidential winners,
+            # presidential signups, then admin-created general campaign candidates
+            lookups = [
+                ("winners", "winners", {"user_id": user_id, "primary_winner": True, "year": current_year,
+                                        "office": ["President", "Vice President"]}),
+                ("presidential_winners", "winners", {"user_id": user_id, "primary_winner": True, "year": primary_year}),
+                ("presidential_signups", "candidates", {"user_id": user_id, "year": current_year,
+                                                        "office": ["President", "Vice President"]}),
+                ("signups", "candidates", {"user_id": user_id, "year": current_year, "phase": "General Campaign"}),
+            ]
+            for collection, field, match in lookups:
+                col = self.bot.db[collection]
+                candidate = find_entry(col, guild_id, field, match)
+                if candidate:
+                    return col, candidate
 
             return None, None
         else:
@@ -612,45 +582,24 @@ class Demographics(commands.Cog):
         current_year = time_config["current_rp_date"].year if time_config else 2024
 
         if current_phase == "General Campaign":
-            # First check all_winners collection for general campaign primary winners
-            winners_col = self.bot.db["winners"]
-            winners_config = winners_col.find_one({"guild_id": guild_id})
-
-            if winners_config and isinstance(winners_config, dict):
-                for winner in winners_config.get("winners", []):
-                    if (isinstance(winner, dict) and 
-                        winner.get("candidate", "").lower() == candidate_name.lower() and 
-                        winner.get("primary_winner", False) and 
-                        winner.get("year") == current_year and
-                        winner.get("office") in ["President", "Vice President"]):
-                        return winners_col, winner
-
-            # Also check presidential winners collection for general campaign
-            pres_winners_col, pres_winners_config = self._get_presidential_winners_config(guild_id)
-
-            if pres_winners_config and isinstance(pres_winners_config, dict):
-                # For general campaign, look for primary winners from the previous year if we're in an even year
-                # Or current year if odd year
-                primary_year = current_year - 1 if current_year % 2 == 0 else current_year
-
-                for winner in pres_winners_config.get("winners", []):
-                    if (isinstance(winner, dict) and 
-                        winner.get("name", "").lower() == candidate_name.lower() and 
-                        winner.get("primary_winner", False) and 
-                        winner.get("year") == primary_year):
-                        return pres_winners_col, winner
-
-            # Also check signups collection for admin-created general campaign candidates
-            signups_col = self.bot.db["signups"]
-            signups_config = signups_col.find_one({"guild_id": guild_id})
-
-            if signups_config and isinstance(signups_config, dict):
-                for candidate in signups_config.get("candidates", []):
-                    if (isinstance(candidate, dict) and 
-                        candidate.get("name", "").lower() == candidate_name.lower() and 
-                        candidate.get("year") == current_year and
-                        candidate.get("phase") == "General Campaign"):
-                        return signups_col, candidate
+            # For general campaign, look for primary winners from the previous year if we're in an even year
+            # Or current year if odd year
+            primary_year = current_year - 1 if current_year % 2 == 0 else current_year
+
+            # Checked in order: all_winners primary winners, presidential winners,
+            # then admin-created general campaign candidates
+            lookups = [
+                ("winners", "winners", "candidate", {"primary_winner": True, "year": current_year,
+                                                     "office": ["President", "Vice President"]}),
+                ("presidential_winners", "winners", "name", {"primary_winner": True, "year": primary_year}),
+                ("signups", "candidates", "name", {"year": current_year, "phase": "General Campaign"}),
+            ]
+            for collection, field, name_key, match in lookups:
+                col = self.bot.db[collection]
+                candidate = find_entry(col, guild_id, field, {name_key: candidate_name, **match},
+                                       ignore_case=(name_key,))
+                if candidate:
+                    return col, candidate
 
             return None, None
         else:
@@ -689,6 +638,13 @@ class Demographics(commands.Cog):
             upsert=True
         )
 
+    def _apply_buff_debuff_multiplier(self, base_points: float, user_id: int, guild_id: int, action_type: str) -> float:
+        """Apply any active buffs or debuffs to the points gained"""
+        effects_cog = self.bot.get_cog("CampaignEffects")
+        if not effects_cog:
+            return base_points
+        return effects_cog.apply_multiplier(base_points, user_id, guild_id, action_type)
+
     def _get_cooldown_remaining(self, guild_id: int, user_id: int, action_type: str, cooldown_hours: int):
         """Get remaining cooldown time"""
         cooldowns_col = self.bot.db["demographic_cooldowns"]
@@ -1111,14 +1067,9 @@ class Demographics(commands.Cog):
         # Get the response message
         response_message = await interaction.original_response()
 
-        def check(message):
-            return (message.author.id == interaction.user.id and 
-                    message.reference and 
-                    message.reference.message_id == response_message.id)
-
         try:
             # Wait for user to reply with speech
-            reply_message = await self.bot.wait_for('message', timeout=300.0, check=check)
+            reply_message = await wait_for_reply(self.bot, response_message.id, interaction.user.id, timeout=300.0)
 
             speech_content = reply_message.content
             char_count = len(speech_content)
@@ -1134,6 +1085,7 @@ class Demographics(commands.Cog):
             # Calculate demographic points
             base_points = (char_count / 200) * 1.0  # 1 point per 200 characters
             final_points = base_points * total_multiplier
+            final_points = self._apply_buff_debuff_multiplier(final_points, target_candidate["user_id"], interaction.guild.id, "demographic_speech")
 
             # Update demographic points
             points_gained, backlash_updates = self._update_demographic_points(
@@ -1319,6 +1271,7 @@ class Demographics(commands.Cog):
 
         # Random demographic points between 0.3 and 0.8
         base_points = random.uniform(0.3, 0.8)
+        base_points = self._apply_buff_debuff_multiplier(base_points, target_candidate["user_id"], interaction.guild.id, "demographic_poster")
 
         # Update demographic points and handle backlash
         points_gained, backlash_updates = self._update_demographic_points(
@@ -1490,15 +1443,9 @@ class Demographics(commands.Cog):
         # Get the response message
         response_message = await interaction.original_response()
 
-        def check(message):
-            return (message.author.id == interaction.user.id and 
-                    message.reference and 
-                    message.reference.message_id == response_message.id and
-                    len(message.attachments) > 0)
-
         try:
             # Wait for user to reply with attachment
-            reply_message = await self.bot.wait_for('message', timeout=300.0, check=check)
+            reply_message = await wait_for_reply(self.bot, response_message.id, interaction.user.id, timeout=300.0, require_attachments=True)
 
             video = reply_message.attachments[0]
 
@@ -1514,6 +1461,7 @@ class Demographics(commands.Cog):
 
             # Random demographic points between 0.8 and 1.5
             base_points = random.uniform(0.8, 1.5)
+            base_points = self._apply_buff_debuff_multiplier(base_points, target_candidate["user_id"], interaction.guild.id, "demographic_ad")
 
             # Update demographic points and handle backlash
             points_gained, backlash_updates = self._update_demographic_points(
@@ -4,28 +4,43 @@ from discord import app_commands
 from datetime import datetime, timedelta
 from typing import List, Dict, Optional
 import math
+from .config_registry import configs
+from .persistent_views import pack, persistent_view, template, unpack
 
-class SeatsUpDropdown(discord.ui.Select):
-    def __init__(self, office_groups, current_year):
-        self.office_groups = office_groups
-        self.current_year = current_year
+class SeatsUpSelect(discord.ui.DynamicItem[discord.ui.Select], template=template("elections:seats_up")):
+    """Office picker under the seats-up-for-election overview and announcement.
 
+    Holds no state: each pick recomputes the seats that are up from the current
+    elections config, so it keeps working after a restart.
+    """
+
+    def __init__(self, office_groups: Optional[dict] = None):
         options = []
-        for i, (office_type, seats) in enumerate(office_groups.items()):
+        for office_type, seats in (office_groups or {}).items():
             options.append(discord.SelectOption(
                 label=f"🏛️ {office_type}",
                 description=f"{len(seats)} seats up for election",
-                value=str(i)
+                value=office_type
             ))
 
-        super().__init__(placeholder="Select office type to view seats...", options=options)
+        super().__init__(discord.ui.Select(
+            custom_id=pack("elections:seats_up"),
+            placeholder="Select office type to view seats...",
+            options=options
+        ))
+
+    @classmethod
+    async def from_custom_id(cls, interaction: discord.Interaction, item: discord.ui.Select, match):
+        return cls()
 
     async def callback(self, interaction: discord.Interaction):
-        office_type = list(self.office_groups.keys())[int(self.values[0])]
-        seats = self.office_groups[office_type]
+        elections_cog = interaction.client.get_cog("Elections")
+        current_year, office_groups = elections_cog._seats_up_by_office(interaction.guild.id)
+        office_type = self.item.values[0]
+        seats = office_groups.get(office_type, [])
 
         embed = discord.Embed(
-            title=f"🗳️ {office_type} Seats Up for Election ({self.current_year})",
+            title=f"🗳️ {office_type} Seats Up for Election ({current_year})",
             color=discord.Color.gold(),
             timestamp=datetime.utcnow()
         )
@@ -75,32 +90,40 @@ class SeatsUpDropdown(discord.ui.Select):
                 inline=False
             )
 
-        await interaction.response.edit_message(embed=embed, view=self.view)
+        view = persistent_view(SeatsUpSelect, office_groups) if office_groups else None
+        await interaction.response.edit_message(embed=embed, view=view)
 
-class SeatsUpView(discord.ui.View):
-    def __init__(self, office_groups, current_year):
-        super().__init__(timeout=300)
-        self.office_groups = office_groups
-        self.current_year = current_year
-        self.add_item(SeatsUpDropdown(office_groups, current_year))
+class SeatTermsSelect(discord.ui.DynamicItem[discord.ui.Select],
+                      template=template("elections:seat_terms", "state", "office")):
+    """State picker for show_seat_terms; the command's state/office filters live in the custom_id"""
 
-class SeatTermsDropdown(discord.ui.Select):
-    def __init__(self, state_groups):
-        self.state_groups = state_groups
+    def __init__(self, filter_state: Optional[str], filter_office: Optional[str], state_groups: Optional[dict] = None):
+        self.filter_state = filter_state
+        self.filter_office = filter_office
 
         options = []
-        for i, (state_name, seats) in enumerate(list(state_groups.items())[:25]):  # Discord limit
+        for state_name, seats in list((state_groups or {}).items())[:25]:  # Discord limit
             options.append(discord.SelectOption(
                 label=f"📍 {state_name}",
                 description=f"{len(seats)} seats",
-                value=str(i)
+                value=state_name
             ))
 
-        super().__init__(placeholder="Select state to view seat terms...", options=options)
+        super().__init__(discord.ui.Select(
+            custom_id=pack("elections:seat_terms", filter_state, filter_office),
+            placeholder="Select state to view seat terms...",
+            options=options
+        ))
+
+    @classmethod
+    async def from_custom_id(cls, interaction: discord.Interaction, item: discord.ui.Select, match):
+        return cls(unpack(match["state"]), unpack(match["office"]))
 
     async def callback(self, interaction: discord.Interaction):
-        state_name = list(self.state_groups.keys())[int(self.values[0])]
-        seats = self.state_groups[state_name]
+        elections_cog = interaction.client.get_cog("Elections")
+        state_groups = elections_cog._seat_terms_by_state(interaction.guild.id, self.filter_state, self.filter_office)
+        state_name = self.item.values[0]
+        seats = state_groups.get(state_name, [])
 
         embed = discord.Embed(
             title=f"📅 Seat Terms: {state_name}",
@@ -154,20 +177,22 @@ class SeatTermsDropdown(discord.ui.Select):
             inline=False
         )
 
-        await interaction.response.edit_message(embed=embed, view=self.view)
-
-class SeatTermsView(discord.ui.View):
-    def __init__(self, state_groups):
-        super().__init__(timeout=300)
-        self.state_groups = state_groups
-        self.add_item(SeatTermsDropdown(state_groups))
+        view = persistent_view(SeatTermsSelect, self.filter_state, self.filter_office, state_groups) if state_groups else None
+        await interaction.response.edit_message(embed=embed, view=view)
 
 class Elections(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
         self.seats_data = self._initialize_seats()
+        configs.register("elections_config", self._default_elections_config)
         print("Elections cog loaded successfully")
 
+    async def cog_load(self):
+        self.bot.add_dynamic_items(SeatsUpSelect, SeatTermsSelect)
+
+    def cog_unload(self):
+        self.bot.remove_dynamic_items(SeatsUpSelect, SeatTermsSelect)
+
     # Consolidate into fewer groups to save command slots
     # Use the admin group from basics.py instead of creating a new one
 
@@ -405,16 +430,9 @@ class Elections(commands.Cog):
         if not guild:
             return
 
-        # Get announcement channel
-        setup_col = self.bot.db["guild_configs"]
-        setup_config = setup_col.find_one({"guild_id": guild_id})
-        announcement_channel_id = setup_config.get("announcement_channel") if setup_config else None
-
-        channel = None
-        if announcement_channel_id:
-            channel = guild.get_channel(announcement_channel_id)
-        if not channel:
-            channel = discord.utils.get(guild.channels, name="general") or guild.system_channel
+        # Handlers send through the announcement queue so the time loop never waits on Discord
+        announcements = self.bot.get_cog("Announcements")
+        channel = announcements.outbound(guild) if announcements else None
 
         # Handle different phase transitions
         if new_phase == "Signups":
@@ -775,35 +793,34 @@ class Elections(commands.Cog):
 
         return False
 
+    def _default_elections_config(self):
+        """Every seat vacant and up for election, regions taken from the seats"""
+        # Initialize seats in database
+        seats_in_db = []
+        default_regions = set()
+
+        for seat in self.seats_data:
+            seats_in_db.append({
+                **seat,
+                "current_holder": None,
+                "current_holder_id": None,
+                "term_start": None,
+                "term_end": None,
+                "up_for_election": True
+            })
+            default_regions.add(seat["state"])
+
+        return {
+            "seats": seats_in_db,
+            "regions": sorted(list(default_regions)),  # Default regions from seats
+            "candidates": [],  # List of candidate registrations
+            "elections": []    # List of past/current elections
+        }
+
     def _get_elections_config(self, guild_id: int):
         """Get or create elections configuration for a guild"""
         col = self.bot.db["elections_config"]
-        config = col.find_one({"guild_id": guild_id})
-        if not config:
-            # Initialize seats in database
-            seats_in_db = []
-            default_regions = set()
-
-            for seat in self.seats_data:
-                seats_in_db.append({
-                    **seat,
-                    "current_holder": None,
-                    "current_holder_id": None,
-                    "term_start": None,
-                    "term_end": None,
-                    "up_for_election": True
-                })
-                default_regions.add(seat["state"])
-
-            config = {
-                "guild_id": guild_id,
-                "seats": seats_in_db,
-                "regions": sorted(list(default_regions)),  # Default regions from seats
-                "candidates": [],  # List of candidate registrations
-                "elections": []    # List of past/current elections
-            }
-            col.insert_one(config)
-        return col, config
+        return col, configs.get(col, guild_id)
 
     @election_info_group.command(
         name="show_seats",
@@ -1080,16 +1097,13 @@ class Elections(commands.Cog):
             ephemeral=True
         )
 
-    @election_info_group.command(
-        name="seats_up_for_election",
-        description="Show all seats that are up for election this cycle"
-    )
-    async def seats_up_for_election(self, interaction: discord.Interaction):
-        col, config = self._get_elections_config(interaction.guild.id)
+    def _seats_up_by_office(self, guild_id: int):
+        """(current RP year, seats up for election this cycle grouped by office type)"""
+        col, config = self._get_elections_config(guild_id)
 
         # Get current RP year
         time_col = self.bot.db["time_configs"]
-        time_config = time_col.find_one({"guild_id": interaction.guild.id})
+        time_config = time_col.find_one({"guild_id": guild_id})
         current_year = time_config["current_rp_date"].year if time_config else 2024
 
         up_for_election = []
@@ -1115,10 +1129,6 @@ class Elections(commands.Cog):
             if should_be_up:
                 up_for_election.append(seat)
 
-        if not up_for_election:
-            await interaction.response.send_message("🗳️ No seats are currently up for election.", ephemeral=True)
-            return
-
         # Group by office type
         office_groups = {}
         for seat in up_for_election:
@@ -1127,6 +1137,48 @@ class Elections(commands.Cog):
                 office_groups[office_type] = []
             office_groups[office_type].append(seat)
 
+        return current_year, office_groups
+
+    def _seat_terms_by_state(self, guild_id: int, state: Optional[str], office_type: Optional[str]) -> dict:
+        """Seats matching show_seat_terms' filters, grouped by state"""
+        col, config = self._get_elections_config(guild_id)
+
+        seats = config["seats"]
+
+        # Apply filters
+        if state:
+            seats = [s for s in seats if s["state"].lower() == state.lower()]
+
+        if office_type:
+            if office_type.lower() == "senate":
+                seats = [s for s in seats if s["office"] == "Senate"]
+            elif office_type.lower() == "governor":
+                seats = [s for s in seats if s["office"] == "Governor"]
+            elif office_type.lower() == "house":
+                seats = [s for s in seats if "District" in s["office"]]
+            elif office_type.lower() == "national":
+                seats = [s for s in seats if s["state"] == "National"]
+
+        # Group seats by state for pagination
+        state_groups = {}
+        for seat in seats:
+            if seat["state"] not in state_groups:
+                state_groups[seat["state"]] = []
+            state_groups[seat["state"]].append(seat)
+        return state_groups
+
+    @election_info_group.command(
+        name="seats_up_for_election",
+        description="Show all seats that are up for election this cycle"
+    )
+    async def seats_up_for_election(self, interaction: discord.Interaction):
+        current_year, office_groups = self._seats_up_by_office(interaction.guild.id)
+        up_for_election = [seat for seats in office_groups.values() for seat in seats]
+
+        if not up_for_election:
+            await interaction.response.send_message("🗳️ No seats are currently up for election.", ephemeral=True)
+            return
+
         # Create main overview embed
         embed = discord.Embed(
             title="🗳️ Seats Up for Election ({current_year})",
@@ -1158,8 +1210,7 @@ class Elections(commands.Cog):
             inline=False
         )
 
-        view = SeatsUpView(office_groups, current_year)
-        await interaction.response.send_message(embed=embed, view=view)
+        await interaction.response.send_message(embed=embed, view=persistent_view(SeatsUpSelect, office_groups))
 
     @election_manage_group.command(
         name="toggle_election",
@@ -1904,21 +1955,14 @@ class Elections(commands.Cog):
     @app_commands.checks.has_permissions(administrator=True)
     async def announce_seats_up(self, interaction: discord.Interaction):
         """Announce seats up for election in the configured announcement channel"""
-        col, config = self._get_elections_config(interaction.guild.id)
-
-        # Get current RP year
-        time_col = self.bot.db["time_configs"]
-        time_config = time_col.find_one({"guild_id": interaction.guild.id})
-        current_year = time_config["current_rp_date"].year if time_config else 2024
-
         # Get announcement channel
         setup_col = self.bot.db["guild_configs"]
         setup_config = setup_col.find_one({"guild_id": interaction.guild.id})
-        announcement_channel_id = setup_config.get("announcement_channel") if setup_config else None
+        announcement_channel_id = (setup_config.get("announcement_channel_id") or setup_config.get("announcement_channel")) if setup_config else None
 
         if not announcement_channel_id:
             await interaction.response.send_message(
-                "❌ No announcement channel configured. Use `/setup announcement_channel` first.",
+                "❌ No announcement channel configured. Use `/setup set_announcement_channel` first.",
                 ephemeral=True
             )
             return
@@ -1931,37 +1975,13 @@ class Elections(commands.Cog):
             )
             return
 
-        # Get seats up for election
-        up_for_election = []
-        for seat in config["seats"]:
-            should_be_up = False
-
-            if seat.get("up_for_election"):
-                should_be_up = True
-            elif seat.get("term_end"):
-                election_year = current_year + 1 if current_year % 2 == 1 else current_year
-                if seat["term_end"].year == election_year:
-                    should_be_up = True
-            elif not seat.get("current_holder"):
-                should_be_up = self._should_seat_be_up_for_election(seat, current_year)
-            else:
-                should_be_up = self._should_seat_be_up_for_election(seat, current_year)
-
-            if should_be_up:
-                up_for_election.append(seat)
+        current_year, office_groups = self._seats_up_by_office(interaction.guild.id)
+        up_for_election = [seat for seats in office_groups.values() for seat in seats]
 
         if not up_for_election:
             await interaction.response.send_message("🗳️ No seats are currently up for election to announce.", ephemeral=True)
             return
 
-        # Group by office type
-        office_groups = {}
-        for seat in up_for_election:
-            office_type = seat["office"] if seat["office"] in ["Senate", "Governor", "President", "Vice President"] else "House"
-            if office_type not in office_groups:
-                office_groups[office_type] = []
-            office_groups[office_type].append(seat)
-
         # Create main overview embed with dropdown navigation
         embed = discord.Embed(
             title="🗳️ ELECTION ANNOUNCEMENT",
@@ -1995,8 +2015,8 @@ class Elections(commands.Cog):
 
         embed.set_footer(text="Good luck to all potential candidates!")
 
-        # Create the dropdown view for detailed seat information
-        view = SeatsUpView(office_groups, current_year)
+        # Dropdown for detailed seat information; it keeps working after restarts
+        view = persistent_view(SeatsUpSelect, office_groups)
 
         try:
             await channel.send(embed=embed, view=view)
@@ -2024,35 +2044,12 @@ class Elections(commands.Cog):
         state: str = None,
         office_type: str = None
     ):
-        col, config = self._get_elections_config(interaction.guild.id)
-
-        seats = config["seats"]
-
-        # Apply filters
-        if state:
-            seats = [s for s in seats if s["state"].lower() == state.lower()]
-
-        if office_type:
-            if office_type.lower() == "senate":
-                seats = [s for s in seats if s["office"] == "Senate"]
-            elif office_type.lower() == "governor":
-                seats = [s for s in seats if s["office"] == "Governor"]
-            elif office_type.lower() == "house":
-                seats = [s for s in seats if "District" in s["office"]]
-            elif office_type.lower() == "national":
-                seats = [s for s in seats if s["state"] == "National"]
+        state_groups = self._seat_terms_by_state(interaction.guild.id, state, office_type)
 
-        if not seats:
+        if not state_groups:
             await interaction.response.send_message("No seats found with those criteria.", ephemeral=True)
             return
 
-        # Group seats by state for pagination
-        state_groups = {}
-        for seat in seats:
-            if seat["state"] not in state_groups:
-                state_groups[seat["state"]] = []
-            state_groups[seat["state"]].append(seat)
-
         # Create main overview embed
         embed = discord.Embed(
             title="📅 Seat Term End Years",
@@ -2089,8 +2086,11 @@ class Elections(commands.Cog):
             inline=False
         )
 
-        view = SeatTermsView(state_groups)
-        await interaction.response.send_message(embed=embed, view=view)
+        view = persistent_view(SeatTermsSelect, state, office_type, state_groups)
+        if view:
+            await interaction.response.send_message(embed=embed, view=view)
+        else:
+            await interaction.response.send_message(embed=embed)
 
     @election_info_group.command(
         name="list_states",
@@ -0,0 +1,307 @@
+from discord.ext import commands
+import discord
+from discord import app_commands
+from typing import Dict, List, Optional, Set
+import asyncio
+import time
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from .presidential_winners import PRESIDENTIAL_STATE_DATA
+from .forecast import POOL_THRESHOLD, get_process_pool
+
+# 2020 apportionment, winner-take-all everywhere (Maine/Nebraska splits are not modelled)
+ELECTORAL_VOTES = {
+    "ALABAMA": 9, "ALASKA": 3, "ARIZONA": 11, "ARKANSAS": 6, "CALIFORNIA": 54,
+    "COLORADO": 10, "CONNECTICUT": 7, "DELAWARE": 3, "DISTRICT OF COLUMBIA": 3, "FLORIDA": 30,
+    "GEORGIA": 16, "HAWAII": 4, "IDAHO": 4, "ILLINOIS": 19, "INDIANA": 11,
+    "IOWA": 6, "KANSAS": 6, "KENTUCKY": 8, "LOUISIANA": 8, "MAINE": 4,
+    "MARYLAND": 10, "MASSACHUSETTS": 11, "MICHIGAN": 15, "MINNESOTA": 10, "MISSISSIPPI": 6,
+    "MISSOURI": 10, "MONTANA": 4, "NEBRASKA": 5, "NEVADA": 6, "NEW HAMPSHIRE": 4,
+    "NEW JERSEY": 14, "NEW MEXICO": 5, "NEW YORK": 28, "NORTH CAROLINA": 16, "NORTH DAKOTA": 3,
+    "OHIO": 17, "OKLAHOMA": 7, "OREGON": 8, "PENNSYLVANIA": 19, "RHODE ISLAND": 4,
+    "SOUTH CAROLINA": 9, "SOUTH DAKOTA": 3, "TENNESSEE": 11, "TEXAS": 40, "UTAH": 6,
+    "VERMONT": 3, "VIRGINIA": 13, "WASHINGTON": 12, "WEST VIRGINIA": 4, "WISCONSIN": 10,
+    "WYOMING": 3
+}
+STATES = sorted(PRESIDENTIAL_STATE_DATA.keys())
+VOTES_TO_WIN = sum(ELECTORAL_VOTES.values()) // 2 + 1
+STATE_FLOOR, STATE_CEILING = 15.0, 85.0  # Same bounds as the national presidential polling
+NATIONAL_SIGMA = 2.0  # Swing shared by every state in one simulated election
+STATE_SIGMA = 3.0  # Independent error on top of it per state
+DEFAULT_EV_SIMULATIONS = 20000
+MAX_EV_SIMULATIONS = 100000
+# Collections feeding the map; a change to any of them from another process dirties it
+REMOTE_COLLECTIONS = {"presidential_winners", "presidential_signups", "momentum_config", "time_configs"}
+
+
+def _party_alignment(party: str) -> str:
+    party = party.lower()
+    if "republican" in party:
+        return "republican"
+    if "democrat" in party:
+        return "democrat"
+    return "other"
+
+
+def _momentum_key(party: str) -> str:
+    return {"republican": "Republican", "democrat": "Democrat"}.get(_party_alignment(party), "Independent")
+
+
+def state_winners(shares: "np.ndarray", electoral_votes: "np.ndarray"):
+    """Winner index per state and electoral votes per candidate, for a (candidates, states) share matrix"""
+    winners = shares.argmax(axis=0)
+    totals = np.bincount(winners, weights=electoral_votes, minlength=shares.shape[0])
+    return winners, totals
+
+
+def simulate_electoral_votes(shares: "np.ndarray", electoral_votes: "np.ndarray", simulations: int,
+                             seed: Optional[int] = None) -> dict:
+    """Monte Carlo the electoral vote distribution for a (candidates, states) share matrix.
+
+    Each simulated election adds a national swing per candidate plus independent state
+    noise, so neighbouring states move together the way real polling misses do.
+    Module level so it can run in a worker process.
+    """
+    rng = np.random.default_rng(seed)
+    candidates, states = shares.shape
+    national = rng.standard_normal((simulations, candidates, 1), dtype=np.float32) * NATIONAL_SIGMA
+    draws = rng.standard_normal((simulations, candidates, states), dtype=np.float32) * STATE_SIGMA
+    draws += national
+    draws += shares.astype(np.float32)
+    winners = draws.argmax(axis=1)  # (simulations, states)
+
+    totals = np.zeros((simulations, candidates), dtype=np.int32)
+    for index in range(candidates):
+        totals[:, index] = (winners == index).astype(np.int32) @ electoral_votes.astype(np.int32)
+
+    low, high = np.percentile(totals, (5, 95), axis=0)
+    state_win = np.stack([(winners == index).mean(axis=0) for index in range(candidates)])
+    return {
+        "mean": totals.mean(axis=0).tolist(),
+        "low": low.tolist(),
+        "high": high.tolist(),
+        "win_probability": (totals >= VOTES_TO_WIN).mean(axis=0).tolist(),
+        "state_win_probability": state_win.tolist(),
+        "simulations": simulations,
+    }
+
+
+class ElectoralMap:
+    """Per-state shares for every presidential ticket of one guild, held as a (candidates, states) matrix"""
+
+    def __init__(self, candidates: List[dict]):
+        self.candidates = [(c.get("user_id"), c.get("name", "Unknown"), c.get("party", "")) for c in candidates]
+        self.raw = np.zeros((len(candidates), len(STATES)))
+        self.electoral_votes = np.array([ELECTORAL_VOTES[state] for state in STATES], dtype=np.float64)
+        self.shares = None
+        self.winners = None
+        self.totals = None
+        self.dirty: Set[str] = set(STATES)
+        self.simulation = None  # Cached Monte Carlo result, dropped whenever a state changes
+
+    def fill(self, candidates: List[dict], momentum_config: Optional[dict], states: Set[str]):
+        """Rebuild the raw support columns for the given states from candidate documents"""
+        state_momentum = (momentum_config or {}).get("state_momentum", {})
+        columns = [STATES.index(state) for state in states if state in PRESIDENTIAL_STATE_DATA]
+        for row, candidate in enumerate(candidates):
+            alignment = _party_alignment(candidate.get("party", ""))
+            momentum_key = _momentum_key(candidate.get("party", ""))
+            state_points = candidate.get("state_points", {})
+            for column in columns:
+                state = STATES[column]
+                momentum = state_momentum.get(state, {}).get(momentum_key, 0.0)
+                self.raw[row, column] = (
+                    PRESIDENTIAL_STATE_DATA[state][alignment]
+                    + state_points.get(state, 0.0)
+                    + max(-15.0, min(15.0, momentum / 10.0))  # Same effect curve as the momentum cog
+                )
+
+    def recompute(self):
+        """Bound, normalise and pick every state's winner in one vectorized step"""
+        bounded = np.clip(self.raw, STATE_FLOOR, STATE_CEILING)
+        self.shares = bounded * (100.0 / bounded.sum(axis=0, keepdims=True))
+        self.winners, self.totals = state_winners(self.shares, self.electoral_votes)
+        self.dirty.clear()
+        self.simulation = None
+
+
+class ElectoralCollege(commands.Cog):
+    """State-by-state electoral vote projections for the presidential general election"""
+
+    def __init__(self, bot):
+        self.bot = bot
+        self.maps: Dict[int, ElectoralMap] = {}
+        print("ElectoralCollege cog loaded successfully")
+
+    def touch(self, guild_id: Optional[int], state: Optional[str] = None):
+        """Mark one state (or the whole map) as changed; it is recomputed on the next read.
+
+        guild_id None applies to every guild, for edits to the shared state baselines.
+        """
+        guild_ids = list(self.maps) if guild_id is None else [guild_id]
+        for gid in guild_ids:
+            electoral_map = self.maps.get(gid)
+            if electoral_map is None:
+                continue
+            if state is None:
+                del self.maps[gid]
+            else:
+                electoral_map.dirty.add(state.upper())
+                electoral_map.simulation = None
+
+    @commands.Cog.listener()
+    async def on_remote_change(self, collection: str, operation: str, guild_id: Optional[int]):
+        """Writes from other processes, relayed by CacheSync.
+
+        Every state is marked dirty rather than the map dropped: our own writes echo
+        back through the change stream too, and get_map still rebuilds from scratch
+        if the ticket list changed.
+        """
+        if collection not in REMOTE_COLLECTIONS:
+            return
+        guild_ids = list(self.maps) if guild_id is None else [guild_id]
+        for gid in guild_ids:
+            electoral_map = self.maps.get(gid)
+            if electoral_map is not None:
+                electoral_map.dirty.update(STATES)
+                electoral_map.simulation = None
+
+    def _get_general_candidates(self, guild_id: int) -> List[dict]:
+        time_config = self.bot.db["time_configs"].find_one({"guild_id": guild_id})
+        current_year = time_config["current_rp_date"].year if time_config else 2024
+        primary_year = current_year - 1 if current_year % 2 == 0 else current_year
+
+        winners_config = self.bot.db["presidential_winners"].find_one(
+            {"guild_id": guild_id},
+            {"winners.user_id": 1, "winners.name": 1, "winners.party": 1, "winners.office": 1,
+             "winners.year": 1, "winners.primary_winner": 1, "winners.state_points": 1}
+        )
+        winners = (winners_config or {}).get("winners", [])
+        if not isinstance(winners, list):
+            return []
+        return [
+            w for w in winners
+            if isinstance(w, dict) and w.get("primary_winner", False)
+            and w.get("year") == primary_year and w.get("office") == "President"
+        ]
+
+    def get_map(self, guild_id: int) -> Optional[ElectoralMap]:
+        """Cached electoral map for a guild, refreshing only the states touched since the last read"""
+        electoral_map = self.maps.get(guild_id)
+        if electoral_map is not None and not electoral_map.dirty:
+            return electoral_map
+
+        candidates = self._get_general_candidates(guild_id)
+        if not candidates:
+            self.maps.pop(guild_id, None)
+            return None
+
+        ids = [(c.get("user_id"), c.get("name", "Unknown"), c.get("party", "")) for c in candidates]
+        if electoral_map is None or electoral_map.candidates != ids:
+            electoral_map = ElectoralMap(candidates)  # Ticket list changed: every column is dirty
+            self.maps[guild_id] = electoral_map
+
+        momentum_config = self.bot.db["momentum_config"].find_one({"guild_id": guild_id}, {"state_momentum": 1})
+        electoral_map.fill(candidates, momentum_config, electoral_map.dirty)
+        electoral_map.recompute()
+        return electoral_map
+
+    async def simulate(self, guild_id: int, simulations: int) -> Optional[dict]:
+        electoral_map = self.get_map(guild_id)
+        if electoral_map is None:
+            return None
+        cached = electoral_map.simulation
+        if cached is not None and cached["simulations"] >= simulations:
+            return cached
+
+        draws = simulations * electoral_map.shares.size
+        if draws <= POOL_THRESHOLD:
+            result = simulate_electoral_votes(electoral_map.shares, electoral_map.electoral_votes, simulations)
+        else:
+            loop = asyncio.get_running_loop()
+            result = await loop.run_in_executor(
+                get_process_pool(), simulate_electoral_votes,
+                electoral_map.shares, electoral_map.electoral_votes, simulations
+            )
+        if electoral_map.simulation is None and not electoral_map.dirty:
+            electoral_map.simulation = result  # Only keep it if nothing changed while it ran
+        return result
+
+    @app_commands.command(
+        name="pres_electoral_map",
+        description="Project the presidential electoral vote map from current state polling"
+    )
+    @app_commands.describe(
+        simulations=f"Also simulate the race this many times for win probabilities (0-{MAX_EV_SIMULATIONS})"
+    )
+    async def pres_electoral_map(self, interaction: discord.Interaction, simulations: Optional[int] = 0):
+        if np is None:
+            await interaction.response.send_message(
+                "❌ The electoral map needs NumPy installed on the bot host.", ephemeral=True
+            )
+            return
+
+        await interaction.response.defer()
+        electoral_map = self.get_map(interaction.guild.id)
+        if electoral_map is None:
+            await interaction.followup.send(
+                "❌ No presidential general election candidates found for this cycle.", ephemeral=True
+            )
+            return
+
+        simulation = None
+        if simulations:
+            started = time.perf_counter()
+            simulation = await self.simulate(interaction.guild.id, min(MAX_EV_SIMULATIONS, max(1000, simulations)))
+            elapsed_ms = (time.perf_counter() - started) * 1000
+
+        embed = discord.Embed(
+            title="🗳️ Projected Electoral Map",
+            description=f"{VOTES_TO_WIN} electoral votes needed to win",
+            color=discord.Color.blue(),
+            timestamp=discord.utils.utcnow()
+        )
+
+        order = sorted(range(len(electoral_map.candidates)), key=lambda i: electoral_map.totals[i], reverse=True)
+        for index in order:
+            _, name, party = electoral_map.candidates[index]
+            won = [STATES[s] for s in np.flatnonzero(electoral_map.winners == index)]
+            value = f"**{int(electoral_map.totals[index])} EV** from {len(won)} states"
+            if simulation:
+                value += (
+                    f"\nSimulated: {simulation['mean'][index]:.0f} EV "
+                    f"({simulation['low'][index]:.0f}–{simulation['high'][index]:.0f}), "
+                    f"{simulation['win_probability'][index] * 100:.1f}% to win"
+                )
+            if won:
+                value += "\n" + ", ".join(state.title() for state in won)
+            embed.add_field(name=f"{name} ({party})", value=value[:1024], inline=False)
+
+        # Closest states by margin between the top two shares
+        if len(electoral_map.candidates) > 1:
+            top_two = np.sort(electoral_map.shares, axis=0)[-2:]
+            margins = top_two[1] - top_two[0]
+            closest = np.argsort(margins)[:8]
+            embed.add_field(
+                name="Closest States",
+                value="\n".join(
+                    f"{STATES[s].title()} ({ELECTORAL_VOTES[STATES[s]]} EV): "
+                    f"{electoral_map.candidates[electoral_map.winners[s]][1]} +{margins[s]:.1f}%"
+                    for s in closest
+                ),
+                inline=False
+            )
+
+        footer = "Winner-take-all by state"
+        if simulation:
+            footer += f" • {simulation['simulations']:,} simulations in {elapsed_ms:.0f} ms"
+        embed.set_footer(text=footer)
+        await interaction.followup.send(embed=embed)
+
+
+async def setup(bot):
+    await bot.add_cog(ElectoralCollege(bot))
@@ -3,6 +3,32 @@ from discord.ext import commands
 from discord import app_commands
 from datetime import datetime, timedelta
 from typing import Optional
+from .config_registry import configs
+from .member_cache import mention
+
+
+def _default_endorsement_config():
+    return {
+        "role_mappings": {
+            "President": None,
+            "Vice President": None,
+            "Governor": None,
+            "Senator": None,
+            "House": None,
+            "Mayor": None,
+            "State Legislator": None,
+            "Other": None
+        }
+    }
+
+
+def _default_endorsement_history():
+    return {"endorsements": []}
+
+
+configs.register("endorsement_config", _default_endorsement_config)
+configs.register("endorsement_history", _default_endorsement_history)
+
 
 class Endorsements(commands.Cog):
     def __init__(self, bot):
@@ -18,35 +44,12 @@ class Endorsements(commands.Cog):
     def _get_endorsement_config(self, guild_id: int):
         """Get or create endorsement configuration"""
         col = self.bot.db["endorsement_config"]
-        config = col.find_one({"guild_id": guild_id})
-        if not config:
-            config = {
-                "guild_id": guild_id,
-                "role_mappings": {
-                    "President": None,
-                    "Vice President": None,
-                    "Governor": None,
-                    "Senator": None,
-                    "House": None,
-                    "Mayor": None,
-                    "State Legislator": None,
-                    "Other": None
-                }
-            }
-            col.insert_one(config)
-        return col, config
+        return col, configs.get(col, guild_id)
 
     def _get_endorsement_history(self, guild_id: int):
         """Get or create endorsement history"""
         col = self.bot.db["endorsement_history"]
-        config = col.find_one({"guild_id": guild_id})
-        if not config:
-            config = {
-                "guild_id": guild_id,
-                "endorsements": []
-            }
-            col.insert_one(config)
-        return col, config
+        return col, configs.get(col, guild_id)
 
     def _check_duplicate_endorsement(self, guild_id: int, user_id: int, candidate_name: str):
         """Check if user has already endorsed this specific candidate"""
@@ -189,7 +192,7 @@ class Endorsements(commands.Cog):
     def _record_endorsement(self, guild_id: int, endorser_id: int, candidate_name: str, 
                            endorsement_value: float, role_type: str, role_name: str):
         """Record endorsement in history"""
-        history_col, history_config = self._get_endorsement_history(guild_id)
+        history_col = self.bot.db["endorsement_history"]
 
         # Add new endorsement (no duplicates should reach here due to check)
         new_endorsement = {
@@ -201,11 +204,11 @@ class Endorsements(commands.Cog):
             "timestamp": datetime.utcnow()
         }
 
-        history_config["endorsements"].append(new_endorsement)
-
+        # $push instead of rewriting the array so concurrent endorsements aren't lost
         history_col.update_one(
             {"guild_id": guild_id},
-            {"$set": {"endorsements": history_config["endorsements"]}}
+            {"$push": {"endorsements": new_endorsement}},
+            upsert=True
         )
 
     @app_commands.command(
@@ -460,8 +463,7 @@ class Endorsements(commands.Cog):
         
         # Show up to 15 most recent endorsements
         for endorsement in endorsements[:15]:
-            endorser = interaction.guild.get_member(endorsement["endorser_id"])
-            endorser_name = endorser.display_name if endorser else f"User {endorsement['endorser_id']}"
+            endorser_name = mention(endorsement["endorser_id"])
             
             timestamp = endorsement["timestamp"].strftime("%m/%d %H:%M")
             
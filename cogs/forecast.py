@@ -0,0 +1,282 @@
+from discord.ext import commands
+import discord
+from discord import app_commands
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Tuple
+import asyncio
+import os
+import time
+
+from .dashboard import add_seat_fields, seat_chamber
+from .zero_sum import minimum_floor
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+DEFAULT_SIMULATIONS = 20000
+MAX_SIMULATIONS = 100000
+MIN_SIMULATIONS = 1000
+FORECAST_SIGMA = 3.5  # Election-day error per candidate; the 7% polling margin is ~2 sigma
+INTERVAL = (5, 95)  # Percentiles reported as the confidence interval
+INTERVAL_SAMPLES = 5000  # Simulations the share intervals are read from; plenty for 5th/95th percentiles
+CHUNK_ELEMENTS = 4_000_000  # Draws held in memory at once (~16 MB of float32)
+POOL_THRESHOLD = 2_000_000  # Runs with more draws than this go to the process pool
+POOL_WORKERS = int(os.getenv("FORECAST_WORKERS", "2"))
+
+# One (seat_id, group, [(candidate, party, share, floor), ...]) entry per seat; seat totals
+# and majorities are counted per group (Senate, House, Governor, or the office name)
+SeatInput = Tuple[str, str, List[Tuple[str, str, float, float]]]
+
+_pool: Optional[ProcessPoolExecutor] = None
+
+
+def seat_group(office: str) -> str:
+    """The chamber a seat counts toward; offices outside the chambers stand on their own"""
+    return seat_chamber({"office": office}) or office
+
+
+def get_process_pool() -> ProcessPoolExecutor:
+    """Worker processes shared by every heavy NumPy simulation"""
+    global _pool
+    if _pool is None:
+        _pool = ProcessPoolExecutor(max_workers=POOL_WORKERS)
+    return _pool
+
+
+def simulate_seats(seats: List[SeatInput], simulations: int, seed: Optional[int] = None,
+                   sigma: float = FORECAST_SIGMA) -> dict:
+    """Run every seat `simulations` times with NumPy and summarise the outcomes.
+
+    Each run perturbs every candidate's expected share with normal noise, re-applies
+    the polling floors and renormalises to 100%. Seats with the same number of
+    candidates are stacked into one (seats, simulations, candidates) array, so the
+    work is a handful of array operations rather than a Python loop per draw.
+    Seat totals and majority odds are reported per seat group, since a majority
+    only means something within one chamber. Module level so it can run in a
+    worker process.
+    """
+    rng = np.random.default_rng(seed)
+    parties = sorted({party for _, _, candidates in seats for _, party, _, _ in candidates})
+    party_index = {party: i for i, party in enumerate(parties)}
+    groups = sorted({group for _, group, _ in seats})
+    group_index = {group: i for i, group in enumerate(groups)}
+    party_seats = np.zeros((len(groups), simulations, len(parties)), dtype=np.int32)
+
+    by_size: Dict[int, List[SeatInput]] = {}
+    for seat in seats:
+        by_size.setdefault(len(seat[2]), []).append(seat)
+
+    results = {}
+    for size, group in by_size.items():
+        chunk = max(1, CHUNK_ELEMENTS // (simulations * size))
+        for start in range(0, len(group), chunk):
+            batch = group[start:start + chunk]
+            shares = np.array([[c[2] for c in candidates] for _, _, candidates in batch], dtype=np.float32)
+            floors = np.array([[c[3] for c in candidates] for _, _, candidates in batch], dtype=np.float32)
+            party_of = np.array([[party_index[c[1]] for c in candidates] for _, _, candidates in batch])
+            group_of = np.array([group_index[group] for _, group, _ in batch])
+
+            draws = rng.standard_normal((len(batch), simulations, size), dtype=np.float32)
+            draws *= sigma
+            draws += shares[:, None, :]
+            np.maximum(draws, floors[:, None, :], out=draws)
+            draws *= 100.0 / draws.sum(axis=2, keepdims=True)
+
+            winners = draws.argmax(axis=2)  # (seats, simulations)
+            # Count wins per (seat, candidate) in one pass over the flattened winner indices
+            offsets = (winners + np.arange(len(batch))[:, None] * size).ravel()
+            win_probability = np.bincount(offsets, minlength=len(batch) * size).reshape(len(batch), size) / simulations
+            mean = draws.mean(axis=1, dtype=np.float64)
+            low, high = np.percentile(draws[:, :INTERVAL_SAMPLES], INTERVAL, axis=1)
+
+            winner_party = np.take_along_axis(party_of, winners, axis=1)
+            for g in np.unique(group_of):
+                in_group = winner_party[group_of == g]
+                for index in np.unique(party_of):
+                    party_seats[g, :, index] += (in_group == index).sum(axis=0)
+
+            for b, (seat_id, _, candidates) in enumerate(batch):
+                results[seat_id] = sorted((
+                    {
+                        "candidate": name,
+                        "party": party,
+                        "win_probability": float(win_probability[b, k]),
+                        "mean": float(mean[b, k]),
+                        "low": float(low[b, k]),
+                        "high": float(high[b, k]),
+                    }
+                    for k, (name, party, _, _) in enumerate(candidates)
+                ), key=lambda row: row["win_probability"], reverse=True)
+
+    chambers = {}
+    for group, g in group_index.items():
+        group_seats = [candidates for _, seat_group, candidates in seats if seat_group == group]
+        majority = len(group_seats) // 2 + 1
+        group_parties = {party for candidates in group_seats for _, party, _, _ in candidates}
+        totals = {}
+        for party, index in party_index.items():
+            if party not in group_parties:
+                continue
+            counts = party_seats[g, :, index]
+            low, high = np.percentile(counts, INTERVAL)
+            totals[party] = {
+                "mean": float(counts.mean()),
+                "low": float(low),
+                "high": float(high),
+                "majority_probability": float((counts >= majority).mean()),
+            }
+        chambers[group] = {"seats": len(group_seats), "majority": majority, "parties": totals}
+    return {"seats": results, "chambers": chambers, "simulations": simulations}
+
+
+class Forecast(commands.Cog):
+    """Monte Carlo seat forecasts built on the polling model"""
+
+    def __init__(self, bot):
+        self.bot = bot
+        print("Forecast cog loaded successfully")
+
+    def cog_unload(self):
+        global _pool
+        if _pool is not None:
+            _pool.shutdown(wait=False, cancel_futures=True)
+            _pool = None
+
+    def _get_forecast_candidates(self, guild_id: int) -> Tuple[Dict[str, List[dict]], str]:
+        """General election candidates of the current cycle grouped by seat, and the current phase"""
+        time_config = self.bot.db["time_configs"].find_one({"guild_id": guild_id})
+        winners_config = self.bot.db["winners"].find_one({"guild_id": guild_id})
+        if not time_config or not winners_config:
+            return {}, ""
+
+        current_year = time_config["current_rp_date"].year
+        # Same cycle selection as the polling model
+        primary_year = current_year - 1 if current_year % 2 == 0 else current_year
+
+        by_seat: Dict[str, List[dict]] = {}
+        for winner in winners_config.get("winners", []):
+            if winner.get("office") in ("President", "Vice President"):
+                continue  # Presidential races are decided by the electoral college
+            if winner.get("year") == primary_year and winner.get("primary_winner", False):
+                by_seat.setdefault(winner["seat_id"], []).append(winner)
+        return by_seat, time_config.get("current_phase", "")
+
+    def _build_seat_inputs(self, guild_id: int, by_seat: Dict[str, List[dict]], current_phase: str) -> List[SeatInput]:
+        """Expected shares from the same zero-sum model /poll uses, computed from the already loaded candidates"""
+        polling_cog = self.bot.get_cog("Polling")
+        seats = []
+        for seat_id, candidates in sorted(by_seat.items()):
+            shares = polling_cog._calculate_seat_percentages(guild_id, candidates, current_phase)
+            if not shares:
+                continue
+            seats.append((seat_id, seat_group(candidates[0].get("office", "")), [
+                (c["candidate"], c["party"], shares.get(c["candidate"], 0.0), minimum_floor(c["party"]))
+                for c in candidates
+            ]))
+        return seats
+
+    async def run_forecast(self, seats: List[SeatInput], simulations: int) -> dict:
+        """Simulate inline for small runs, in the process pool for heavy ones"""
+        draws = simulations * sum(len(candidates) for _, _, candidates in seats)
+        if draws <= POOL_THRESHOLD:
+            return simulate_seats(seats, simulations)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(get_process_pool(), simulate_seats, seats, simulations)
+
+    @app_commands.command(
+        name="forecast",
+        description="Simulate the general election thousands of times and show each seat's win probability"
+    )
+    @app_commands.describe(
+        region="Only forecast seats in this region (leave blank for all regions)",
+        office="Only forecast this office, e.g. Senate or House (leave blank for all)",
+        simulations=f"Number of simulated elections ({MIN_SIMULATIONS}-{MAX_SIMULATIONS}, default {DEFAULT_SIMULATIONS})"
+    )
+    async def forecast(
+        self,
+        interaction: discord.Interaction,
+        region: Optional[str] = None,
+        office: Optional[str] = None,
+        simulations: Optional[int] = None
+    ):
+        if np is None:
+            await interaction.response.send_message(
+                "❌ Forecasting needs NumPy installed on the bot host.", ephemeral=True
+            )
+            return
+        if self.bot.get_cog("Polling") is None:
+            await interaction.response.send_message("❌ Polling system not loaded.", ephemeral=True)
+            return
+
+        simulations = max(MIN_SIMULATIONS, min(MAX_SIMULATIONS, simulations or DEFAULT_SIMULATIONS))
+        await interaction.response.defer()
+
+        by_seat, current_phase = self._get_forecast_candidates(interaction.guild.id)
+        by_seat = {
+            seat_id: candidates for seat_id, candidates in by_seat.items()
+            if (not region or candidates[0].get("state", "").lower() == region.lower())
+            and (not office or candidates[0].get("office", "").lower() == office.lower())
+        }
+        if not by_seat:
+            await interaction.followup.send(
+                "❌ No general election candidates found for that selection.", ephemeral=True
+            )
+            return
+
+        seats = self._build_seat_inputs(interaction.guild.id, by_seat, current_phase)
+        started = time.perf_counter()
+        result = await self.run_forecast(seats, simulations)
+        elapsed_ms = (time.perf_counter() - started) * 1000
+
+        scope = " ".join(part for part in (region, office) if part) or "All Seats"
+        embed = discord.Embed(
+            title=f"🔮 Election Forecast: {scope}",
+            description=f"{len(seats)} seats, {simulations:,} simulated elections each",
+            color=discord.Color.purple(),
+            timestamp=discord.utils.utcnow()
+        )
+
+        for group, chamber in result["chambers"].items():
+            chamber_lines = []
+            for party, stats in sorted(chamber["parties"].items(), key=lambda item: item[1]["mean"], reverse=True):
+                chamber_lines.append(
+                    f"**{party}**: {stats['mean']:.1f} seats ({stats['low']:.0f}–{stats['high']:.0f}), "
+                    f"majority {stats['majority_probability'] * 100:.1f}%"
+                )
+            embed.add_field(
+                name=f"{group}: {chamber['seats']} seats, {chamber['majority']} for a majority (90% interval)",
+                value="\n".join(chamber_lines)[:1024],
+                inline=False
+            )
+
+        seat_lines = []
+        for seat_id, _, _ in seats:
+            leader = result["seats"][seat_id][0]
+            seat_lines.append(
+                f"**{seat_id}**: {leader['candidate']} ({leader['party']}) "
+                f"{leader['win_probability'] * 100:.1f}% to win, "
+                f"{leader['mean']:.1f}% [{leader['low']:.1f}–{leader['high']:.1f}]"
+            )
+
+        add_seat_fields(embed, "Seats", seat_lines, "more seats. Filter by region or office to see them.")
+
+        embed.set_footer(text=f"Shares shown as mean [90% interval] • simulated in {elapsed_ms:.0f} ms")
+        await interaction.followup.send(embed=embed)
+
+    @forecast.autocomplete("region")
+    async def region_autocomplete(self, interaction: discord.Interaction, current: str):
+        by_seat, _ = self._get_forecast_candidates(interaction.guild.id)
+        regions = sorted({candidates[0].get("state", "") for candidates in by_seat.values()} - {""})
+        return [app_commands.Choice(name=r, value=r) for r in regions if current.lower() in r.lower()][:25]
+
+    @forecast.autocomplete("office")
+    async def office_autocomplete(self, interaction: discord.Interaction, current: str):
+        by_seat, _ = self._get_forecast_candidates(interaction.guild.id)
+        offices = sorted({candidates[0].get("office", "") for candidates in by_seat.values()} - {""})
+        return [app_commands.Choice(name=o, value=o) for o in offices if current.lower() in o.lower()][:25]
+
+
+async def setup(bot):
+    await bot.add_cog(Forecast(bot))
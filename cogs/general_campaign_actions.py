@@ -7,6 +7,9 @@ import asyncio
 from typing import Optional, List
 from .presidential_winners import PRESIDENTIAL_STATE_DATA
 from cogs.ideology import STATE_DATA
+from .reply_router import wait_for_reply
+from .queries import find_entries, find_entry
+from .zero_sum import minimum_floor, zero_sum_percentages
 
 
 
@@ -24,20 +27,12 @@ class GeneralCampaignActions(commands.Cog):
     def _get_user_candidate(self, guild_id: int, user_id: int):
         """Get user's candidate information from all signups"""
         signups_col = self.bot.db["all_signups"]
-        signups_config = signups_col.find_one({"guild_id": guild_id})
-
-        if not signups_config:
-            return signups_col, None
 
         time_col, time_config = self._get_time_config(guild_id)
         current_year = time_config["current_rp_date"].year if time_config else 2024
 
-        for candidate in signups_config.get("candidates", []):
-            if (candidate["user_id"] == user_id and 
-                candidate["year"] == current_year):
-                return signups_col, candidate
-
-        return signups_col, None
+        candidate = find_entry(signups_col, guild_id, "candidates", {"user_id": user_id, "year": current_year})
+        return signups_col, candidate
 
     def _get_candidate_by_name(self, guild_id: int, candidate_name: str):
         """Get candidate information by name from appropriate collection based on phase"""
@@ -48,62 +43,25 @@ class GeneralCampaignActions(commands.Cog):
         # During General Campaign, look in winners collection for primary winners
         if current_phase == "General Campaign":
             winners_col = self.bot.db["winners"]
-            winners_config = winners_col.find_one({"guild_id": guild_id})
-
-            if winners_config and "winners" in winners_config:
-                for winner in winners_config["winners"]:
-                    if (winner.get("candidate", "").lower() == candidate_name.lower() and 
-                        winner.get("year") == current_year and
-                        winner.get("primary_winner", False)):
-                        return winners_col, winner
+            winner = find_entry(winners_col, guild_id, "winners",
+                                {"candidate": candidate_name, "year": current_year, "primary_winner": True},
+                                ignore_case=("candidate",))
+            if winner:
+                return winners_col, winner
 
         # For other phases or fallback, look in all_signups
         signups_col = self.bot.db["all_signups"]
-        signups_config = signups_col.find_one({"guild_id": guild_id})
-
-        if signups_config:
-            for candidate in signups_config.get("candidates", []):
-                if (candidate.get("name", "").lower() == candidate_name.lower() and 
-                    candidate["year"] == current_year):
-                    return signups_col, candidate
-
-        return signups_col, None
+        candidate = find_entry(signups_col, guild_id, "candidates",
+                               {"name": candidate_name, "year": current_year}, ignore_case=("name",))
+        return signups_col, candidate
 
 
     def _apply_buff_debuff_multiplier_enhanced(self, base_points: float, user_id: int, guild_id: int, action_type: str) -> float:
         """Apply any active buffs or debuffs to the points gained with announcements"""
-        buffs_col, buffs_config = self._get_buffs_debuffs_config(guild_id)
-
-        active_effects = buffs_config.get("active_effects", {})
-        multiplier = 1.0
-        current_time = datetime.utcnow()
-
-        # Clean up expired effects
-        expired_effects = []
-        for effect_id, effect in active_effects.items():
-            if effect.get("expires_at", current_time) <= current_time:
-                expired_effects.append(effect_id)
-
-        if expired_effects:
-            for effect_id in expired_effects:
-                buffs_col.update_one(
-                    {"guild_id": guild_id},
-                    {"$unset": {f"active_effects.{effect_id}": ""}}
-                )
-
-        for effect_id, effect in active_effects.items():
-            # Check if effect applies to this user and action
-            if (effect.get("target_user_id") == user_id and 
-                effect.get("expires_at") > current_time and
-                (not effect.get("action_types") or action_type in effect.get("action_types", []))):
-
-                effect_multiplier = effect.get("multiplier", 1.0)
-                if effect.get("effect_type") == "buff":
-                    multiplier += (effect_multiplier - 1.0)
-                elif effect.get("effect_type") == "debuff":
-                    multiplier *= effect_multiplier
-
-        return base_points * max(0.1, multiplier)  # Minimum 10% effectiveness
+        effects_cog = self.bot.get_cog("CampaignEffects")
+        if not effects_cog:
+            return base_points
+        return effects_cog.apply_multiplier(base_points, user_id, guild_id, action_type)
 
 
 
@@ -191,14 +149,9 @@ class GeneralCampaignActions(commands.Cog):
         # Get the response message
         response_message = await interaction.original_response()
 
-        def check(message):
-            return (message.author.id == interaction.user.id and 
-                    message.reference and 
-                    message.reference.message_id == response_message.id)
-
         try:
             # Wait for user to reply with speech
-            reply_message = await self.bot.wait_for('message', timeout=300.0, check=check)
+            reply_message = await wait_for_reply(self.bot, response_message.id, interaction.user.id, timeout=300.0)
 
             speech_content = reply_message.content
             char_count = len(speech_content)
@@ -394,14 +347,9 @@ class GeneralCampaignActions(commands.Cog):
         # Get the response message
         response_message = await interaction.original_response()
 
-        def check(message):
-            return (message.author.id == interaction.user.id and 
-                    message.reference and 
-                    message.reference.message_id == response_message.id)
-
         try:
             # Wait for user to reply with donor appeal
-            reply_message = await self.bot.wait_for('message', timeout=300.0, check=check)
+            reply_message = await wait_for_reply(self.bot, response_message.id, interaction.user.id, timeout=300.0)
 
             donor_appeal = reply_message.content
             char_count = len(donor_appeal)
@@ -740,15 +688,9 @@ class GeneralCampaignActions(commands.Cog):
         # Get the response message
         response_message = await interaction.original_response()
 
-        def check(message):
-            return (message.author.id == interaction.user.id and 
-                    message.reference and 
-                    message.reference.message_id == response_message.id and
-                    len(message.attachments) > 0)
-
         try:
             # Wait for user to reply with attachment
-            reply_message = await self.bot.wait_for('message', timeout=300.0, check=check)
+            reply_message = await wait_for_reply(self.bot, response_message.id, interaction.user.id, timeout=300.0, require_attachments=True)
 
             video = reply_message.attachments[0]
 
@@ -1025,55 +967,24 @@ class GeneralCampaignActions(commands.Cog):
 
         candidate_choices = []
 
-        # During General Campaign, get primary winners from all_winners
+        # During General Campaign, get primary winners from all_winners, otherwise from signups.
+        # Only the names matching what's typed so far come back from the server.
         if current_phase == "General Campaign":
-            winners_col = self.bot.db["winners"]
-            winners_config = winners_col.find_one({"guild_id": interaction.guild.id})
-
-            if winners_config and "winners" in winners_config:
-                for winner in winners_config["winners"]:
-                    if (winner.get("year") == current_year and 
-                        winner.get("primary_winner", False)):
-                        candidate_name = winner.get("candidate")
-                        if candidate_name and current.lower() in candidate_name.lower():
-                            if len(candidate_choices) < 25:
-                                candidate_choices.append(app_commands.Choice(name=candidate_name, value=candidate_name))
-                            else:
-                                break
-
-        # During other phases, get from signups
+            names = find_entries(self.bot.db["winners"], interaction.guild.id, "winners",
+                                 {"year": current_year, "primary_winner": True},
+                                 contains={"candidate": current}, limit=25, fields=("candidate",)) or []
+            names = [winner.get("candidate") for winner in names]
         else:
-            signups_col = self.bot.db["all_signups"]
-            signups_config = signups_col.find_one({"guild_id": interaction.guild.id})
-
-            if signups_config and "candidates" in signups_config:
-                for candidate in signups_config["candidates"]:
-                    if candidate.get("year") == current_year:
-                        candidate_name = candidate.get("name")
-                        if candidate_name and current.lower() in candidate_name.lower():
-                            if len(candidate_choices) < 25:
-                                candidate_choices.append(app_commands.Choice(name=candidate_name, value=candidate_name))
-                            else:
-                                break
-
-        return candidate_choices
-
-
-    # --- Buff/Debuff Management Functions ---
-
-    def _get_buffs_debuffs_config(self, guild_id: int):
-        """Get or create campaign buffs/debuffs configuration"""
-        col = self.bot.db["campaign_buffs_debuffs"]
-        config = col.find_one({"guild_id": guild_id})
-        if not config:
-            config = {
-                "guild_id": guild_id,
-                "active_effects": {}  # effect_id -> {effect_type, target_user_id, effect_name, multiplier, expires_at}
-            }
-            col.insert_one(config)
-        return col, config
+            names = find_entries(self.bot.db["all_signups"], interaction.guild.id, "candidates",
+                                 {"year": current_year}, contains={"name": current},
+                                 limit=25, fields=("name",)) or []
+            names = [candidate.get("name") for candidate in names]
 
+        for candidate_name in names:
+            if candidate_name:
+                candidate_choices.append(app_commands.Choice(name=candidate_name, value=candidate_name))
 
+        return candidate_choices
 
     def _check_cooldown(self, guild_id: int, user_id: int, action_type: str, hours: int):
         """Check if user is on cooldown for an action"""
@@ -1129,13 +1040,6 @@ class GeneralCampaignActions(commands.Cog):
 
     def _calculate_zero_sum_percentages(self, guild_id: int, seat_id: str):
         """Calculate zero-sum redistribution percentages for general election candidates"""
-        # Get general election candidates (primary winners) for this seat
-        winners_col = self.bot.db["winners"]
-        winners_config = winners_col.find_one({"guild_id": guild_id})
-
-        if not winners_config:
-            return {}
-
         # Get current year
         time_col, time_config = self._get_time_config(guild_id)
         current_year = time_config["current_rp_date"].year if time_config else 2024
@@ -1146,17 +1050,20 @@ class GeneralCampaignActions(commands.Cog):
         # Or current year if odd year
         primary_year = current_year - 1 if current_year % 2 == 0 else current_year
 
+        # Only this seat's entries for both candidate years come back from the server
+        seat_entries = find_entries(self.bot.db["winners"], guild_id, "winners",
+                                    {"seat_id": seat_id, "year": [primary_year, current_year]})
+        if seat_entries is None:
+            return {}
+
         seat_candidates = [
-            w for w in winners_config["winners"]
-            if w["seat_id"] == seat_id and w["year"] == primary_year and w.get("primary_winner", False)
+            w for w in seat_entries
+            if w["year"] == primary_year and w.get("primary_winner", False)
         ]
 
         # If no primary winners found, fall back to all candidates for this seat in the current year
         if not seat_candidates:
-            seat_candidates = [
-                w for w in winners_config["winners"]
-                if w["seat_id"] == seat_id and w["year"] == current_year
-            ]
+            seat_candidates = [w for w in seat_entries if w["year"] == current_year]
 
         if not seat_candidates:
             return {}
@@ -1193,77 +1100,14 @@ class GeneralCampaignActions(commands.Cog):
             for candidate in seat_candidates:
                 baseline_percentages[candidate.get('candidate', candidate.get('name', ''))] = 100.0 / num_candidates
 
-        # Apply proportional redistribution with minimum floors
-        final_percentages = {}
-
-        # Define minimum percentage floors
-        def get_minimum_floor(candidate):
-            party = candidate.get('party', '').lower()
-            if any(keyword in party for keyword in ['democrat', 'republican']):
-                return 25.0  # 25% minimum for major parties
-            else:
-                return 2.0   # 2% minimum for independents/third parties
-
-        # Calculate total campaign points across all candidates in this seat
-        total_campaign_points = sum(candidate.get('points', 0.0) for candidate in seat_candidates)
-
-        # Start with baseline percentages
-        current_percentages = baseline_percentages.copy()
-
-        # Apply campaign effects using proportional redistribution
-        if total_campaign_points > 0:
-            for candidate in seat_candidates:
-                candidate_name = candidate.get('candidate', candidate.get('name', ''))
-                candidate_points = candidate.get('points', 0.0)
-
-                if candidate_points > 0:
-                    # This candidate gains points
-                    points_gained = candidate_points
-
-                    # Calculate total percentage that can be taken from other candidates
-                    total_available_to_take = 0.0
-                    for other_candidate in seat_candidates:
-                        if other_candidate != candidate:
-                            other_name = other_candidate.get('candidate', other_candidate.get('name', ''))
-                            other_current = current_percentages[other_name]
-                            other_minimum = get_minimum_floor(other_candidate)
-                            available = max(0, other_current - other_minimum)
-                            total_available_to_take += available
-
-                    # Limit gains to what's actually available
-                    actual_gain = min(points_gained, total_available_to_take)
-                    current_percentages[candidate_name] += actual_gain
-
-                    # Distribute losses proportionally among other candidates
-                    if total_available_to_take > 0 and actual_gain > 0:
-                        for other_candidate in seat_candidates:
-                            if other_candidate != candidate:
-                                other_name = other_candidate.get('candidate', other_candidate.get('name', ''))
-                                other_current = current_percentages[other_name]
-                                other_minimum = get_minimum_floor(other_candidate)
-                                available = max(0, other_current - other_minimum)
-                                
-                                if available > 0:
-                                    loss_proportion = available / total_available_to_take
-                                    loss = actual_gain * loss_proportion
-                                    current_percentages[other_name] -= loss
-
-        # Ensure percentages sum to 100% and respect minimums
-        total_percentage = sum(current_percentages.values())
-        if total_percentage > 0:
-            for candidate_name in current_percentages:
-                current_percentages[candidate_name] = (current_percentages[candidate_name] / total_percentage) * 100.0
-
-        # Final verification and correction for floating point errors
-        final_total = sum(current_percentages.values())
-        if abs(final_total - 100.0) > 0.001:
-            # Apply micro-adjustment to the largest percentage instead of equal distribution
-            largest_candidate = max(current_percentages.keys(), key=lambda x: current_percentages[x])
-            adjustment = 100.0 - final_total
-            current_percentages[largest_candidate] += adjustment
-
-        final_percentages = current_percentages
-        return final_percentages
+        # Redistribute campaign points above each party's floor and normalise to 100%
+        names = [c.get('candidate', c.get('name', '')) for c in seat_candidates]
+        return zero_sum_percentages(
+            names,
+            [baseline_percentages[name] for name in names],
+            [c.get('points', 0.0) for c in seat_candidates],
+            [minimum_floor(c.get('party', '')) for c in seat_candidates]
+        )
 
     def _add_momentum_from_general_action(self, guild_id: int, user_id: int, state_name: str, points_gained: float, candidate_data: dict = None, target_name: str = None):
         """Adds momentum to a state based on general campaign actions."""
@@ -1340,7 +1184,6 @@ class GeneralCampaignActions(commands.Cog):
             # Apply momentum multiplier to the original campaign points
             boosted_points = points_gained * campaign_multiplier
             
-            print(f"DEBUG: General campaign - Original points: {points_gained:.2f}, Momentum multiplier: {campaign_multiplier:.2f}x, Boosted points: {boosted_points:.2f}")
 
             # Calculate momentum gained
             momentum_gain_factor = 1.5  # Slightly less than presidential actions
@@ -0,0 +1,51 @@
+import asyncio
+from contextlib import asynccontextmanager
+from typing import Dict, Tuple
+
+
+class GuildLockManager:
+    """Per-guild write locks for read-modify-write sections on shared guild documents.
+
+    Only sections that await between their read and their write need one: code
+    that never awaits already runs without interleaving. Only writers take a
+    lock; read-only commands never wait. Locks are keyed by (guild_id, resource)
+    so unrelated documents of the same guild don't contend, and are dropped again
+    once nobody holds or waits for them.
+    """
+
+    def __init__(self):
+        self._locks: Dict[Tuple[int, str], asyncio.Lock] = {}
+        self._users: Dict[Tuple[int, str], int] = {}
+
+    @asynccontextmanager
+    async def write(self, guild_id: int, *resources: str):
+        """Hold the write lock for each resource of a guild, e.g. write(guild_id, "winners")"""
+        # Always acquire in sorted order so two sections locking the same pair can't deadlock
+        keys = [(guild_id, resource) for resource in sorted(set(resources or ("*",)))]
+        for key in keys:
+            self._users[key] = self._users.get(key, 0) + 1
+            if key not in self._locks:
+                self._locks[key] = asyncio.Lock()
+
+        acquired = []
+        try:
+            for key in keys:
+                await self._locks[key].acquire()
+                acquired.append(key)
+            yield
+        finally:
+            for key in reversed(acquired):
+                self._locks[key].release()
+            for key in keys:
+                self._users[key] -= 1
+                if self._users[key] == 0:
+                    del self._users[key]
+                    del self._locks[key]
+
+    def is_locked(self, guild_id: int, resource: str = "*") -> bool:
+        lock = self._locks.get((guild_id, resource))
+        return bool(lock and lock.locked())
+
+
+# Shared by every cog that rewrites guild arrays
+guild_locks = GuildLockManager()
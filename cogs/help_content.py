@@ -0,0 +1,234 @@
+import os
+import re
+import discord
+from typing import Dict, List, Optional, Tuple
+
+# Discord embed limits
+EMBED_TITLE_LIMIT = 256
+EMBED_DESCRIPTION_LIMIT = 4096
+EMBED_FOOTER_LIMIT = 2048
+EMBED_TOTAL_LIMIT = 6000
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+HANDBOOK_PATH = os.path.join(ROOT_DIR, "handbook.txt")
+
+# Handbook chapter number -> (dropdown value, embed title)
+HANDBOOK_CHAPTERS = {
+    1: ("getting_started", "📖 Getting Started"),
+    2: ("election_management", "🗳️ Election Management"),
+    3: ("campaign_strategies", "🎯 Campaign Strategies"),
+    4: ("demographics", "👥 Demographics & Targeting"),
+    5: ("momentum", "🌊 Momentum System"),
+    6: ("special_elections", "🚨 Special Elections"),
+    7: ("presidential", "🏛️ Presidential Campaigns"),
+    8: ("party_management", "🎉 Party Management"),
+    9: ("advanced", "🎓 Advanced Strategies"),
+    10: ("admin_tools", "🔧 Admin Tools"),
+    11: ("troubleshooting", "🛠️ Troubleshooting"),
+}
+
+CHAPTER_RE = re.compile(r"^## (\d+)\.\s*(.+)$")
+SUBSECTION_RE = re.compile(r"^#{3,4} (.+)$")
+WORD_RE = re.compile(r"[a-z0-9_]+")
+
+
+def _split_text(text: str, limit: int) -> List[str]:
+    """Split text into chunks no longer than limit, preferring paragraph then line breaks"""
+    chunks = []
+    while len(text) > limit:
+        cut = text.rfind("\n\n", 0, limit)
+        if cut <= 0:
+            cut = text.rfind("\n", 0, limit)
+        if cut <= 0:
+            cut = text.rfind(" ", 0, limit)
+        if cut <= 0:
+            cut = limit
+        chunks.append(text[:cut].rstrip())
+        text = text[cut:].lstrip("\n")
+    if text.strip():
+        chunks.append(text.rstrip())
+    return chunks
+
+
+def _paginate(blocks: List[str], limit: int) -> List[str]:
+    """Greedily pack blocks into pages that fit within limit characters"""
+    pages = []
+    current = ""
+    for block in blocks:
+        for piece in _split_text(block, limit):
+            candidate = f"{current}\n\n{piece}" if current else piece
+            if len(candidate) <= limit:
+                current = candidate
+            else:
+                pages.append(current)
+                current = piece
+    if current:
+        pages.append(current)
+    return pages
+
+
+def _tokenize(text: str) -> List[str]:
+    return WORD_RE.findall(text.lower())
+
+
+class HelpContent:
+    """Prebuilt help and handbook embeds, compiled once when the Basics cog loads"""
+
+    def __init__(self):
+        self.command_pages: Dict[str, List[discord.Embed]] = {}
+        self.handbook_pages: Dict[str, List[discord.Embed]] = {}
+        # (label, value, searchable text) for every command category and handbook subsection
+        self._search_entries: List[Tuple[str, str, str]] = []
+        self._index: Dict[str, set] = {}
+
+    def load(self, categories: Dict[str, Dict[str, str]], handbook_path: str = HANDBOOK_PATH):
+        """Compile the command reference and the handbook into cached embeds"""
+        self.command_pages = {}
+        self.handbook_pages = {}
+        self._search_entries = []
+        self._index = {}
+
+        for key, data in categories.items():
+            pages = _paginate([data["content"]], EMBED_DESCRIPTION_LIMIT) or [""]
+            embeds = []
+            for i, page in enumerate(pages):
+                footer = "Use the dropdown below to navigate between command categories"
+                if len(pages) > 1:
+                    footer = f"Page {i + 1}/{len(pages)} • {footer}"
+                embeds.append(self._build_embed(data["title"], page, discord.Colour.blue(), footer))
+            self.command_pages[key] = embeds
+            self._add_search_entry(f"Commands › {data['title']}", f"commands:{key}", data["content"])
+
+        chapters = self._parse_handbook(handbook_path)
+        for number, (key, title) in HANDBOOK_CHAPTERS.items():
+            subsections = chapters.get(number)
+            if not subsections:
+                subsections = [("", "*This handbook section is unavailable.*")]
+
+            blocks = []
+            block_titles = []
+            for heading, body in subsections:
+                block = f"**{heading}**\n{body}" if heading else body
+                blocks.append(block)
+                block_titles.append((heading, block))
+
+            pages = _paginate(blocks, EMBED_DESCRIPTION_LIMIT)
+            embeds = []
+            for i, page in enumerate(pages):
+                footer = f"Page {i + 1}/{len(pages)} • Use the dropdown below to navigate between handbook sections"
+                embeds.append(self._build_embed(title, page, discord.Colour.green(), footer))
+            self.handbook_pages[key] = embeds
+
+            for heading, block in block_titles:
+                page_number = self._find_page(pages, block)
+                label = f"Handbook › {title}" + (f" › {heading}" if heading else "")
+                self._add_search_entry(label, f"handbook:{key}:{page_number}", block)
+
+        print(f"Help content compiled: {len(self.command_pages)} command categories, "
+              f"{sum(len(p) for p in self.handbook_pages.values())} handbook pages")
+
+    def _parse_handbook(self, path: str) -> Dict[int, List[Tuple[str, str]]]:
+        """Parse handbook.txt into {chapter number: [(subsection heading, body)]}"""
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                lines = f.read().splitlines()
+        except OSError as e:
+            print(f"Could not read handbook at {path}: {e}")
+            return {}
+
+        chapters: Dict[int, List[Tuple[str, str]]] = {}
+        chapter = None
+        heading = ""
+        body: List[str] = []
+
+        def flush():
+            text = "\n".join(body).strip().strip("-").strip()
+            if chapter is not None and (heading or text):
+                chapters.setdefault(chapter, []).append((heading, text))
+
+        for line in lines:
+            chapter_match = CHAPTER_RE.match(line)
+            if chapter_match:
+                flush()
+                chapter = int(chapter_match.group(1))
+                heading, body = "", []
+                continue
+            if line.startswith("## "):
+                # Unnumbered top-level section (table of contents, appendices)
+                flush()
+                chapter, heading, body = None, "", []
+                continue
+            sub_match = SUBSECTION_RE.match(line)
+            if sub_match:
+                flush()
+                heading, body = sub_match.group(1).strip("* "), []
+                continue
+            body.append(line)
+        flush()
+        return chapters
+
+    @staticmethod
+    def _find_page(pages: List[str], block: str) -> int:
+        first_line = block.split("\n", 1)[0]
+        for i, page in enumerate(pages):
+            if first_line in page:
+                return i
+        return 0
+
+    @staticmethod
+    def _build_embed(title: str, description: str, color: discord.Colour, footer: str) -> discord.Embed:
+        title = title[:EMBED_TITLE_LIMIT]
+        footer = footer[:EMBED_FOOTER_LIMIT]
+        budget = EMBED_TOTAL_LIMIT - len(title) - len(footer)
+        description = description[:min(EMBED_DESCRIPTION_LIMIT, budget)]
+        embed = discord.Embed(title=title, description=description, color=color)
+        embed.set_footer(text=footer)
+        return embed
+
+    def _add_search_entry(self, label: str, value: str, text: str):
+        entry_id = len(self._search_entries)
+        self._search_entries.append((label[:100], value, text))
+        for token in set(_tokenize(label) + _tokenize(text)):
+            self._index.setdefault(token, set()).add(entry_id)
+
+    def get_command_page(self, category: str, page: int = 0) -> Tuple[discord.Embed, int]:
+        """Return (embed, page count) for a command category, clamping the page number"""
+        pages = self.command_pages.get(category) or self.command_pages["basic"]
+        page = max(0, min(page, len(pages) - 1))
+        return pages[page], len(pages)
+
+    def get_handbook_page(self, section: str, page: int = 0) -> Tuple[discord.Embed, int]:
+        """Return (embed, page count) for a handbook section, clamping the page number"""
+        pages = self.handbook_pages.get(section) or self.handbook_pages["getting_started"]
+        page = max(0, min(page, len(pages) - 1))
+        return pages[page], len(pages)
+
+    def search(self, query: str, limit: int = 25) -> List[Tuple[str, str]]:
+        """Return up to limit (label, value) pairs whose text contains every query word.
+
+        The last word is treated as a prefix so results update while the user types.
+        """
+        tokens = _tokenize(query)
+        if not tokens:
+            return []
+
+        *complete, partial = tokens
+        matches: Optional[set] = None
+        for token in complete:
+            ids = self._index.get(token, set())
+            matches = ids if matches is None else matches & ids
+            if not matches:
+                return []
+
+        partial_ids = set()
+        for token, ids in self._index.items():
+            if token.startswith(partial):
+                partial_ids |= ids
+        matches = partial_ids if matches is None else matches & partial_ids
+
+        # Entries whose label matches rank ahead of body-only matches
+        ranked = sorted(
+            matches,
+            key=lambda i: (not all(t in self._search_entries[i][0].lower() for t in tokens), i)
+        )
+        return [self._search_entries[i][:2] for i in ranked[:limit]]
@@ -4,6 +4,7 @@ from discord import app_commands
 from datetime import datetime
 import statistics
 from typing import Dict, List, Tuple
+from .member_cache import mention
 
 # State ideological data
 STATE_DATA = {
@@ -880,8 +881,7 @@ class IdeologyManagement(commands.Cog):
         )
 
         for mod in modifications:
-            user = interaction.guild.get_member(mod.get("user_id"))
-            user_name = user.display_name if user else f"User {mod.get('user_id', 'Unknown')}"
+            user_name = mention(mod["user_id"]) if mod.get("user_id") else "Unknown"
 
             timestamp = mod["timestamp"].strftime("%Y-%m-%d %H:%M")
 
@@ -0,0 +1,306 @@
+import discord
+from discord import app_commands
+from contextlib import contextmanager
+from contextvars import ContextVar
+from collections import deque
+from typing import Callable, Dict, List, Optional, Tuple
+from pymongo.collection import Collection
+from .db_profiler import QueryProfiler
+from .traffic_trace import TrafficRecorder
+import itertools
+import functools
+import math
+import time
+import os
+
+WINDOW_SIZE = 1000  # Samples kept per command/loop for percentiles
+
+# Collection methods that talk to the server
+TRACKED_OPERATIONS = {
+    "find", "find_one", "find_one_and_update", "find_one_and_replace", "find_one_and_delete",
+    "insert_one", "insert_many", "update_one", "update_many", "replace_one",
+    "delete_one", "delete_many", "count_documents", "estimated_document_count",
+    "aggregate", "distinct", "bulk_write", "create_index", "create_indexes",
+}
+# The subset that changes documents; write listeners hear about these
+WRITE_OPERATIONS = {
+    "find_one_and_update", "find_one_and_replace", "find_one_and_delete",
+    "insert_one", "insert_many", "update_one", "update_many", "replace_one",
+    "delete_one", "delete_many", "bulk_write",
+}
+
+
+class LatencyWindow:
+    """Rolling window of latency samples (ms) plus lifetime totals"""
+
+    def __init__(self, size: int = WINDOW_SIZE):
+        self.samples = deque(maxlen=size)
+        self.db_ops = deque(maxlen=size)
+        self.count = 0
+        self.total_ms = 0.0
+        self.errors = 0
+
+    def add(self, elapsed_ms: float, db_ops: int = 0, error: bool = False):
+        self.samples.append(elapsed_ms)
+        self.db_ops.append(db_ops)
+        self.count += 1
+        self.total_ms += elapsed_ms
+        if error:
+            self.errors += 1
+
+    @staticmethod
+    def _percentile(ordered: List[float], q: float) -> float:
+        if not ordered:
+            return 0.0
+        # Nearest-rank percentile
+        index = max(0, min(len(ordered) - 1, math.ceil(q * len(ordered)) - 1))
+        return ordered[index]
+
+    def percentiles(self) -> Dict[str, float]:
+        ordered = sorted(self.samples)
+        return {
+            "p50": self._percentile(ordered, 0.50),
+            "p95": self._percentile(ordered, 0.95),
+            "p99": self._percentile(ordered, 0.99),
+        }
+
+    def mean_db_ops(self) -> float:
+        return sum(self.db_ops) / len(self.db_ops) if self.db_ops else 0.0
+
+
+_scope_ids = itertools.count(1)
+
+
+class OperationScope:
+    """One command invocation or loop iteration; collects the DB calls made inside it"""
+
+    def __init__(self, kind: str, name: str):
+        self.id = next(_scope_ids)
+        self.kind = kind
+        self.name = name
+        self.db_ops = 0
+        self.db_ms = 0.0
+        self.failed = False  # Set when the failure was handled inside the scope instead of raised
+
+
+current_scope: ContextVar[Optional[OperationScope]] = ContextVar("current_scope", default=None)
+
+
+class MetricsRegistry:
+    def __init__(self):
+        self.windows: Dict[Tuple[str, str], LatencyWindow] = {}
+        # (collection, operation) -> [count, total ms]
+        self.db_totals: Dict[Tuple[str, str], List[float]] = {}
+        self.started_at = time.time()
+        # Full per-interaction query log, off unless DB_PROFILE=1 or turned on by an admin
+        self.profiler = QueryProfiler(enabled=os.getenv("DB_PROFILE") == "1")
+        # Slash command trace for replaying real traffic, off unless TRAFFIC_TRACE=1 or turned on by an admin
+        self.recorder = TrafficRecorder(enabled=os.getenv("TRAFFIC_TRACE") == "1")
+
+    def observe(self, kind: str, name: str, elapsed_ms: float, db_ops: int = 0, error: bool = False):
+        window = self.windows.get((kind, name))
+        if window is None:
+            window = self.windows[(kind, name)] = LatencyWindow()
+        window.add(elapsed_ms, db_ops, error)
+
+    def observe_db(self, collection: str, operation: str, elapsed_ms: float):
+        totals = self.db_totals.setdefault((collection, operation), [0, 0.0])
+        totals[0] += 1
+        totals[1] += elapsed_ms
+        scope = current_scope.get()
+        if scope is not None:
+            scope.db_ops += 1
+            scope.db_ms += elapsed_ms
+
+    @contextmanager
+    def track(self, kind: str, name: str):
+        """Time the enclosed block and attribute DB calls made inside it to (kind, name)"""
+        scope = OperationScope(kind, name)
+        token = current_scope.set(scope)
+        start = time.perf_counter()
+        error = False
+        try:
+            yield scope
+        except BaseException:
+            error = True
+            raise
+        finally:
+            current_scope.reset(token)
+            self.observe(kind, name, (time.perf_counter() - start) * 1000, scope.db_ops, error or scope.failed)
+
+    def summary(self, kind: Optional[str] = None) -> List[dict]:
+        """Rows sorted by p95, slowest first"""
+        rows = []
+        for (row_kind, name), window in self.windows.items():
+            if kind and row_kind != kind:
+                continue
+            rows.append({
+                "kind": row_kind,
+                "name": name,
+                "count": window.count,
+                "errors": window.errors,
+                "mean_db_ops": window.mean_db_ops(),
+                **window.percentiles(),
+            })
+        rows.sort(key=lambda row: row["p95"], reverse=True)
+        return rows
+
+    def to_prometheus(self) -> str:
+        lines = [
+            "# HELP election_bot_latency_seconds Latency of slash commands, autocompletes and background loop iterations",
+            "# TYPE election_bot_latency_seconds summary",
+        ]
+        for (kind, name), window in sorted(self.windows.items()):
+            labels = f'kind="{kind}",name="{_escape_label(name)}"'
+            for quantile, value in zip(("0.5", "0.95", "0.99"), window.percentiles().values()):
+                lines.append(f'election_bot_latency_seconds{{{labels},quantile="{quantile}"}} {value / 1000:.6f}')
+            lines.append(f"election_bot_latency_seconds_sum{{{labels}}} {window.total_ms / 1000:.6f}")
+            lines.append(f"election_bot_latency_seconds_count{{{labels}}} {window.count}")
+
+        lines.append("# HELP election_bot_errors_total Invocations that raised")
+        lines.append("# TYPE election_bot_errors_total counter")
+        for (kind, name), window in sorted(self.windows.items()):
+            lines.append(f'election_bot_errors_total{{kind="{kind}",name="{_escape_label(name)}"}} {window.errors}')
+
+        lines.append("# HELP election_bot_db_ops_per_invocation Mean DB round trips per invocation (rolling window)")
+        lines.append("# TYPE election_bot_db_ops_per_invocation gauge")
+        for (kind, name), window in sorted(self.windows.items()):
+            lines.append(
+                f'election_bot_db_ops_per_invocation{{kind="{kind}",name="{_escape_label(name)}"}} {window.mean_db_ops():.3f}'
+            )
+
+        lines.append("# HELP election_bot_db_operations_total MongoDB operations by collection and method")
+        lines.append("# TYPE election_bot_db_operations_total counter")
+        for (collection, operation), (count, _) in sorted(self.db_totals.items()):
+            lines.append(f'election_bot_db_operations_total{{collection="{collection}",operation="{operation}"}} {int(count)}')
+
+        lines.append("# HELP election_bot_db_operation_seconds_total Time spent in MongoDB calls")
+        lines.append("# TYPE election_bot_db_operation_seconds_total counter")
+        for (collection, operation), (_, total_ms) in sorted(self.db_totals.items()):
+            lines.append(
+                f'election_bot_db_operation_seconds_total{{collection="{collection}",operation="{operation}"}} {total_ms / 1000:.6f}'
+            )
+        return "\n".join(lines) + "\n"
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+# Shared by the command tree, the DB wrapper, the loop decorator and the Metrics cog. Lives
+# outside the cogs.metrics extension because main.py imports InstrumentedCommandTree before
+# extensions load, and load_extension executes an extension's module a second time.
+metrics = MetricsRegistry()
+
+
+def timed_loop(name: str):
+    """Record each iteration of a tasks.loop body. Apply below @tasks.loop."""
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            with metrics.track("loop", name):
+                return await func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+class InstrumentedCollection:
+    """Proxy for a pymongo Collection that times every server call"""
+
+    def __init__(self, collection: Collection, registry: MetricsRegistry, write_listeners: list = None):
+        self._collection = collection
+        self._registry = registry
+        self._write_listeners = write_listeners if write_listeners is not None else []
+
+    def __getattr__(self, name):
+        attr = getattr(self._collection, name)
+        if name not in TRACKED_OPERATIONS:
+            return attr
+
+        @functools.wraps(attr)
+        def tracked(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                result = attr(*args, **kwargs)
+            finally:
+                elapsed_ms = (time.perf_counter() - start) * 1000
+                self._registry.observe_db(self._collection.name, name, elapsed_ms)
+            profiler = self._registry.profiler
+            if profiler.enabled:
+                result = profiler.record(current_scope.get(), self._collection, name, args, kwargs, result, elapsed_ms)
+            if name in WRITE_OPERATIONS and self._write_listeners:
+                self._notify_write(name, args[0] if args else kwargs.get("filter"))
+            return result
+        return tracked
+
+    def _notify_write(self, operation: str, spec):
+        # insert_one passes the document, the rest a filter; both carry guild_id
+        guild_id = spec.get("guild_id") if isinstance(spec, dict) else None
+        for listener in list(self._write_listeners):
+            try:
+                listener(self._collection.name, operation, guild_id)
+            except Exception as e:
+                print(f"Write listener {listener!r} failed: {e}")
+
+    def __repr__(self):
+        return f"InstrumentedCollection({self._collection.name!r})"
+
+
+class InstrumentedDatabase:
+    """Proxy for bot.db that hands out InstrumentedCollections"""
+
+    def __init__(self, db, registry: MetricsRegistry):
+        self._db = db
+        self._registry = registry
+        self._collections: Dict[str, InstrumentedCollection] = {}
+        self._write_listeners: List[Callable[[str, str, Optional[int]], None]] = []
+
+    def __getitem__(self, name: str) -> InstrumentedCollection:
+        collection = self._collections.get(name)
+        if collection is None:
+            collection = self._collections[name] = InstrumentedCollection(
+                self._db[name], self._registry, self._write_listeners
+            )
+        return collection
+
+    def add_write_listener(self, listener: Callable[[str, str, Optional[int]], None]):
+        """Call listener(collection, operation, guild_id) after every successful write.
+
+        guild_id is None when the write isn't scoped to a single guild (e.g. insert_many).
+        Only sees writes made through this process's bot.db.
+        """
+        self._write_listeners.append(listener)
+
+    def remove_write_listener(self, listener):
+        if listener in self._write_listeners:
+            self._write_listeners.remove(listener)
+
+    def __getattr__(self, name):
+        attr = getattr(self._db, name)
+        if isinstance(attr, Collection):
+            return self[name]
+        return attr
+
+
+def qualified_command_name(data: dict) -> str:
+    """'admincentral system metrics' from the raw interaction payload"""
+    parts = [data.get("name", "unknown")]
+    options = data.get("options", [])
+    while options and options[0].get("type") in (1, 2):  # SUB_COMMAND, SUB_COMMAND_GROUP
+        parts.append(options[0]["name"])
+        options = options[0].get("options", [])
+    return " ".join(parts)
+
+
+class InstrumentedCommandTree(app_commands.CommandTree):
+    """Command tree that times every slash command and autocomplete it dispatches"""
+
+    async def _call(self, interaction: discord.Interaction) -> None:
+        kind = "autocomplete" if interaction.type == discord.InteractionType.autocomplete else "command"
+        name = qualified_command_name(interaction.data or {})
+        if kind == "command":
+            metrics.recorder.record(interaction, name)
+        with metrics.track(kind, name) as scope:
+            await super()._call(interaction)
+            # The tree catches AppCommandError itself and reports it through on_error
+            scope.failed = interaction.command_failed
@@ -0,0 +1,141 @@
+from discord.ext import commands
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Optional, Tuple
+import asyncio
+import os
+import time
+
+import discord
+
+MEMBER_CACHE = os.getenv("MEMBER_CACHE", "lean")  # "full" brings back the members intent and startup chunking
+LRU_SIZE = int(os.getenv("MEMBER_LRU_SIZE", "1000"))  # Members kept across all guilds of this process
+MISS_TTL = 600  # Seconds a "not in this guild" answer is remembered
+QUERY_BATCH = 100  # Most user_ids Discord accepts in one member request
+
+
+def gateway_options(lean: Optional[bool] = None) -> dict:
+    """Intents and cache settings for the bot constructor.
+
+    Lean mode leaves out the privileged members intent, so guilds aren't chunked at
+    startup and Discord sends neither member lists nor member events; the members
+    the bot does need come from MemberCache. message_content stays on because
+    ReplyRouter reads reply attachments, but nothing reads the message cache, so
+    it is turned off.
+    """
+    if lean is None:
+        lean = MEMBER_CACHE != "full"
+    intents = discord.Intents.default()
+    intents.message_content = True
+    if not lean:
+        intents.members = True
+        return {"intents": intents}
+    return {
+        "intents": intents,
+        "member_cache_flags": discord.MemberCacheFlags.from_intents(intents),
+        "chunk_guilds_at_startup": False,
+        "max_messages": None,
+    }
+
+
+def mention(user_id) -> str:
+    """Mention markup; Discord renders it client-side, no cached member needed"""
+    return f"<@{user_id}>"
+
+
+class MemberCache(commands.Cog):
+    """Member lookups for a bot that doesn't hold guild member lists.
+
+    Keeps the members the bot actually deals with (interaction authors, and
+    candidates once looked up) in one small LRU. Misses are fetched on demand,
+    batched through the gateway member request, and "not in guild" answers are
+    remembered for MISS_TTL. Role checks need no lookup at all:
+    interaction.user already carries the author's roles.
+    """
+
+    def __init__(self, bot, size: int = LRU_SIZE):
+        self.bot = bot
+        self.size = size
+        self.members: "OrderedDict[Tuple[int, int], discord.Member]" = OrderedDict()
+        self.misses: Dict[Tuple[int, int], float] = {}  # (guild_id, user_id) -> retry after (monotonic)
+        self.fetched = 0
+        print("MemberCache cog loaded successfully")
+
+    def remember(self, member: discord.Member):
+        key = (member.guild.id, member.id)
+        self.members[key] = member
+        self.members.move_to_end(key)
+        self.misses.pop(key, None)
+        while len(self.members) > self.size:
+            self.members.popitem(last=False)
+
+    @commands.Cog.listener()
+    async def on_interaction(self, interaction: discord.Interaction):
+        if isinstance(interaction.user, discord.Member):
+            self.remember(interaction.user)
+
+    def get(self, guild: discord.Guild, user_id: int) -> Optional[discord.Member]:
+        """Cached member (guild cache, then the LRU) without touching Discord"""
+        member = guild.get_member(user_id)
+        if member:
+            return member
+        key = (guild.id, user_id)
+        member = self.members.get(key)
+        if member:
+            self.members.move_to_end(key)
+        return member
+
+    async def fetch(self, guild: discord.Guild, user_id: int) -> Optional[discord.Member]:
+        return (await self.fetch_many(guild, [user_id])).get(user_id)
+
+    async def fetch_many(self, guild: discord.Guild, user_ids: Iterable[int]) -> Dict[int, discord.Member]:
+        """user_id -> member for those still in the guild, fetching the uncached ones in batches"""
+        found = {}
+        missing = []
+        now = time.monotonic()
+        for user_id in dict.fromkeys(user_id for user_id in user_ids if user_id):
+            member = self.get(guild, user_id)
+            if member:
+                found[user_id] = member
+            elif self.misses.get((guild.id, user_id), 0) <= now:
+                missing.append(user_id)
+
+        for start in range(0, len(missing), QUERY_BATCH):
+            batch = missing[start:start + QUERY_BATCH]
+            for member in await self._request(guild, batch):
+                self.remember(member)
+                found[member.id] = member
+            for user_id in batch:
+                if user_id not in found:
+                    self.misses[(guild.id, user_id)] = now + MISS_TTL
+            self.fetched += len(batch)
+
+        if len(self.misses) > self.size:
+            self.misses = {key: until for key, until in self.misses.items() if until > now}
+        return found
+
+    async def _request(self, guild: discord.Guild, user_ids: List[int]) -> List[discord.Member]:
+        try:
+            return await guild.query_members(user_ids=user_ids, limit=len(user_ids), cache=False)
+        except (asyncio.TimeoutError, discord.ClientException) as e:
+            print(f"Member request failed for guild {guild.id}, fetching one by one: {e}")
+        members = []
+        for user_id in user_ids:
+            try:
+                members.append(await guild.fetch_member(user_id))
+            except discord.NotFound:
+                pass
+            except discord.HTTPException as e:
+                print(f"Could not fetch member {user_id}: {e}")
+        return members
+
+
+async def resolve_member(bot, guild: discord.Guild, user_id: int) -> Optional[discord.Member]:
+    """A guild member by id, fetched on demand when it isn't cached"""
+    member_cache = bot.get_cog("MemberCache")
+    if member_cache:
+        return await member_cache.fetch(guild, user_id)
+    return guild.get_member(user_id)
+
+
+async def setup(bot):
+    await bot.add_cog(MemberCache(bot))
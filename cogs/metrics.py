@@ -0,0 +1,39 @@
+from discord.ext import commands, tasks
+from .instrumentation import InstrumentedDatabase, metrics, timed_loop
+import os
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# Prometheus text exposition file, e.g. for node_exporter's textfile collector
+METRICS_TEXTFILE = os.getenv("METRICS_TEXTFILE", os.path.join(ROOT_DIR, "metrics.prom"))
+
+
+class Metrics(commands.Cog):
+    def __init__(self, bot):
+        self.bot = bot
+        self.registry = metrics
+        self.textfile_path = METRICS_TEXTFILE
+        if not isinstance(bot.db, InstrumentedDatabase):
+            bot.db = InstrumentedDatabase(bot.db, metrics)
+        self.export_loop.start()
+        print("Metrics cog loaded successfully")
+
+    def cog_unload(self):
+        self.export_loop.cancel()
+
+    def write_textfile(self):
+        tmp_path = f"{self.textfile_path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(self.registry.to_prometheus())
+        os.replace(tmp_path, self.textfile_path)
+
+    @tasks.loop(seconds=60)
+    @timed_loop("metrics.export_loop")
+    async def export_loop(self):
+        try:
+            self.write_textfile()
+        except OSError as e:
+            print(f"Could not write metrics file {self.textfile_path}: {e}")
+
+
+async def setup(bot):
+    await bot.add_cog(Metrics(bot))
@@ -6,6 +6,79 @@ import random
 import math
 from typing import Optional, Dict, List
 from .presidential_winners import PRESIDENTIAL_STATE_DATA
+from .instrumentation import timed_loop
+from .sharding import local_guilds_filter
+from .config_registry import NOW, configs
+
+
+def _default_momentum_config():
+    """Momentum system defaults: settings plus a lean and zeroed momentum for every state and region"""
+    from .ideology import REGIONS
+
+    config = {
+        "settings": {
+            "vulnerability_threshold": 3,  # How many people needed to trigger collapse
+            "admin_can_change_lean": True,
+            "momentum_decay_rate": 0.95,  # Daily decay rate
+            "exponential_growth_rate": 1.05,  # Growth multiplier
+            "volatility_threshold": 50.0,  # Momentum level that triggers volatility
+            "auto_collapse_threshold": 100.0,  # Automatic collapse threshold (anti-spam)
+        },
+        "state_leans": {},  # State political leans (hardcoded values)
+        "state_momentum": {},  # Current momentum by state and party
+        "regional_momentum": {},  # Regional momentum for senate/governor races
+        "momentum_events": []  # Log of momentum changes
+    }
+
+    # Initialize state leans based on PRESIDENTIAL_STATE_DATA
+    for state_name, state_data in PRESIDENTIAL_STATE_DATA.items():
+        republican_pct = state_data.get("republican", 33.3)
+        democrat_pct = state_data.get("democrat", 33.3)
+        other_pct = state_data.get("other", 33.3)
+
+        # Determine lean based on highest percentage
+        if republican_pct > democrat_pct and republican_pct > other_pct:
+            if republican_pct >= 55:
+                lean = {"party": "Republican", "intensity": "Strong"}
+            elif republican_pct >= 45:
+                lean = {"party": "Republican", "intensity": "Moderate"}
+            else:
+                lean = {"party": "Republican", "intensity": "Weak"}
+        elif democrat_pct > republican_pct and democrat_pct > other_pct:
+            if democrat_pct >= 55:
+                lean = {"party": "Democrat", "intensity": "Strong"}
+            elif democrat_pct >= 45:
+                lean = {"party": "Democrat", "intensity": "Moderate"}
+            else:
+                lean = {"party": "Democrat", "intensity": "Weak"}
+        else:
+            lean = {"party": "Swing", "intensity": "None"}  # Swing state
+
+        config["state_leans"][state_name] = lean
+
+        # Initialize momentum at 0 for all parties
+        config["state_momentum"][state_name] = {
+            "Republican": 0.0,
+            "Democrat": 0.0,
+            "Independent": 0.0,
+            "last_updated": NOW
+        }
+
+    # Initialize regional momentum for senate/governor races
+    for region_name in REGIONS.keys():
+        config["regional_momentum"][region_name] = {
+            "Republican": 0.0,
+            "Democrat": 0.0,
+            "Independent": 0.0,
+            "last_updated": NOW
+        }
+
+    return config
+
+
+# Built once per process, not on every lookup
+configs.register("momentum_config", _default_momentum_config)
+
 
 class Momentum(commands.Cog):
     def __init__(self, bot):
@@ -29,79 +102,7 @@ class Momentum(commands.Cog):
     def _get_momentum_config(self, guild_id: int):
         """Get or create momentum configuration"""
         col = self.bot.db["momentum_config"]
-        config = col.find_one({"guild_id": guild_id})
-
-        if not config:
-            # Initialize momentum system with default settings
-            config = {
-                "guild_id": guild_id,
-                "settings": {
-                    "vulnerability_threshold": 3,  # How many people needed to trigger collapse
-                    "admin_can_change_lean": True,
-                    "momentum_decay_rate": 0.95,  # Daily decay rate
-                    "exponential_growth_rate": 1.05,  # Growth multiplier
-                    "volatility_threshold": 50.0,  # Momentum level that triggers volatility
-                    "auto_collapse_threshold": 100.0,  # Automatic collapse threshold (anti-spam)
-                },
-                "state_leans": {},  # State political leans (hardcoded values)
-                "state_momentum": {},  # Current momentum by state and party
-                "regional_momentum": {},  # Regional momentum for senate/governor races
-                "momentum_events": []  # Log of momentum changes
-            }
-
-            # Initialize state leans based on PRESIDENTIAL_STATE_DATA
-            for state_name, state_data in PRESIDENTIAL_STATE_DATA.items():
-                republican_pct = state_data.get("republican", 33.3)
-                democrat_pct = state_data.get("democrat", 33.3)
-                other_pct = state_data.get("other", 33.3)
-
-                # Determine lean based on highest percentage
-                if republican_pct > democrat_pct and republican_pct > other_pct:
-                    if republican_pct >= 55:
-                        lean = {"party": "Republican", "intensity": "Strong"}
-                    elif republican_pct >= 45:
-                        lean = {"party": "Republican", "intensity": "Moderate"}
-                    else:
-                        lean = {"party": "Republican", "intensity": "Weak"}
-                elif democrat_pct > republican_pct and democrat_pct > other_pct:
-                    if democrat_pct >= 55:
-                        lean = {"party": "Democrat", "intensity": "Strong"}
-                    elif democrat_pct >= 45:
-                        lean = {"party": "Democrat", "intensity": "Moderate"}
-                    else:
-                        lean = {"party": "Democrat", "intensity": "Weak"}
-                else:
-                    lean = {"party": "Swing", "intensity": "None"}  # Swing state
-
-                config["state_leans"][state_name] = lean
-
-                # Initialize momentum at 0 for all parties (only if not already exists)
-                if state_name not in config.get("state_momentum", {}):
-                    if "state_momentum" not in config:
-                        config["state_momentum"] = {}
-                    config["state_momentum"][state_name] = {
-                        "Republican": 0.0,
-                        "Democrat": 0.0,
-                        "Independent": 0.0,
-                        "last_updated": datetime.utcnow()
-                    }
-
-            # Initialize regional momentum for senate/governor races (only if not already exists)
-            from .ideology import REGIONS
-            if "regional_momentum" not in config:
-                config["regional_momentum"] = {}
-            for region_name in REGIONS.keys():
-                if region_name not in config["regional_momentum"]:
-                    config["regional_momentum"][region_name] = {
-                        "Republican": 0.0,
-                        "Democrat": 0.0,
-                        "Independent": 0.0,
-                        "last_updated": datetime.utcnow()
-                    }
-
-            col.insert_one(config)
-
-        return col, config
+        return col, configs.get(col, guild_id)
 
     def _get_intensity_multiplier(self, intensity: str) -> float:
         """Get momentum gain multiplier based on lean intensity"""
@@ -157,7 +158,6 @@ class Momentum(commands.Cog):
                     }
                 }
             )
-            print(f"DEBUG: Momentum event logged - matched: {result.matched_count}, modified: {result.modified_count}")
         except Exception as e:
             print(f"ERROR: Failed to log momentum event: {e}")
             import traceback
@@ -185,6 +185,7 @@ class Momentum(commands.Cog):
                     }
                 }
             )
+            self._touch_electoral_map(guild_id, state)
 
             # Log the auto-collapse event
             self._add_momentum_event(
@@ -196,6 +197,12 @@ class Momentum(commands.Cog):
 
         return current_momentum, False
 
+    def _touch_electoral_map(self, guild_id: int, state: Optional[str] = None):
+        """Momentum feeds presidential state polling; mark the cached electoral map stale"""
+        electoral_cog = self.bot.get_cog("ElectoralCollege")
+        if electoral_cog:
+            electoral_cog.touch(guild_id, state)
+
     def _calculate_momentum_effect_on_polling(self, state: str, party: str, momentum_config: dict) -> float:
         """Calculate how momentum affects polling percentages"""
         state_momentum = momentum_config["state_momentum"].get(state, {})
@@ -257,13 +264,14 @@ class Momentum(commands.Cog):
         return None
 
     @tasks.loop(hours=12)  # Run decay every 12 hours
+    @timed_loop("momentum.momentum_decay_loop")
     async def momentum_decay_loop(self):
-        """Apply momentum decay across all guilds"""
+        """Apply momentum decay across the guilds on this process's shards"""
         try:
             col = self.bot.db["momentum_config"]
-            configs = col.find({})
+            momentum_configs = col.find(local_guilds_filter(self.bot))
 
-            for config in configs:
+            for config in momentum_configs:
                 guild_id = config["guild_id"]
 
                 # Check if we're in General Campaign phase
@@ -314,6 +322,7 @@ class Momentum(commands.Cog):
                         {"guild_id": guild_id},
                         {"$set": updates}
                     )
+                    self._touch_electoral_map(guild_id)
 
                     print(f"Applied momentum decay for guild {guild_id}")
 
@@ -389,8 +398,6 @@ class Momentum(commands.Cog):
         momentum_text = ""
         parties = ["Republican", "Democrat", "Independent"]
 
-        print(f"DEBUG: Checking momentum for state {state_upper}")
-        print(f"DEBUG: State momentum data: {state_momentum}")
 
         for party in parties:
             current_momentum = state_momentum.get(party, 0.0)
@@ -561,6 +568,7 @@ class Momentum(commands.Cog):
                 }
             }
         )
+        self._touch_electoral_map(interaction.guild.id, state_upper)
 
         # Log the event
         self._add_momentum_event(
@@ -699,6 +707,7 @@ class Momentum(commands.Cog):
                 }
             }
         )
+        self._touch_electoral_map(interaction.guild.id, state_upper)
 
         # Log the event
         self._add_momentum_event(
@@ -1014,6 +1023,7 @@ class Momentum(commands.Cog):
                 {"guild_id": interaction.guild.id},
                 {"$set": updates}
             )
+            self._touch_electoral_map(interaction.guild.id, state)
 
         # Create response embed
         embed = discord.Embed(
@@ -1127,6 +1137,7 @@ class Momentum(commands.Cog):
                 {"guild_id": interaction.guild.id},
                 {"$set": updates}
             )
+            self._touch_electoral_map(interaction.guild.id)
 
         embed = discord.Embed(
             title="⚙️ Momentum Decay Applied",
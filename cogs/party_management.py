@@ -3,6 +3,40 @@ import discord
 from discord import app_commands
 from datetime import datetime
 from typing import List, Optional
+from .config_registry import NOW, configs
+
+
+def _default_parties_config():
+    # Initialize with default parties
+    return {
+        "parties": [
+            {
+                "name": "Democratic Party",
+                "abbreviation": "D",
+                "color": 0x0099FF,  # Blue
+                "created_at": NOW,
+                "is_default": True
+            },
+            {
+                "name": "Republican Party",
+                "abbreviation": "R",
+                "color": 0xFF0000,  # Red
+                "created_at": NOW,
+                "is_default": True
+            },
+            {
+                "name": "Independent",
+                "abbreviation": "I",
+                "color": 0x800080,  # Purple
+                "created_at": NOW,
+                "is_default": True
+            }
+        ]
+    }
+
+
+configs.register("parties_config", _default_parties_config)
+
 
 class PartyManagement(commands.Cog):
     def __init__(self, bot):
@@ -19,37 +53,7 @@ class PartyManagement(commands.Cog):
     def _get_parties_config(self, guild_id: int):
         """Get or create parties configuration for a guild"""
         col = self.bot.db["parties_config"]
-        config = col.find_one({"guild_id": guild_id})
-        if not config:
-            # Initialize with default parties
-            config = {
-                "guild_id": guild_id,
-                "parties": [
-                    {
-                        "name": "Democratic Party",
-                        "abbreviation": "D",
-                        "color": 0x0099FF,  # Blue
-                        "created_at": datetime.utcnow(),
-                        "is_default": True
-                    },
-                    {
-                        "name": "Republican Party",
-                        "abbreviation": "R",
-                        "color": 0xFF0000,  # Red
-                        "created_at": datetime.utcnow(),
-                        "is_default": True
-                    },
-                    {
-                        "name": "Independent",
-                        "abbreviation": "I",
-                        "color": 0x800080,  # Purple
-                        "created_at": datetime.utcnow(),
-                        "is_default": True
-                    }
-                ]
-            }
-            col.insert_one(config)
-        return col, config
+        return col, configs.get(col, guild_id)
 
     @party_manage_group.command(
         name="create",
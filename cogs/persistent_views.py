@@ -0,0 +1,68 @@
+from typing import List, Optional
+import re
+
+import discord
+
+CUSTOM_ID_LIMIT = 100  # Discord's maximum custom_id length
+SMART_PAGE_LIMIT = 25  # Options a select can hold
+
+
+def _escape(value) -> str:
+    return "" if value is None else str(value).replace("%", "%25").replace(":", "%3A")
+
+
+def unpack(value: str) -> Optional[str]:
+    """One field of a packed custom_id back to its value ("" was None)"""
+    return value.replace("%3A", ":").replace("%25", "%") or None
+
+
+def pack(prefix: str, *fields) -> str:
+    """prefix:field1:field2... with ':' escaped inside fields.
+
+    Raises ValueError when the result doesn't fit a custom_id (very long filters).
+    """
+    custom_id = ":".join([prefix] + [_escape(field) for field in fields])
+    if len(custom_id) > CUSTOM_ID_LIMIT:
+        raise ValueError(f"View state too long for a custom_id ({len(custom_id)} chars)")
+    return custom_id
+
+
+def template(prefix: str, *names: str) -> str:
+    """The DynamicItem template matching pack(prefix, *fields)"""
+    return ":".join([re.escape(prefix)] + [f"(?P<{name}>[^:]*)" for name in names])
+
+
+def persistent_view(item_class, *args) -> Optional[discord.ui.View]:
+    """A timeout-less view holding one dynamic item, or None if its state doesn't fit a custom_id"""
+    try:
+        item = item_class(*args)
+    except ValueError as e:
+        print(f"Not attaching {item_class.__name__}: {e}")
+        return None
+    view = discord.ui.View(timeout=None)
+    view.add_item(item)
+    return view
+
+
+def is_admin(interaction: discord.Interaction) -> bool:
+    """interaction_check for components of admin-only commands; anyone can replay a custom_id"""
+    return bool(interaction.guild and interaction.user.guild_permissions.administrator)
+
+
+def page_options(total_pages: int, current_page: int) -> List[discord.SelectOption]:
+    """Page select options: every page up to 25, otherwise the first, last and nearby pages"""
+    if total_pages <= SMART_PAGE_LIMIT:
+        pages = range(1, total_pages + 1)
+    else:
+        shown = set(range(1, 4))
+        shown.update(range(max(1, current_page - 2), min(total_pages, current_page + 2) + 1))
+        shown.update(range(total_pages - 2, total_pages + 1))
+        pages = sorted(shown)
+
+    options = []
+    for page in pages:
+        label = f"Page {page}"
+        if page == current_page:
+            label += " (Current)"
+        options.append(discord.SelectOption(label=label, value=str(page), default=(page == current_page)))
+    return options
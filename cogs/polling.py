@@ -4,7 +4,9 @@ from discord import app_commands
 from datetime import datetime
 import random
 from typing import Optional, List
+from .queries import find_entries, find_entry, find_fields
 from .ideology import STATE_DATA
+from .zero_sum import minimum_floor, zero_sum_percentages
 
 class Polling(commands.Cog):
     def __init__(self, bot):
@@ -45,35 +47,25 @@ class Polling(commands.Cog):
         if current_phase == "General Campaign":
             # Look in winners collection for general campaign
             winners_col = self.bot.db["winners"]
-            winners_config = winners_col.find_one({"guild_id": guild_id})
-
-            if not winners_config:
-                return None, None
 
             # For general campaign, look for primary winners from the previous year if we're in an even year
             # Or current year if odd year
             primary_year = current_year - 1 if current_year % 2 == 0 else current_year
 
-            for winner in winners_config["winners"]:
-                if (winner["user_id"] == user_id and
-                    winner.get("primary_winner", False) and
-                    winner["year"] == primary_year):
-                    return winners_col, winner
-
-            return winners_col, None
+            winners = find_entries(winners_col, guild_id, "winners",
+                                   {"user_id": user_id, "primary_winner": True, "year": primary_year}, limit=1)
+            if winners is None:
+                return None, None
+            return winners_col, winners[0] if winners else None
 
         else:
             # Look in signups collection for primary campaign
-            signups_col, signups_config = self._get_signups_config(guild_id)
-
-            if not signups_config:
+            signups_col = self.bot.db["signups"]
+            candidates = find_entries(signups_col, guild_id, "candidates",
+                                      {"user_id": user_id, "year": current_year}, limit=1)
+            if candidates is None:
                 return None, None
-
-            for candidate in signups_config["candidates"]:
-                if candidate["user_id"] == user_id and candidate["year"] == current_year:
-                    return signups_col, candidate
-
-            return signups_col, None
+            return signups_col, candidates[0] if candidates else None
 
     def _get_candidate_by_name(self, guild_id: int, candidate_name: str):
         """Get candidate by name based on current phase"""
@@ -84,22 +76,20 @@ class Polling(commands.Cog):
         if current_phase == "General Campaign":
             # First check presidential signups directly for presidential candidates
             pres_signups_col = self.bot.db["presidential_signups"]
-            pres_signups_config = pres_signups_col.find_one({"guild_id": guild_id})
 
-            if pres_signups_config:
-                # Try multiple signup years to be safe
-                possible_years = [current_year, current_year - 1, current_year - 2]
-
-                for signup_year in possible_years:
-                    for candidate in pres_signups_config.get("candidates", []):
-                        if (candidate["name"].lower() == candidate_name.lower() and 
-                            candidate["year"] == signup_year and
-                            candidate["office"] == "President"):
-                            return pres_signups_col, candidate
+            # Try multiple signup years to be safe
+            possible_years = [current_year, current_year - 1, current_year - 2]
+            pres_candidates = find_entries(
+                pres_signups_col, guild_id, "candidates",
+                {"name": candidate_name, "year": possible_years, "office": "President"}, ignore_case=("name",)
+            ) or []
+            for signup_year in possible_years:
+                for candidate in pres_candidates:
+                    if candidate["year"] == signup_year:
+                        return pres_signups_col, candidate
 
             # Also check presidential winners collection
-            pres_winners_col = self.bot.db["presidential_winners"]
-            pres_winners_config = pres_winners_col.find_one({"guild_id": guild_id})
+            pres_winners_config = find_fields(self.bot.db["presidential_winners"], guild_id, "winners", "election_year")
 
             if pres_winners_config:
                 winners_data = pres_winners_config.get("winners", {})
@@ -108,57 +98,39 @@ class Polling(commands.Cog):
                     for party, winner_name in winners_data.items():
                         if isinstance(winner_name, str) and winner_name.lower() == candidate_name.lower():
                             # Get full candidate data from presidential signups
-                            if pres_signups_config:
-                                election_year = pres_winners_config.get("election_year", current_year)
-                                signup_year = election_year - 1 if election_year % 2 == 0 else election_year
-
-                                for candidate in pres_signups_config.get("candidates", []):
-                                    if (candidate["name"].lower() == candidate_name.lower() and 
-                                        candidate["year"] == signup_year and
-                                        candidate["office"] == "President"):
-                                        return pres_signups_col, candidate
+                            election_year = pres_winners_config.get("election_year", current_year)
+                            signup_year = election_year - 1 if election_year % 2 == 0 else election_year
+                            candidate = find_entry(
+                                pres_signups_col, guild_id, "candidates",
+                                {"name": candidate_name, "year": signup_year, "office": "President"},
+                                ignore_case=("name",)
+                            )
+                            if candidate:
+                                return pres_signups_col, candidate
 
             # If not presidential, look in regular winners collection
             winners_col = self.bot.db["winners"]
-            winners_config = winners_col.find_one({"guild_id": guild_id})
-
-            if winners_config:
-                primary_year = current_year - 1 if current_year % 2 == 0 else current_year
-                for winner in winners_config["winners"]:
-                    if (winner.get("candidate", "").lower() == candidate_name.lower() and
-                        winner.get("primary_winner", False) and
-                        winner["year"] == primary_year):
-                        return winners_col, winner
+            primary_year = current_year - 1 if current_year % 2 == 0 else current_year
+            winner = find_entry(winners_col, guild_id, "winners",
+                                {"candidate": candidate_name, "primary_winner": True, "year": primary_year},
+                                ignore_case=("candidate",))
+            if winner:
+                return winners_col, winner
 
             return None, None
         else:
             # Look in signups collection for primary campaign (including presidential)
-            signups_col, signups_config = self._get_signups_config(guild_id)
-            if signups_config:
-                for candidate in signups_config["candidates"]:
-                    if candidate["name"].lower() == candidate_name.lower() and candidate["year"] == current_year:
-                        return signups_col, candidate
-
-            # Also check presidential signups
-            pres_signups_col = self.bot.db["presidential_signups"]
-            pres_signups_config = pres_signups_col.find_one({"guild_id": guild_id})
-            if pres_signups_config:
-                for candidate in pres_signups_config.get("candidates", []):
-                    if (candidate["name"].lower() == candidate_name.lower() and 
-                        candidate["year"] == current_year):
-                        return pres_signups_col, candidate
+            for collection in ("signups", "presidential_signups"):
+                col = self.bot.db[collection]
+                candidate = find_entry(col, guild_id, "candidates",
+                                       {"name": candidate_name, "year": current_year}, ignore_case=("name",))
+                if candidate:
+                    return col, candidate
 
             return None, None
 
     def _calculate_zero_sum_percentages(self, guild_id: int, seat_id: str):
         """Calculate zero-sum redistribution percentages for general election candidates"""
-        # Get general election candidates (primary winners) for this seat
-        winners_col = self.bot.db["winners"]
-        winners_config = winners_col.find_one({"guild_id": guild_id})
-
-        if not winners_config:
-            return {}
-
         # Get current year
         time_col, time_config = self._get_time_config(guild_id)
         current_year = time_config["current_rp_date"].year if time_config else 2024
@@ -169,18 +141,26 @@ class Polling(commands.Cog):
         # Or current year if odd year
         primary_year = current_year - 1 if current_year % 2 == 0 else current_year
 
+        # Only this seat's entries for both candidate years come back from the server
+        seat_entries = find_entries(self.bot.db["winners"], guild_id, "winners",
+                                    {"seat_id": seat_id, "year": [primary_year, current_year]})
+        if seat_entries is None:
+            return {}
+
         seat_candidates = [
-            w for w in winners_config["winners"]
-            if w["seat_id"] == seat_id and w["year"] == primary_year and w.get("primary_winner", False)
+            w for w in seat_entries
+            if w["year"] == primary_year and w.get("primary_winner", False)
         ]
 
         # If no primary winners found, fall back to all candidates for this seat in the current year
         if not seat_candidates:
-            seat_candidates = [
-                w for w in winners_config["winners"]
-                if w["seat_id"] == seat_id and w["year"] == current_year
-            ]
+            seat_candidates = [w for w in seat_entries if w["year"] == current_year]
 
+        return self._calculate_seat_percentages(guild_id, seat_candidates, current_phase)
+
+    def _calculate_seat_percentages(self, guild_id: int, seat_candidates: list, current_phase: str,
+                                    momentum_config: Optional[dict] = None) -> dict:
+        """Zero-sum percentages for one seat's candidates, from already loaded documents"""
         if not seat_candidates:
             return {}
 
@@ -188,10 +168,7 @@ class Polling(commands.Cog):
         momentum_effects = {}
         if (current_phase == "General Campaign" and
             any(c.get("office") in ["President", "Vice President"] for c in seat_candidates)):
-            momentum_effects = self._get_momentum_effects_for_candidates(guild_id, seat_candidates)
-
-        # Get state name from seat_id for momentum calculation
-        state_name = self._extract_state_from_seat_id(seat_id)
+            momentum_effects = self._get_momentum_effects_for_candidates(guild_id, seat_candidates, momentum_config)
 
         # Determine baseline percentages based on number of candidates and parties
         num_candidates = len(seat_candidates)
@@ -251,94 +228,23 @@ class Polling(commands.Cog):
                 for candidate in seat_candidates:
                     baseline_percentages[candidate.get('candidate', candidate.get('name', ''))] = 100.0 / num_candidates
 
-        # Apply proportional redistribution with minimum floors
-        final_percentages = {}
-
-        # Define minimum percentage floors
-        def get_minimum_floor(candidate):
-            party = candidate.get('party', '').lower()
-            if any(keyword in party for keyword in ['democrat', 'republican']):
-                return 25.0  # 25% minimum for major parties
-            else:
-                return 2.0   # 2% minimum for independents/third parties
-
-        # Calculate total campaign points across all candidates in this seat
-        total_campaign_points = sum(candidate.get('points', 0.0) for candidate in seat_candidates)
-
-        # Start with baseline percentages
-        current_percentages = baseline_percentages.copy()
+        # Redistribute campaign points above each party's floor, add momentum, normalise to 100%
+        names = [c.get('candidate', c.get('name', '')) for c in seat_candidates]
+        return zero_sum_percentages(
+            names,
+            [baseline_percentages[name] for name in names],
+            [c.get('points', 0.0) for c in seat_candidates],
+            [minimum_floor(c.get('party', '')) for c in seat_candidates],
+            [momentum_effects.get(name, 0.0) for name in names]
+        )
 
-        # Apply campaign effects using proportional redistribution
-        if total_campaign_points > 0:
-            for candidate in seat_candidates:
-                candidate_name = candidate.get('candidate', candidate.get('name', ''))
-                candidate_points = candidate.get('points', 0.0)
-
-                if candidate_points > 0:
-                    # This candidate gains points
-                    points_gained = candidate_points
-
-                    # Calculate total percentage that can be taken from other candidates
-                    total_available_to_take = 0.0
-                    for other_candidate in seat_candidates:
-                        if other_candidate != candidate:
-                            other_name = other_candidate.get('candidate', other_candidate.get('name', ''))
-                            other_current = current_percentages[other_name]
-                            other_minimum = get_minimum_floor(other_candidate)
-                            available = max(0, other_current - other_minimum)
-                            total_available_to_take += available
-
-                    # Limit gains to what's actually available
-                    actual_gain = min(points_gained, total_available_to_take)
-                    current_percentages[candidate_name] += actual_gain
-
-                    # Distribute losses proportionally among other candidates
-                    if total_available_to_take > 0:
-                        for other_candidate in seat_candidates:
-                            if other_candidate != candidate:
-                                other_name = other_candidate.get('candidate', other_candidate.get('name', ''))
-                                other_current = current_percentages[other_name]
-                                other_minimum = get_minimum_floor(other_candidate)
-                                available = max(0, other_current - other_minimum)
-
-                                if available > 0:
-                                    proportional_loss = (available / total_available_to_take) * actual_gain
-                                    current_percentages[other_name] -= proportional_loss
-
-        # Apply momentum effects if available
-        for candidate in seat_candidates:
-            candidate_name = candidate.get('candidate', candidate.get('name', ''))
-            momentum_effect = momentum_effects.get(candidate_name, 0.0)
-            current_percentages[candidate_name] += momentum_effect
-
-        # Ensure minimum floors are respected
-        for candidate in seat_candidates:
-            candidate_name = candidate.get('candidate', candidate.get('name', ''))
-            minimum_floor = get_minimum_floor(candidate)
-            current_percentages[candidate_name] = max(current_percentages[candidate_name], minimum_floor)
-
-        # COMPLETE 100% NORMALIZATION - Force total to exactly 100%
-        total_percentage = sum(current_percentages.values())
-        if total_percentage > 0:
-            for candidate_name in current_percentages:
-                current_percentages[candidate_name] = (current_percentages[candidate_name] / total_percentage) * 100.0
-
-        # Final verification and correction for floating point errors
-        final_total = sum(current_percentages.values())
-        if abs(final_total - 100.0) > 0.001:
-            # Apply micro-adjustment to the largest percentage instead of equal distribution
-            largest_candidate = max(current_percentages.keys(), key=lambda x: current_percentages[x])
-            adjustment = 100.0 - final_total
-            current_percentages[largest_candidate] += adjustment
-
-        final_percentages = current_percentages
-        return final_percentages
-
-    def _get_momentum_effects_for_candidates(self, guild_id: int, candidates: list) -> dict:
+    def _get_momentum_effects_for_candidates(self, guild_id: int, candidates: list,
+                                             momentum_config: Optional[dict] = None) -> dict:
         """Get momentum effects for presidential candidates"""
         try:
-            momentum_col = self.bot.db["momentum_config"]
-            momentum_config = momentum_col.find_one({"guild_id": guild_id})
+            if momentum_config is None:
+                momentum_col = self.bot.db["momentum_config"]
+                momentum_config = momentum_col.find_one({"guild_id": guild_id})
 
             if not momentum_config:
                 return {}
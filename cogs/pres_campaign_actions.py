@@ -5,7 +5,10 @@ from datetime import datetime, timedelta
 import random
 import asyncio
 from typing import Optional, List
+from .member_cache import mention
 from .presidential_winners import PRESIDENTIAL_STATE_DATA
+from .reply_router import wait_for_reply
+from .zero_sum import minimum_floor, zero_sum_percentages
 
 class PresCampaignActions(commands.Cog):
     def __init__(self, bot):
@@ -271,7 +274,6 @@ class PresCampaignActions(commands.Cog):
                 momentum_multiplier = momentum_cog._calculate_momentum_campaign_multiplier(state_name.upper(), party_key, momentum_config)
                 actual_polling_boost = polling_boost * momentum_multiplier
 
-                print(f"DEBUG: Applied momentum multiplier {momentum_multiplier:.2f}x to polling boost: {polling_boost:.2f} -> {actual_polling_boost:.2f}")
 
         # Determine who pays the stamina cost
         stamina_deduction_user_id = user_id  # Default to target candidate
@@ -325,8 +327,12 @@ class PresCampaignActions(commands.Cog):
             )
 
             # Add momentum effects during General Campaign (use the boosted points)
-            print(f"DEBUG: Adding momentum from stats update: {actual_polling_boost} points in {state_name.upper()}")
             self._add_momentum_from_campaign_action(guild_id, user_id, state_name.upper(), actual_polling_boost, candidate_data)
+
+            # Only this state's column of the electoral map needs recomputing
+            electoral_cog = self.bot.get_cog("ElectoralCollege")
+            if electoral_cog:
+                electoral_cog.touch(guild_id, state_name)
         else:
             # For primary campaign, update in presidential signups collection (no momentum multiplier)
             collection.update_one(
@@ -355,12 +361,16 @@ class PresCampaignActions(commands.Cog):
             PRESIDENTIAL_STATE_DATA[state_name]["other"] = round(data["other"], 1)
 
     def _transfer_pres_points_to_winners(self, guild_id: int, candidate_data: dict, state_name: str, points_gained: float):
-        """Transfer points to the all_winners system, mapping to political parties."""
-        all_winners_col = self.bot.db["winners"]
+        """Feed a presidential campaign action into the state baselines, mapping to political parties.
+
+        The candidate's points live in presidential_signups (and reach the winners array
+        through PresidentialWinners._transfer_to_all_winners). This used to also upsert a
+        separate per-candidate document into `winners`, which nothing read and which the
+        unique guild_id index on that collection now rejects.
+        """
         user_id = candidate_data.get("user_id")
         candidate_name = candidate_data.get("name")
         party = candidate_data.get("party", "").lower()
-        office = candidate_data.get("office", "President")
         year = candidate_data.get("year")
 
         if not user_id or not candidate_name or not year:
@@ -375,37 +385,6 @@ class PresCampaignActions(commands.Cog):
         else:
             political_party = "Independents"
 
-        # Update or insert the winner data
-        all_winners_col.update_one(
-            {
-                "guild_id": guild_id,
-                "user_id": user_id,
-                "office": office,
-                "year": year,
-                "political_party": political_party # Store the categorized party
-            },
-            {
-                "$set": {
-                    "candidate": candidate_name,
-                    "party": candidate_data.get("party"), # Keep original party name
-                    "political_party": political_party, # Store categorized party
-                    "office": office,
-                    "year": year,
-                    "stamina": candidate_data.get("stamina", 300),
-                    "corruption": candidate_data.get("corruption", 0),
-                    "primary_winner": candidate_data.get("primary_winner", False),
-                    "state_points": candidate_data.get("state_points", {}),
-                    "total_points": candidate_data.get("total_points", 0.0)
-                },
-                "$inc": {
-                    # We are not directly adding points here as the points are already part of total_points/state_points
-                    # This structure ensures the data is present and updated correctly.
-                    # If a specific "points" field needs incrementing in all_winners, it should be handled here.
-                }
-            },
-            upsert=True
-        )
-
         # Update PRESIDENTIAL_STATE_DATA based on campaign activity
         self._update_state_baseline_data(guild_id, state_name, political_party, points_gained)
 
@@ -530,9 +509,10 @@ class PresCampaignActions(commands.Cog):
 
     def _apply_buff_debuff_multiplier(self, base_points: float, user_id: int, guild_id: int, action_type: str) -> float:
         """Apply any active buffs or debuffs to the points gained"""
-        # For now, return base points without modification
-        # This can be expanded later to include buff/debuff system
-        return base_points
+        effects_cog = self.bot.get_cog("CampaignEffects")
+        if not effects_cog:
+            return base_points
+        return effects_cog.apply_multiplier(base_points, user_id, guild_id, action_type)
 
     def _add_momentum_from_campaign_action(self, guild_id: int, user_id: int, state_name: str, points_gained: float, candidate_data: Optional[dict] = None):
         """Adds momentum to a state based on campaign actions."""
@@ -543,7 +523,6 @@ class PresCampaignActions(commands.Cog):
 
             if current_phase != "General Campaign":
                 # Momentum only applies during General Campaign
-                print(f"DEBUG: Not in General Campaign phase (current: {current_phase}), skipping momentum")
                 return
 
             # Use the momentum system from the momentum cog
@@ -561,7 +540,6 @@ class PresCampaignActions(commands.Cog):
                 signups_col, candidate = self._get_user_presidential_candidate(guild_id, user_id)
 
             if not candidate or not isinstance(candidate, dict) or not candidate.get("party"):
-                print(f"DEBUG: No valid candidate data found for user {user_id}, attempting to find by name from all_winners")
 
                 # Try to find candidate in all_winners system as fallback
                 all_winners_col = self.bot.db["winners"]
@@ -603,14 +581,12 @@ class PresCampaignActions(commands.Cog):
 
                             # Found a match!
                             candidate = winner
-                            print(f"DEBUG: Found candidate in all_winners using strategy {search_strategies.index(strategy) + 1}: {candidate.get('candidate', 'Unknown')}")
                             break
 
                         if candidate:
                             break
 
                 if not candidate or not isinstance(candidate, dict) or not candidate.get("party"):
-                    print(f"DEBUG: Could not find candidate data for user {user_id} in database, creating minimal candidate object")
 
                     # As a final fallback, create a minimal candidate object for momentum purposes
                     # This handles cases where the campaign action is valid but database lookup fails
@@ -628,7 +604,6 @@ class PresCampaignActions(commands.Cog):
                         "year": time_config.get("current_rp_date", {}).year if time_config else 2024,
                         "primary_winner": True  # Assume they're a valid candidate if performing actions
                     }
-                    print(f"DEBUG: Created fallback candidate object: {candidate['name']} ({candidate['party']})")
 
             # Determine party key with comprehensive mapping
             party = candidate.get("party", "").lower()
@@ -640,7 +615,6 @@ class PresCampaignActions(commands.Cog):
             else:
                 party_key = "Independent"
 
-            print(f"DEBUG: Adding momentum for {candidate.get('name')} ({party_key}) in {state_name}")
 
             # Validate state name exists in momentum config
             if state_name not in momentum_config["state_momentum"]:
@@ -654,7 +628,6 @@ class PresCampaignActions(commands.Cog):
             # Apply momentum multiplier to the original campaign points
             boosted_points = points_gained * campaign_multiplier
 
-            print(f"DEBUG: Original points: {points_gained:.2f}, Momentum multiplier: {campaign_multiplier:.2f}x, Boosted points: {boosted_points:.2f}")
 
             # Calculate momentum gained - convert campaign points to momentum
             # Use a factor that makes momentum visible but not overwhelming
@@ -663,18 +636,15 @@ class PresCampaignActions(commands.Cog):
 
             new_momentum = current_momentum + momentum_gained
 
-            print(f"DEBUG: Current momentum: {current_momentum}, adding: {momentum_gained}, new total: {new_momentum}")
 
             # Check for auto-collapse and apply if needed
             final_momentum, collapsed = momentum_cog._check_and_apply_auto_collapse(
                 momentum_col, guild_id, state_name, party_key, new_momentum
             )
 
-            if collapsed:
-                print(f"DEBUG: Momentum auto-collapsed to {final_momentum}")
-            else:
+            if not collapsed:
                 # Update momentum in database
-                result = momentum_col.update_one(
+                momentum_col.update_one(
                     {"guild_id": guild_id},
                     {
                         "$set": {
@@ -683,7 +653,6 @@ class PresCampaignActions(commands.Cog):
                         }
                     }
                 )
-                print(f"DEBUG: Momentum update result - matched: {result.matched_count}, modified: {result.modified_count}")
 
                 # Log the momentum gain event
                 if momentum_gained > 0.1:  # Only log significant gains
@@ -691,9 +660,6 @@ class PresCampaignActions(commands.Cog):
                         momentum_col, guild_id, state_name, party_key,
                         momentum_gained, f"Presidential campaign action (+{points_gained:.1f} pts)", user_id
                     )
-                    print(f"DEBUG: Momentum event logged for {party_key} in {state_name}")
-
-            print(f"DEBUG: Successfully added {momentum_gained} momentum for {party_key} in {state_name}")
 
         except Exception as e:
             print(f"ERROR in _add_momentum_from_campaign_action: {e}")
@@ -777,14 +743,6 @@ class PresCampaignActions(commands.Cog):
         if not candidates:
             return {}
 
-        # Define minimum percentage floors for presidential races
-        def get_presidential_minimum_floor(candidate):
-            party = candidate.get("party", "").lower()
-            if any(keyword in party for keyword in ['democrat', 'republican']):
-                return 25.0  # 25% minimum for major parties
-            else:
-                return 2.0   # 2% minimum for independents/third parties
-
         # Calculate baseline percentages based on party alignment
         baseline_percentages = {}
         num_candidates = len(candidates)
@@ -823,67 +781,14 @@ class PresCampaignActions(commands.Cog):
             for candidate in candidates:
                 baseline_percentages[candidate["name"]] = 100.0 / num_candidates
 
-        # Start with baseline percentages
-        current_percentages = baseline_percentages.copy()
-
-        # Apply campaign effects using COMPLETE proportional redistribution
-        for candidate in candidates:
-            candidate_name = candidate["name"]
-            total_campaign_points = candidate.get("total_points", 0.0)
-
-            if total_campaign_points > 0:
-                # Points gained equals the campaign points directly
-                points_gained = total_campaign_points
-
-                # Calculate total percentage that can be taken from other candidates
-                total_available_to_take = 0.0
-                for other_candidate in candidates:
-                    if other_candidate != candidate:
-                        other_name = other_candidate["name"]
-                        other_current = current_percentages[other_name]
-                        other_minimum = get_presidential_minimum_floor(other_candidate)
-                        available = max(0, other_current - other_minimum)
-                        total_available_to_take += available
-
-                # Limit gains to what's actually available
-                actual_gain = min(points_gained, total_available_to_take)
-                current_percentages[candidate_name] += actual_gain
-
-                # Distribute losses proportionally among other candidates
-                if total_available_to_take > 0:
-                    for other_candidate in candidates:
-                        if other_candidate != candidate:
-                            other_name = other_candidate["name"]
-                            other_current = current_percentages[other_name]
-                            other_minimum = get_presidential_minimum_floor(other_candidate)
-                            available = max(0, other_current - other_minimum)
-
-                            if available > 0:
-                                proportional_loss = (available / total_available_to_take) * actual_gain
-                                current_percentages[other_name] -= proportional_loss
-
-        # Ensure minimum floors are respected
-        for candidate in candidates:
-            candidate_name = candidate["name"]
-            minimum_floor = get_presidential_minimum_floor(candidate)
-            current_percentages[candidate_name] = max(current_percentages[candidate_name], minimum_floor)
-
-        # COMPLETE 100% NORMALIZATION - Force total to exactly 100%
-        total_percentage = sum(current_percentages.values())
-        if total_percentage > 0:
-            for candidate_name in current_percentages:
-                current_percentages[candidate_name] = (current_percentages[candidate_name] / total_percentage) * 100.0
-
-        # Final verification and correction for floating point errors
-        final_total = sum(current_percentages.values())
-        if abs(final_total - 100.0) > 0.001:
-            # Apply micro-adjustment to the largest percentage
-            largest_candidate = max(current_percentages.keys(), key=lambda x: current_percentages[x])
-            adjustment = 100.0 - final_total
-            current_percentages[largest_candidate] += adjustment
-
-        final_percentages = current_percentages
-        return final_percentages
+        # Redistribute campaign points above each party's floor and normalise to 100%
+        names = [c["name"] for c in candidates]
+        return zero_sum_percentages(
+            names,
+            [baseline_percentages[name] for name in names],
+            [c.get("total_points", 0.0) for c in candidates],
+            [minimum_floor(c.get("party", "")) for c in candidates]
+        )
 
     # State autocomplete for all commands
     @app_commands.command(
@@ -1124,14 +1029,9 @@ class PresCampaignActions(commands.Cog):
         # Get the response message
         response_message = await interaction.original_response()
 
-        def check(message):
-            return (message.author.id == interaction.user.id and
-                    message.reference and
-                    message.reference.message_id == response_message.id)
-
         try:
             # Wait for user to reply with donor appeal
-            reply_message = await self.bot.wait_for('message', timeout=300.0, check=check)
+            reply_message = await wait_for_reply(self.bot, response_message.id, interaction.user.id, timeout=300.0)
 
             donor_appeal = reply_message.content
             char_count = len(donor_appeal)
@@ -1151,6 +1051,7 @@ class PresCampaignActions(commands.Cog):
             # Calculate polling boost - 1% per 1000 characters
             polling_boost = (char_count / 1000) * 1.0
             polling_boost = min(polling_boost, 3.0)
+            polling_boost = self._apply_buff_debuff_multiplier(polling_boost, target_candidate.get("user_id"), interaction.guild.id, "pres_donor")
 
             # Update target candidate stats
             self._update_presidential_candidate_stats(target_signups_col, interaction.guild.id, target_candidate.get("user_id"),
@@ -1286,15 +1187,9 @@ class PresCampaignActions(commands.Cog):
         # Get the response message
         response_message = await interaction.original_response()
 
-        def check(message):
-            return (message.author.id == interaction.user.id and
-                    message.reference and
-                    message.reference.message_id == response_message.id and
-                    len(message.attachments) > 0)
-
         try:
             # Wait for user to reply with attachment
-            reply_message = await self.bot.wait_for('message', timeout=300.0, check=check)
+            reply_message = await wait_for_reply(self.bot, response_message.id, interaction.user.id, timeout=300.0, require_attachments=True)
 
             video = reply_message.attachments[0]
 
@@ -1310,6 +1205,7 @@ class PresCampaignActions(commands.Cog):
 
             # Random polling boost between 0.2% and 0.3%
             polling_boost = random.uniform(0.2, 0.3)
+            polling_boost = self._apply_buff_debuff_multiplier(polling_boost, target_candidate["user_id"], interaction.guild.id, "pres_ad")
 
             # Update target candidate stats
             self._update_presidential_candidate_stats(target_signups_col, interaction.guild.id, target_candidate["user_id"],
@@ -1517,6 +1413,8 @@ class PresCampaignActions(commands.Cog):
                 )
                 return
 
+            polling_boost = self._apply_buff_debuff_multiplier(polling_boost, target_user_id, interaction.guild.id, "pres_poster")
+
             # Update target candidate stats
             self._update_presidential_candidate_stats(target_signups_col, interaction.guild.id, target_user_id,
                                                      state_upper, polling_boost=polling_boost, stamina_cost=4,
@@ -1723,14 +1621,9 @@ class PresCampaignActions(commands.Cog):
         # Get the response message
         response_message = await interaction.original_response()
 
-        def check(message):
-            return (message.author.id == interaction.user.id and
-                    message.reference and
-                    message.reference.message_id == response_message.id)
-
         try:
             # Wait for user to reply with speech
-            reply_message = await self.bot.wait_for('message', timeout=300.0, check=check)
+            reply_message = await wait_for_reply(self.bot, response_message.id, interaction.user.id, timeout=300.0)
 
             speech_content = reply_message.content
             char_count = len(speech_content)
@@ -1754,6 +1647,7 @@ class PresCampaignActions(commands.Cog):
 
             # Total polling boost
             polling_boost = base_polling_boost + ideology_bonus
+            polling_boost = self._apply_buff_debuff_multiplier(polling_boost, target_candidate["user_id"], interaction.guild.id, "pres_speech")
 
             # Update target candidate stats
             self._update_presidential_candidate_stats(target_signups_col, interaction.guild.id, target_candidate["user_id"],
@@ -2280,8 +2174,7 @@ class PresCampaignActions(commands.Cog):
             pres_text = ""
             for candidate in presidents:
                 candidate_name = candidate["name"]
-                user = interaction.guild.get_member(candidate["user_id"])
-                user_mention = user.mention if user else candidate_name
+                user_mention = mention(candidate["user_id"]) if candidate.get("user_id") else candidate_name
 
                 if current_phase == "General Campaign":
                     general_percentages = self._calculate_general_election_percentages(interaction.guild.id, candidate["office"])
@@ -2316,8 +2209,7 @@ class PresCampaignActions(commands.Cog):
             vp_text = ""
             for candidate in vice_presidents:
                 candidate_name = candidate["name"]
-                user = interaction.guild.get_member(candidate["user_id"])
-                user_mention = user.mention if user else candidate_name
+                user_mention = mention(candidate["user_id"]) if candidate.get("user_id") else candidate_name
 
                 if current_phase == "General Campaign":
                     general_percentages = self._calculate_general_election_percentages(interaction.guild.id, "Vice President")
@@ -2433,6 +2325,10 @@ class PresCampaignActions(commands.Cog):
             # Transfer points to all_winners system for proper tracking
             self._transfer_pres_points_to_winners(interaction.guild.id, target_candidate, state_upper, points)
 
+            electoral_cog = self.bot.get_cog("ElectoralCollege")
+            if electoral_cog:
+                electoral_cog.touch(interaction.guild.id, state_upper)
+
             # Calculate new percentages
             general_percentages = self._calculate_general_election_percentages(interaction.guild.id, target_candidate["office"])
             updated_percentage = general_percentages.get(target_candidate["name"], 50.0)
@@ -4,6 +4,19 @@ from discord import app_commands
 from datetime import datetime
 from typing import Optional
 from .ideology import STATE_DATA
+from .config_registry import configs
+from .member_cache import mention, resolve_member
+
+
+def _default_presidential_config():
+    return {
+        "candidates": [],  # Presidential and VP candidates
+        "pending_vp_requests": []  # VP requests pending acceptance
+    }
+
+
+configs.register("presidential_signups", _default_presidential_config)
+
 
 class PresidentialSignups(commands.Cog):
     def __init__(self, bot):
@@ -19,15 +32,7 @@ class PresidentialSignups(commands.Cog):
     def _get_presidential_config(self, guild_id: int):
         """Get or create presidential signups configuration for a guild"""
         col = self.bot.db["presidential_signups"]
-        config = col.find_one({"guild_id": guild_id})
-        if not config:
-            config = {
-                "guild_id": guild_id,
-                "candidates": [],  # Presidential and VP candidates
-                "pending_vp_requests": []  # VP requests pending acceptance
-            }
-            col.insert_one(config)
-        return col, config
+        return col, configs.get(col, guild_id)
 
     def _get_available_choices(self):
         """Get all available ideology choices from STATE_DATA"""
@@ -474,7 +479,7 @@ class PresidentialSignups(commands.Cog):
 
         # Notify the presidential candidate
         guild = interaction.guild
-        president_user = guild.get_member(presidential_candidate_data["user_id"])
+        president_user = await resolve_member(self.bot, guild, presidential_candidate_data["user_id"])
 
         if president_user:
             try:
@@ -1021,8 +1026,7 @@ class PresidentialSignups(commands.Cog):
                 vp_name = candidate.get("vp_candidate", "No VP selected")
 
                 # Get Discord user info
-                user = interaction.guild.get_member(candidate.get("user_id"))
-                user_mention = user.mention if user else "Unknown User"
+                user_mention = mention(candidate["user_id"]) if candidate.get("user_id") else "Unknown User"
 
                 # Simple polling calculation (you can improve this)
                 polling_percentage = base_percentage + ((-1) ** i) * (i * 2)  # Slight variation
@@ -1076,8 +1080,7 @@ class PresidentialSignups(commands.Cog):
                 vp_name = president.get("vp_candidate", "No VP selected")
 
                 # Get Discord user info
-                user = interaction.guild.get_member(president.get("user_id"))
-                user_mention = user.mention if user else "Unknown User"
+                user_mention = mention(president["user_id"]) if president.get("user_id") else "Unknown User"
 
                 ticket_info = f"**Party:** {president['party']}\n"
                 ticket_info += f"**Discord User:** {user_mention}\n"
@@ -1439,8 +1442,7 @@ class PresidentialSignups(commands.Cog):
         )
 
         for mod in modifications:
-            user = interaction.guild.get_member(mod.get("user_id"))
-            user_name = user.display_name if user else f"User {mod.get('user_id', 'Unknown')}"
+            user_name = mention(mod["user_id"]) if mod.get("user_id") else "Unknown"
 
             timestamp = mod["timestamp"].strftime("%Y-%m-%d %H:%M")
 
@@ -1529,8 +1531,7 @@ class PresidentialSignups(commands.Cog):
         if presidents:
             president_text = ""
             for i, candidate in enumerate(presidents, 1):
-                user = interaction.guild.get_member(candidate["user_id"])
-                user_mention = user.mention if user else f"User {candidate['user_id']}"
+                user_mention = mention(candidate["user_id"])
 
                 president_text += f"**{i}. {candidate['name']}** ({candidate['party']})\n"
                 president_text += f"   Points: {candidate.get('points', 0):.2f}\n"
@@ -1562,8 +1563,7 @@ class PresidentialSignups(commands.Cog):
         if vice_presidents:
             vp_text = ""
             for i, candidate in enumerate(vice_presidents, 1):
-                user = interaction.guild.get_member(candidate["user_id"])
-                user_mention = user.mention if user else f"User {candidate['user_id']}"
+                user_mention = mention(candidate["user_id"])
 
                 vp_text += f"**{i}. {candidate['name']}** ({candidate['party']})\n"
                 vp_text += f"   Points: {candidate.get('points', 0):.2f}\n"
@@ -1640,8 +1640,7 @@ class PresidentialSignups(commands.Cog):
         )
 
         for mod in modifications:
-            user = interaction.guild.get_member(mod.get("user_id"))
-            user_name = user.display_name if user else f"User {mod.get('user_id', 'Unknown')}"
+            user_name = mention(mod["user_id"]) if mod.get("user_id") else "Unknown"
 
             timestamp = mod["timestamp"].strftime("%Y-%m-%d %H:%M")
 
@@ -2,6 +2,9 @@ import discord
 from discord.ext import commands
 from discord import app_commands
 from datetime import datetime
+from typing import Optional
+from .config_registry import configs
+from .transitions import apply_once, transition_key
 
 # Presidential election state data
 # Data shows Republican/Democrat/Other percentages for each state
@@ -136,6 +139,14 @@ from discord.ext import commands
 from discord import app_commands
 from datetime import datetime
 
+
+def _default_presidential_winners_config():
+    return {"winners": {}}
+
+
+configs.register("presidential_winners", _default_presidential_winners_config)
+
+
 class PresidentialWinners(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
@@ -143,14 +154,7 @@ class PresidentialWinners(commands.Cog):
     def _get_presidential_winners_config(self, guild_id: int):
         """Get or create presidential winners configuration for a guild"""
         col = self.bot.db["presidential_winners"]
-        config = col.find_one({"guild_id": guild_id})
-        if not config:
-            config = {
-                "guild_id": guild_id,
-                "winners": {}
-            }
-            col.insert_one(config)
-        return col, config
+        return col, configs.get(col, guild_id)
 
     def _get_time_config(self, guild_id: int):
         """Get time configuration for a guild"""
@@ -169,13 +173,16 @@ class PresidentialWinners(commands.Cog):
             else:  # Even year (2000)
                 signup_year = current_year - 1
 
-            await self._process_presidential_primary_winners(guild_id, signup_year)
+            # Keyed so a transition resumed after a crash can't transfer the winners twice
+            once_key = transition_key(old_phase, new_phase, current_year, "presidential_primary_winners")
+            await self._process_presidential_primary_winners(guild_id, signup_year, once_key=once_key)
 
         elif old_phase == "Primary Election" and new_phase == "General Campaign":
             # Reset presidential primary winners for general campaign
-            await self._reset_presidential_candidates_for_general_campaign(guild_id, current_year)
+            self._reset_presidential_candidates_for_general_campaign(guild_id, current_year)
 
-    async def _process_presidential_primary_winners(self, guild_id: int, signup_year: int):
+    async def _process_presidential_primary_winners(self, guild_id: int, signup_year: int,
+                                                    once_key: Optional[str] = None):
         """Process presidential primary winners from signups to winners"""
         # Get presidential signups
         pres_signups_col = self.bot.db["presidential_signups"]
@@ -223,7 +230,7 @@ class PresidentialWinners(commands.Cog):
         )
 
         # Transfer presidential primary winners to all_winners system
-        await self._transfer_to_all_winners(guild_id, presidential_primary_winners, election_year)
+        await self._transfer_to_all_winners(guild_id, presidential_primary_winners, election_year, once_key)
 
         print(f"Processed {len(winners)} presidential primary winners for guild {guild_id}, election year {election_year}")
 
@@ -623,6 +630,10 @@ class PresidentialWinners(commands.Cog):
                 {"$set": {"winners.$[].total_points": 0, "winners.$[].state_points": {}}}
             )
 
+            electoral_cog = self.bot.get_cog("ElectoralCollege")
+            if electoral_cog:
+                electoral_cog.touch(guild_id)
+
             # Reset delegates points if they exist
             delegates_col = self.bot.db["delegates_config"]
             delegates_col.update_one(
@@ -638,46 +649,33 @@ class PresidentialWinners(commands.Cog):
 
     def _reset_presidential_candidates_for_general_campaign(self, guild_id: int, current_year: int):
         """Reset presidential candidates for the general campaign phase."""
+        # Reset points of current-year candidates in place. Updating only the matching
+        # array elements means concurrent $inc on other candidates can't be overwritten.
         pres_signups_col = self.bot.db["presidential_signups"]
-        pres_signups_config = pres_signups_col.find_one({"guild_id": guild_id})
-
-        if pres_signups_config:
-            # Filter out candidates from the previous election year and reset points
-            updated_candidates = []
-            for candidate in pres_signups_config.get("candidates", []):
-                if candidate.get("year", 0) == current_year:  # Keep candidates from the current year
-                    candidate["points"] = 0
-                    candidate["total_points"] = 0
-                updated_candidates.append(candidate)
-
-            pres_signups_col.update_one(
-                {"guild_id": guild_id},
-                {"$set": {"candidates": updated_candidates}}
-            )
+        pres_signups_col.update_one(
+            {"guild_id": guild_id},
+            {"$set": {"candidates.$[c].points": 0, "candidates.$[c].total_points": 0}},
+            array_filters=[{"c.year": current_year}]
+        )
 
         # Also reset presidential candidates in all_winners system
         winners_col = self.bot.db["winners"]
-        winners_config = winners_col.find_one({"guild_id": guild_id})
-
-        if winners_config:
-            updated_count = 0
-            for i, winner in enumerate(winners_config.get("winners", [])):
-                if (winner.get("year") == current_year and 
-                    winner.get("office") == "President" and
-                    winner.get("primary_winner", False) and
-                    winner.get("phase") != "General Campaign"):
-
-                    winners_config["winners"][i]["points"] = 0.0
-                    winners_config["winners"][i]["stamina"] = 300  # Presidential candidates get higher stamina
-                    winners_config["winners"][i]["phase"] = "General Campaign"
-                    updated_count += 1
-
-            if updated_count > 0:
-                winners_col.update_one(
-                    {"guild_id": guild_id},
-                    {"$set": {"winners": winners_config["winners"]}}
-                )
-                print(f"Reset {updated_count} presidential winners in all_winners system for general campaign")
+        result = winners_col.update_one(
+            {"guild_id": guild_id},
+            {"$set": {
+                "winners.$[w].points": 0.0,
+                "winners.$[w].stamina": 300,  # Presidential candidates get higher stamina
+                "winners.$[w].phase": "General Campaign"
+            }},
+            array_filters=[{
+                "w.year": current_year,
+                "w.office": "President",
+                "w.primary_winner": True,
+                "w.phase": {"$ne": "General Campaign"}
+            }]
+        )
+        if result.modified_count:
+            print("Reset presidential winners in all_winners system for general campaign")
 
         print(f"Reset presidential candidates for general campaign in guild {guild_id}, year {current_year}")
 
@@ -767,17 +765,12 @@ class PresidentialWinners(commands.Cog):
             ephemeral=True
         )
 
-    async def _transfer_to_all_winners(self, guild_id: int, presidential_winners: list, election_year: int):
-        """Transfer presidential primary winners to the all_winners system"""
-        # Get or create all_winners configuration
+    async def _transfer_to_all_winners(self, guild_id: int, presidential_winners: list, election_year: int,
+                                       once_key: Optional[str] = None):
+        """Transfer presidential primary winners to the all_winners system (at most once per once_key)"""
+        # Get or create all_winners configuration (defaults registered by AllWinners)
         winners_col = self.bot.db["winners"]
-        winners_config = winners_col.find_one({"guild_id": guild_id})
-        if not winners_config:
-            winners_config = {
-                "guild_id": guild_id,
-                "winners": []
-            }
-            winners_col.insert_one(winners_config)
+        configs.get(winners_col, guild_id)
 
         # Create winner entries for all_winners system
         all_winners_entries = []
@@ -829,14 +822,10 @@ class PresidentialWinners(commands.Cog):
 
         # Add presidential winners to all_winners system
         if all_winners_entries:
-            if "winners" not in winners_config:
-                winners_config["winners"] = []
-            winners_config["winners"].extend(all_winners_entries)
-
-            winners_col.update_one(
-                {"guild_id": guild_id},
-                {"$set": {"winners": winners_config["winners"]}}
-            )
+            # $push appends without rewriting (and clobbering) the rest of the array
+            query, update = apply_once(guild_id, {"$push": {"winners": {"$each": all_winners_entries}}}, once_key)
+            if not winners_col.update_one(query, update).modified_count:
+                return
 
             print(f"Transferred {len(all_winners_entries)} presidential primary winners to all_winners system for guild {guild_id}")
 
@@ -952,6 +941,11 @@ class PresidentialWinners(commands.Cog):
         PRESIDENTIAL_STATE_DATA[state_upper]["democrat"] = round(democrat, 1)
         PRESIDENTIAL_STATE_DATA[state_upper]["other"] = round(other, 1)
 
+        # The baseline is shared by every guild's electoral map
+        electoral_cog = self.bot.get_cog("ElectoralCollege")
+        if electoral_cog:
+            electoral_cog.touch(None, state_upper)
+
         # Create response embed
         embed = discord.Embed(
             title="📊 State Base Percentages Updated",
@@ -0,0 +1,72 @@
+from typing import Iterable, List, Optional
+import re
+
+
+def _element_condition(key: str, value, ignore_case: bool) -> dict:
+    field = f"$$entry.{key}"
+    if isinstance(value, (list, tuple, set)):
+        return {"$in": [field, list(value)]}
+    if ignore_case and isinstance(value, str):
+        return {"$eq": [{"$toLower": {"$ifNull": [field, ""]}}, value.lower()]}
+    return {"$eq": [field, value]}
+
+
+def array_filter(field: str, match: dict, ignore_case: Iterable[str] = (), contains: Optional[dict] = None) -> dict:
+    """$filter expression keeping the entries of `field` whose keys equal `match`.
+
+    List values match any of their items; keys named in ignore_case compare
+    lowercased, like the .lower() == .lower() checks they replace. `contains`
+    maps keys to case-insensitive substrings, for autocomplete.
+    """
+    ignore_case = set(ignore_case)
+    conditions = [_element_condition(key, value, key in ignore_case) for key, value in match.items()]
+    for key, text in (contains or {}).items():
+        if text:
+            conditions.append({"$regexMatch": {
+                "input": {"$ifNull": [f"$$entry.{key}", ""]}, "regex": re.escape(text), "options": "i"
+            }})
+    return {
+        "$filter": {
+            # Some guild documents keep a dict under the same name (presidential_winners.winners)
+            "input": {"$cond": [{"$isArray": f"${field}"}, f"${field}", []]},
+            "as": "entry",
+            "cond": {"$and": conditions} if conditions else True,
+        }
+    }
+
+
+def find_entries(collection, guild_id: int, field: str, match: dict, ignore_case: Iterable[str] = (),
+                 contains: Optional[dict] = None, limit: Optional[int] = None,
+                 fields: Optional[Iterable[str]] = None) -> Optional[List[dict]]:
+    """Matching entries of a guild document's array, filtered server side.
+
+    Only the matching entries cross the wire instead of the whole document, and
+    with `fields` only those keys of each entry. Returns None when the guild has
+    no document at all, [] when nothing matched.
+    """
+    entries = array_filter(field, match, ignore_case, contains)
+    if limit is not None:
+        entries = {"$slice": [entries, limit]}
+    if fields is not None:
+        entries = {"$map": {"input": entries, "as": "entry", "in": {key: f"$$entry.{key}" for key in fields}}}
+    pipeline = [
+        {"$match": {"guild_id": guild_id}},
+        {"$limit": 1},
+        {"$project": {"_id": 0, field: entries}},
+    ]
+    result = next(iter(collection.aggregate(pipeline)), None)
+    if result is None:
+        return None
+    return result.get(field, [])
+
+
+def find_entry(collection, guild_id: int, field: str, match: dict,
+               ignore_case: Iterable[str] = ()) -> Optional[dict]:
+    """First matching entry, or None (whether or not the guild document exists)"""
+    entries = find_entries(collection, guild_id, field, match, ignore_case=ignore_case, limit=1)
+    return entries[0] if entries else None
+
+
+def find_fields(collection, guild_id: int, *fields: str) -> Optional[dict]:
+    """The guild document with only the named top-level fields"""
+    return collection.find_one({"guild_id": guild_id}, {"_id": 0, **{field: 1 for field in fields}})
@@ -0,0 +1,160 @@
+from discord.ext import commands
+import discord
+import asyncio
+import time
+from typing import Dict, List, Optional
+
+WHEEL_SLOTS = 512  # One slot per second; covers the 300s reply window without wrapping
+TICK_SECONDS = 1.0
+
+
+class PendingReply:
+    """A command waiting for a specific user to reply to a specific bot message"""
+
+    __slots__ = ("message_id", "author_id", "require_attachments", "future", "rounds")
+
+    def __init__(self, message_id: int, author_id: int, require_attachments: bool, future: asyncio.Future):
+        self.message_id = message_id
+        self.author_id = author_id
+        self.require_attachments = require_attachments
+        self.future = future
+        self.rounds = 0
+
+    def matches(self, message: discord.Message) -> bool:
+        if message.author.id != self.author_id:
+            return False
+        return not self.require_attachments or len(message.attachments) > 0
+
+
+class TimerWheel:
+    """Hashed timing wheel: O(1) schedule, expiry work proportional to what actually expires"""
+
+    def __init__(self, slots: int = WHEEL_SLOTS, tick: float = TICK_SECONDS):
+        self.slots: List[List[PendingReply]] = [[] for _ in range(slots)]
+        self.tick = tick
+        self.cursor = 0
+        self.last_tick = time.monotonic()
+
+    def schedule(self, entry: PendingReply, timeout: float):
+        ticks = max(1, int(timeout / self.tick + 0.999))
+        entry.rounds, offset = divmod(ticks - 1, len(self.slots))
+        self.slots[(self.cursor + offset + 1) % len(self.slots)].append(entry)
+
+    def advance(self, now: float) -> List[PendingReply]:
+        """Move the wheel up to now and return entries whose timeout elapsed"""
+        expired = []
+        while now - self.last_tick >= self.tick:
+            self.last_tick += self.tick
+            self.cursor = (self.cursor + 1) % len(self.slots)
+            slot = self.slots[self.cursor]
+            if not slot:
+                continue
+            remaining = []
+            for entry in slot:
+                if entry.future.done():
+                    continue  # Already answered or cancelled
+                if entry.rounds > 0:
+                    entry.rounds -= 1
+                    remaining.append(entry)
+                else:
+                    expired.append(entry)
+            self.slots[self.cursor] = remaining
+        return expired
+
+
+class ReplyRouter(commands.Cog):
+    """Routes replies to the speech/donor/ad prompts that are waiting for them.
+
+    Replaces one bot.wait_for('message') check per pending prompt (run against every
+    message) with a single listener and a dict lookup on the referenced message id.
+    """
+
+    def __init__(self, bot):
+        self.bot = bot
+        self.pending: Dict[int, List[PendingReply]] = {}
+        self.wheel = TimerWheel()
+        self._expiry_task: Optional[asyncio.Task] = None
+        print("ReplyRouter cog loaded successfully")
+
+    async def cog_load(self):
+        self._expiry_task = asyncio.create_task(self._expire_loop())
+
+    def cog_unload(self):
+        if self._expiry_task:
+            self._expiry_task.cancel()
+        for waiters in self.pending.values():
+            for entry in waiters:
+                if not entry.future.done():
+                    entry.future.cancel()
+        self.pending.clear()
+
+    def register(self, message_id: int, author_id: int, timeout: float = 300.0,
+                 require_attachments: bool = False) -> asyncio.Future:
+        future = asyncio.get_running_loop().create_future()
+        entry = PendingReply(message_id, author_id, require_attachments, future)
+        self.pending.setdefault(message_id, []).append(entry)
+        self.wheel.schedule(entry, timeout)
+        # Covers answer, expiry and the waiting command being cancelled
+        future.add_done_callback(lambda _: self._discard(entry))
+        return future
+
+    def _discard(self, entry: PendingReply):
+        waiters = self.pending.get(entry.message_id)
+        if not waiters:
+            return
+        try:
+            waiters.remove(entry)
+        except ValueError:
+            return
+        if not waiters:
+            del self.pending[entry.message_id]
+
+    def dispatch(self, message: discord.Message) -> bool:
+        """Resolve the waiter this message answers, if any. Returns True if one was resolved."""
+        reference = message.reference
+        if reference is None or reference.message_id is None:
+            return False
+        waiters = self.pending.get(reference.message_id)
+        if not waiters:
+            return False
+        for entry in waiters:
+            if not entry.future.done() and entry.matches(message):
+                entry.future.set_result(message)
+                return True
+        return False
+
+    def expire(self, now: float = None) -> int:
+        expired = self.wheel.advance(time.monotonic() if now is None else now)
+        for entry in expired:
+            if not entry.future.done():
+                entry.future.set_exception(asyncio.TimeoutError())
+        return len(expired)
+
+    async def _expire_loop(self):
+        while True:
+            await asyncio.sleep(self.wheel.tick)
+            self.expire()
+
+    @commands.Cog.listener()
+    async def on_message(self, message: discord.Message):
+        if message.reference is None or message.author.bot:
+            return
+        self.dispatch(message)
+
+
+async def wait_for_reply(bot, message_id: int, author_id: int, timeout: float = 300.0,
+                         require_attachments: bool = False) -> discord.Message:
+    """Wait for author_id to reply to message_id. Raises asyncio.TimeoutError like bot.wait_for."""
+    router = bot.get_cog("ReplyRouter")
+    if router is None:
+        def check(message):
+            return (message.author.id == author_id and
+                    message.reference and
+                    message.reference.message_id == message_id and
+                    (not require_attachments or len(message.attachments) > 0))
+        return await bot.wait_for('message', timeout=timeout, check=check)
+    return await router.register(message_id, author_id, timeout, require_attachments)
+
+
+async def setup(bot):
+    await bot.add_cog(ReplyRouter(bot))
@@ -2,6 +2,19 @@ from discord.ext import commands
 import discord
 from discord import app_commands
 from datetime import datetime
+from .config_registry import configs
+
+
+def _default_guild_config():
+    return {
+        "regions": [],       # list of state codes
+        "start_datetime": None,
+        "announcement_channel_id": None
+    }
+
+
+configs.register("guild_configs", _default_guild_config)
+
 
 class Setup(commands.Cog):
     def __init__(self, bot):
@@ -13,16 +26,7 @@ class Setup(commands.Cog):
         Returns (or creates) the config document for this guild.
         """
         col = self.bot.db["guild_configs"]
-        config = col.find_one({"guild_id": guild_id})
-        if not config:
-            config = {
-                "guild_id": guild_id,
-                "regions": [],       # list of state codes
-                "start_datetime": None,
-                "announcement_channel_id": None
-            }
-            col.insert_one(config)
-        return col, config
+        return col, configs.get(col, guild_id)
 
     # Create a command group
     setup_group = app_commands.Group(
@@ -0,0 +1,138 @@
+from discord.ext import commands, tasks
+from datetime import datetime, timedelta
+from typing import List, Optional
+import asyncio
+import os
+import socket
+
+from pymongo.errors import DuplicateKeyError, PyMongoError
+
+from .instrumentation import timed_loop
+
+LEASE_TTL = int(os.getenv("LEADER_LEASE_SECONDS", "30"))  # A dead leader is replaced within this long
+LEASE_NAME = "global"
+
+
+def parse_shard_ids(spec: Optional[str]) -> Optional[List[int]]:
+    """SHARD_IDS env value ("0-3", "0,2,4" or "0-1,6") -> shard id list, None when unset"""
+    if not spec or not spec.strip():
+        return None
+    shard_ids = []
+    for part in spec.split(","):
+        part = part.strip()
+        if "-" in part:
+            first, last = part.split("-", 1)
+            shard_ids.extend(range(int(first), int(last) + 1))
+        elif part:
+            shard_ids.append(int(part))
+    return sorted(set(shard_ids))
+
+
+def shard_for_guild(guild_id: int, shard_count: int) -> int:
+    """Discord's routing rule: which shard a guild's events arrive on"""
+    return (guild_id >> 22) % shard_count
+
+
+def local_guilds_filter(bot) -> dict:
+    """Mongo filter for the per-guild documents this process owns.
+
+    bot.guilds only holds guilds on this process's shards, so background loops
+    using it never load (or act on) another process's guilds.
+    """
+    return {"guild_id": {"$in": [guild.id for guild in bot.guilds]}}
+
+
+def process_holder_id(bot=None) -> str:
+    shard_ids = getattr(bot, "shard_ids", None)
+    shards = ",".join(map(str, shard_ids)) if shard_ids else "all"
+    return f"{socket.gethostname()}:{os.getpid()}:shards={shards}"
+
+
+class LeaderLease:
+    """A named lease in the `leases` collection, held by at most one process at a time.
+
+    The holder renews it well within `ttl`; once it stops (crash, shutdown, lost
+    connection) any other process can take it over after expiry. Taking and
+    renewing is one conditional upsert: it matches only when we already hold the
+    lease or it expired, and the insert half fails on the unique _id otherwise.
+    """
+
+    def __init__(self, col, name: str, holder: str, ttl: int = LEASE_TTL):
+        self.col = col
+        self.name = name
+        self.holder = holder
+        self.ttl = ttl
+
+    def try_acquire(self) -> bool:
+        now = datetime.utcnow()
+        try:
+            self.col.find_one_and_update(
+                {"_id": self.name, "$or": [{"holder": self.holder}, {"expires_at": {"$lt": now}}]},
+                {"$set": {"holder": self.holder, "expires_at": now + timedelta(seconds=self.ttl), "renewed_at": now}},
+                upsert=True
+            )
+            return True
+        except DuplicateKeyError:
+            return False  # Held by someone else and not expired
+
+    def release(self):
+        self.col.delete_one({"_id": self.name, "holder": self.holder})
+
+    def current_holder(self) -> Optional[str]:
+        lease = self.col.find_one({"_id": self.name})
+        if not lease or lease["expires_at"] < datetime.utcnow():
+            return None
+        return lease["holder"]
+
+
+class Leadership(commands.Cog):
+    """Elects one process (of several sharded ones) to run global, not per-guild, duties.
+
+    Per-guild work belongs to whichever process owns the guild's shard; anything
+    that must run once per deployment (command tree sync) checks `is_leader`
+    first. A `leadership_change(is_leader)` event is dispatched on every change.
+    """
+
+    def __init__(self, bot):
+        self.bot = bot
+        self.lease = LeaderLease(bot.db["leases"], LEASE_NAME, process_holder_id(bot))
+        self.is_leader = False
+        self.renew_loop.change_interval(seconds=max(1, LEASE_TTL / 3))
+        self.renew_loop.start()
+        print("Leadership cog loaded successfully")
+
+    def cog_unload(self):
+        self.renew_loop.cancel()
+        if self.is_leader:
+            try:
+                self.lease.release()  # Let the next process take over right away
+            except PyMongoError as e:
+                print(f"Could not release leader lease: {e}")
+
+    async def acquire(self) -> bool:
+        """Try for (or renew) the lease now; returns whether this process leads"""
+        try:
+            leader = await asyncio.to_thread(self.lease.try_acquire)
+        except PyMongoError as e:
+            print(f"Leader lease check failed: {e}")
+            leader = False  # Can't prove we still hold it
+        if leader != self.is_leader:
+            self.is_leader = leader
+            print(f"{'Acquired' if leader else 'Lost'} leadership ({self.lease.holder})")
+            self.bot.dispatch("leadership_change", leader)
+        return leader
+
+    @tasks.loop(seconds=10)
+    @timed_loop("sharding.renew_loop")
+    async def renew_loop(self):
+        await self.acquire()
+
+    @renew_loop.before_loop
+    async def before_renew_loop(self):
+        db_ready = getattr(self.bot, "db_ready", None)
+        if db_ready is not None:
+            await db_ready.wait()
+
+
+async def setup(bot):
+    await bot.add_cog(Leadership(bot))
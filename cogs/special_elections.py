@@ -5,6 +5,19 @@ from datetime import datetime, timedelta
 import random
 import asyncio
 from typing import Optional
+from .reply_router import wait_for_reply
+from .config_registry import configs
+
+
+def _default_special_config():
+    return {
+        "active_elections": [],
+        "completed_elections": []
+    }
+
+
+configs.register("special_elections", _default_special_config)
+
 
 class SpecialElections(commands.Cog):
     def __init__(self, bot):
@@ -25,15 +38,7 @@ class SpecialElections(commands.Cog):
     def _get_special_config(self, guild_id: int):
         """Get or create special elections configuration"""
         col = self.bot.db["special_elections"]
-        config = col.find_one({"guild_id": guild_id})
-        if not config:
-            config = {
-                "guild_id": guild_id,
-                "active_elections": [],
-                "completed_elections": []
-            }
-            col.insert_one(config)
-        return col, config
+        return col, configs.get(col, guild_id)
 
     def _get_elections_config(self, guild_id: int):
         """Get elections configuration to access seats"""
@@ -377,14 +382,9 @@ class SpecialElections(commands.Cog):
         # Get the response message
         response_message = await interaction.original_response()
 
-        def check(message):
-            return (message.author.id == interaction.user.id and 
-                    message.reference and 
-                    message.reference.message_id == response_message.id)
-
         try:
             # Wait for user to reply with speech
-            reply_message = await self.bot.wait_for('message', timeout=300.0, check=check)
+            reply_message = await wait_for_reply(self.bot, response_message.id, interaction.user.id, timeout=300.0)
 
             speech_content = reply_message.content
             char_count = len(speech_content)
@@ -773,15 +773,9 @@ class SpecialElections(commands.Cog):
         # Get the response message
         response_message = await interaction.original_response()
 
-        def check(message):
-            return (message.author.id == interaction.user.id and 
-                    message.reference and 
-                    message.reference.message_id == response_message.id and
-                    len(message.attachments) > 0)
-
         try:
             # Wait for user to reply with attachment
-            reply_message = await self.bot.wait_for('message', timeout=300.0, check=check)
+            reply_message = await wait_for_reply(self.bot, response_message.id, interaction.user.id, timeout=300.0, require_attachments=True)
 
             video = reply_message.attachments[0]
 
@@ -1172,31 +1166,24 @@ class SpecialElections(commands.Cog):
             "called_by": interaction.user.id
         }
 
-        # Add to database
+        # Add to database. $push/$set touch only the new election and the one seat,
+        # so concurrent updates to other elections or seats are never overwritten
         col, config = self._get_special_config(interaction.guild.id)
-        if "active_elections" not in config:
-            config["active_elections"] = []
-        config["active_elections"].append(new_election)
-
         col.update_one(
             {"guild_id": interaction.guild.id},
-            {"$set": {"active_elections": config["active_elections"]}}
+            {"$push": {"active_elections": new_election}}
         )
 
         # Mark seat as vacant in elections config
-        for i, seat in enumerate(elections_config["seats"]):
-            if seat["seat_id"].upper() == seat_id.upper():
-                elections_config["seats"][i].update({
-                    "current_holder": None,
-                    "current_holder_id": None,
-                    "up_for_election": True,
-                    "special_election": True
-                })
-                break
-
         elections_col.update_one(
             {"guild_id": interaction.guild.id},
-            {"$set": {"seats": elections_config["seats"]}}
+            {"$set": {
+                "seats.$[seat].current_holder": None,
+                "seats.$[seat].current_holder_id": None,
+                "seats.$[seat].up_for_election": True,
+                "seats.$[seat].special_election": True
+            }},
+            array_filters=[{"seat.seat_id": seat_info["seat_id"]}]
         )
 
         embed = discord.Embed(
@@ -2,12 +2,54 @@ import discord
 from discord.ext import commands, tasks
 from discord import app_commands
 import asyncio
+import time
 from datetime import datetime, timedelta
+from typing import Optional
 import pytz
+from .instrumentation import timed_loop
+from .archive import ARCHIVED_ARRAYS, archive_completed_cycles
+from .config_registry import NOW, configs
+from .guild_locks import guild_locks
+from .sharding import local_guilds_filter
+from .transitions import TransitionJournal
+from .catchup import last_instant, rp_timeline
+from .announcements import post_announcement
+
+CATCHUP_AFTER_MINUTES = 5  # A gap this long since the last tick means the bot was offline
+
+
+def _default_time_config():
+    return {
+        "minutes_per_rp_day": 28,  # Default: 28 minutes = 1 RP day
+        "current_rp_date": datetime(1999, 2, 1),  # Start at signups phase
+        "current_phase": "Signups",
+        "cycle_year": 1999,
+        "last_real_update": NOW,
+        "last_stamina_regen": datetime(1999, 1, 1),  # Track last stamina regeneration
+        "voice_channel_id": None,  # Specific voice channel to update
+        "update_voice_channels": True,  # Enable voice updates by default
+        "time_paused": False,  # Whether time progression is paused
+        "phases": [
+            {"name": "Signups", "start_month": 2, "end_month": 7},
+            {"name": "Primary Campaign", "start_month": 8, "end_month": 12},
+            {"name": "Primary Election", "start_month": 1, "end_month": 2},
+            {"name": "General Campaign", "start_month": 3, "end_month": 10},
+            {"name": "General Election", "start_month": 11, "end_month": 12}
+        ],
+        "regions": [
+            "Columbia", "Cambridge", "Superior", "Austin", 
+            "Heartland", "Yellowstone", "Phoenix"
+        ]
+    }
+
+
+configs.register("time_configs", _default_time_config)
+
 
 class TimeManager(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
+        self.journal = TransitionJournal(bot.db)
         self.time_loop.start()  # Start the time loop
         print("Time Manager cog loaded successfully")
 
@@ -22,34 +64,7 @@ class TimeManager(commands.Cog):
 
     def _get_time_config(self, guild_id: int):
         """Get or create time configuration for a guild"""
-        col = self.bot.db["time_configs"]
-        config = col.find_one({"guild_id": guild_id})
-        if not config:
-            config = {
-                "guild_id": guild_id,
-                "minutes_per_rp_day": 28,  # Default: 28 minutes = 1 RP day
-                "current_rp_date": datetime(1999, 2, 1),  # Start at signups phase
-                "current_phase": "Signups",
-                "cycle_year": 1999,
-                "last_real_update": datetime.utcnow(),
-                "last_stamina_regen": datetime(1999, 1, 1),  # Track last stamina regeneration
-                "voice_channel_id": None,  # Specific voice channel to update
-                "update_voice_channels": True,  # Enable voice updates by default
-                "time_paused": False,  # Whether time progression is paused
-                "phases": [
-                    {"name": "Signups", "start_month": 2, "end_month": 7},
-                    {"name": "Primary Campaign", "start_month": 8, "end_month": 12},
-                    {"name": "Primary Election", "start_month": 1, "end_month": 2},
-                    {"name": "General Campaign", "start_month": 3, "end_month": 10},
-                    {"name": "General Election", "start_month": 11, "end_month": 12}
-                ],
-                "regions": [
-                    "Columbia", "Cambridge", "Superior", "Austin", 
-                    "Heartland", "Yellowstone", "Phoenix"
-                ]
-            }
-            col.insert_one(config)
-        return config
+        return configs.get(self.bot.db["time_configs"], guild_id)
 
     def _calculate_current_rp_time(self, config):
         """Calculate current RP time based on real time elapsed"""
@@ -88,6 +103,158 @@ class TimeManager(commands.Cog):
 
         return "Between Phases"
 
+    async def _run_phase_transition(self, guild: discord.Guild, entry: dict, announce: bool = True) -> bool:
+        """Run (or resume) a journaled phase transition. Returns False if a step failed."""
+        guild_id = entry["guild_id"]
+        old_phase, new_phase, year = entry["old_phase"], entry["new_phase"], entry["year"]
+        try:
+            # Reset stamina when transitioning to General Campaign
+            if new_phase == "General Campaign":
+                await self.journal.step(entry, "reset_stamina", self._reset_stamina_for_general_campaign, guild_id, year)
+
+            # Hand the transition to the cogs that automate each phase
+            for step, cog_name in (("elections", "Elections"), ("all_winners", "AllWinners"),
+                                   ("presidential_winners", "PresidentialWinners")):
+                cog = self.bot.get_cog(cog_name)
+                if cog:
+                    await self.journal.step(entry, step, cog.on_phase_change, guild_id, old_phase, new_phase, year)
+
+            if entry.get("new_cycle"):
+                # Every cog is done with the finished cycle; move it out of the live documents
+                await self.journal.step(entry, "archive", self._archive_completed_cycle, guild_id, year)
+
+            # Candidates and points may have been reset; rebuild the electoral map on next use
+            electoral_cog = self.bot.get_cog("ElectoralCollege")
+            if electoral_cog:
+                electoral_cog.touch(guild_id)
+
+            if announce:
+                announcer = self._announce_new_cycle if entry.get("new_cycle") else self._announce_phase_change
+                await self.journal.step(entry, "announce", announcer, guild, entry)
+            self.journal.complete(entry)
+            return True
+        except Exception as e:
+            print(f"Phase transition {old_phase} -> {new_phase} failed for guild {guild_id}, will resume: {e}")
+            return False
+
+    async def _catch_up(self, guild: discord.Guild, config: dict, current_rp_date: datetime):
+        """Replay every RP event between the last processed date and now, in order.
+
+        Only kicks in after downtime (CATCHUP_AFTER_MINUTES without a tick) or when
+        more than one phase change is due; otherwise returns None and the loop's
+        normal single-transition path runs. Each missed transition goes through the
+        journal, state primaries due during a missed Primary Campaign are called in
+        one batch per campaign, and a single summary replaces the per-event
+        announcements. Returns the (date, phase) reached, or False if a step failed
+        (it resumes from there next minute).
+        """
+        transitions, segments, reached = rp_timeline(
+            config["current_rp_date"], config["current_phase"], current_rp_date,
+            lambda rp_date: self._get_current_phase(rp_date, config)
+        )
+        offline_minutes = (datetime.utcnow() - config["last_real_update"]).total_seconds() / 60
+        missed_campaign = any(segment.phase == "Primary Campaign" for segment in segments[:-1])
+        if len(transitions) <= 1 and not (offline_minutes >= CATCHUP_AFTER_MINUTES and missed_campaign):
+            return None
+
+        guild_id = guild.id
+        start = time.perf_counter()
+        called = []
+        try:
+            for index, segment in enumerate(segments):
+                is_last = index == len(segments) - 1
+                if segment.phase == "Primary Campaign":
+                    delegates_cog = self.bot.get_cog("Delegates")
+                    if delegates_cog:
+                        called.extend(await delegates_cog.call_due_primaries(
+                            guild, guild_id, last_instant(segment, is_last), announce=False
+                        ))
+                if is_last:
+                    break
+
+                transition = transitions[index]
+                entry = self.journal.begin(
+                    guild_id, transition.old_phase, transition.new_phase, transition.year,
+                    transition.rp_date, new_cycle=transition.new_cycle
+                )
+                if not await self._run_phase_transition(guild, entry, announce=False):
+                    return False
+        except Exception as e:
+            print(f"Catch-up failed for guild {guild_id}, will resume: {e}")
+            return False
+
+        print(f"Caught up guild {guild_id}: {len(transitions)} transitions, {len(called)} primaries "
+              f"in {(time.perf_counter() - start) * 1000:.0f}ms")
+        await self._announce_catch_up(guild, config["current_rp_date"], reached, segments[-1].phase, transitions, called)
+        return reached, segments[-1].phase
+
+    async def _announce_catch_up(self, guild: discord.Guild, from_date: datetime, to_date: datetime, phase: str,
+                                 transitions: list, called: list):
+        if not transitions and not called:
+            return
+
+        embed = discord.Embed(
+            title="⏩ Caught Up on Missed Time",
+            description=f"RP time moved on from **{from_date.strftime('%B %d, %Y')}** to "
+                        f"**{to_date.strftime('%B %d, %Y')}** while the bot was away.",
+            color=discord.Color.blue(),
+            timestamp=datetime.utcnow()
+        )
+        if transitions:
+            lines = [
+                f"{t.rp_date.strftime('%b %d, %Y')}: "
+                + (f"New {t.year} cycle" if t.new_cycle else f"{t.old_phase} → {t.new_phase}")
+                for t in transitions
+            ]
+            embed.add_field(name="Phase Changes", value="\n".join(lines)[:1024], inline=False)
+        if called:
+            by_party = {}
+            for result in called:
+                by_party.setdefault(result["party"], []).append(result["state"])
+            for party, states in by_party.items():
+                shown = ", ".join(states[:15]) + (f" and {len(states) - 15} more" if len(states) > 15 else "")
+                embed.add_field(name=f"{party} Primaries Called ({len(states)})", value=shown[:1024], inline=False)
+        embed.add_field(name="Current Phase", value=phase, inline=True)
+        post_announcement(self.bot, guild, embed=embed)
+
+    async def _announce_phase_change(self, guild: discord.Guild, entry: dict):
+        embed = discord.Embed(
+            title="🗳️ Election Phase Change",
+            description=f"We have entered the **{entry['new_phase']}** phase!",
+            color=discord.Color.green(),
+            timestamp=datetime.utcnow()
+        )
+        embed.add_field(
+            name="Current RP Date", 
+            value=entry["rp_date"].strftime("%B %d, %Y"), 
+            inline=True
+        )
+        post_announcement(self.bot, guild, embed=embed)
+
+    async def _announce_new_cycle(self, guild: discord.Guild, entry: dict):
+        embed = discord.Embed(
+            title="🔄 New Election Cycle Started!",
+            description=f"The {entry['year']} election cycle has begun! We are now in the **Signups** phase.",
+            color=discord.Color.gold(),
+            timestamp=datetime.utcnow()
+        )
+        embed.add_field(
+            name="New RP Date", 
+            value=entry["rp_date"].strftime("%B %d, %Y"), 
+            inline=True
+        )
+        post_announcement(self.bot, guild, embed=embed)
+
+    async def _archive_completed_cycle(self, guild_id: int, next_year: int):
+        """Move signups and winners of finished cycles into the yearly archive collections.
+
+        Errors propagate so the journal keeps the archive step pending and retries it.
+        """
+        async with guild_locks.write(guild_id, *ARCHIVED_ARRAYS):
+            moved = await asyncio.to_thread(archive_completed_cycles, self.bot.db, guild_id, next_year)
+        if moved:
+            print(f"Archived completed cycle for guild {guild_id}: {moved}")
+
     async def _reset_stamina_for_general_campaign(self, guild_id: int, year: int):
         """Resets stamina for all players in the general campaign phase."""
         # Reset general election candidates to 100 stamina
@@ -193,13 +360,22 @@ class TimeManager(commands.Cog):
 
 
     @tasks.loop(minutes=1)
+    @timed_loop("time_manager.time_loop")
     async def time_loop(self):
         """Update RP time every minute"""
         try:
             col = self.bot.db["time_configs"]
-            configs = col.find({})
+            guild_filter = local_guilds_filter(self.bot)  # Only guilds on this process's shards
+
+            # Finish transitions a crash or error interrupted before looking for new ones
+            for entry in self.journal.pending(guild_filter):
+                guild = self.bot.get_guild(entry["guild_id"])
+                if guild:
+                    await self._run_phase_transition(guild, entry)
 
-            for config in configs:
+            time_configs = col.find(guild_filter)
+
+            for config in time_configs:
                 # Skip time progression if paused
                 if config.get("time_paused", False):
                     continue
@@ -210,63 +386,23 @@ class TimeManager(commands.Cog):
                 if not guild:
                     continue
 
+                # Offline for a while, or more than one phase behind: replay what was missed in order
+                caught_up = await self._catch_up(guild, config, current_rp_date)
+                if caught_up is False:
+                    continue  # A step failed; resumed next minute
+                if caught_up:
+                    current_rp_date, current_phase = caught_up
+                    config["current_phase"] = current_phase
+                    self._voice_clock_changed(config["guild_id"])
+
                 # Check if phase changed
                 if current_phase != config["current_phase"]:
-                    # Phase transition occurred
-                    old_phase = config["current_phase"]
-
-                    # Reset stamina when transitioning to General Campaign
-                    if current_phase == "General Campaign":
-                        await self._reset_stamina_for_general_campaign(config["guild_id"], current_rp_date.year)
-
-                    # Dispatch event to elections cog for automatic handling
-                    elections_cog = self.bot.get_cog("Elections")
-                    if elections_cog:
-                        await elections_cog.on_phase_change(
-                            config["guild_id"], 
-                            old_phase, 
-                            current_phase, 
-                            current_rp_date.year
-                        )
-
-                    # Dispatch event to all_winners cog for automatic handling
-                    all_winners_cog = self.bot.get_cog("AllWinners")
-                    if all_winners_cog:
-                        await all_winners_cog.on_phase_change(
-                            config["guild_id"], 
-                            old_phase, 
-                            current_phase, 
-                            current_rp_date.year
-                        )
-
-                    # Dispatch event to presidential_winners cog for automatic handling
-                    pres_winners_cog = self.bot.get_cog("PresidentialWinners")
-                    if pres_winners_cog:
-                        await pres_winners_cog.on_phase_change(
-                            config["guild_id"], 
-                            old_phase, 
-                            current_phase, 
-                            current_rp_date.year
-                        )
-
-                    # Find a general channel to announce phase change
-                    channel = discord.utils.get(guild.channels, name="general") or guild.system_channel
-                    if channel:
-                        embed = discord.Embed(
-                            title="🗳️ Election Phase Change",
-                            description=f"We have entered the **{current_phase}** phase!",
-                            color=discord.Color.green(),
-                            timestamp=datetime.utcnow()
-                        )
-                        embed.add_field(
-                            name="Current RP Date", 
-                            value=current_rp_date.strftime("%B %d, %Y"), 
-                            inline=True
-                        )
-                        try:
-                            await channel.send(embed=embed)
-                        except:
-                            pass  # Ignore if can't send message
+                    entry = self.journal.begin(
+                        config["guild_id"], config["current_phase"], current_phase,
+                        current_rp_date.year, current_rp_date
+                    )
+                    if not await self._run_phase_transition(guild, entry):
+                        continue  # Retried (from the failed step) next minute; keep the old phase until then
 
                 # Check if 24 hours have passed for stamina regeneration
                 last_stamina_regen = config.get("last_stamina_regen", datetime(1999, 1, 1))
@@ -304,6 +440,12 @@ class TimeManager(commands.Cog):
                     next_year = current_rp_date.year + 1
                     new_rp_date = datetime(next_year, 2, 1)
 
+                    entry = self.journal.begin(
+                        config["guild_id"], "General Election", "Signups", next_year, new_rp_date, new_cycle=True
+                    )
+                    if not await self._run_phase_transition(guild, entry):
+                        continue
+
                     col.update_one(
                         {"guild_id": config["guild_id"]},
                         {
@@ -314,89 +456,20 @@ class TimeManager(commands.Cog):
                             }
                         }
                     )
-
-                    # Dispatch event to elections cog for new cycle automation
-                    elections_cog = self.bot.get_cog("Elections")
-                    if elections_cog:
-                        await elections_cog.on_phase_change(
-                            config["guild_id"], 
-                            "General Election", 
-                            "Signups", 
-                            next_year
-                        )
-
-                    # Dispatch event to all_winners cog for new cycle automation
-                    all_winners_cog = self.bot.get_cog("AllWinners")
-                    if all_winners_cog:
-                        await all_winners_cog.on_phase_change(
-                            config["guild_id"], 
-                            "General Election", 
-                            "Signups", 
-                            next_year
-                        )
-
-                    # Dispatch event to presidential_winners cog for new cycle automation
-                    pres_winners_cog = self.bot.get_cog("PresidentialWinners")
-                    if pres_winners_cog:
-                        await pres_winners_cog.on_phase_change(
-                            config["guild_id"], 
-                            "General Election", 
-                            "Signups", 
-                            next_year
-                        )
-
-                    # Announce new cycle
-                    channel = discord.utils.get(guild.channels, name="general") or guild.system_channel
-                    if channel:
-                        embed = discord.Embed(
-                            title="🔄 New Election Cycle Started!",
-                            description=f"The {next_year} election cycle has begun! We are now in the **Signups** phase.",
-                            color=discord.Color.gold(),
-                            timestamp=datetime.utcnow()
-                        )
-                        embed.add_field(
-                            name="New RP Date", 
-                            value=new_rp_date.strftime("%B %d, %Y"), 
-                            inline=True
-                        )
-                        try:
-                            await channel.send(embed=embed)
-                        except:
-                            pass
-
-                # Update voice channel if enabled and configured
-                if (config.get("update_voice_channels", True) and 
-                    config.get("voice_channel_id")):
-                    date_string = current_rp_date.strftime("%B %d, %Y")
-                    channel = guild.get_channel(config["voice_channel_id"])
-                    if channel and hasattr(channel, 'edit'):  # Check if it's a voice channel
-                        try:
-                            new_name = f"📅 {date_string}"
-                            # Force update if names don't match or if there's a significant time difference
-                            current_name = channel.name
-                            should_update = (current_name != new_name or 
-                                           not current_name.startswith("📅") or
-                                           "1999" not in current_name)
-
-                            if should_update:
-                                await channel.edit(name=new_name)
-                                print(f"Updated voice channel from '{current_name}' to: {new_name}")
-                        except Exception as e:
-                            print(f"Failed to update voice channel: {e}")
-                            # Try again in next loop iteration
-                            pass
+                    self._voice_clock_changed(config["guild_id"])  # The date jumped to Feb 1
 
         except Exception as e:
             print(f"Error in time loop: {e}")
 
     @tasks.loop(minutes=1)
+    @timed_loop("time_manager.time_ticker")
     async def time_ticker(self): # Renamed from time_loop to time_ticker to avoid conflict
         """Update RP time every minute"""
         try:
             col = self.bot.db["time_configs"]
-            configs = col.find({})
+            time_configs = col.find({})
 
-            for config in configs:
+            for config in time_configs:
                 # Skip time progression if paused
                 if config.get("time_paused", False):
                     continue
@@ -587,13 +660,14 @@ class TimeManager(commands.Cog):
             print(f"Error in time loop: {e}")
 
     @tasks.loop(minutes=1)
+    @timed_loop("time_manager.time_ticker")
     async def time_ticker(self): # Renamed from time_loop to time_ticker to avoid conflict
         """Update RP time every minute"""
         try:
             col = self.bot.db["time_configs"]
-            configs = col.find({})
+            time_configs = col.find({})
 
-            for config in configs:
+            for config in time_configs:
                 # Skip time progression if paused
                 if config.get("time_paused", False):
                     continue
@@ -784,13 +858,14 @@ class TimeManager(commands.Cog):
             print(f"Error in time loop: {e}")
 
     @tasks.loop(minutes=1)
+    @timed_loop("time_manager.time_ticker")
     async def time_ticker(self): # Renamed from time_loop to time_ticker to avoid conflict
         """Update RP time every minute"""
         try:
             col = self.bot.db["time_configs"]
-            configs = col.find({})
+            time_configs = col.find({})
 
-            for config in configs:
+            for config in time_configs:
                 # Skip time progression if paused
                 if config.get("time_paused", False):
                     continue
@@ -981,13 +1056,14 @@ class TimeManager(commands.Cog):
             print(f"Error in time loop: {e}")
 
     @tasks.loop(minutes=1)
+    @timed_loop("time_manager.time_ticker")
     async def time_ticker(self): # Renamed from time_loop to time_ticker to avoid conflict
         """Update RP time every minute"""
         try:
             col = self.bot.db["time_configs"]
-            configs = col.find({})
+            time_configs = col.find({})
 
-            for config in configs:
+            for config in time_configs:
                 # Skip time progression if paused
                 if config.get("time_paused", False):
                     continue
@@ -1256,6 +1332,9 @@ class TimeManager(commands.Cog):
         # Determine the new phase
         new_phase = self._get_current_phase(new_date, config)
 
+        # Transitions after the new date can happen again
+        self.journal.forget(interaction.guild.id, new_date)
+
         # Update the configuration
         col.update_one(
             {"guild_id": interaction.guild.id},
@@ -1268,6 +1347,8 @@ class TimeManager(commands.Cog):
             }
         )
 
+        self._voice_clock_changed(interaction.guild.id)
+
         embed = discord.Embed(
             title="🕒 RP Time Updated",
             color=discord.Color.green(),
@@ -1317,6 +1398,8 @@ class TimeManager(commands.Cog):
             }
         )
 
+        self._voice_clock_changed(interaction.guild.id)
+
         await interaction.response.send_message(
             f"✅ Time scale updated: {minutes_per_day} real minutes = 1 RP day",
             ephemeral=True
@@ -1334,6 +1417,7 @@ class TimeManager(commands.Cog):
         current_year = config["current_rp_date"].year
         # Find next odd year for signups
         next_signup_year = current_year + 1 if current_year % 2 == 0 else current_year + 2
+        self.journal.forget(interaction.guild.id, datetime(next_signup_year, 2, 1))
 
         col.update_one(
             {"guild_id": interaction.guild.id},
@@ -1347,6 +1431,8 @@ class TimeManager(commands.Cog):
             }
         )
 
+        self._voice_clock_changed(interaction.guild.id)
+
         await interaction.response.send_message(
             f"✅ Election cycle reset! Now in Signups phase for {next_signup_year} cycle.",
             ephemeral=True
@@ -1484,6 +1570,8 @@ class TimeManager(commands.Cog):
             {"$set": {"voice_channel_id": channel.id}}
         )
 
+        self._voice_clock_changed(interaction.guild.id)
+
         await interaction.response.send_message(
             f"✅ Voice channel set to {channel.mention}. It will be updated with the current RP date.",
             ephemeral=True
@@ -1506,6 +1594,8 @@ class TimeManager(commands.Cog):
             {"$set": {"update_voice_channels": new_setting}}
         )
 
+        self._voice_clock_changed(interaction.guild.id)
+
         status = "enabled" if new_setting else "disabled"
         await interaction.response.send_message(
             f"✅ Voice channel date updates have been **{status}**.",
@@ -1518,39 +1608,21 @@ class TimeManager(commands.Cog):
         description="Manually update the configured voice channel with current RP date"
     )
     async def update_voice_channel(self, interaction: discord.Interaction):
-        config = self._get_time_config(interaction.guild.id)
-        col = self.bot.db["time_configs"]
-
-        if not config.get("voice_channel_id"):
-            await interaction.response.send_message(
-                "❌ No voice channel configured. Use `/set_voice_channel` first.",
-                ephemeral=True
-            )
+        result = await self._sync_voice_clock(interaction)
+        if result is None:
             return
 
-        current_rp_date, current_phase = self._calculate_current_rp_time(config)
-        date_string = current_rp_date.strftime("%B %d, %Y")
-
-        channel = interaction.guild.get_channel(config["voice_channel_id"])
-        if not channel:
-            await interaction.response.send_message(
-                "❌ Configured voice channel not found.",
-                ephemeral=True
-            )
-            return
-
-        try:
-            new_name = f"📅 {date_string}"
-            await channel.edit(name=new_name)
-            await interaction.response.send_message(
-                f"✅ Updated {channel.mention} with date: **{date_string}**",
-                ephemeral=True
-            )
-        except Exception as e:
-            await interaction.response.send_message(
-                f"❌ Failed to update voice channel: {str(e)}",
-                ephemeral=True
-            )
+        channel, new_name = result["channel"], result["new_name"]
+        if result["status"] == "renamed":
+            message = f"✅ Updated {channel.mention} with date: **{new_name[2:]}**"
+        elif result["status"] == "unchanged":
+            message = f"✅ {channel.mention} already shows **{new_name[2:]}**"
+        elif result["status"] == "queued":
+            message = (f"⏳ {channel.mention} was renamed recently; Discord allows 2 renames per 10 minutes. "
+                       f"It will update in about {result['retry_in'] / 60:.0f} min.")
+        else:
+            message = f"❌ Failed to update voice channel: {result.get('error', 'unknown error')}"
+        await interaction.followup.send(message, ephemeral=True)
 
     @app_commands.checks.has_permissions(administrator=True)
     @time_admin_group.command(
@@ -1574,6 +1646,8 @@ class TimeManager(commands.Cog):
             {"$set": update_data}
         )
 
+        self._voice_clock_changed(interaction.guild.id)
+
         status = "paused" if new_paused else "resumed"
         embed = discord.Embed(
             title="⏸️ Time Control" if new_paused else "▶️ Time Control",
@@ -1634,76 +1708,75 @@ class TimeManager(commands.Cog):
         description="Force sync the voice channel name with current RP date (Admin only)"
     )
     async def force_sync_voice(self, interaction: discord.Interaction):
-        config = self._get_time_config(interaction.guild.id)
-
-        if not config.get("voice_channel_id"):
-            await interaction.response.send_message(
-                "❌ No voice channel configured. Use `/time admin set_voice_channel` first.",
-                ephemeral=True
-            )
+        result = await self._sync_voice_clock(interaction)
+        if result is None:
             return
 
-        current_rp_date, current_phase = self._calculate_current_rp_time(config)
-        date_string = current_rp_date.strftime("%B %d, %Y")
-
-        channel = interaction.guild.get_channel(config["voice_channel_id"])
-        if not channel:
-            await interaction.response.send_message(
-                "❌ Configured voice channel not found. It may have been deleted.",
+        if result["status"] == "failed":
+            await interaction.followup.send(
+                f"❌ Failed to update voice channel: {result.get('error', 'unknown error')}",
                 ephemeral=True
             )
             return
 
-        if not hasattr(channel, 'edit'):
-            await interaction.response.send_message(
-                "❌ The configured channel is not a voice channel.",
-                ephemeral=True
-            )
-            return
-
-        try:
-            new_name = f"📅 {date_string}"
-            old_name = channel.name
-            await channel.edit(name=new_name)
-            
-            embed = discord.Embed(
-                title="🔄 Voice Channel Synced",
-                description="Successfully updated voice channel with current RP date.",
-                color=discord.Color.green(),
-                timestamp=datetime.utcnow()
-            )
-            
-            embed.add_field(
-                name="Channel Updated",
-                value=f"{channel.mention}",
-                inline=True
-            )
-            
-            embed.add_field(
-                name="Old Name",
-                value=f"`{old_name}`",
-                inline=True
-            )
-            
-            embed.add_field(
-                name="New Name",
-                value=f"`{new_name}`",
-                inline=True
-            )
-            
-            embed.add_field(
-                name="Current RP Date",
-                value=date_string,
-                inline=False
-            )
+        descriptions = {
+            "renamed": "Successfully updated voice channel with current RP date.",
+            "unchanged": "The voice channel already shows the current RP date.",
+            "queued": (f"Discord allows 2 renames per channel every 10 minutes; the rename is queued "
+                       f"and runs in about {result.get('retry_in', 0) / 60:.0f} min."),
+        }
+        embed = discord.Embed(
+            title="🔄 Voice Channel Synced" if result["status"] != "queued" else "⏳ Voice Channel Sync Queued",
+            description=descriptions[result["status"]],
+            color=discord.Color.green() if result["status"] != "queued" else discord.Color.orange(),
+            timestamp=datetime.utcnow()
+        )
+        
+        embed.add_field(
+            name="Channel Updated",
+            value=f"{result['channel'].mention}",
+            inline=True
+        )
+        
+        embed.add_field(
+            name="Old Name",
+            value=f"`{result['old_name']}`",
+            inline=True
+        )
+        
+        embed.add_field(
+            name="New Name",
+            value=f"`{result['new_name']}`",
+            inline=True
+        )
 
-            await interaction.response.send_message(embed=embed, ephemeral=True)
-            
-        except Exception as e:
-            await interaction.response.send_message(
-                f"❌ Failed to update voice channel: {str(e)}",
-                ephemeral=True
-            )
+        await interaction.followup.send(embed=embed, ephemeral=True)
+
+    async def _sync_voice_clock(self, interaction: discord.Interaction) -> Optional[dict]:
+        """Shared by update_voice_channel and force_sync_voice; defers the response, None once an error was sent"""
+        # sync_now can wait on the guild's rename lock and a slow channel.edit, past the 3s interaction deadline
+        await interaction.response.defer(ephemeral=True)
+        voice_clock = self.bot.get_cog("VoiceClock")
+        if not voice_clock:
+            await interaction.followup.send("❌ Voice clock is not loaded.", ephemeral=True)
+            return None
+
+        result = await voice_clock.sync_now(interaction.guild.id)
+        errors = {
+            "not_configured": "❌ No voice channel configured. Use `/time admin set_voice_channel` first.",
+            "missing": "❌ Configured voice channel not found. It may have been deleted.",
+            "not_voice": "❌ The configured channel is not a voice channel.",
+        }
+        if result["status"] in errors:
+            await interaction.followup.send(errors[result["status"]], ephemeral=True)
+            return None
+        return result
+
+    def _voice_clock_changed(self, guild_id: int):
+        """The RP clock or voice settings changed; let the voice clock recompute its schedule"""
+        voice_clock = self.bot.get_cog("VoiceClock")
+        if voice_clock:
+            voice_clock.schedule(guild_id)
 
 async def setup(bot):
     await bot.add_cog(TimeManager(bot))
\ No newline at end of file
@@ -0,0 +1,69 @@
+from typing import Optional
+import json
+import os
+import time
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# JSON lines, one per slash command; replayed by benchmarks.replay
+TRACE_FILE = os.getenv("TRAFFIC_TRACE_FILE", os.path.join(ROOT_DIR, "traffic_trace.jsonl"))
+
+
+def option_values(options: Optional[list]) -> dict:
+    """Leaf option values of a slash command payload by name, subcommand levels skipped"""
+    values = {}
+    for option in options or []:
+        if option.get("type") in (1, 2):  # SUB_COMMAND, SUB_COMMAND_GROUP
+            values.update(option_values(option.get("options")))
+        elif "value" in option:
+            values[option["name"]] = option["value"]
+    return values
+
+
+class TrafficRecorder:
+    """Opt-in trace of incoming slash commands, enabled with TRAFFIC_TRACE=1 or the admin command.
+
+    Each line holds the arrival time, qualified command name, option values (user,
+    channel and role options as ids), guild, user and whether the user is an
+    administrator. Options are whatever users typed and the ids are real, so keep
+    trace files as carefully as the database.
+    """
+
+    def __init__(self, enabled: bool = False, path: str = TRACE_FILE):
+        self.path = path
+        self.recorded = 0
+        self._file = None
+        if enabled:
+            self.start()
+
+    @property
+    def enabled(self) -> bool:
+        return self._file is not None
+
+    def start(self, path: Optional[str] = None):
+        self.stop()
+        self.path = path or self.path
+        self._file = open(self.path, "a", encoding="utf-8", buffering=1)  # Line buffered: one write per command
+
+    def stop(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def record(self, interaction, name: str):
+        if self._file is None:
+            return
+        permissions = getattr(interaction.user, "guild_permissions", None)
+        entry = {
+            "at": round(time.time(), 3),
+            "command": name,
+            "options": option_values((interaction.data or {}).get("options")),
+            "guild_id": interaction.guild_id,
+            "user_id": interaction.user.id,
+            "admin": bool(permissions and permissions.administrator),
+        }
+        try:
+            self._file.write(json.dumps(entry, ensure_ascii=False) + "\n")
+            self.recorded += 1
+        except (OSError, ValueError) as e:
+            print(f"Could not write traffic trace {self.path}, recording stopped: {e}")
+            self.stop()
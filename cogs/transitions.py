@@ -0,0 +1,112 @@
+from datetime import datetime
+from typing import List, Optional, Tuple
+import inspect
+import re
+
+from pymongo import ReturnDocument
+
+JOURNAL_COLLECTION = "phase_transitions"
+ONCE_COLLECTIONS = ["winners"]  # Collections whose guild documents carry apply_once markers
+
+_indexed = set()  # Databases whose journal index this process already ensured
+
+
+def transition_key(old_phase: str, new_phase: str, year: int, step: Optional[str] = None) -> str:
+    """Stable name for one transition of a guild (and optionally one step of it)"""
+    key = f"{year}:{old_phase}->{new_phase}"
+    return f"{key}:{step}" if step else key
+
+
+def apply_once(guild_id: int, update: dict, key: Optional[str] = None) -> Tuple[dict, dict]:
+    """Filter and update that apply `update` to the guild document at most once per key.
+
+    The key is recorded in the document's applied_transitions in the same atomic
+    update, so a step re-run after a crash matches nothing instead of appending its
+    entries a second time. With key None the update applies unconditionally
+    (manual admin reruns).
+    """
+    query = {"guild_id": guild_id}
+    if key is None:
+        return query, update
+    query["applied_transitions"] = {"$ne": key}
+    return query, dict(update, **{"$addToSet": {"applied_transitions": key}})
+
+
+class TransitionJournal:
+    """Per guild and year record of which steps of a phase transition have finished.
+
+    TimeManager opens an entry before running a transition, marks each step as it
+    completes and closes the entry before it persists the new phase. After a crash
+    the transition is detected again (or found still open) and resumes at the first
+    unfinished step; finished steps are never run twice.
+    """
+
+    def __init__(self, db):
+        self.db = db
+        self.col = db[JOURNAL_COLLECTION]
+        self.db_name = db.name
+
+    def _ensure_index(self):
+        if self.db_name in _indexed:
+            return
+        self.col.create_index([("guild_id", 1), ("completed_at", 1)])
+        _indexed.add(self.db_name)
+
+    def begin(self, guild_id: int, old_phase: str, new_phase: str, year: int,
+              rp_date: datetime, new_cycle: bool = False) -> dict:
+        """The journal entry for this transition, opened if it isn't there yet"""
+        self._ensure_index()
+        return self.col.find_one_and_update(
+            {"_id": f"{guild_id}:{transition_key(old_phase, new_phase, year)}"},
+            {"$setOnInsert": {
+                "guild_id": guild_id,
+                "old_phase": old_phase,
+                "new_phase": new_phase,
+                "year": year,
+                "rp_date": rp_date,
+                "new_cycle": new_cycle,
+                "steps": {},
+                "started_at": datetime.utcnow(),
+                "completed_at": None,
+            }},
+            upsert=True,
+            return_document=ReturnDocument.AFTER
+        )
+
+    async def step(self, entry: dict, name: str, func, *args) -> bool:
+        """Run one step unless the journal says it already finished. Returns whether it ran."""
+        if name in entry["steps"]:
+            return False
+        result = func(*args)
+        if inspect.isawaitable(result):
+            await result
+        now = datetime.utcnow()
+        self.col.update_one({"_id": entry["_id"]}, {"$set": {f"steps.{name}": now}})
+        entry["steps"][name] = now
+        return True
+
+    def complete(self, entry: dict):
+        if entry.get("completed_at") is None:
+            entry["completed_at"] = datetime.utcnow()
+            self.col.update_one({"_id": entry["_id"]}, {"$set": {"completed_at": entry["completed_at"]}})
+
+    def forget(self, guild_id: int, since: datetime) -> int:
+        """Reopen the guild's transitions dated `since` or later, after an admin moves the clock back.
+
+        Without this a replayed transition would find every step already done.
+        """
+        entries = list(self.col.find({"guild_id": guild_id, "rp_date": {"$gte": since}}, {"old_phase": 1, "new_phase": 1, "year": 1}))
+        if not entries:
+            return 0
+        self.col.delete_many({"_id": {"$in": [entry["_id"] for entry in entries]}})
+        keys = [re.escape(transition_key(e["old_phase"], e["new_phase"], e["year"])) for e in entries]
+        for collection in ONCE_COLLECTIONS:
+            self.db[collection].update_one(
+                {"guild_id": guild_id},
+                {"$pull": {"applied_transitions": {"$regex": f"^(?:{'|'.join(keys)})(?::|$)"}}}
+            )
+        return len(entries)
+
+    def pending(self, guild_filter: dict) -> List[dict]:
+        """Open entries (interrupted transitions) of the matching guilds, oldest first"""
+        return list(self.col.find(dict(guild_filter, completed_at=None)).sort("started_at", 1))
@@ -0,0 +1,173 @@
+from discord.ext import commands
+from collections import deque
+from datetime import datetime, timedelta
+from typing import Deque, Dict, Optional
+import asyncio
+import time
+
+import discord
+
+from .guild_locks import guild_locks
+from .sharding import local_guilds_filter
+
+RENAME_BUDGET = 2  # Discord allows this many renames of one channel...
+RENAME_WINDOW = 600  # ...per this many seconds
+EDIT_TIMEOUT = 15  # discord.py sleeps through a 429 inside edit(); give up on it after this long
+MAX_RECHECK = 300  # Re-read the config at least this often (admin edits, cycle rolls)
+MAX_BACKOFF = 3600
+
+
+def channel_name(rp_date: datetime) -> str:
+    return f"📅 {rp_date.strftime('%B %d, %Y')}"
+
+
+def seconds_until_next_day(config: dict, rp_date: datetime) -> Optional[float]:
+    """Real seconds until the displayed RP date changes; None while time is paused"""
+    if config.get("time_paused", False):
+        return None
+    next_day = datetime(rp_date.year, rp_date.month, rp_date.day) + timedelta(days=1)
+    rp_days = (next_day - rp_date).total_seconds() / 86400
+    return rp_days * config["minutes_per_rp_day"] * 60
+
+
+class VoiceClock(commands.Cog):
+    """Keeps each guild's date voice channel named after the current RP date.
+
+    Runs off the time loop in its own task: every guild has one due time, the real
+    moment its displayed date next changes, so a channel is renamed once per RP
+    day instead of being re-edited every minute. Requests for the same guild
+    coalesce into that one entry. Renames stay within Discord's per-channel budget
+    (RENAME_BUDGET per RENAME_WINDOW); when it's spent, or Discord answers 429, the
+    rename waits (with growing backoff) and then shows whatever the date is by then.
+    """
+
+    def __init__(self, bot):
+        self.bot = bot
+        self.due: Dict[int, float] = {}  # guild_id -> monotonic time of the next sync
+        self.renames: Dict[int, Deque[float]] = {}  # channel_id -> recent rename times
+        self.backoff: Dict[int, float] = {}  # channel_id -> current backoff in seconds
+        self.blocked_until: Dict[int, float] = {}  # channel_id -> no renames before this
+        self._wake = asyncio.Event()
+        self._task = None
+        print("VoiceClock cog loaded successfully")
+
+    async def cog_load(self):
+        self._task = asyncio.create_task(self.run())
+
+    def cog_unload(self):
+        if self._task and not self._task.done():
+            self._task.cancel()
+
+    def schedule(self, guild_id: int, delay: float = 0):
+        """Sync the guild's channel after `delay` seconds (or sooner if already due)"""
+        at = time.monotonic() + delay
+        self.due[guild_id] = min(self.due.get(guild_id, at), at)
+        self._wake.set()
+
+    @commands.Cog.listener()
+    async def on_remote_change(self, collection: str, operation: str, guild_id: Optional[int]):
+        if collection == "time_configs" and guild_id is not None and self.bot.get_guild(guild_id):
+            self.schedule(guild_id)
+
+    async def run(self):
+        await self.bot.wait_until_ready()
+        query = dict(local_guilds_filter(self.bot), voice_channel_id={"$ne": None})
+        for config in self.bot.db["time_configs"].find(query, {"guild_id": 1}):
+            self.schedule(config["guild_id"])
+
+        while True:
+            self._wake.clear()
+            now = time.monotonic()
+            for guild_id in [guild_id for guild_id, at in self.due.items() if at <= now]:
+                self.due.pop(guild_id, None)
+                try:
+                    await self._sync(guild_id)
+                except Exception as e:
+                    print(f"Voice clock update failed for guild {guild_id}: {e}")
+                    self.schedule(guild_id, MAX_RECHECK)
+
+            delay = min(self.due.values()) - time.monotonic() if self.due else MAX_RECHECK
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout=max(0.0, delay))
+            except asyncio.TimeoutError:
+                pass
+
+    def _budget_wait(self, channel_id: int) -> float:
+        """Seconds until the channel may be renamed again"""
+        now = time.monotonic()
+        wait = self.blocked_until.get(channel_id, 0) - now
+        recent = self.renames.get(channel_id)
+        if recent:
+            while recent and recent[0] <= now - RENAME_WINDOW:
+                recent.popleft()
+            if len(recent) >= RENAME_BUDGET:
+                wait = max(wait, recent[0] + RENAME_WINDOW - now)
+        return max(0.0, wait)
+
+    def _back_off(self, channel_id: int, retry_after: Optional[float] = None) -> float:
+        delay = min(MAX_BACKOFF, max(retry_after or 0, self.backoff.get(channel_id, 30) * 2))
+        self.backoff[channel_id] = delay
+        self.blocked_until[channel_id] = time.monotonic() + delay
+        return delay
+
+    async def sync_now(self, guild_id: int) -> dict:
+        """Sync right away for the admin commands; same budget and coalescing as the automatic path"""
+        self.due.pop(guild_id, None)
+        return await self._sync(guild_id, manual=True)
+
+    async def _sync(self, guild_id: int, manual: bool = False) -> dict:
+        """Rename the channel if its date is stale, then schedule the next sync"""
+        async with guild_locks.write(guild_id, "voice_clock"):
+            config = self.bot.db["time_configs"].find_one({"guild_id": guild_id})
+            if not config or not config.get("voice_channel_id"):
+                return {"status": "not_configured"}
+            if not manual and not config.get("update_voice_channels", True):
+                self.schedule(guild_id, MAX_RECHECK)
+                return {"status": "disabled"}
+
+            guild = self.bot.get_guild(guild_id)
+            channel = guild.get_channel(config["voice_channel_id"]) if guild else None
+            if not channel:
+                return {"status": "missing"}
+            if not hasattr(channel, "edit"):
+                return {"status": "not_voice", "channel": channel}
+
+            time_cog = self.bot.get_cog("TimeManager")
+            if time_cog and not config.get("time_paused", False):
+                rp_date, _ = time_cog._calculate_current_rp_time(config)
+            else:
+                rp_date = config["current_rp_date"]
+
+            new_name = channel_name(rp_date)
+            result = {"status": "unchanged", "channel": channel, "old_name": channel.name, "new_name": new_name}
+            if channel.name != new_name:
+                wait = self._budget_wait(channel.id)
+                if wait > 0:
+                    self.schedule(guild_id, wait)
+                    return dict(result, status="queued", retry_in=wait)
+                try:
+                    await asyncio.wait_for(channel.edit(name=new_name), timeout=EDIT_TIMEOUT)
+                except asyncio.TimeoutError:
+                    # discord.py was sleeping out a rate limit we didn't know about (restart, manual renames)
+                    delay = self._back_off(channel.id)
+                    self.schedule(guild_id, delay)
+                    return dict(result, status="queued", retry_in=delay)
+                except discord.HTTPException as e:
+                    if e.status == 429:
+                        delay = self._back_off(channel.id, getattr(e, "retry_after", None))
+                        self.schedule(guild_id, delay)
+                        return dict(result, status="queued", retry_in=delay)
+                    self.schedule(guild_id, MAX_RECHECK)
+                    return dict(result, status="failed", error=str(e))
+                self.renames.setdefault(channel.id, deque()).append(time.monotonic())
+                self.backoff.pop(channel.id, None)
+                print(f"Updated voice channel from '{result['old_name']}' to: {new_name}")
+                result["status"] = "renamed"
+
+            next_change = seconds_until_next_day(config, rp_date)
+            self.schedule(guild_id, min(next_change, MAX_RECHECK) if next_change is not None else MAX_RECHECK)
+            return result
+
+
+async def setup(bot):
+    await bot.add_cog(VoiceClock(bot))
@@ -0,0 +1,122 @@
+from typing import List, Sequence
+
+MAJOR_PARTY_FLOOR = 25.0  # Democrats and Republicans never poll below this
+MINOR_PARTY_FLOOR = 2.0  # Independents and third parties
+RESCALE_BELOW = 1e-12  # Fold the lazy headroom scale back in before it loses precision
+
+
+def minimum_floor(party: str) -> float:
+    """Lowest share a candidate of this party can be pushed down to"""
+    party = party.lower()
+    if "democrat" in party or "republican" in party:
+        return MAJOR_PARTY_FLOOR
+    return MINOR_PARTY_FLOOR
+
+
+def redistribute(baselines: Sequence[float], gains: Sequence[float], floors: Sequence[float]) -> List[float]:
+    """Apply each candidate's campaign gain in order, taken proportionally from everyone else's headroom.
+
+    Candidate i gains min(gain, headroom of the others), where headroom is share above
+    floor, and every other candidate loses the same fraction of their own headroom.
+    That uniform fraction is what makes a single pass possible: instead of touching
+    every other candidate per gain, all headrooms share one running scale factor and
+    only the gaining candidate is updated. O(n) per seat, same results (and the same
+    order dependence) as applying the gains one at a time.
+    """
+    n = len(baselines)
+    values = list(baselines)  # Only authoritative while a candidate is below their floor
+    pooled = [baselines[j] >= floors[j] for j in range(n)]  # Has (possibly zero) headroom
+    stored = [baselines[j] - floors[j] if pooled[j] else 0.0 for j in range(n)]
+    epoch = [0] * n  # Headroom from an older epoch was wiped out by a gain that took everything
+    scale, current_epoch = 1.0, 0
+    total = sum(stored)
+
+    for i, gain in enumerate(gains):
+        if gain <= 0:
+            continue
+        own = scale * stored[i] if pooled[i] and epoch[i] == current_epoch else 0.0
+        available = total - own
+        if available <= 0:
+            continue
+        taken = min(gain, available)
+        keep = 1.0 - taken / available  # Fraction of their headroom every other candidate keeps
+
+        if pooled[i]:
+            new_own = own + taken
+        else:
+            values[i] += taken
+            new_own = values[i] - floors[i]
+            pooled[i] = new_own >= 0
+            new_own = max(0.0, new_own)
+
+        if keep <= 0:
+            current_epoch += 1
+            scale = 1.0
+        else:
+            scale *= keep
+            if scale < RESCALE_BELOW:
+                for j in range(n):
+                    if pooled[j] and epoch[j] == current_epoch:
+                        stored[j] *= scale
+                scale = 1.0
+
+        if pooled[i]:
+            stored[i] = new_own / scale
+            epoch[i] = current_epoch
+        total = available * keep + new_own
+
+    return [
+        (floors[j] + scale * stored[j] if epoch[j] == current_epoch else floors[j]) if pooled[j] else values[j]
+        for j in range(n)
+    ]
+
+
+def linear_redistribute(baselines: Sequence[float], changes: Sequence[float], minimum: float = 0.1) -> List[float]:
+    """Final_i = b_i + a_i - (b_i / B) * s with B = 100, the closed-form model used for election results"""
+    net_change = sum(changes)
+    return [
+        max(minimum, baseline + change - (baseline / 100.0) * net_change)
+        for baseline, change in zip(baselines, changes)
+    ]
+
+
+def _fix_rounding(values: List[float]) -> List[float]:
+    # Floating point leftovers go to the largest share
+    error = 100.0 - sum(values)
+    if abs(error) > 1e-9:
+        largest = max(range(len(values)), key=values.__getitem__)
+        values[largest] += error
+    return values
+
+
+def normalize(values: Sequence[float]) -> List[float]:
+    """Scale every share proportionally so the seat sums to exactly 100%"""
+    total = sum(values)
+    if total <= 0:
+        return list(values)
+    return _fix_rounding([value * 100.0 / total for value in values])
+
+
+def finalize(values: Sequence[float], floors: Sequence[float]) -> List[float]:
+    """Lift everyone to their floor, then scale the headroom so the seat sums to exactly 100%.
+
+    Only the share above the floors is scaled, so floors still hold afterwards. If the
+    floors alone reach 100% (or nobody has headroom) it falls back to plain proportional
+    scaling.
+    """
+    values = [max(value, floor) for value, floor in zip(values, floors)]
+    floor_total = sum(floors)
+    headroom = sum(values) - floor_total
+    if floor_total < 100.0 and headroom > 0:
+        factor = (100.0 - floor_total) / headroom
+        return _fix_rounding([floor + (value - floor) * factor for value, floor in zip(values, floors)])
+    return normalize(values)
+
+
+def zero_sum_percentages(names: Sequence[str], baselines: Sequence[float], gains: Sequence[float],
+                         floors: Sequence[float], adjustments: Sequence[float] = None) -> dict:
+    """Redistribute gains, add any flat adjustments (e.g. momentum) and normalise to 100%"""
+    values = redistribute(baselines, gains, floors)
+    if adjustments is not None:
+        values = [value + adjustment for value, adjustment in zip(values, adjustments)]
+    return dict(zip(names, finalize(values, floors)))
@@ -0,0 +1,85 @@
+import hashlib
+import json
+import os
+from typing import Optional
+
+import discord
+
+ROOT_DIR = os.path.dirname(os.path.abspath(__file__))
+SYNC_STATE_PATH = os.path.join(ROOT_DIR, ".command_sync.json")
+
+
+class CommandSyncManager:
+    """Syncs the app command tree only when it changed since the last successful sync.
+
+    on_ready fires again on every gateway reconnect, so the manager also makes sure
+    the tree is synced at most once per process.
+    """
+
+    def __init__(self, bot, state_path: str = SYNC_STATE_PATH):
+        self.bot = bot
+        self.state_path = state_path
+        self.synced = False
+
+    def _serialize_command(self, command) -> dict:
+        try:
+            return command.to_dict(self.bot.tree)
+        except TypeError:
+            # discord.py < 2.4 takes no tree argument
+            return command.to_dict()
+
+    def tree_hash(self, guild: Optional[discord.abc.Snowflake] = None) -> str:
+        """SHA-256 of the serialized command payload that a sync would upload"""
+        payload = [self._serialize_command(command) for command in self.bot.tree.get_commands(guild=guild)]
+        payload.sort(key=lambda c: (c.get("type", 1), c["name"]))
+        encoded = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str)
+        return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+    def _state_key(self, guild: Optional[discord.abc.Snowflake]) -> str:
+        application_id = self.bot.application_id or (self.bot.user.id if self.bot.user else "unknown")
+        target = f"guild:{guild.id}" if guild else "global"
+        return f"{application_id}:{target}"
+
+    def _load_state(self) -> dict:
+        try:
+            with open(self.state_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save_state(self, state: dict):
+        tmp_path = f"{self.state_path}.tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(state, f, indent=2)
+            os.replace(tmp_path, self.state_path)
+        except OSError as e:
+            print(f"Could not persist command sync state: {e}")
+
+    async def sync(self, guild: Optional[discord.abc.Snowflake] = None, force: bool = False) -> bool:
+        """Sync the tree to a guild (or globally) if needed. Returns True if a sync was sent.
+
+        force skips the hash comparison but not the once-per-process guard.
+        """
+        if self.synced:
+            print("Command tree already synced in this process, skipping")
+            return False
+
+        if guild is not None:
+            self.bot.tree.copy_global_to(guild=guild)
+
+        key = self._state_key(guild)
+        current_hash = self.tree_hash(guild)
+        state = self._load_state()
+
+        if not force and state.get(key) == current_hash:
+            print(f"Command tree unchanged ({current_hash[:12]}), skipping sync")
+            self.synced = True
+            return False
+
+        synced = await self.bot.tree.sync(guild=guild)
+        state[key] = current_hash
+        self._save_state(state)
+        self.synced = True
+        print(f"Synced {len(synced)} commands ({current_hash[:12]})")
+        return True
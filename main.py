@@ -3,47 +3,67 @@ import asyncio
 from discord.ext import commands
 import os
 from dotenv import load_dotenv
+from startup import load_extensions
+from command_sync import CommandSyncManager
+from cogs.instrumentation import InstrumentedCommandTree
+from cogs.sharding import parse_shard_ids
+from cogs.member_cache import gateway_options
 
 load_dotenv()
 
 ### Configuration
 TESTING = True  # Set to False for production - shitty code, I know
+FORCE_COMMAND_SYNC = os.getenv("FORCE_COMMAND_SYNC") == "1"  # Sync even if the command tree looks unchanged
 dev_guild= discord.Object(id=1407527193470439565)  # Replace with your dev guild ID
-# Set up intents
-intents = discord.Intents.default()
-intents.members = True
-intents.message_content = True
+# Running several processes: give each the same SHARD_COUNT and its own SHARD_IDS range, e.g. "0-3"
+SHARD_COUNT = int(os.getenv("SHARD_COUNT")) if os.getenv("SHARD_COUNT") else None
+SHARD_IDS = parse_shard_ids(os.getenv("SHARD_IDS"))
+# Intents and caches: lean by default (no member list, no startup chunking); MEMBER_CACHE=full restores both
+gateway = gateway_options()
 
 # Create bot
-bot = commands.Bot(command_prefix=None, intents=intents, help_command=None)
-
-@bot.event
-async def on_ready():
-    print("on_ready event triggered!")
+bot = commands.AutoShardedBot(command_prefix=None, help_command=None, tree_cls=InstrumentedCommandTree,
+                              shard_count=SHARD_COUNT, shard_ids=SHARD_IDS, **gateway)
+# Skips the sync when the command tree hasn't changed since the last deploy
+command_sync = CommandSyncManager(bot)
 
+async def sync_command_tree():
     try:
         if TESTING:
             print("Testing mode: syncing to dev guild...")
             # sync to dev guild (instant)
-            bot.tree.copy_global_to(guild=dev_guild)
-            print("Commands copied to dev guild")
-            await bot.tree.sync(guild=dev_guild)
-            print("Commands synced to dev guild successfully")
+            await command_sync.sync(guild=dev_guild, force=FORCE_COMMAND_SYNC)
         else:
             print("Production mode: syncing globally...")
             # sync globally (can take up to 1 hour, slash commands suck)
-            await bot.tree.sync()
-            print("Commands synced globally successfully")
-
-        print(f"Logged in as {bot.user} (ID: {bot.user.id})")
-        print("------")
+            await command_sync.sync(force=FORCE_COMMAND_SYNC)
         print("Bot is ready and all commands are synced!")
 
     except Exception as e:
-        print(f"Error in on_ready: {e}")
+        print(f"Error syncing commands: {e}")
         import traceback
         traceback.print_exc()
 
+@bot.event
+async def on_ready():
+    print("on_ready event triggered!")
+    print(f"Logged in as {bot.user} (ID: {bot.user.id}, shards {SHARD_IDS or 'all'})")
+    print("------")
+
+    # The command tree is per application, so only the leader process syncs it
+    leadership = bot.get_cog("Leadership")
+    if leadership and not leadership.is_leader:
+        # Usually a previous run's lease that hasn't expired yet (a restart); on_leadership_change syncs once it's ours
+        print("Command sync left to the leader")
+        return
+    await sync_command_tree()
+
+@bot.event
+async def on_leadership_change(is_leader: bool):
+    # Before ready, on_ready does the sync
+    if is_leader and bot.is_ready():
+        await sync_command_tree()
+
 @bot.tree.error
 async def on_app_command_error(interaction: discord.Interaction, error: discord.app_commands.AppCommandError):
     """Handle application command errors"""
@@ -60,55 +80,12 @@ async def main():
         return
 
     async with bot: #load cogs here
-        try:
-            print("Loading cogs...")
-            await bot.load_extension("cogs.db")
-            print("✓ Loaded db")
-            await bot.load_extension("cogs.basics")
-            print("✓ Loaded basics")
-            await bot.load_extension("cogs.setup")
-            print("✓ Loaded setup")
-            await bot.load_extension("cogs.time_manager")
-            print("✓ Loaded time_manager")
-            await bot.load_extension("cogs.elections")
-            print("✓ Loaded elections")
-            await bot.load_extension("cogs.polling")
-            print("✓ Loaded polling")
-            await bot.load_extension("cogs.all_signups")
-            print("✓ Loaded all_signups")
-            await bot.load_extension("cogs.all_winners")
-            print("✓ Loaded all_winners")
-            await bot.load_extension("cogs.party_management")
-            print("✓ Loaded party_management")
-            await bot.load_extension("cogs.presidential_signups")
-            print("✓ Loaded presidential_signups_actions")
-            await bot.load_extension("cogs.ideology")
-            print("✓ Loaded ideology")
-            await bot.load_extension("cogs.general_campaign_actions")
-            print("✓ Loaded general_campaign_actions")
-            await bot.load_extension("cogs.presidential_winners")
-            print("✓ Loaded presidential_winners")
-            await bot.load_extension("cogs.endorsements")
-            print("✓ Loaded endorsements")
-            await bot.load_extension("cogs.delegates")
-            print("✓ Loaded delegates")
-            await bot.load_extension("cogs.demographics")
-            print("✓ Loaded demographics")
-            await bot.load_extension("cogs.admin_central")
-            print("✓ Loaded admin_central")
-            await bot.load_extension("cogs.pres_campaign_actions")
-            print("✓ Loaded pres_campaign_actions")
-            await bot.load_extension("cogs.special_elections")
-            print("✓ Loaded special_elections")
-            await bot.load_extension("cogs.momentum")
-            print("✓ Loaded momentum")
-            print("All cogs loaded successfully!")
-            
-        except Exception as e:
-            print(f"Error loading cogs: {e}")
-            import traceback
-            traceback.print_exc()
+        print("Loading cogs...")
+        report = await load_extensions(bot)
+        if report.failed:
+            print(f"Error loading cogs: {', '.join(report.failed)}")
             return
+        print(f"All cogs loaded successfully in {report.total_ms:.0f}ms!")
         await bot.start(TOKEN)
 
 if __name__ == "__main__":
@@ -0,0 +1,141 @@
+import asyncio
+import importlib.abc
+import importlib.machinery
+import sys
+import time
+import traceback
+from typing import Dict, List
+
+# Must load before everything else, in this order: cogs.db sets bot.db and
+# bot.db_ready, cogs.metrics wraps bot.db to count round trips
+CORE_EXTENSIONS = ["cogs.db", "cogs.metrics"]
+
+# Independent of each other - loaded concurrently. Cross-cog lookups
+# (bot.get_cog) only happen inside commands and loops, never at setup.
+EXTENSIONS = [
+    "cogs.basics",
+    "cogs.setup",
+    "cogs.time_manager",
+    "cogs.elections",
+    "cogs.polling",
+    "cogs.all_signups",
+    "cogs.all_winners",
+    "cogs.party_management",
+    "cogs.presidential_signups",
+    "cogs.ideology",
+    "cogs.general_campaign_actions",
+    "cogs.presidential_winners",
+    "cogs.endorsements",
+    "cogs.delegates",
+    "cogs.demographics",
+    "cogs.admin_central",
+    "cogs.pres_campaign_actions",
+    "cogs.special_elections",
+    "cogs.momentum",
+    "cogs.reply_router",
+    "cogs.campaign_effects",
+    "cogs.forecast",
+    "cogs.electoral_college",
+    "cogs.dashboard",
+    "cogs.cache_sync",
+    "cogs.sharding",
+    "cogs.voice_clock",
+    "cogs.announcements",
+    "cogs.member_cache",
+]
+
+
+class _TimedLoader(importlib.abc.Loader):
+    """Wraps an extension's loader to time module execution separately from setup()"""
+
+    def __init__(self, loader, timings: Dict[str, dict], name: str):
+        self.loader = loader
+        self.timings = timings
+        self.name = name
+
+    def create_module(self, spec):
+        return self.loader.create_module(spec)
+
+    def exec_module(self, module):
+        start = time.perf_counter()
+        try:
+            self.loader.exec_module(module)
+        finally:
+            self.timings.setdefault(self.name, {})["import_ms"] = (time.perf_counter() - start) * 1000
+
+
+class _TimedFinder(importlib.abc.MetaPathFinder):
+    def __init__(self, names: List[str], timings: Dict[str, dict]):
+        self.names = set(names)
+        self.timings = timings
+
+    def find_spec(self, fullname, path=None, target=None):
+        if fullname not in self.names:
+            return None
+        spec = importlib.machinery.PathFinder.find_spec(fullname, path)
+        if spec is not None and spec.loader is not None:
+            spec.loader = _TimedLoader(spec.loader, self.timings, fullname)
+        return spec
+
+
+class StartupReport:
+    """Per-extension import/setup timings collected by load_extensions"""
+
+    def __init__(self):
+        self.timings: Dict[str, dict] = {}
+        self.failed: Dict[str, Exception] = {}
+        self.total_ms = 0.0
+
+    def record(self, name: str, total_ms: float):
+        entry = self.timings.setdefault(name, {})
+        entry["total_ms"] = total_ms
+        entry["setup_ms"] = max(0.0, total_ms - entry.get("import_ms", 0.0))
+
+    def format(self) -> str:
+        lines = [f"{'extension':<34}{'import':>10}{'setup':>10}{'total':>10}"]
+        rows = sorted(self.timings.items(), key=lambda item: item[1].get("total_ms", 0), reverse=True)
+        for name, entry in rows:
+            lines.append(
+                f"{name:<34}{entry.get('import_ms', 0):>8.1f}ms{entry.get('setup_ms', 0):>8.1f}ms"
+                f"{entry.get('total_ms', 0):>8.1f}ms"
+            )
+        for name, error in self.failed.items():
+            lines.append(f"{name:<34} FAILED: {error}")
+        lines.append(f"{'wall clock':<34}{'':>20}{self.total_ms:>8.1f}ms")
+        return "\n".join(lines)
+
+
+async def _load_one(bot, name: str, report: StartupReport):
+    start = time.perf_counter()
+    try:
+        await bot.load_extension(name)
+    except Exception as e:
+        report.failed[name] = e
+        print(f"✗ Failed to load {name.split('.')[-1]}: {e}")
+        traceback.print_exception(e)
+        return
+    report.record(name, (time.perf_counter() - start) * 1000)
+    entry = report.timings[name]
+    print(f"✓ Loaded {name.split('.')[-1]} (import {entry.get('import_ms', 0):.0f}ms, setup {entry['setup_ms']:.0f}ms)")
+
+
+async def load_extensions(bot, core: List[str] = None, extensions: List[str] = None) -> StartupReport:
+    """Load the core extensions in order, then every other extension concurrently"""
+    core = CORE_EXTENSIONS if core is None else core
+    extensions = EXTENSIONS if extensions is None else extensions
+
+    report = StartupReport()
+    finder = _TimedFinder(core + extensions, report.timings)
+    sys.meta_path.insert(0, finder)
+    start = time.perf_counter()
+    try:
+        for name in core:
+            await _load_one(bot, name, report)
+            if name in report.failed:
+                # Nothing else works without the database handle
+                return report
+        await asyncio.gather(*(_load_one(bot, name, report) for name in extensions))
+    finally:
+        sys.meta_path.remove(finder)
+        report.total_ms = (time.perf_counter() - start) * 1000
+    return report
@@ -0,0 +1,41 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+mongomock = pytest.importorskip("mongomock")
+
+from cogs.archive import archive_collection_name, archive_completed_cycles, year_entries
+
+GUILD_ID = 1
+
+
+def winner(user_id: int, year: int, points: float = 0.0) -> dict:
+    return {"user_id": user_id, "seat_id": f"SEN-{user_id}", "office": "Senate", "year": year, "points": points}
+
+
+def test_entry_edited_during_a_run_is_archived_once():
+    db = mongomock.MongoClient()["archive_test"]
+    db["winners"].insert_one({"guild_id": GUILD_ID, "winners": [winner(1, 2000), winner(2, 2000), winner(3, 2002)]})
+
+    # Simulate a campaign write landing between the run's read and its $pull
+    original_update = db["winners"].update_one
+
+    def update_after_edit(query, update, **kwargs):
+        original_update({"guild_id": GUILD_ID, "winners.user_id": 2}, {"$inc": {"winners.$.points": 5}})
+        return original_update(query, update, **kwargs)
+
+    db["winners"].update_one = update_after_edit
+    assert archive_completed_cycles(db, GUILD_ID, 2001) == {"winners": 2}
+    db["winners"].update_one = original_update
+
+    live = db["winners"].find_one({"guild_id": GUILD_ID})["winners"]
+    assert [entry["user_id"] for entry in live] == [2, 3]  # The edited entry missed the $pull
+
+    assert archive_completed_cycles(db, GUILD_ID, 2001) == {"winners": 1}
+    archived = list(db[archive_collection_name("winners", 2000)].find({}))
+    assert sorted(entry["user_id"] for entry in archived) == [1, 2]
+    assert next(entry for entry in archived if entry["user_id"] == 2)["points"] == 5
+    assert [entry["user_id"] for entry in year_entries(db, GUILD_ID, "winners", 2000)] == [1, 2]
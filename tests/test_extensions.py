@@ -0,0 +1,45 @@
+import ast
+import asyncio
+import os
+import sys
+
+import pytest
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+discord = pytest.importorskip("discord")
+mongomock = pytest.importorskip("mongomock")
+
+from discord.ext import commands
+
+from cogs.instrumentation import InstrumentedCommandTree
+from cogs.member_cache import gateway_options
+from startup import CORE_EXTENSIONS, EXTENSIONS, load_extensions
+
+
+@pytest.mark.parametrize("name", CORE_EXTENSIONS + EXTENSIONS)
+def test_extension_has_entry_point(name):
+    # Read, not imported: cogs.db connects to MongoDB at import
+    with open(os.path.join(ROOT_DIR, *name.split(".")) + ".py", encoding="utf-8") as f:
+        tree = ast.parse(f.read())
+    assert any(isinstance(node, ast.AsyncFunctionDef) and node.name == "setup" for node in tree.body), \
+        f"{name} has no async setup(bot)"
+
+
+def test_every_extension_loads():
+    async def load():
+        bot = commands.Bot(command_prefix=None, help_command=None, tree_cls=InstrumentedCommandTree,
+                           **gateway_options())
+        bot.db = mongomock.MongoClient()["election_bot_test"]  # Stands in for cogs.db, which connects to Atlas with db_user/db_password
+        async with bot:
+            report = await load_extensions(bot, core=["cogs.metrics"])
+            try:
+                return report.failed, set(bot.extensions)
+            finally:
+                for name in list(bot.extensions):
+                    await bot.unload_extension(name)
+
+    failed, loaded = asyncio.run(load())
+    assert not failed, f"Extensions failed to load: {failed}"
+    assert loaded == {"cogs.metrics", *EXTENSIONS}
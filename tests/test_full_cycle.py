@@ -0,0 +1,41 @@
+import asyncio
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+pytest.importorskip("discord")
+pytest.importorskip("mongomock")
+
+from benchmarks.full_cycle import open_guilds, simulate
+from benchmarks.offline import OfflineBot, stand_in_database
+
+
+def test_one_guild_rolls_over_a_full_cycle(monkeypatch):
+    monkeypatch.delenv("MONGO_URI", raising=False)  # Always the in-memory stand-in, never a real database
+
+    async def cycle():
+        db, _ = stand_in_database()
+        async with OfflineBot(db) as offline:
+            campaigns = open_guilds(offline, guilds=1, candidates=6, rp_days_per_tick=5)
+            start = db["time_configs"].find_one()["current_rp_date"]
+            result = await simulate(offline, campaigns, presidential=2, rp_days_per_tick=5, cycles=1, max_ticks=400)
+            return db, start, result
+
+    db, start, result = asyncio.run(cycle())
+    assert result.failing == 0, f"Stuck in {result.stuck}"
+    assert result.cycles == 1, f"No rollover in {result.ticks} ticks: {dict(result.phase_ticks)}"
+    assert set(result.phase_ticks) == {"Signups", "Primary Campaign", "Primary Election",
+                                       "General Campaign", "General Election"}
+
+    config = db["time_configs"].find_one()
+    assert config["current_phase"] == "Signups"
+    assert config["current_rp_date"].year == start.year + 2
+    assert all(entry["completed_at"] for entry in db["phase_transitions"].find())
+
+    # The finished cycle was archived, its primary winners moved on to the general campaign
+    winners = list(db[f"winners_archive_{start.year + 1}"].find())
+    assert winners and all(winner["phase"] == "General Campaign" for winner in winners)
+    assert not (db["winners"].find_one() or {}).get("winners")
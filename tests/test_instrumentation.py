@@ -0,0 +1,27 @@
+import asyncio
+import os
+import sys
+from types import SimpleNamespace
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+discord = pytest.importorskip("discord")
+from discord import app_commands
+
+from cogs.instrumentation import InstrumentedCommandTree, metrics
+
+
+def test_handled_command_failure_counts_as_error(monkeypatch):
+    async def failing_call(self, interaction):
+        interaction.command_failed = True  # What CommandTree._call does when a command raises AppCommandError
+
+    monkeypatch.setattr(app_commands.CommandTree, "_call", failing_call)
+    tree = InstrumentedCommandTree(discord.Client(intents=discord.Intents.none()))
+    interaction = SimpleNamespace(type=discord.InteractionType.application_command,
+                                  data={"name": "instrumentation_test"}, command_failed=False)
+
+    asyncio.run(tree._call(interaction))
+    window = metrics.windows.pop(("command", "instrumentation_test"))
+    assert (window.count, window.errors) == (1, 1)
@@ -0,0 +1,127 @@
+import asyncio
+import os
+import random
+import sys
+import threading
+import time
+from collections import Counter
+from types import SimpleNamespace
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+pytest.importorskip("discord")
+
+from cogs.all_winners import AllWinners
+from cogs.endorsements import Endorsements
+from cogs.presidential_winners import PresidentialWinners
+
+GUILD_ID = 1
+YEAR = 2000
+WINNERS = 50
+THREADS = 4
+SECONDS = 2.0
+
+
+@pytest.fixture
+def db():
+    """A scratch database that supports $push and arrayFilters: MONGO_URI if set, else the mongomock stand-in"""
+    uri = os.getenv("MONGO_URI")
+    if uri:
+        from pymongo import MongoClient
+        from pymongo.errors import PyMongoError
+        client = MongoClient(uri, serverSelectionTimeoutMS=2000)
+        try:
+            client.admin.command("ping")
+        except PyMongoError as e:
+            pytest.skip(f"MongoDB at MONGO_URI unreachable: {e}")
+        name = os.getenv("STRESS_DB", "election_bot_stress")
+        client.drop_database(name)
+        yield client[name]
+        client.drop_database(name)
+        return
+    mongomock = pytest.importorskip("mongomock")
+    from benchmarks.offline import ArrayFilterDatabase
+    yield ArrayFilterDatabase(mongomock.MongoClient()["election_bot_stress"])
+
+
+def seed(db):
+    db["winners"].insert_one({"guild_id": GUILD_ID, "winners": [
+        {"year": YEAR - 2, "user_id": 1000 + i, "candidate": f"Incumbent {i}", "office": "Senate",
+         "seat_id": f"SEN-{i}", "party": "Independent", "points": 0.0, "stamina": 0,
+         "primary_winner": True, "phase": "General Campaign"}
+        for i in range(WINNERS)
+    ]})
+    db["signups"].insert_one({"guild_id": GUILD_ID, "candidates": [
+        {"year": YEAR - 1, "user_id": 5000 + i, "name": f"Hopeful {i}", "office": "House",
+         "seat_id": f"REP-{i}", "party": "Democrat", "region": "Columbia", "points": i}
+        for i in range(20)
+    ]})
+    db["elections_config"].insert_one({"guild_id": GUILD_ID, "seats": [
+        {"seat_id": f"REP-{i}", "office": "House", "state": "Columbia", "current_holder": f"Rep {i}"}
+        for i in range(20)
+    ]})
+    db["special_elections"].insert_one({"guild_id": GUILD_ID, "active_elections": []})
+    db["presidential_signups"].insert_one({"guild_id": GUILD_ID, "candidates": []})
+
+
+def increment_worker(db, stop: threading.Event, counts: Counter, lock: threading.Lock):
+    """What speeches, canvassing and endorsements do: $inc on an existing winner"""
+    rng = random.Random()
+    local = Counter()
+    while not stop.is_set():
+        user_id = 1000 + rng.randrange(WINNERS)
+        db["winners"].update_one(
+            {"guild_id": GUILD_ID, "winners.user_id": user_id},
+            {"$inc": {"winners.$.points": 1, "winners.$.stamina": 1}}
+        )
+        local[user_id] += 1
+    with lock:
+        counts.update(local)
+
+
+async def run_writers(bot) -> int:
+    """The sections that append to or reset the same arrays, in a loop"""
+    all_winners = AllWinners(bot)
+    endorsements = Endorsements(bot)
+    presidential = PresidentialWinners(bot)
+    rounds = 0
+    deadline = time.perf_counter() + SECONDS
+    while time.perf_counter() < deadline:
+        await all_winners._process_primary_winners(GUILD_ID, YEAR - 1, YEAR)
+        endorsements._record_endorsement(GUILD_ID, rounds, "Incumbent 0", 0.5, "Senator", "Senator")
+        presidential._reset_presidential_candidates_for_general_campaign(GUILD_ID, YEAR)
+        await all_winners._ensure_general_campaign_candidates(GUILD_ID, YEAR)
+        # Same seat update admin_call_election makes when it vacates a seat
+        bot.db["elections_config"].update_one(
+            {"guild_id": GUILD_ID},
+            {"$set": {"seats.$[seat].current_holder": None, "seats.$[seat].up_for_election": True}},
+            array_filters=[{"seat.seat_id": f"REP-{rounds % 20}"}]
+        )
+        rounds += 1
+        await asyncio.sleep(0)
+    return rounds
+
+
+def test_campaign_increments_survive_phase_and_admin_writers(db):
+    seed(db)
+    bot = SimpleNamespace(db=db, get_guild=lambda guild_id: None)
+
+    counts, counts_lock, stop = Counter(), threading.Lock(), threading.Event()
+    workers = [threading.Thread(target=increment_worker, args=(db, stop, counts, counts_lock))
+               for _ in range(THREADS)]
+    for worker in workers:
+        worker.start()
+    try:
+        rounds = asyncio.run(run_writers(bot))
+    finally:
+        stop.set()
+        for worker in workers:
+            worker.join()
+
+    assert rounds > 1 and sum(counts.values()) > 0
+    stored = {w["user_id"]: w for w in db["winners"].find_one({"guild_id": GUILD_ID})["winners"]
+              if w["user_id"] in counts}
+    assert {user_id: stored[user_id]["points"] for user_id in counts} == dict(counts)
+    assert {user_id: stored[user_id]["stamina"] for user_id in counts} == dict(counts)
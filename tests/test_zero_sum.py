@@ -0,0 +1,46 @@
+import os
+import random
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cogs.zero_sum import finalize, linear_redistribute, normalize, redistribute
+from tests.zero_sum_reference import legacy_redistribute, random_seat
+
+CASES = 20000
+
+
+def seats():
+    """Random seats, each with its own seeded generator so a case doesn't depend on the ones before it"""
+    for case in range(CASES):
+        rng = random.Random(case)
+        yield random_seat(rng, rng.randint(1, 20)), rng
+
+
+def test_redistribute_matches_sequential_loop():
+    for (baselines, gains, floors), _ in seats():
+        shares = redistribute(baselines, gains, floors)
+        expected = legacy_redistribute(baselines, gains, floors)
+        assert max(abs(a - b) for a, b in zip(shares, expected)) < 1e-9
+
+
+def test_finalize_sums_to_100_and_keeps_floors():
+    for (baselines, gains, floors), rng in seats():
+        shares = redistribute(baselines, gains, floors)
+        momentum = [rng.uniform(-15, 15) for _ in shares]
+        final = finalize([share + m for share, m in zip(shares, momentum)], floors)
+        assert sum(final) == pytest.approx(100.0, abs=1e-9)
+        if sum(floors) < 100.0:
+            assert all(share >= floor - 1e-9 for share, floor in zip(final, floors))
+
+
+def test_linear_model_rescales_proportionally():
+    # The AllWinners model: b + a - (b/B)s with a 0.1% minimum, then plain proportional rescaling
+    baselines, changes = [40.0, 40.0, 20.0], [60.0, -30.0, 0.0]
+    final = linear_redistribute(baselines, changes)
+    assert final[1] == 0.1  # Pushed below the minimum
+    shares = normalize(final)
+    assert sum(shares) == pytest.approx(100.0, abs=1e-9)
+    assert shares == pytest.approx([value * 100.0 / sum(final) for value in final])
@@ -0,0 +1,31 @@
+"""Reference implementation for the zero-sum kernel, shared by tests/test_zero_sum.py and benchmarks/zero_sum.py"""
+from cogs.zero_sum import MAJOR_PARTY_FLOOR, MINOR_PARTY_FLOOR
+
+
+def legacy_redistribute(baselines, gains, floors):
+    """The per-gain loop previously copied into Polling, GeneralCampaignActions and PresCampaignActions"""
+    current = list(baselines)
+    n = len(current)
+    for i in range(n):
+        if gains[i] <= 0:
+            continue
+        total_available = sum(max(0, current[j] - floors[j]) for j in range(n) if j != i)
+        actual_gain = min(gains[i], total_available)
+        current[i] += actual_gain
+        if total_available > 0:
+            available = [max(0, current[j] - floors[j]) if j != i else 0 for j in range(n)]
+            for j in range(n):
+                if j != i and available[j] > 0:
+                    current[j] -= available[j] / total_available * actual_gain
+    return current
+
+
+def random_seat(rng, candidates):
+    floors = [rng.choice((MAJOR_PARTY_FLOOR, MINOR_PARTY_FLOOR)) for _ in range(candidates)]
+    if rng.random() < 0.5:
+        baselines = [100.0 / candidates] * candidates
+    else:
+        weights = [rng.random() for _ in range(candidates)]
+        baselines = [w * 100.0 / sum(weights) for w in weights]
+    gains = [rng.choice((0.0, rng.uniform(0, 5), rng.uniform(0, 150))) for _ in range(candidates)]
+    return baselines, gains, floors